@@ -49,11 +49,11 @@ async def get_redis():
     Usage:
         @app.get("/cached")
         async def cached_endpoint(redis: RedisService = Depends(get_redis)):
-            cached = redis.get("key")
+            cached = await redis.aget("key")
             if cached:
                 return cached
             # ... compute result
-            redis.set("key", result, ttl=300)
+            await redis.aset("key", result, ttl=300)
             return result
     """
     return get_redis_service()
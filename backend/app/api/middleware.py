@@ -0,0 +1,79 @@
+"""
+API Middleware
+요청별 타이밍 스팬 수집 및 Server-Timing 응답 헤더, 라우트별 요청 메트릭
+"""
+
+import time
+
+from app.core.services import metrics, timing
+
+
+class ServerTimingMiddleware:
+    """
+    Server-Timing 헤더 ASGI 미들웨어
+
+    요청마다 스팬 수집을 시작하고, 응답 시작 시점까지 기록된 노드/외부 호출 스팬과
+    전체 처리 시간을 Server-Timing 헤더로 추가한다.
+    (BaseHTTPMiddleware 와 달리 응답 본문을 다시 감싸지 않음)
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        spans = timing.start_request()
+        start = time.perf_counter()
+
+        async def send_with_timing(message):
+            if message["type"] == "http.response.start":
+                header = timing.server_timing_header(spans, time.perf_counter() - start)
+                message["headers"] = list(message.get("headers", [])) + [
+                    (b"server-timing", header.encode("latin-1"))
+                ]
+            await send(message)
+
+        await self.app(scope, receive, send_with_timing)
+
+
+class MetricsMiddleware:
+    """
+    HTTP 요청 메트릭 ASGI 미들웨어
+
+    진행 중인 요청 수와 라우트 템플릿(예: /api/v1/services/{category}/{service_id})별
+    지연 시간 히스토그램을 기록한다. 매칭되지 않은 경로는 레이블 카디널리티를 막기 위해
+    "unmatched" 로 묶는다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+        start = time.perf_counter()
+        metrics.HTTP_REQUESTS_IN_FLIGHT.inc()
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            metrics.HTTP_REQUESTS_IN_FLIGHT.dec()
+            route = scope.get("route")
+            metrics.HTTP_REQUEST_DURATION.observe(
+                time.perf_counter() - start,
+                scope["method"],
+                getattr(route, "path", "unmatched"),
+                str(status)
+            )
@@ -3,12 +3,17 @@ Geocode API Endpoints
 지오코딩 API 엔드포인트
 """
 
+import asyncio
+import json
 import logging
-from typing import Optional
+from typing import Optional, List, Dict, Any, AsyncIterator, Tuple
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
+from app.core.config import settings
 from app.core.services.kakao_map_service import get_kakao_map_service
+from app.core.services.geocode_cache import get_geocode_cache, canonicalize_address
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +27,16 @@ class GeocodeRequest(BaseModel):
     address: str = Field(..., description="주소 (예: 서울시청, 서울 중구 세종대로 110)")
 
 
+class BatchGeocodeRequest(BaseModel):
+    """배치 지오코딩 요청"""
+    addresses: List[str] = Field(
+        ...,
+        min_length=1,
+        max_length=settings.GEOCODE_BATCH_MAX_SIZE,
+        description="주소 목록 (중복은 한 번만 조회)"
+    )
+
+
 class ReverseGeocodeRequest(BaseModel):
     """역방향 지오코딩 요청"""
     latitude: float = Field(..., description="위도 (WGS84)")
@@ -98,13 +113,8 @@ async def geocode(request: GeocodeRequest):
         # Kakao Map Service 사용
         kakao_service = get_kakao_map_service()
 
-        # 주소 검색 시도
-        coords = await kakao_service.address_to_coordinates(request.address)
-
-        # 주소 검색 실패 시 키워드 검색
-        if not coords:
-            logger.info(f"[geocode] Address search failed, trying keyword search")
-            coords = await kakao_service.keyword_search(request.address)
+        # 캐시 조회 후 미스 시 주소 검색 → 키워드 검색
+        coords = await get_geocode_cache().geocode(request.address, kakao_service)
 
         if not coords:
             raise HTTPException(
@@ -135,6 +145,130 @@ async def geocode(request: GeocodeRequest):
         )
 
 
+def _batch_line(
+    items: List[Tuple[int, str]],
+    status: str,
+    source: Optional[str] = None,
+    coords: Optional[tuple] = None,
+    error: Optional[str] = None
+) -> str:
+    """같은 주소의 모든 입력 (위치, 원래 표기)에 대한 NDJSON 라인 생성"""
+    lines = []
+    for index, address in items:
+        item: Dict[str, Any] = {"index": index, "address": address, "status": status}
+        if coords:
+            item["latitude"], item["longitude"] = coords
+        if source:
+            item["source"] = source
+        if error:
+            item["error"] = error
+        lines.append(json.dumps(item, ensure_ascii=False) + "\n")
+    return "".join(lines)
+
+
+async def _stream_batch_geocode(addresses: List[str]) -> AsyncIterator[str]:
+    """
+    배치 지오코딩 결과를 완료되는 순서대로 NDJSON 라인으로 생성
+
+    1. 정규화 주소 기준 중복 제거
+    2. 캐시 일괄 조회 (MGET 1회) 후 적중 주소 즉시 응답
+    3. 나머지는 세마포어로 동시 요청 수를 제한해 Kakao 조회
+    """
+    cache = get_geocode_cache()
+    kakao_service = get_kakao_map_service()
+
+    # 정규화 키 → (대표 주소, [(입력 위치, 원래 표기)])
+    groups: Dict[str, Tuple[str, List[Tuple[int, str]]]] = {}
+    for index, address in enumerate(addresses):
+        key = canonicalize_address(address)
+        if not key:
+            yield _batch_line([(index, address)], "invalid", error="Empty address")
+            continue
+        if key in groups:
+            groups[key][1].append((index, address))
+        else:
+            groups[key] = (address, [(index, address)])
+
+    # 캐시 조회 (전체 주소를 Redis 왕복 1회로)
+    unique = list(groups.values())
+    try:
+        entries = await cache.get_forward_many([address for address, _ in unique])
+    except Exception as e:
+        logger.warning(f"[geocode_batch] Cache lookup failed: {e}")
+        entries = [None] * len(unique)
+
+    pending = []
+    for (address, items), entry in zip(unique, entries):
+        if entry is None:
+            pending.append((address, items))
+        elif entry.get("coords"):
+            yield _batch_line(items, "ok", "cache", tuple(entry["coords"]))
+        else:
+            yield _batch_line(items, "not_found", "cache")
+
+    if not pending:
+        return
+
+    # 캐시 미스 주소 동시 조회
+    semaphore = asyncio.Semaphore(settings.GEOCODE_BATCH_CONCURRENCY)
+
+    async def resolve(address: str, items: List[Tuple[int, str]]) -> str:
+        async with semaphore:
+            try:
+                coords = await cache.geocode(address, kakao_service, check_cache=False)
+            except Exception as e:
+                logger.error(f"[geocode_batch] Geocoding failed for '{address}': {e}")
+                return _batch_line(items, "error", "kakao", error=str(e))
+
+        if coords:
+            return _batch_line(items, "ok", "kakao", coords)
+        return _batch_line(items, "not_found", "kakao")
+
+    tasks = [asyncio.create_task(resolve(address, items)) for address, items in pending]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        # 클라이언트 연결이 끊기면 남은 조회 취소
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+
+
+@router.post(
+    "/batch",
+    summary="배치 주소 → 좌표 변환",
+    description="여러 주소를 한 번에 변환하고 결과를 NDJSON으로 스트리밍합니다.",
+    response_class=StreamingResponse
+)
+async def geocode_batch(request: BatchGeocodeRequest):
+    """
+    배치 지오코딩 (NDJSON 스트리밍)
+
+    **입력**:
+    - addresses: 주소 목록 (최대 GEOCODE_BATCH_MAX_SIZE개)
+
+    **응답** (`application/x-ndjson`, 입력 주소마다 한 줄, 완료 순서):
+    - index: 입력 목록에서의 위치
+    - address: 입력 주소
+    - status: ok | not_found | error | invalid
+    - latitude, longitude: 좌표 (status=ok)
+    - source: cache | kakao
+
+    **응답 예시**:
+    ```
+    {"index": 1, "address": "강남역", "status": "ok", "latitude": 37.4979, "longitude": 127.0276, "source": "cache"}
+    {"index": 0, "address": "서울시청", "status": "ok", "latitude": 37.5665, "longitude": 126.978, "source": "kakao"}
+    ```
+    """
+    logger.info(f"[geocode_batch] Request: {len(request.addresses)} addresses")
+
+    return StreamingResponse(
+        _stream_batch_geocode(request.addresses),
+        media_type="application/x-ndjson"
+    )
+
+
 @router.post(
     "/reverse",
     response_model=ReverseGeocodeResponse,
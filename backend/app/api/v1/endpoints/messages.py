@@ -0,0 +1,52 @@
+"""
+LLM Message API Endpoints
+백그라운드에서 생성되는 LLM 추천 메시지 조회 엔드포인트
+"""
+
+import logging
+from typing import Literal, Optional
+from fastapi import APIRouter, HTTPException, Query
+from pydantic import BaseModel, Field
+
+from app.core.config import settings
+from app.core.services.llm_message_service import get_llm_message_service
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/messages", tags=["messages"])
+
+
+class LLMMessageResponse(BaseModel):
+    """LLM 메시지 조회 응답"""
+    token: str
+    status: Literal["ready", "pending", "failed"] = Field(
+        ..., description="ready: 생성 완료, pending: 생성 중, failed: 생성 실패 (템플릿 메시지 사용)"
+    )
+    message: Optional[str] = None
+
+
+@router.get(
+    "/{token}",
+    response_model=LLMMessageResponse,
+    summary="LLM 추천 메시지 조회",
+    description="검색 응답의 message_token 으로 백그라운드에서 생성된 LLM 추천 메시지를 조회합니다."
+)
+async def get_llm_message(
+    token: str,
+    wait: float = Query(
+        0.0, ge=0, le=settings.LLM_MESSAGE_MAX_WAIT,
+        description="생성 중이면 완료까지 대기할 최대 시간 (초, long-polling)"
+    )
+):
+    """
+    LLM 추천 메시지 조회
+
+    **응답**:
+    - status: ready | pending | failed
+    - message: 생성된 메시지 (ready 일 때)
+    """
+    status = await get_llm_message_service().get_status(token, wait=wait)
+    if status is None:
+        raise HTTPException(status_code=404, detail="Unknown or expired message token")
+
+    return LLMMessageResponse(**status)
@@ -3,10 +3,12 @@ Service API Endpoints
 서비스 검색 API 엔드포인트
 """
 
+import json
 import logging
-from typing import Optional
+from typing import Any, AsyncIterator, Dict, Literal, Optional
 from fastapi import APIRouter, HTTPException, Query
-from fastapi.responses import JSONResponse
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, StreamingResponse
 
 from app.api.v1.schemas.service_schemas import (
     ServiceSearchResponse,
@@ -22,6 +24,51 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/services", tags=["services"])
 
+# 스트리밍 응답 형식별 Content-Type
+STREAM_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "sse": "text/event-stream"
+}
+
+
+def encode_stream_event(event: Dict[str, Any], stream_format: str) -> str:
+    """
+    스트리밍 이벤트 직렬화
+
+    Args:
+        event: 이벤트 딕셔너리 ('type' 포함)
+        stream_format: "ndjson" (한 줄에 JSON 하나) 또는 "sse" (event/data 필드)
+
+    Returns:
+        전송할 문자열
+    """
+    data = json.dumps(jsonable_encoder(event), ensure_ascii=False)
+    if stream_format == "sse":
+        return f"event: {event['type']}\ndata: {data}\n\n"
+    return data + "\n"
+
+
+async def stream_events(
+    events: AsyncIterator[Dict[str, Any]],
+    stream_format: str
+) -> AsyncIterator[str]:
+    """
+    워크플로우 이벤트 스트림 직렬화 (도중 오류는 error 이벤트로 전달)
+
+    Args:
+        events: ServiceSearchGraph.stream 이벤트
+        stream_format: "ndjson" 또는 "sse"
+
+    Yields:
+        직렬화된 이벤트
+    """
+    try:
+        async for event in events:
+            yield encode_stream_event(event, stream_format)
+    except Exception as e:
+        logger.error(f"[nearby] Streaming error: {e}", exc_info=True)
+        yield encode_stream_event({'type': 'error', 'errors': [str(e)]}, stream_format)
+
 
 @router.get(
     "/nearby",
@@ -36,7 +83,9 @@ async def search_nearby(
     radius: int = Query(2000, ge=100, le=10000, description="검색 반경 (미터)"),
     category: Optional[str] = Query(None, description="카테고리 필터"),
     limit: int = Query(50, ge=1, le=200, description="최대 결과 개수"),
-    use_llm: bool = Query(False, description="LLM 기반 응답 생성 사용")
+    use_llm: bool = Query(False, description="LLM 기반 응답 생성 사용"),
+    include_address: bool = Query(True, description="좌표 입력 시 역지오코딩 주소 포함 (false면 Kakao 호출 생략)"),
+    stream: Optional[Literal["ndjson", "sse"]] = Query(None, description="스트리밍 응답 형식 (카테고리별 결과를 완료 순서대로 전송)")
 ):
     """
     근처 서비스 검색
@@ -56,6 +105,14 @@ async def search_nearby(
     - locations: 검색된 위치 리스트 (거리순 정렬)
     - summary: 요약 정보 (총 개수, 평균 거리, Kakao Map 마커 등)
     - workflow_id: 워크플로우 추적 ID
+    - message_token: use_llm=true 일 때 LLM 추천 메시지 조회 토큰
+      (message 는 템플릿 메시지, 같은 결과의 LLM 메시지가 이미 있으면 해당 메시지)
+
+    **스트리밍 (stream=ndjson | sse)**:
+    - header: workflow_id, 검색 중심/반경, 조회할 카테고리 목록
+    - locations: 카테고리별 위치 + kakao_markers (조회가 끝나는 순서대로, 카테고리당 최대 limit개)
+    - final: 메시지, 요약 (거리순 상위 limit개 기준), message_token, 오류
+    - error: 처리 중단 시 (마지막 이벤트)
     """
     try:
         # 입력 검증
@@ -91,11 +148,21 @@ async def search_nearby(
             longitude=lon,
             address=address,
             radius=radius,
-            category=category
+            category=category,
+            include_address=include_address
         )
 
         # 워크플로우 실행
         graph = get_service_graph(use_llm=use_llm)
+
+        # 스트리밍: 헤더 → 카테고리별 배치 → 최종 메시지
+        if stream is not None:
+            return StreamingResponse(
+                stream_events(graph.stream(query, limit=limit), stream),
+                media_type=STREAM_MEDIA_TYPES[stream],
+                headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+            )
+
         state = await graph.run(query)
 
         # 에러 체크
@@ -146,6 +213,7 @@ async def search_nearby(
             locations=final_locations,
             summary=summary,
             workflow_id=state.workflow_id,
+            message_token=state.response.message_token,
             errors=state.errors
         )
 
@@ -182,7 +250,8 @@ async def search_by_category(
     radius: int = Query(2000, ge=100, le=10000, description="검색 반경 (미터)"),
     limit: int = Query(50, ge=1, le=200, description="최대 결과 개수"),
     sort_by: str = Query("distance", description="정렬 기준 (distance, name)"),
-    use_llm: bool = Query(False, description="LLM 기반 응답 생성 사용")
+    use_llm: bool = Query(False, description="LLM 기반 응답 생성 사용"),
+    include_address: bool = Query(True, description="역지오코딩 주소 포함 (false면 Kakao 호출 생략)")
 ):
     """
     카테고리별 서비스 검색
@@ -223,7 +292,8 @@ async def search_by_category(
             latitude=lat,
             longitude=lon,
             radius=radius,
-            category=category
+            category=category,
+            include_address=include_address
         )
 
         # 워크플로우 실행
@@ -404,7 +474,8 @@ async def get_service_detail(
                 latitude=lat,
                 longitude=lon,
                 radius=nearby_radius,
-                category=category
+                category=category,
+                include_address=False  # 주변 목록에는 검색 주소 불필요
             )
 
             graph = get_service_graph(use_llm=False)
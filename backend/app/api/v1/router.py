@@ -4,7 +4,7 @@ Aggregates all v1 endpoints
 """
 
 from fastapi import APIRouter
-from app.api.v1.endpoints import services, geocode
+from app.api.v1.endpoints import services, geocode, messages
 
 # Create main API router
 api_router = APIRouter()
@@ -12,6 +12,7 @@ api_router = APIRouter()
 # Include endpoint routers
 api_router.include_router(services.router, tags=["Services"])
 api_router.include_router(geocode.router, tags=["Geocoding"])
+api_router.include_router(messages.router, tags=["Messages"])
 
 # Status endpoint
 @api_router.get("/status")
@@ -120,6 +120,10 @@ class ServiceSearchResponse(BaseModel):
     locations: List[Dict[str, Any]] = Field(default_factory=list)
     summary: Optional[SearchSummary] = None
     workflow_id: Optional[str] = None
+    message_token: Optional[str] = Field(
+        None,
+        description="LLM 추천 메시지 조회 토큰 (use_llm=true, GET /messages/{token})"
+    )
     errors: List[str] = Field(default_factory=list)
     timestamp: datetime = Field(default_factory=datetime.now)
 
@@ -9,6 +9,8 @@ import uuid
 
 from app.core.workflow.state import LocationQuery, AnalyzedLocation
 from app.core.services.kakao_map_service import get_kakao_map_service
+from app.core.services.geocode_cache import get_geocode_cache
+from app.core.services.gazetteer import get_gazetteer
 from app.utils.coordinate_transform import CoordinateTransformer
 
 logger = logging.getLogger(__name__)
@@ -20,7 +22,7 @@ class LocationAnalyzer:
 
     기능:
     1. 사용자 입력 분석 (좌표 vs 주소)
-    2. 주소 → 좌표 변환 (Kakao Geocoding)
+    2. 주소 → 좌표 변환 (오프라인 지명 사전 → Kakao Geocoding)
     3. 좌표 정규화 (소수점 6자리)
     4. 서울 범위 검증
     5. 반경 및 카테고리 설정
@@ -29,18 +31,23 @@ class LocationAnalyzer:
     def __init__(self):
         """LocationAnalyzer 초기화"""
         self.kakao_service = get_kakao_map_service()
+        self.geocode_cache = get_geocode_cache()
+        self.gazetteer = get_gazetteer()
         self.coord_transformer = CoordinateTransformer()
         logger.info("LocationAnalyzer initialized")
 
     async def analyze(
         self,
-        query: LocationQuery
+        query: LocationQuery,
+        resolve_address: bool = True
     ) -> Optional[AnalyzedLocation]:
         """
         위치 쿼리 분석
 
         Args:
             query: 사용자 위치 쿼리
+            resolve_address: 좌표 입력 시 역지오코딩 수행 여부
+                (False면 호출 측에서 resolve_address()를 별도로 호출)
 
         Returns:
             AnalyzedLocation 또는 None (실패 시)
@@ -59,7 +66,8 @@ class LocationAnalyzer:
                     query.longitude,
                     query.address,
                     query.radius,
-                    query.category
+                    query.category,
+                    resolve_address=resolve_address and query.include_address
                 )
 
             # Case 2: 주소가 주어진 경우
@@ -86,7 +94,8 @@ class LocationAnalyzer:
         longitude: float,
         address: Optional[str],
         radius: int,
-        category: Optional[str]
+        category: Optional[str],
+        resolve_address: bool = True
     ) -> Optional[AnalyzedLocation]:
         """
         좌표 기반 분석
@@ -97,6 +106,7 @@ class LocationAnalyzer:
             address: 주소 (선택)
             radius: 반경
             category: 카테고리
+            resolve_address: 주소가 없을 때 역지오코딩 수행 여부
 
         Returns:
             AnalyzedLocation 또는 None
@@ -117,15 +127,8 @@ class LocationAnalyzer:
 
         # 3. 주소 조회 (없으면 Reverse Geocoding)
         final_address = address
-        if not final_address:
-            try:
-                final_address = await self.kakao_service.reverse_geocode(
-                    normalized_lat,
-                    normalized_lon
-                )
-            except Exception as e:
-                logger.warning(f"Reverse geocoding failed: {e}")
-                final_address = None
+        if not final_address and resolve_address:
+            final_address = await self.resolve_address(normalized_lat, normalized_lon)
 
         # 4. AnalyzedLocation 생성
         return AnalyzedLocation(
@@ -138,6 +141,35 @@ class LocationAnalyzer:
             confidence=1.0
         )
 
+    async def resolve_address(
+        self,
+        latitude: float,
+        longitude: float
+    ) -> Optional[str]:
+        """
+        역지오코딩 (캐시 우선)
+
+        Args:
+            latitude: 위도
+            longitude: 경도
+
+        Returns:
+            주소 또는 None (실패 시)
+        """
+        try:
+            cached = await self.geocode_cache.get_reverse(latitude, longitude)
+            if cached is not None:
+                return cached
+
+            address = await self.kakao_service.reverse_geocode(latitude, longitude)
+            if address:
+                await self.geocode_cache.set_reverse(latitude, longitude, address)
+            return address
+
+        except Exception as e:
+            logger.warning(f"Reverse geocoding failed: {e}")
+            return None
+
     async def _analyze_address(
         self,
         address: str,
@@ -155,15 +187,20 @@ class LocationAnalyzer:
         Returns:
             AnalyzedLocation 또는 None
         """
-        # 1. 주소 → 좌표 변환 (Kakao Geocoding)
-        try:
-            # 먼저 주소 검색 시도
-            coords = await self.kakao_service.address_to_coordinates(address)
+        # 주소 변환은 약간 낮은 신뢰도
+        confidence = 0.9
 
-            # 주소 검색 실패 시 키워드 검색 시도
-            if not coords:
-                logger.info(f"Address search failed, trying keyword search for '{address}'")
-                coords = await self.kakao_service.keyword_search(address)
+        # 1. 오프라인 지명 사전 조회 (역/공공시설 이름, 외부 호출 없음)
+        match = self.gazetteer.lookup(address)
+
+        # 2. 주소 → 좌표 변환 (캐시 우선, Kakao 주소 검색 → 키워드 검색)
+        try:
+            if match:
+                coords = (match["latitude"], match["longitude"])
+                confidence = round(confidence * match["score"], 3)
+                logger.debug(f"Gazetteer hit '{address}' → {match['name']} ({match['source']})")
+            else:
+                coords = await self.geocode_cache.geocode(address, self.kakao_service)
 
             if not coords:
                 logger.error(f"Failed to geocode address: {address}")
@@ -175,17 +212,17 @@ class LocationAnalyzer:
             logger.error(f"Geocoding failed for '{address}': {e}")
             return None
 
-        # 2. 좌표 정규화
+        # 3. 좌표 정규화
         normalized_lat = round(latitude, 6)
         normalized_lon = round(longitude, 6)
 
         logger.info(f"Geocoded '{address}' → ({normalized_lat}, {normalized_lon})")
 
-        # 3. 서울 범위 검증
+        # 4. 서울 범위 검증
         if not self.coord_transformer.is_in_seoul(normalized_lat, normalized_lon):
             logger.warning(f"Geocoded address '{address}' is outside Seoul bounds")
 
-        # 4. AnalyzedLocation 생성
+        # 5. AnalyzedLocation 생성
         return AnalyzedLocation(
             latitude=normalized_lat,
             longitude=normalized_lon,
@@ -193,7 +230,7 @@ class LocationAnalyzer:
             radius=radius,
             category=category,
             source="address",
-            confidence=0.9  # 주소 변환은 약간 낮은 신뢰도
+            confidence=confidence
         )
 
     def validate_location(
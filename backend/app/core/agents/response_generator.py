@@ -8,7 +8,7 @@ from typing import Optional, List, Dict, Any
 import json
 
 from app.core.workflow.state import SearchResults, FormattedResponse, AnalyzedLocation
-from app.core.config import settings
+from app.core.services.llm_message_service import get_llm_message_service
 
 logger = logging.getLogger(__name__)
 
@@ -22,7 +22,7 @@ class ResponseGenerator:
     2. 카테고리별 그룹화
     3. Kakao Map 마커 데이터 생성
     4. 요약 정보 생성 (개수, 평균 거리 등)
-    5. (선택적) Ollama LLM 추천 텍스트 생성
+    5. (선택적) Ollama LLM 추천 텍스트 생성 (백그라운드, 응답은 템플릿 메시지 + 토큰)
     """
 
     # 카테고리 한글명 매핑
@@ -44,17 +44,9 @@ class ResponseGenerator:
         self.use_llm = use_llm
 
         if self.use_llm:
-            try:
-                from langchain_ollama import ChatOllama
-                self.llm = ChatOllama(
-                    base_url=settings.OLLAMA_BASE_URL,
-                    model=settings.OLLAMA_LLM_MODEL,
-                    temperature=0.7
-                )
-                logger.info("LLM enabled for response generation")
-            except Exception as e:
-                logger.warning(f"Failed to initialize LLM: {e}. Falling back to template-based generation.")
-                self.use_llm = False
+            # 응답을 LLM 호출로 막지 않도록 백그라운드 생성 서비스 사용
+            self.llm_messages = get_llm_message_service()
+            logger.info("LLM enabled for response generation (background)")
         else:
             logger.info("Template-based response generation enabled")
 
@@ -83,15 +75,20 @@ class ResponseGenerator:
             # 3. Kakao Map 마커 데이터 생성
             markers = self._generate_markers(search_results.locations)
 
-            # 4. 메시지 생성 (템플릿 또는 LLM)
+            # 4. 메시지 생성 (템플릿, LLM 사용 시 같은 결과의 생성된 메시지가 있으면 해당 메시지)
+            message = self._generate_template_message(search_results, analyzed_location, summary)
+            message_token = None
             if self.use_llm and analyzed_location:
-                message = await self._generate_llm_message(search_results, analyzed_location, summary)
-            else:
-                message = self._generate_template_message(search_results, analyzed_location, summary)
+                message_token, llm_message = self.llm_messages.submit(
+                    self._build_llm_prompt(search_results, analyzed_location, summary)
+                )
+                if llm_message:
+                    message = llm_message
 
             # 5. FormattedResponse 생성
             return FormattedResponse(
                 message=message,
+                message_token=message_token,
                 locations=search_results.locations,
                 summary={
                     **summary,
@@ -110,6 +107,29 @@ class ResponseGenerator:
                 error=str(e)
             )
 
+    def format_batch(
+        self,
+        category: str,
+        locations: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        스트리밍 응답용 카테고리 배치 (위치 + Kakao Map 마커)
+
+        Args:
+            category: 카테고리 (테이블명)
+            locations: 해당 카테고리 위치 리스트
+
+        Returns:
+            배치 딕셔너리
+        """
+        return {
+            'category': category,
+            'category_name': self.CATEGORY_NAMES.get(category, category),
+            'count': len(locations),
+            'locations': locations,
+            'kakao_markers': self._generate_markers(locations)
+        }
+
     def _group_by_category(
         self,
         locations: List[Dict[str, Any]]
@@ -366,14 +386,17 @@ class ResponseGenerator:
 
         return "\n".join(lines)
 
-    async def _generate_llm_message(
+    def _build_llm_prompt(
         self,
         search_results: SearchResults,
         analyzed_location: AnalyzedLocation,
         summary: Dict[str, Any]
     ) -> str:
         """
-        LLM 기반 메시지 생성
+        LLM 추천 메시지 프롬프트 생성
+
+        검색 결과 요약으로만 구성되므로 프롬프트 fingerprint 가 메시지 캐시 키가 된다.
+        (실행 시간 등 요청마다 달라지는 값은 포함하지 않음)
 
         Args:
             search_results: 검색 결과
@@ -381,22 +404,17 @@ class ResponseGenerator:
             summary: 요약 정보
 
         Returns:
-            LLM이 생성한 메시지 문자열
+            프롬프트 문자열
         """
-        if not self.use_llm:
-            return self._generate_template_message(search_results, analyzed_location, summary)
+        # 상위 5개 장소 정보
+        top_locations = []
+        for loc in search_results.locations[:5]:
+            table = loc.get('_table')
+            title = self._extract_title(loc, table)
+            distance = loc.get('distance_formatted', '')
+            top_locations.append(f"- {title} ({distance})")
 
-        try:
-            # 상위 5개 장소 정보
-            top_locations = []
-            for loc in search_results.locations[:5]:
-                table = loc.get('_table')
-                title = self._extract_title(loc, table)
-                distance = loc.get('distance_formatted', '')
-                top_locations.append(f"- {title} ({distance})")
-
-            # 프롬프트 생성
-            prompt = f"""당신은 서울시 문화/공공시설 추천 도우미입니다.
+        return f"""당신은 서울시 문화/공공시설 추천 도우미입니다.
 
 사용자가 '{analyzed_location.address or '특정 위치'}' 주변 {summary['search_radius_km']}km 내에서 검색했습니다.
 
@@ -416,14 +434,6 @@ class ResponseGenerator:
 
 한국어로 3-5문장 정도로 간결하게 작성하세요."""
 
-            # LLM 호출
-            response = await self.llm.ainvoke(prompt)
-            return response.content.strip()
-
-        except Exception as e:
-            logger.error(f"LLM message generation failed: {e}")
-            return self._generate_template_message(search_results, analyzed_location, summary)
-
     async def generate_batch(
         self,
         results_list: List[SearchResults],
@@ -3,14 +3,21 @@ ServiceFetcher Agent
 서비스 조회 에이전트 - Supabase 데이터 조회 및 거리 계산
 """
 
+import asyncio
 import logging
-from typing import Optional, List, Dict, Any
+from collections import defaultdict
+from typing import Optional, List, Dict, Any, AsyncIterator, Tuple
 import time
 
+from app.core.config import settings
 from app.core.workflow.state import AnalyzedLocation, SearchResults
-from app.db.supabase_client import get_supabase_client
+from app.db.supabase_client import get_supabase_client, get_supabase_breaker
 from app.core.services.redis_service import get_redis_service
+from app.core.services.spatial_index import get_spatial_index, COORDINATE_COLUMNS
+from app.core.services.single_flight import get_single_flight
+from app.core.services.timing import span
 from app.core.services.distance_service import (
+    calculate_bounding_box,
     calculate_distance_to_point,
     sort_by_distance,
     format_distance
@@ -18,16 +25,21 @@ from app.core.services.distance_service import (
 
 logger = logging.getLogger(__name__)
 
+# PostgREST 알 수 없는 컬럼 오류 코드 (PostgreSQL undefined_column, 스키마 캐시에 없는 컬럼)
+UNKNOWN_COLUMN_ERROR_CODES = {'42703', 'PGRST204'}
+
 
 class ServiceFetcher:
     """
     서비스 조회 에이전트
 
     기능:
-    1. Redis 캐시 조회 (캐시 히트 시 즉시 반환)
-    2. Supabase PostGIS 공간 쿼리
-    3. Haversine 거리 계산 및 정렬
-    4. Redis 캐시 저장 (TTL 5분)
+    1. 인메모리 공간 인덱스 조회 (구축된 경우 즉시 반환)
+    2. Redis 캐시 조회 (캐시 히트 시 즉시 반환)
+    3. 그리드 셀 캐시 (셀별 후보 목록 재사용, 없는 셀만 Supabase 조회)
+    4. Supabase PostGIS 공간 쿼리
+    5. Haversine 거리 계산 및 정렬
+    6. Redis 캐시 저장 (TTL 5분)
     """
 
     # 테이블명 매핑
@@ -39,10 +51,42 @@ class ServiceFetcher:
         'public_reservations': 'public_reservations'
     }
 
+    # 테이블별 조회 컬럼 (scripts/init_supabase_schema.sql 기준)
+    # location(geography), created_at/updated_at, data_source 는 응답에 쓰이지 않으므로 제외
+    SELECT_COLUMNS = {
+        'cultural_events': (
+            'id,api_id,title,codename,guname,place,org_name,use_trgt,use_fee,player,'
+            'program,etc_desc,org_link,main_img,rgstdate,ticket,strtdate,end_date,'
+            'themecode,lot,lat,is_free,hmpg_addr'
+        ),
+        'libraries': (
+            'id,api_id,library_name,library_type,guname,address,tel,homepage,'
+            'latitude,longitude,opertime,closing_day,book_count,seat_count,facilities'
+        ),
+        'cultural_spaces': (
+            'id,api_id,fac_name,guname,subjcode,fac_code,codename,addr,zipcode,telno,'
+            'homepage,restroomyn,parking_info,main_purps,latitude,longitude'
+        ),
+        'future_heritages': (
+            'id,api_id,no,main_category,sub_category,name,year_designated,gu_name,'
+            'dong_name,address,latitude,longitude,description,reason,main_img'
+        ),
+        'public_reservations': (
+            'id,api_id,service_type,svcid,maxclassnm,minclassnm,svcstatnm,svcnm,'
+            'payatnm,placenm,usetgtinfo,svcurl,x_coord,y_coord,svcopnbgndt,svcopnenddt,'
+            'rcptbgndt,rcptenddt,areanm,imgurl,dtlcont,telno,v_max,v_min,revstddaynm,revstdday'
+        )
+    }
+
     def __init__(self):
         """ServiceFetcher 초기화"""
         self.supabase = get_supabase_client()
+        self.supabase_breaker = get_supabase_breaker()
         self.redis = get_redis_service()
+        self.spatial_index = get_spatial_index()
+        self.single_flight = get_single_flight()
+        # 컬럼 프로젝션이 실패한 테이블 (스키마 불일치 시 '*'로 조회)
+        self._projection_disabled: set = set()
         logger.info("ServiceFetcher initialized")
 
     async def fetch(
@@ -63,96 +107,488 @@ class ServiceFetcher:
         start_time = time.time()
 
         try:
-            # 1. Redis 캐시 조회
-            cached = await self._check_cache(analyzed_location)
-            if cached:
-                execution_time = time.time() - start_time
-                logger.info(f"Cache HIT - Execution time: {execution_time:.3f}s")
-                return SearchResults(
-                    locations=cached,
-                    total=len(cached),
+            # 0. 공간 인덱스 조회 (Supabase/Redis 왕복 없음)
+            if settings.SPATIAL_INDEX_ENABLED and self.spatial_index.is_ready:
+                indexed = self.spatial_index.query(
+                    analyzed_location.latitude,
+                    analyzed_location.longitude,
+                    analyzed_location.radius,
                     category=analyzed_location.category,
-                    search_center={
-                        'latitude': analyzed_location.latitude,
-                        'longitude': analyzed_location.longitude
-                    },
-                    search_radius=analyzed_location.radius,
-                    execution_time=execution_time
+                    limit=limit
                 )
+                execution_time = time.time() - start_time
+                logger.info(
+                    f"Spatial index HIT - {len(indexed)} locations "
+                    f"in {execution_time:.4f}s"
+                )
+                return self._build_results(analyzed_location, indexed, execution_time)
+
+            # 1~4. 캐시/Supabase 조회 (같은 쿼리의 동시 요청은 한 번만 계산)
+            if settings.SINGLE_FLIGHT_ENABLED:
+                final_locations = await self.single_flight.do(
+                    self._flight_key(analyzed_location, limit),
+                    lambda: self._search(analyzed_location, limit)
+                )
+            else:
+                final_locations = await self._search(analyzed_location, limit)
 
-            # 2. Supabase 쿼리
-            locations = await self._fetch_from_supabase(
-                analyzed_location,
-                limit
+            execution_time = time.time() - start_time
+            logger.info(
+                f"Fetched {len(final_locations)} locations "
+                f"in {execution_time:.3f}s"
             )
 
-            if not locations:
+            return self._build_results(analyzed_location, final_locations, execution_time)
+
+        except Exception as e:
+            logger.error(f"Service fetch failed: {e}")
+            return None
+
+    def _flight_key(
+        self,
+        analyzed_location: AnalyzedLocation,
+        limit: int
+    ) -> str:
+        """
+        Single-flight 병합 키 (정규화된 쿼리 = 캐시 키 + limit)
+
+        Args:
+            analyzed_location: 분석된 위치
+            limit: 최대 결과 개수
+
+        Returns:
+            병합 키
+        """
+        cache_key = self._location_key(analyzed_location)
+        return f"{cache_key}:{limit}"
+
+    async def _search(
+        self,
+        analyzed_location: AnalyzedLocation,
+        limit: int
+    ) -> List[Dict[str, Any]]:
+        """
+        캐시 조회 후 미스 시 Supabase 조회 및 캐시 저장
+
+        Args:
+            analyzed_location: 분석된 위치
+            limit: 최대 결과 개수
+
+        Returns:
+            거리순 정렬된 위치 리스트
+        """
+        # 1. 그리드 셀 캐시 (셀 수가 한도를 넘으면 좌표 키 캐시로 진행)
+        #    PostGIS RPC 사용 시에는 서버 측 반경 검색이 더 효율적이므로 셀 캐시를 건너뛰고
+        #    좌표 키 캐시 + RPC (+ 워커 간 락) 경로 사용
+        if settings.CELL_CACHE_ENABLED and not settings.NEARBY_RPC_ENABLED and self.redis.enabled:
+            cell_locations = await self._search_cells(analyzed_location, limit)
+            if cell_locations is not None:
+                logger.info(f"Cell cache search: {len(cell_locations)} locations")
+                return cell_locations
+
+        # 2. Redis 캐시 조회 (soft 만료된 값은 응답 후 백그라운드 갱신)
+        cached = await self._check_cache(analyzed_location, limit)
+        if cached:
+            logger.info("Cache HIT")
+            return cached
+
+        # 워커 간 병합: 다른 워커가 같은 쿼리를 계산 중이면 캐시 저장을 대기
+        lock_name = None
+        token = None
+        if settings.SINGLE_FLIGHT_REDIS_LOCK and self.redis.enabled:
+            lock_name = self._flight_key(analyzed_location, limit)
+            token = await self.redis.acquire_lock(lock_name, settings.SINGLE_FLIGHT_LOCK_TTL)
+            if token is None:
+                cached = await self._wait_for_cache(analyzed_location, limit, lock_name)
+                if cached:
+                    return cached
+
+        try:
+            # 3. Supabase 조회 (반경 필터링, 거리순 정렬, limit 적용)
+            started = time.monotonic()
+            final_locations = await self._search_supabase(analyzed_location, limit)
+
+            if not final_locations:
                 logger.warning("No locations found")
-                return SearchResults(
-                    locations=[],
-                    total=0,
-                    category=analyzed_location.category,
-                    search_center={
-                        'latitude': analyzed_location.latitude,
-                        'longitude': analyzed_location.longitude
-                    },
-                    search_radius=analyzed_location.radius,
-                    execution_time=time.time() - start_time
-                )
+                return []
 
-            # 3. 거리 계산 및 정렬
-            locations_with_distance = self._add_distances(
-                locations,
-                analyzed_location.latitude,
-                analyzed_location.longitude
+            # 4. Redis 캐시 저장
+            await self._save_cache(
+                analyzed_location, final_locations, time.monotonic() - started
             )
+            return final_locations
 
-            # 4. 반경 내 필터링
-            filtered = [
-                loc for loc in locations_with_distance
-                if loc.get('distance') is not None and loc.get('distance') <= analyzed_location.radius
-            ]
+        finally:
+            if token is not None:
+                await self.redis.release_lock(lock_name, token)
 
-            # 5. 거리순 정렬
-            sorted_locations = sort_by_distance(filtered, ascending=True)
+    async def _wait_for_cache(
+        self,
+        analyzed_location: AnalyzedLocation,
+        limit: int,
+        lock_name: str
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        다른 워커의 캐시 저장 대기 (락 해제 또는 대기 시간 초과 시 중단)
 
-            # 6. Limit 적용
-            final_locations = sorted_locations[:limit]
+        Args:
+            analyzed_location: 분석된 위치
+            limit: 최대 결과 개수
+            lock_name: 다른 워커가 보유한 락 이름
 
-            # 7. Redis 캐시 저장
-            await self._save_cache(analyzed_location, final_locations)
+        Returns:
+            캐시된 위치 리스트 또는 None (직접 조회 필요)
+        """
+        deadline = time.monotonic() + settings.SINGLE_FLIGHT_LOCK_WAIT
 
-            execution_time = time.time() - start_time
-            logger.info(
-                f"Fetched {len(final_locations)} locations "
-                f"in {execution_time:.3f}s"
+        while time.monotonic() < deadline:
+            await asyncio.sleep(settings.SINGLE_FLIGHT_POLL_INTERVAL)
+
+            cached = await self._check_cache(analyzed_location, limit)
+            if cached:
+                logger.info("Cache filled by another worker")
+                return cached
+
+            if not await self.redis.is_locked(lock_name):
+                return await self._check_cache(analyzed_location, limit)
+
+        logger.warning(f"Single-flight lock wait timed out: {lock_name}")
+        return None
+
+    def _build_results(
+        self,
+        analyzed_location: AnalyzedLocation,
+        locations: List[Dict[str, Any]],
+        execution_time: float
+    ) -> SearchResults:
+        """
+        SearchResults 생성
+
+        Args:
+            analyzed_location: 분석된 위치
+            locations: 최종 위치 리스트
+            execution_time: 실행 시간 (초)
+
+        Returns:
+            SearchResults
+        """
+        return SearchResults(
+            locations=locations,
+            total=len(locations),
+            category=analyzed_location.category,
+            search_center={
+                'latitude': analyzed_location.latitude,
+                'longitude': analyzed_location.longitude
+            },
+            search_radius=analyzed_location.radius,
+            execution_time=execution_time
+        )
+
+    async def _search_supabase(
+        self,
+        analyzed_location: AnalyzedLocation,
+        limit: int
+    ) -> List[Dict[str, Any]]:
+        """
+        Supabase 반경 검색
+
+        nearby_services RPC(PostGIS)가 활성화되어 있으면 서버에서 반경 필터링과
+        정렬을 처리하고, 실패하거나 비활성화된 경우 테이블 조회 후 Python에서 계산
+
+        Args:
+            analyzed_location: 분석된 위치
+            limit: 최대 결과 개수
+
+        Returns:
+            거리순 정렬된 위치 리스트 (최대 limit개)
+        """
+        if settings.NEARBY_RPC_ENABLED:
+            locations = await self._fetch_from_rpc(analyzed_location, limit)
+            if locations is not None:
+                return locations
+
+        locations = await self._fetch_from_supabase(analyzed_location, limit)
+        return self._rank(locations, analyzed_location, limit)
+
+    def _rank(
+        self,
+        locations: List[Dict[str, Any]],
+        analyzed_location: AnalyzedLocation,
+        limit: int
+    ) -> List[Dict[str, Any]]:
+        """
+        후보 위치의 거리 계산, 반경 필터링, 거리순 정렬
+
+        Args:
+            locations: 후보 위치 리스트 (거리 필드가 추가됨)
+            analyzed_location: 분석된 위치
+            limit: 최대 결과 개수
+
+        Returns:
+            거리순 정렬된 위치 리스트 (최대 limit개)
+        """
+        if not locations:
+            return []
+
+        # 거리 계산
+        locations_with_distance = self._add_distances(
+            locations,
+            analyzed_location.latitude,
+            analyzed_location.longitude
+        )
+
+        # 반경 내 필터링
+        filtered = [
+            loc for loc in locations_with_distance
+            if loc.get('distance') is not None and loc.get('distance') <= analyzed_location.radius
+        ]
+
+        # 거리순 정렬 후 limit 적용
+        return sort_by_distance(filtered, ascending=True)[:limit]
+
+    async def _search_cells(
+        self,
+        analyzed_location: AnalyzedLocation,
+        limit: int
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        그리드 셀 캐시 기반 반경 검색
+
+        검색 범위를 덮는 셀별 후보 목록을 한 번에 조회하고, 캐시에 없는 셀만
+        Supabase에서 가져와 저장한다. 합친 후보는 정확한 반경으로 다시 필터링하므로
+        좌표가 조금 다르거나 반경이 달라도 같은 셀 캐시를 재사용한다.
+
+        Args:
+            analyzed_location: 분석된 위치
+            limit: 최대 결과 개수
+
+        Returns:
+            거리순 정렬된 위치 리스트, 셀 수가 한도를 넘으면 None
+        """
+        cell_size = settings.CELL_CACHE_SIZE
+        cells = self.redis.covering_cells(
+            analyzed_location.latitude,
+            analyzed_location.longitude,
+            analyzed_location.radius,
+            cell_size
+        )
+        if len(cells) > settings.CELL_CACHE_MAX_CELLS:
+            return None
+
+        tables = self._resolve_tables(analyzed_location.category)
+        entries = [
+            (table, cell, self.redis.generate_cell_key(table, cell, cell_size))
+            for table in tables
+            for cell in cells
+        ]
+
+        keys = [key for _, _, key in entries]
+        if settings.SWR_ENABLED:
+            # soft 만료/조기 갱신 대상 셀은 응답 후 백그라운드에서 다시 채움
+            cells_by_key = {key: (table, cell) for table, cell, key in entries}
+            cached = await self.redis.amget_swr(
+                keys,
+                lambda due: self._reload_cells([cells_by_key[key] for key in due]),
+                ttl=settings.CELL_CACHE_TTL
             )
+        else:
+            cached = await self.redis.amget(keys)
+
+        candidates = []
+        missing: Dict[str, List[Tuple[int, int]]] = defaultdict(list)
+        for (table, cell, _), rows in zip(entries, cached):
+            if rows is None:
+                missing[table].append(cell)
+            else:
+                candidates.extend(rows)
+
+        missed = sum(len(table_cells) for table_cells in missing.values())
+        logger.info(f"Cell cache: {len(entries) - missed}/{len(entries)} cells hit")
+
+        if missing:
+            candidates.extend(await self._fetch_cells(missing))
+
+        # 캐시된 행은 공유 객체이므로 복사 후 거리 필드 추가
+        return self._rank([dict(row) for row in candidates], analyzed_location, limit)
+
+    async def _fetch_cells(
+        self,
+        missing: Dict[str, List[Tuple[int, int]]]
+    ) -> List[Dict[str, Any]]:
+        """
+        캐시에 없는 셀의 후보 행을 Supabase에서 조회 후 셀별로 저장
+
+        Args:
+            missing: {테이블명: 누락 셀 인덱스 리스트}
+
+        Returns:
+            누락 셀에 속한 행 리스트
+        """
+        started = time.monotonic()
+        to_cache = await self._load_cells(missing)
+
+        if settings.SWR_ENABLED:
+            await self.redis.amset_swr(
+                to_cache, ttl=settings.CELL_CACHE_TTL, delta=time.monotonic() - started
+            )
+        else:
+            await self.redis.amset(to_cache, ttl=settings.CELL_CACHE_TTL)
+
+        return [row for rows in to_cache.values() for row in rows]
+
+    async def _reload_cells(
+        self,
+        cells: List[Tuple[str, Tuple[int, int]]]
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        셀 캐시 백그라운드 갱신용 재조회 (저장은 호출 측 RedisService가 수행)
+
+        Args:
+            cells: [(테이블명, 셀 인덱스)] 리스트
+
+        Returns:
+            {셀 캐시 키: 행 리스트}
+        """
+        missing: Dict[str, List[Tuple[int, int]]] = defaultdict(list)
+        for table, cell in cells:
+            missing[table].append(cell)
+        return await self._load_cells(missing)
+
+    async def _load_cells(
+        self,
+        missing: Dict[str, List[Tuple[int, int]]]
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        셀 후보 행을 Supabase에서 조회해 셀별로 분류
+
+        테이블마다 대상 셀 전체를 덮는 경계 상자로 한 번만 조회한다.
+        조회에 실패한 테이블의 셀은 결과에 포함하지 않는다 (빈 셀로 저장 방지).
 
-            return SearchResults(
-                locations=final_locations,
-                total=len(final_locations),
-                category=analyzed_location.category,
-                search_center={
-                    'latitude': analyzed_location.latitude,
-                    'longitude': analyzed_location.longitude
-                },
-                search_radius=analyzed_location.radius,
-                execution_time=execution_time
+        Args:
+            missing: {테이블명: 셀 인덱스 리스트}
+
+        Returns:
+            {셀 캐시 키: 행 리스트}
+        """
+        cell_size = settings.CELL_CACHE_SIZE
+        semaphore = asyncio.Semaphore(max(1, settings.SUPABASE_FETCH_CONCURRENCY))
+
+        def cells_bbox(cells: List[Tuple[int, int]]) -> tuple:
+            lat_indices = [i for i, _ in cells]
+            lon_indices = [j for _, j in cells]
+            return (
+                min(lat_indices) * cell_size,
+                (max(lat_indices) + 1) * cell_size,
+                min(lon_indices) * cell_size,
+                (max(lon_indices) + 1) * cell_size
             )
 
+        tables = list(missing)
+        results = await asyncio.gather(*[
+            self._fetch_table(table, cells_bbox(missing[table]), semaphore)
+            for table in tables
+        ])
+
+        to_cache: Dict[str, List[Dict[str, Any]]] = {}
+
+        for table, rows in zip(tables, results):
+            if rows is None:
+                continue
+
+            lat_key, lon_key = COORDINATE_COLUMNS[table]
+            buckets: Dict[Tuple[int, int], List[Dict[str, Any]]] = {
+                cell: [] for cell in missing[table]
+            }
+
+            for row in rows:
+                try:
+                    cell = self.redis.cell_index(
+                        float(row[lat_key]), float(row[lon_key]), cell_size
+                    )
+                except (KeyError, TypeError, ValueError):
+                    continue
+
+                # 경계 상자에 걸친 이미 캐시된 셀의 행은 제외
+                if cell in buckets:
+                    buckets[cell].append(row)
+
+            for cell, cell_rows in buckets.items():
+                to_cache[self.redis.generate_cell_key(table, cell, cell_size)] = cell_rows
+
+        return to_cache
+
+    async def _fetch_from_rpc(
+        self,
+        analyzed_location: AnalyzedLocation,
+        limit: int
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        nearby_services RPC 호출 (ST_DWithin + KNN 정렬)
+
+        scripts/create_nearby_services_function.sql 참고
+
+        Args:
+            analyzed_location: 분석된 위치
+            limit: 최대 결과 개수
+
+        Returns:
+            거리순 정렬된 위치 리스트, RPC 실패/타임아웃 시 None
+        """
+        params = {
+            'center_lat': analyzed_location.latitude,
+            'center_lon': analyzed_location.longitude,
+            'radius_m': analyzed_location.radius,
+            'category': analyzed_location.category,
+            'result_limit': limit
+        }
+
+        if not self.supabase_breaker.allow():
+            return None
+
+        try:
+            # 동기 클라이언트 호출이 이벤트 루프를 막지 않도록 스레드에서 실행
+            with span("supabase", rpc="nearby_services"):
+                response = await asyncio.wait_for(
+                    asyncio.to_thread(lambda: self.supabase.rpc('nearby_services', params).execute()),
+                    timeout=settings.SUPABASE_TABLE_TIMEOUT
+                )
+        except asyncio.TimeoutError as e:
+            self.supabase_breaker.record_failure(e)
+            logger.warning(
+                f"nearby_services RPC timed out after {settings.SUPABASE_TABLE_TIMEOUT}s, "
+                f"falling back to table scan"
+            )
+            return None
         except Exception as e:
-            logger.error(f"Service fetch failed: {e}")
+            self._record_supabase_error(e)
+            logger.error(f"nearby_services RPC failed, falling back to table scan: {e}")
             return None
 
+        self.supabase_breaker.record_success()
+
+        locations = []
+        for row in response.data or []:
+            location = dict(row.get('data') or {})
+            distance = row.get('distance')
+            location['_table'] = row.get('table_name')
+            location['distance'] = round(distance, 2) if distance is not None else None
+            location['distance_formatted'] = format_distance(distance) if distance is not None else None
+            locations.append(location)
+
+        logger.info(f"Fetched {len(locations)} locations via nearby_services RPC")
+        return locations
+
     async def _check_cache(
         self,
-        analyzed_location: AnalyzedLocation
+        analyzed_location: AnalyzedLocation,
+        limit: int = 20
     ) -> Optional[List[Dict[str, Any]]]:
         """
-        Redis 캐시 조회
+        Redis 캐시 조회 (SWR 사용 시 만료 임박/stale 값은 백그라운드에서 Supabase 재조회)
 
         Args:
             analyzed_location: 분석된 위치
+            limit: 최대 결과 개수 (백그라운드 갱신 시 사용)
 
         Returns:
             캐시된 위치 리스트 또는 None
@@ -161,21 +597,24 @@ class ServiceFetcher:
             return None
 
         # 캐시 키 생성
-        cache_key = self.redis.generate_cache_key(
-            analyzed_location.latitude,
-            analyzed_location.longitude,
-            analyzed_location.radius,
-            analyzed_location.category
-        )
+        cache_key = self._location_key(analyzed_location)
 
         # 캐시 조회
-        cached = self.redis.get(cache_key)
+        if settings.SWR_ENABLED:
+            return await self.redis.aget_swr(
+                cache_key,
+                lambda: self._search_supabase(analyzed_location, limit),
+                ttl=settings.REDIS_CACHE_TTL
+            )
+
+        cached = await self.redis.aget(cache_key)
         return cached
 
     async def _save_cache(
         self,
         analyzed_location: AnalyzedLocation,
-        locations: List[Dict[str, Any]]
+        locations: List[Dict[str, Any]],
+        compute_time: float = 0.0
     ) -> bool:
         """
         Redis 캐시 저장
@@ -183,6 +622,7 @@ class ServiceFetcher:
         Args:
             analyzed_location: 분석된 위치
             locations: 위치 리스트
+            compute_time: 조회 소요 시간 (초, 조기 갱신 확률에 사용)
 
         Returns:
             성공 여부
@@ -191,15 +631,15 @@ class ServiceFetcher:
             return False
 
         # 캐시 키 생성
-        cache_key = self.redis.generate_cache_key(
-            analyzed_location.latitude,
-            analyzed_location.longitude,
-            analyzed_location.radius,
-            analyzed_location.category
-        )
+        cache_key = self._location_key(analyzed_location)
+
+        # 캐시 저장 (TTL 5분, SWR 사용 시 soft TTL 이후 stale 허용 구간 추가)
+        if settings.SWR_ENABLED:
+            return await self.redis.aset_swr(
+                cache_key, locations, ttl=settings.REDIS_CACHE_TTL, delta=compute_time
+            )
 
-        # 캐시 저장 (TTL 5분)
-        return self.redis.set(cache_key, locations, ttl=300)
+        return await self.redis.aset(cache_key, locations, ttl=settings.REDIS_CACHE_TTL)
 
     async def _fetch_from_supabase(
         self,
@@ -216,38 +656,153 @@ class ServiceFetcher:
         Returns:
             위치 리스트
         """
-        # 카테고리 결정
-        if analyzed_location.category:
-            tables = [self.TABLE_MAP.get(analyzed_location.category)]
-        else:
-            # 전체 테이블 조회
-            tables = list(self.TABLE_MAP.values())
+        tables = self._resolve_tables(analyzed_location.category)
+
+        # 경계 상자를 각 테이블의 좌표 컬럼 범위 필터로 변환 (좌표 인덱스 사용)
+        bbox = calculate_bounding_box(
+            analyzed_location.latitude,
+            analyzed_location.longitude,
+            analyzed_location.radius
+        )
+
+        semaphore = asyncio.Semaphore(max(1, settings.SUPABASE_FETCH_CONCURRENCY))
+
+        # 테이블별 쿼리를 스레드에서 동시 실행 (동기 클라이언트가 이벤트 루프를 막지 않도록)
+        results = await asyncio.gather(*[
+            self._fetch_table(table, bbox, semaphore) for table in tables
+        ])
 
         all_locations = []
+        for rows in results:
+            all_locations.extend(rows or [])
 
-        for table in tables:
-            if not table:
-                continue
+        logger.info(f"Fetched {len(all_locations)} candidate locations from Supabase")
+        return all_locations
+
+    async def _fetch_table(
+        self,
+        table: str,
+        bbox: tuple,
+        semaphore: asyncio.Semaphore
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        단일 테이블 조회 (타임아웃 적용)
+
+        타임아웃이나 오류가 발생한 테이블은 None을 반환하여
+        나머지 테이블 결과만으로 응답할 수 있게 한다.
+
+        Args:
+            table: 테이블명
+            bbox: (min_lat, max_lat, min_lon, max_lon)
+            semaphore: 동시 쿼리 수 제한
+
+        Returns:
+            후보 행 리스트 (_table 포함), 타임아웃/오류/서킷 open 시 None
+        """
+        if not self.supabase_breaker.allow():
+            logger.warning(f"Supabase circuit open, skipping table {table}")
+            return None
 
+        async with semaphore:
             try:
-                # PostGIS 공간 쿼리는 복잡하므로 전체 조회 후 필터링
-                # (Supabase Python 클라이언트는 ST_DWithin 직접 지원 안 함)
                 logger.debug(f"Querying table: {table}")
 
-                response = self.supabase.table(table).select('*').execute()
+                with span("supabase", table=table):
+                    rows = await asyncio.wait_for(
+                        asyncio.to_thread(self._query_table, table, bbox),
+                        timeout=settings.SUPABASE_TABLE_TIMEOUT
+                    )
 
-                if response.data:
-                    # 테이블명 추가
-                    for item in response.data:
-                        item['_table'] = table
-                    all_locations.extend(response.data)
+            except asyncio.TimeoutError as e:
+                self.supabase_breaker.record_failure(e)
+                logger.warning(
+                    f"Supabase query timed out for table {table} "
+                    f"after {settings.SUPABASE_TABLE_TIMEOUT}s, skipping"
+                )
+                return None
 
             except Exception as e:
+                self._record_supabase_error(e)
                 logger.error(f"Supabase query failed for table {table}: {e}")
-                continue
+                return None
 
-        logger.info(f"Fetched {len(all_locations)} raw locations from Supabase")
-        return all_locations
+        self.supabase_breaker.record_success()
+
+        # 테이블명 추가
+        rows = rows or []
+        for item in rows:
+            item['_table'] = table
+        return rows
+
+    def _record_supabase_error(self, error: Exception):
+        """
+        Supabase 오류를 서킷 브레이커에 집계
+
+        PostgREST 가 코드와 함께 반환한 오류(스키마/쿼리 문제)는 서버가 응답한 것이므로
+        장애로 보지 않고, 코드 없는 네트워크/연결 오류만 실패로 집계한다.
+
+        Args:
+            error: 발생한 예외
+        """
+        if getattr(error, 'code', None):
+            self.supabase_breaker.record_success()
+        else:
+            self.supabase_breaker.record_failure(error)
+
+    def _resolve_tables(self, category: Optional[str]) -> List[str]:
+        """
+        카테고리에 해당하는 조회 대상 테이블
+
+        Args:
+            category: 카테고리 (None이면 전체)
+
+        Returns:
+            테이블명 리스트
+        """
+        if category:
+            table = self.TABLE_MAP.get(category)
+            return [table] if table else []
+
+        # 전체 테이블 조회
+        return list(self.TABLE_MAP.values())
+
+    def _query_table(
+        self,
+        table: str,
+        bbox: tuple
+    ) -> List[Dict[str, Any]]:
+        """
+        경계 상자 내 후보 행 조회
+
+        Args:
+            table: 테이블명
+            bbox: (min_lat, max_lat, min_lon, max_lon)
+
+        Returns:
+            후보 행 리스트 (정확한 반경 필터링 전)
+        """
+        min_lat, max_lat, min_lon, max_lon = bbox
+        lat_col, lon_col = COORDINATE_COLUMNS[table]
+
+        def run(columns: str):
+            return self.supabase.table(table).select(columns) \
+                .gte(lat_col, min_lat).lte(lat_col, max_lat) \
+                .gte(lon_col, min_lon).lte(lon_col, max_lon) \
+                .execute()
+
+        if table in self._projection_disabled:
+            return run('*').data
+
+        try:
+            return run(self.SELECT_COLUMNS[table]).data
+        except Exception as e:
+            # 실제 스키마에 없는 컬럼이 있을 때만 전체 컬럼으로 재시도
+            # (타임아웃/네트워크/5xx 오류는 그대로 전달해 프로젝션 유지)
+            if getattr(e, 'code', None) not in UNKNOWN_COLUMN_ERROR_CODES:
+                raise
+            logger.warning(f"Column projection failed for table {table}, using '*': {e}")
+            self._projection_disabled.add(table)
+            return run('*').data
 
     def _add_distances(
         self,
@@ -304,6 +859,10 @@ class ServiceFetcher:
         """
         카테고리별 조회
 
+        Redis 캐시 사용 시 모든 카테고리 키를 한 번의 MGET 으로 조회하고,
+        미스된 카테고리만 Supabase에서 동시에 조회한 뒤 한 번의 파이프라인으로 저장한다.
+        (공간 인덱스 사용 중이거나 Redis가 비활성화된 경우 카테고리별 fetch)
+
         Args:
             analyzed_location: 분석된 위치
             categories: 카테고리 리스트
@@ -312,25 +871,181 @@ class ServiceFetcher:
         Returns:
             {category: SearchResults} 딕셔너리
         """
-        results = {}
-
-        for category in categories:
-            # 임시 AnalyzedLocation 생성
-            temp_location = AnalyzedLocation(
-                latitude=analyzed_location.latitude,
-                longitude=analyzed_location.longitude,
-                address=analyzed_location.address,
-                radius=analyzed_location.radius,
-                category=category,
-                source=analyzed_location.source,
-                confidence=analyzed_location.confidence
+        locations = {
+            category: self._with_category(analyzed_location, category)
+            for category in categories
+        }
+
+        use_index = settings.SPATIAL_INDEX_ENABLED and self.spatial_index.is_ready
+        if use_index or not self.redis.enabled:
+            fetched = await asyncio.gather(*[
+                self.fetch(location, limit=limit_per_category)
+                for location in locations.values()
+            ])
+            return {
+                category: result
+                for category, result in zip(locations, fetched)
+                if result
+            }
+
+        start_time = time.time()
+        try:
+            found = await self._search_categories(locations, limit_per_category)
+        except Exception as e:
+            logger.error(f"Multi-category fetch failed: {e}")
+            return {}
+
+        execution_time = time.time() - start_time
+        logger.info(
+            f"Fetched {len(categories)} categories "
+            f"({sum(len(rows) for rows in found.values())} locations) in {execution_time:.3f}s"
+        )
+        return {
+            category: self._build_results(locations[category], found[category], execution_time)
+            for category in locations
+        }
+
+    async def stream_by_category(
+        self,
+        analyzed_location: AnalyzedLocation,
+        categories: List[str],
+        limit_per_category: int = 20
+    ) -> AsyncIterator[Tuple[str, Optional[SearchResults]]]:
+        """
+        카테고리별 동시 조회 후 완료 순서대로 반환 (스트리밍 응답용)
+
+        카테고리마다 fetch 경로(공간 인덱스 / 캐시 / Supabase)를 그대로 사용하므로
+        느린 테이블이 빠른 테이블의 결과 전달을 막지 않는다.
+        반복을 중단하면(클라이언트 연결 종료 등) 남은 조회는 취소된다.
+
+        Args:
+            analyzed_location: 분석된 위치
+            categories: 카테고리 리스트
+            limit_per_category: 카테고리당 최대 개수
+
+        Yields:
+            (카테고리, SearchResults 또는 None)
+        """
+        async def fetch_category(category: str) -> Tuple[str, Optional[SearchResults]]:
+            location = analyzed_location
+            if location.category != category:
+                location = self._with_category(analyzed_location, category)
+            return category, await self.fetch(location, limit=limit_per_category)
+
+        tasks = [asyncio.ensure_future(fetch_category(category)) for category in categories]
+        try:
+            for completed in asyncio.as_completed(tasks):
+                yield await completed
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def _with_category(
+        self,
+        analyzed_location: AnalyzedLocation,
+        category: str
+    ) -> AnalyzedLocation:
+        """카테고리만 바꾼 AnalyzedLocation"""
+        return AnalyzedLocation(
+            latitude=analyzed_location.latitude,
+            longitude=analyzed_location.longitude,
+            address=analyzed_location.address,
+            radius=analyzed_location.radius,
+            category=category,
+            source=analyzed_location.source,
+            confidence=analyzed_location.confidence
+        )
+
+    def _location_key(self, analyzed_location: AnalyzedLocation) -> str:
+        """좌표 키 캐시 키 (_check_cache/_save_cache 와 같은 키)"""
+        return self.redis.generate_cache_key(
+            analyzed_location.latitude,
+            analyzed_location.longitude,
+            analyzed_location.radius,
+            analyzed_location.category
+        )
+
+    async def _search_categories(
+        self,
+        locations: Dict[str, AnalyzedLocation],
+        limit: int
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        여러 카테고리 캐시 일괄 조회 (MGET 1회) 후 미스만 Supabase 조회 및 일괄 저장 (파이프라인 1회)
+
+        Args:
+            locations: {카테고리: 분석된 위치}
+            limit: 카테고리당 최대 개수
+
+        Returns:
+            {카테고리: 거리순 정렬된 위치 리스트}
+        """
+        keys = {category: self._location_key(location) for category, location in locations.items()}
+        categories_by_key = {key: category for category, key in keys.items()}
+
+        # 1. 전체 카테고리 키 단일 왕복 조회 (SWR 사용 시 stale 키는 백그라운드에서 일괄 갱신)
+        if settings.SWR_ENABLED:
+            cached = await self.redis.amget_swr(
+                list(keys.values()),
+                lambda due: self._reload_categories(
+                    {categories_by_key[key]: locations[categories_by_key[key]] for key in due},
+                    limit
+                ),
+                ttl=settings.REDIS_CACHE_TTL
             )
+        else:
+            cached = await self.redis.amget(list(keys.values()))
+
+        found = {
+            category: value
+            for category, value in zip(keys, cached)
+            if value
+        }
+        missing = {category: locations[category] for category in keys if category not in found}
+        logger.info(f"Multi-category cache: {len(found)} hits, {len(missing)} misses")
+
+        if not missing:
+            return found
+
+        # 2. 미스 카테고리 동시 조회 후 단일 파이프라인 저장
+        started = time.monotonic()
+        fetched = await self._reload_categories(missing, limit)
+        compute_time = time.monotonic() - started
 
-            result = await self.fetch(temp_location, limit=limit_per_category)
-            if result:
-                results[category] = result
+        if fetched:
+            if settings.SWR_ENABLED:
+                await self.redis.amset_swr(fetched, ttl=settings.REDIS_CACHE_TTL, delta=compute_time)
+            else:
+                await self.redis.amset(fetched, ttl=settings.REDIS_CACHE_TTL)
+
+        for category in missing:
+            found[category] = fetched.get(keys[category], [])
+        return found
+
+    async def _reload_categories(
+        self,
+        locations: Dict[str, AnalyzedLocation],
+        limit: int
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        카테고리별 Supabase 동시 조회 (저장은 호출 측에서 일괄 수행)
+
+        Args:
+            locations: {카테고리: 분석된 위치}
+            limit: 카테고리당 최대 개수
 
-        return results
+        Returns:
+            {캐시 키: 위치 리스트} (결과가 없는 카테고리는 제외해 빈 값 저장 방지)
+        """
+        results = await asyncio.gather(*[
+            self._search_supabase(location, limit)
+            for location in locations.values()
+        ])
+        return {
+            self._location_key(location): rows
+            for location, rows in zip(locations.values(), results)
+            if rows
+        }
 
 
 # Convenience function
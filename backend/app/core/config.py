@@ -41,6 +41,13 @@ class Settings(BaseSettings):
 
     # Kakao API Configuration
     KAKAO_REST_API_KEY: Optional[str] = None
+    KAKAO_HTTP2: bool = True  # h2 패키지 필요 (없으면 HTTP/1.1)
+    KAKAO_MAX_CONNECTIONS: int = 20  # 공유 클라이언트 커넥션 풀 크기
+    KAKAO_MAX_KEEPALIVE_CONNECTIONS: int = 10
+    KAKAO_KEEPALIVE_EXPIRY: float = 30.0  # seconds
+    KAKAO_TIMEOUT: float = 10.0  # seconds
+    KAKAO_GEOCODE_HEDGE: bool = True  # 주소/키워드 검색 동시 요청 (False면 순차 폴백)
+    KAKAO_GEOCODE_PRIORITY: List[str] = ["address", "keyword"]  # 둘 다 결과가 있을 때 우선순위
 
     # Firebase Configuration (Optional)
     FIREBASE_DATABASE_URL: Optional[str] = None
@@ -51,9 +58,72 @@ class Settings(BaseSettings):
     OLLAMA_LLM_MODEL: Optional[str] = "llama3.1:8b"
     OLLAMA_EMBED_MODEL: Optional[str] = "bge-m3"
 
+    # LLM Message (use_llm=True 응답 메시지를 백그라운드에서 생성)
+    LLM_MESSAGE_CONCURRENCY: int = 2  # 동시 Ollama 호출 수 (나머지는 대기)
+    LLM_MESSAGE_MAX_PENDING: int = 100  # 대기 포함 최대 생성 작업 수 (초과 시 템플릿 메시지만)
+    LLM_MESSAGE_TIMEOUT: float = 60.0  # seconds (Ollama 요청)
+    LLM_MESSAGE_CACHE_TTL: int = 24 * 3600  # 검색 결과 fingerprint 별 생성 메시지 (메모리 + Redis)
+    LLM_MESSAGE_CACHE_MAX_BYTES: int = 4 * 1024 * 1024  # 4MB (메모리 LRU)
+    LLM_MESSAGE_FAILURE_TTL: int = 60  # seconds (생성 실패 상태 보관, 이후 같은 결과는 재시도)
+    LLM_MESSAGE_MAX_WAIT: float = 30.0  # seconds (메시지 조회 API 최대 대기)
+
     # Cache Configuration
     REDIS_CACHE_TTL: int = 300  # 5 minutes
     CACHE_ENABLED: bool = True
+    REDIS_MAX_CONNECTIONS: int = 20  # 비동기 클라이언트 커넥션 풀 크기
+    CACHE_SERIALIZER: str = "msgpack"  # msgpack | json (헤더 바이트로 구분, 변경해도 기존 엔트리 디코딩)
+    CACHE_COMPRESSION: str = "zstd"  # zstd | zlib | none
+    CACHE_COMPRESS_MIN_BYTES: int = 512  # 이보다 작은 값은 압축하지 않음
+    CACHE_COMPRESSION_LEVEL: int = 3
+
+    # L1 (In-process) Cache
+    L1_CACHE_ENABLED: bool = True
+    L1_CACHE_MAX_BYTES: int = 32 * 1024 * 1024  # 32MB (직렬화 크기 기준)
+    L1_CACHE_TTL: int = 60  # seconds (Redis TTL 이하로 유지)
+    CACHE_INVALIDATION_CHANNEL: str = "cache:invalidate"  # 워커 간 L1 무효화 pub/sub 채널
+
+    # Cache Invalidation (카테고리별 세대 카운터 + SCAN/UNLINK 정리)
+    CACHE_GENERATION_REFRESH: int = 30  # seconds (무효화 메시지 누락 대비 세대 재조회 주기)
+    CACHE_SWEEP_BATCH: int = 500  # SCAN COUNT 및 파이프라인당 UNLINK 개수
+
+    # Grid-cell Cache (좌표/반경이 달라도 셀 단위 후보 목록 재사용)
+    CELL_CACHE_ENABLED: bool = True
+    CELL_CACHE_SIZE: float = 0.01  # degrees (약 1.1km)
+    CELL_CACHE_MAX_CELLS: int = 49  # 테이블당 최대 셀 수 (초과 시 좌표 키 캐시 사용)
+    CELL_CACHE_TTL: int = 600  # seconds
+
+    # Stale-while-revalidate (soft 만료 후 stale 응답 + 백그라운드 갱신)
+    SWR_ENABLED: bool = True
+    SWR_STALE_TTL: int = 600  # seconds (soft 만료 후 stale 응답 허용 시간, hard TTL = TTL + 이 값)
+    SWR_XFETCH_BETA: float = 1.0  # 확률적 조기 갱신 강도 (0 = 조기 갱신 없음)
+    SWR_REFRESH_LOCK_TTL: int = 30000  # milliseconds (워커 간 갱신 중복 방지)
+
+    # Single-flight (동일 쿼리 동시 캐시 미스 병합)
+    SINGLE_FLIGHT_ENABLED: bool = True
+    SINGLE_FLIGHT_REDIS_LOCK: bool = False  # 워커 간 병합 (Redis 락 + 캐시 대기)
+    SINGLE_FLIGHT_LOCK_TTL: int = 10000  # milliseconds (보유 워커 장애 시 자동 해제)
+    SINGLE_FLIGHT_LOCK_WAIT: float = 5.0  # seconds (초과 시 직접 조회)
+    SINGLE_FLIGHT_POLL_INTERVAL: float = 0.05  # seconds
+
+    # Geocode Cache
+    GEOCODE_CACHE_MAX_BYTES: int = 4 * 1024 * 1024  # 4MB (메모리 LRU)
+    GEOCODE_CACHE_TTL: int = 30 * 24 * 3600  # 30 days (주소 → 좌표)
+    GEOCODE_NEGATIVE_CACHE_TTL: int = 3600  # 1 hour (결과 없는 주소)
+    GEOCODE_BATCH_MAX_SIZE: int = 500  # 배치 지오코딩 요청당 최대 주소 수
+    GEOCODE_BATCH_CONCURRENCY: int = 8  # 배치 지오코딩 동시 Kakao 요청 수
+    REVERSE_GEOCODE_PRECISION: int = 4  # 좌표 반올림 자릿수 (약 11m)
+    REVERSE_GEOCODE_CACHE_TTL: int = 7 * 24 * 3600  # 7 days
+
+    # Circuit Breaker (Redis / Kakao / Supabase 장애 시 즉시 실패)
+    CIRCUIT_BREAKER_FAILURE_THRESHOLD: int = 5  # open 으로 전환할 연속 실패 횟수
+    CIRCUIT_BREAKER_RECOVERY_TIMEOUT: float = 10.0  # seconds (복구 확인 간격)
+
+    # Observability
+    SERVER_TIMING_ENABLED: bool = True  # 노드/외부 호출 소요 시간을 Server-Timing 헤더로 반환
+    OTEL_ENABLED: bool = False  # requirements-otel.txt 설치 필요
+    OTEL_EXPORTER_OTLP_ENDPOINT: str = "http://localhost:4317"  # 로컬 collector (gRPC)
+    OTEL_SERVICE_NAME: str = "seoul-location-services"
+    METRICS_ENABLED: bool = True  # /metrics (Prometheus 텍스트 노출 형식)
 
     # Data Collection Configuration
     COLLECTION_SCHEDULE_ENABLED: bool = True
@@ -90,6 +160,26 @@ class Settings(BaseSettings):
     DEFAULT_RESULTS_LIMIT: int = 50
     MAX_RESULTS_LIMIT: int = 200
 
+    # In-memory Spatial Index
+    SPATIAL_INDEX_ENABLED: bool = True
+    SPATIAL_INDEX_REFRESH_INTERVAL: int = 600  # seconds
+    SPATIAL_INDEX_CELL_SIZE: float = 0.01  # degrees (약 1.1km)
+
+    # Offline Gazetteer (역/공공시설 이름 → 좌표, Kakao 호출 전 조회)
+    GAZETTEER_ENABLED: bool = True
+    GAZETTEER_REFRESH_INTERVAL: int = 3600  # seconds
+    GAZETTEER_FUZZY_THRESHOLD: float = 0.8  # bigram Dice 유사도 하한
+
+    # Search Workflow
+    WORKFLOW_ENGINE: str = "direct"  # direct (노드 순차 직접 호출) | langgraph (StateGraph 실행)
+
+    # PostGIS RPC (scripts/create_nearby_services_function.sql 적용 필요)
+    NEARBY_RPC_ENABLED: bool = False
+
+    # Supabase 테이블 병렬 조회
+    SUPABASE_FETCH_CONCURRENCY: int = 5  # 동시 테이블 쿼리 수
+    SUPABASE_TABLE_TIMEOUT: float = 3.0  # seconds (초과 테이블은 결과에서 제외)
+
     # Seoul City Bounds (for coordinate validation)
     SEOUL_LAT_MIN: float = 37.0
     SEOUL_LAT_MAX: float = 38.0
@@ -0,0 +1,242 @@
+"""
+Cache Codec
+캐시 값 직렬화/압축 - 첫 바이트(헤더)로 형식을 표시해 설정이 바뀌어도 기존 엔트리 디코딩
+"""
+
+import json
+import logging
+import threading
+import zlib
+from functools import lru_cache
+from typing import Any, Callable, Dict, Tuple, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - 선택 의존성
+    orjson = None
+
+try:
+    import ormsgpack
+except ImportError:  # pragma: no cover - 선택 의존성
+    ormsgpack = None
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - 선택 의존성
+    msgpack = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - 선택 의존성
+    zstandard = None
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 헤더 바이트: 0x80 | (직렬화 ID << 2) | 압축 ID
+# JSON 텍스트는 항상 ASCII 문자로 시작하므로 0x80 미만이면 헤더 없는 기존 JSON 엔트리
+HEADER_FLAG = 0x80
+
+SERIALIZER_IDS = {"json": 0, "msgpack": 1}
+COMPRESSOR_IDS = {"none": 0, "zlib": 1, "zstd": 2}
+
+
+def _json_dumps(value: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _json_loads(data: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _msgpack_dumps(value: Any) -> bytes:
+    if ormsgpack is not None:
+        return ormsgpack.packb(value)
+    return msgpack.packb(value, use_bin_type=True)
+
+
+def _msgpack_loads(data: bytes) -> Any:
+    if ormsgpack is not None:
+        return ormsgpack.unpackb(data)
+    return msgpack.unpackb(data, raw=False)
+
+
+# zstd 컨텍스트는 스레드 간 공유할 수 없으므로 스레드별로 재사용
+_zstd_local = threading.local()
+
+
+def _zstd_compress(data: bytes, level: int) -> bytes:
+    compressors = _zstd_local.__dict__.setdefault("compressors", {})
+    compressor = compressors.get(level)
+    if compressor is None:
+        compressor = compressors[level] = zstandard.ZstdCompressor(level=level)
+    return compressor.compress(data)
+
+
+def _zstd_decompress(data: bytes) -> bytes:
+    decompressor = getattr(_zstd_local, "decompressor", None)
+    if decompressor is None:
+        decompressor = _zstd_local.decompressor = zstandard.ZstdDecompressor()
+    return decompressor.decompress(data)
+
+
+SERIALIZERS: Dict[int, Tuple[Callable[[Any], bytes], Callable[[bytes], Any]]] = {
+    0: (_json_dumps, _json_loads),
+    1: (_msgpack_dumps, _msgpack_loads)
+}
+
+
+def is_available(serializer: str = "json", compression: str = "none") -> bool:
+    """
+    형식에 필요한 라이브러리 설치 여부
+
+    Args:
+        serializer: "json" 또는 "msgpack"
+        compression: "none", "zlib", "zstd"
+
+    Returns:
+        사용 가능 여부
+    """
+    if serializer not in SERIALIZER_IDS or compression not in COMPRESSOR_IDS:
+        return False
+    if serializer == "msgpack" and ormsgpack is None and msgpack is None:
+        return False
+    if compression == "zstd" and zstandard is None:
+        return False
+    return True
+
+
+class CacheCodec:
+    """
+    캐시 값 인코더/디코더
+
+    Features:
+    - 직렬화: msgpack (ormsgpack/msgpack) 또는 JSON (orjson 우선, 없으면 표준 json)
+    - 압축: zstd, zlib 또는 없음 (min_compress_bytes 미만 값은 압축하지 않음)
+    - 라이브러리가 없으면 msgpack → JSON, zstd → zlib 으로 대체
+    - 헤더 없는 기존 JSON 텍스트 엔트리도 디코딩
+    """
+
+    def __init__(
+        self,
+        serializer: str = "msgpack",
+        compression: str = "zstd",
+        min_compress_bytes: int = 512,
+        level: int = 3
+    ):
+        """
+        Args:
+            serializer: "json" 또는 "msgpack"
+            compression: "none", "zlib", "zstd"
+            min_compress_bytes: 압축을 적용할 최소 직렬화 크기 (바이트)
+            level: 압축 레벨
+        """
+        if serializer not in SERIALIZER_IDS:
+            raise ValueError(f"Unknown cache serializer: {serializer}")
+        if compression not in COMPRESSOR_IDS:
+            raise ValueError(f"Unknown cache compression: {compression}")
+
+        if not is_available(serializer):
+            logger.warning("msgpack is not installed. Falling back to JSON cache values.")
+            serializer = "json"
+        if not is_available(serializer, compression):
+            logger.warning("zstandard is not installed. Falling back to zlib compression.")
+            compression = "zlib"
+
+        self.serializer = serializer
+        self.compression = compression
+        self.min_compress_bytes = min_compress_bytes
+        self.level = level
+
+        self._serializer_id = SERIALIZER_IDS[serializer]
+        self._compressor_id = COMPRESSOR_IDS[compression]
+
+    @property
+    def name(self) -> str:
+        """형식 이름 (예: "msgpack+zstd")"""
+        return f"{self.serializer}+{self.compression}"
+
+    def encode(self, value: Any) -> bytes:
+        """
+        값 인코딩
+
+        Args:
+            value: 저장할 데이터 (JSON 호환 타입)
+
+        Returns:
+            헤더 바이트 + 직렬화(및 압축)된 바이트
+        """
+        dumps, _ = SERIALIZERS[self._serializer_id]
+        payload = dumps(value)
+
+        compressor_id = self._compressor_id
+        if compressor_id and len(payload) >= self.min_compress_bytes:
+            if compressor_id == COMPRESSOR_IDS["zstd"]:
+                payload = _zstd_compress(payload, self.level)
+            else:
+                payload = zlib.compress(payload, self.level)
+        else:
+            compressor_id = 0
+
+        header = HEADER_FLAG | (self._serializer_id << 2) | compressor_id
+        return bytes((header,)) + payload
+
+    def decode(self, data: Union[bytes, str]) -> Any:
+        """
+        값 디코딩 (헤더로 형식 판별)
+
+        Args:
+            data: Redis에서 읽은 값
+
+        Returns:
+            디코딩된 데이터
+
+        Raises:
+            ValueError: 알 수 없는 헤더이거나 필요한 라이브러리가 없는 경우
+        """
+        if isinstance(data, str):
+            return json.loads(data)
+
+        header = data[0]
+        if not header & HEADER_FLAG:
+            return json.loads(data)
+
+        serializer_id = (header >> 2) & 0x1F
+        compressor_id = header & 0x03
+        if serializer_id not in SERIALIZERS or compressor_id > COMPRESSOR_IDS["zstd"]:
+            raise ValueError(f"Unknown cache value header: {header:#04x}")
+
+        payload = memoryview(data)[1:]
+        if compressor_id == COMPRESSOR_IDS["zstd"]:
+            if zstandard is None:
+                raise ValueError("zstandard is required to decode this cache value")
+            payload = _zstd_decompress(payload)
+        elif compressor_id == COMPRESSOR_IDS["zlib"]:
+            payload = zlib.decompress(payload)
+
+        if serializer_id == SERIALIZER_IDS["msgpack"] and ormsgpack is None and msgpack is None:
+            raise ValueError("msgpack is required to decode this cache value")
+
+        _, loads = SERIALIZERS[serializer_id]
+        return loads(bytes(payload))
+
+
+@lru_cache()
+def get_cache_codec() -> CacheCodec:
+    """
+    설정 기반 CacheCodec 싱글톤 인스턴스
+
+    Returns:
+        CacheCodec 인스턴스
+    """
+    return CacheCodec(
+        serializer=settings.CACHE_SERIALIZER,
+        compression=settings.CACHE_COMPRESSION,
+        min_compress_bytes=settings.CACHE_COMPRESS_MIN_BYTES,
+        level=settings.CACHE_COMPRESSION_LEVEL
+    )
@@ -0,0 +1,208 @@
+"""
+Circuit Breaker
+외부 의존성(Redis, Kakao, Supabase) 장애 시 요청 경로에서 타임아웃을 기다리지 않고 즉시 실패
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Optional
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """서킷이 열려 있어 호출하지 않음"""
+
+    def __init__(self, name: str):
+        super().__init__(f"Circuit '{name}' is open")
+        self.name = name
+
+
+class CircuitBreaker:
+    """
+    연속 실패 기반 서킷 브레이커
+
+    Features:
+    - closed: 정상 호출, 연속 실패가 failure_threshold 에 도달하면 open
+    - open: 호출하지 않고 즉시 실패 (allow() == False)
+    - probe 가 있으면 open 동안 백그라운드에서 recovery_timeout 간격으로 확인하고 성공 시 close
+    - probe 가 없거나 실행 중이 아니면 recovery_timeout 후 half_open 으로 전환해
+      실제 요청 하나로 확인 (성공 시 close, 실패 시 다시 open)
+    - half_open 에서는 시도 요청 하나만 허용하고 결과가 기록될 때까지 나머지는 거부
+      (결과 없이 recovery_timeout 이 지나면 다음 시도 허용)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: Optional[int] = None,
+        recovery_timeout: Optional[float] = None,
+        probe: Optional[Callable[[], Awaitable[Any]]] = None
+    ):
+        """
+        Args:
+            name: 서킷 이름 (로그/통계용)
+            failure_threshold: open 으로 전환할 연속 실패 횟수
+            recovery_timeout: open 후 복구 확인까지 대기 시간 (초)
+            probe: 복구 확인 코루틴 함수 (예외 없이 끝나면 복구로 판단)
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold or settings.CIRCUIT_BREAKER_FAILURE_THRESHOLD
+        self.recovery_timeout = recovery_timeout or settings.CIRCUIT_BREAKER_RECOVERY_TIMEOUT
+        self.probe = probe
+
+        self.state = CLOSED
+        self.consecutive_failures = 0
+        self.opened_at: Optional[float] = None
+        self._trial_started_at: Optional[float] = None
+        self._probe_task: Optional[asyncio.Task] = None
+
+        # 통계
+        self.failures = 0
+        self.rejected = 0
+        self.opened = 0
+
+    def allow(self) -> bool:
+        """
+        호출 허용 여부 (거부 시 거부 카운트 증가)
+
+        True 를 받은 호출은 record_success / record_failure / release 중 하나로
+        결과를 기록해야 한다. (half_open 시도 슬롯 반환)
+
+        Returns:
+            호출해도 되면 True
+        """
+        if self.state == OPEN:
+            probing = self._probe_task is not None and not self._probe_task.done()
+            if probing or time.monotonic() - self.opened_at < self.recovery_timeout:
+                self.rejected += 1
+                return False
+
+            logger.info(f"Circuit '{self.name}' half-open, allowing a trial request")
+            self.state = HALF_OPEN
+            self._trial_started_at = None
+
+        if self.state == HALF_OPEN:
+            now = time.monotonic()
+            if (
+                self._trial_started_at is not None
+                and now - self._trial_started_at < self.recovery_timeout
+            ):
+                self.rejected += 1
+                return False
+            self._trial_started_at = now
+
+        return True
+
+    def record_success(self):
+        """호출 성공 (half_open 이면 close)"""
+        if self.state != CLOSED:
+            self._close()
+        self.consecutive_failures = 0
+
+    def release(self):
+        """허용된 호출이 서비스 상태와 무관한 이유로 끝남 (half_open 시도 슬롯만 반환)"""
+        self._trial_started_at = None
+
+    def record_failure(self, error: Optional[BaseException] = None):
+        """
+        호출 실패 (연속 실패가 한도에 도달하거나 half_open 이면 open)
+
+        Args:
+            error: 발생한 예외 (로그용)
+        """
+        self.failures += 1
+        self.consecutive_failures += 1
+        self._trial_started_at = None
+
+        if self.state == HALF_OPEN or (
+            self.state == CLOSED and self.consecutive_failures >= self.failure_threshold
+        ):
+            self._open(error)
+
+    def reset(self):
+        """상태 초기화 (closed)"""
+        if self._probe_task is not None and not self._probe_task.done():
+            self._probe_task.cancel()
+        self._probe_task = None
+        self.state = CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = None
+        self._trial_started_at = None
+
+    def _open(self, error: Optional[BaseException]):
+        self.state = OPEN
+        self.opened_at = time.monotonic()
+        self.opened += 1
+        logger.warning(
+            f"Circuit '{self.name}' opened after {self.consecutive_failures} "
+            f"consecutive failures: {error}"
+        )
+        self._start_probe()
+
+    def _close(self):
+        logger.info(f"Circuit '{self.name}' closed")
+        self.state = CLOSED
+        self.opened_at = None
+        self._trial_started_at = None
+
+    def _start_probe(self):
+        """백그라운드 복구 확인 시작 (실행 중인 이벤트 루프가 없으면 half_open 방식 사용)"""
+        if self.probe is None:
+            return
+        if self._probe_task is not None and not self._probe_task.done():
+            return
+
+        try:
+            self._probe_task = asyncio.get_running_loop().create_task(self._run_probe())
+        except RuntimeError:
+            self._probe_task = None
+
+    async def _run_probe(self):
+        """recovery_timeout 간격으로 probe 실행, 성공 시 close"""
+        while self.state == OPEN:
+            await asyncio.sleep(self.recovery_timeout)
+            try:
+                await asyncio.wait_for(self.probe(), timeout=self.recovery_timeout)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.debug(f"Circuit '{self.name}' probe failed: {e}")
+                self.opened_at = time.monotonic()
+                continue
+
+            self.consecutive_failures = 0
+            self._close()
+
+    async def aclose(self):
+        """백그라운드 probe 종료"""
+        if self._probe_task is not None:
+            self._probe_task.cancel()
+            try:
+                await self._probe_task
+            except asyncio.CancelledError:
+                pass
+            self._probe_task = None
+
+    def get_stats(self) -> dict:
+        """
+        서킷 상태 및 통계
+
+        Returns:
+            통계 딕셔너리
+        """
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "failures": self.failures,
+            "rejected": self.rejected,
+            "opened": self.opened,
+            "open_for": round(time.monotonic() - self.opened_at, 1) if self.opened_at else None
+        }
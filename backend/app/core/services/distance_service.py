@@ -7,6 +7,8 @@ import math
 import logging
 from typing import List, Dict, Any, Tuple, Optional
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 # Earth radius in meters
@@ -85,6 +87,148 @@ def calculate_distance_to_point(
     return haversine_distance(target_lat, target_lon, lat, lon)
 
 
+def haversine_distance_array(
+    center_lat: float,
+    center_lon: float,
+    lats: np.ndarray,
+    lons: np.ndarray
+) -> np.ndarray:
+    """
+    한 지점에서 좌표 배열 전체까지의 거리 일괄 계산 (벡터화 Haversine)
+
+    Args:
+        center_lat: 중심점 위도 (degrees)
+        center_lon: 중심점 경도 (degrees)
+        lats: 위도 배열 (degrees)
+        lons: 경도 배열 (degrees)
+
+    Returns:
+        거리 배열 (미터), 좌표가 NaN인 위치는 NaN
+    """
+    lat1 = math.radians(center_lat)
+    lon1 = math.radians(center_lon)
+    lat2 = np.radians(lats)
+    lon2 = np.radians(lons)
+
+    a = np.sin((lat2 - lat1) / 2) ** 2 + \
+        math.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+
+    # 부동소수 오차로 1을 약간 넘는 경우 방지
+    return 2 * EARTH_RADIUS_M * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+
+
+def extract_coordinate_arrays(
+    locations: List[Dict[str, Any]],
+    lat_key: str = 'latitude',
+    lon_key: str = 'longitude'
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    위치 딕셔너리 리스트에서 좌표 배열 추출
+
+    Args:
+        locations: 위치 데이터 리스트
+        lat_key: 위도 필드명
+        lon_key: 경도 필드명
+
+    Returns:
+        (lats, lons) float64 배열, 좌표 없으면 NaN
+    """
+    # dtype=float 변환 시 None은 NaN이 됨
+    lats = np.array([location.get(lat_key) for location in locations], dtype=np.float64)
+    lons = np.array([location.get(lon_key) for location in locations], dtype=np.float64)
+    return lats, lons
+
+
+def radius_search_arrays(
+    lats: np.ndarray,
+    lons: np.ndarray,
+    center_lat: float,
+    center_lon: float,
+    radius_m: Optional[float] = None,
+    limit: Optional[int] = None,
+    use_bbox: bool = True,
+    sort: bool = True
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    컬럼형 반경/top-k 검색
+
+    1. 경계 상자 마스킹 (radius_m 지정 시)
+    2. 후보에 대해서만 벡터화 Haversine 계산
+    3. 반경 마스킹
+    4. argpartition 기반 top-k 선택 후 k개만 정렬
+
+    Args:
+        lats: 위도 배열
+        lons: 경도 배열
+        center_lat: 중심점 위도
+        center_lon: 중심점 경도
+        radius_m: 반경 (미터, None이면 반경 제한 없음)
+        limit: 최대 반환 개수 (None이면 전체)
+        use_bbox: 경계 상자 사전 필터링 여부
+        sort: 거리순 정렬 여부 (False면 원래 순서 유지)
+
+    Returns:
+        (indices, distances) - 원본 배열 기준 인덱스와 거리 (미터)
+    """
+    lats = np.asarray(lats, dtype=np.float64)
+    lons = np.asarray(lons, dtype=np.float64)
+
+    # NaN 비교는 항상 False이므로 좌표 없는 위치는 자동 제외
+    if radius_m is not None and use_bbox:
+        min_lat, max_lat, min_lon, max_lon = calculate_bounding_box(
+            center_lat, center_lon, radius_m
+        )
+        candidates = np.flatnonzero(
+            (lats >= min_lat) & (lats <= max_lat) &
+            (lons >= min_lon) & (lons <= max_lon)
+        )
+    else:
+        candidates = np.flatnonzero(~(np.isnan(lats) | np.isnan(lons)))
+
+    distances = haversine_distance_array(
+        center_lat, center_lon, lats[candidates], lons[candidates]
+    )
+
+    if radius_m is not None:
+        within = distances <= radius_m
+        candidates = candidates[within]
+        distances = distances[within]
+
+    if not sort:
+        if limit is not None:
+            candidates = candidates[:limit]
+            distances = distances[:limit]
+        return candidates, distances
+
+    # top-k: 전체 정렬 대신 k개 선택 후 정렬
+    if limit is not None and limit <= 0:
+        order = np.array([], dtype=np.intp)
+    elif limit is not None and limit < len(distances):
+        top = np.argpartition(distances, limit - 1)[:limit]
+        order = top[np.argsort(distances[top], kind='stable')]
+    else:
+        order = np.argsort(distances, kind='stable')
+
+    return candidates[order], distances[order]
+
+
+def _attach_distances(
+    locations: List[Dict[str, Any]],
+    indices: np.ndarray,
+    distances: np.ndarray,
+    formatted: bool = False
+) -> List[Dict[str, Any]]:
+    """인덱스 순서대로 위치에 distance(및 distance_formatted) 필드 추가"""
+    result = []
+    for idx, distance in zip(indices.tolist(), distances.tolist()):
+        location = locations[idx]
+        location['distance'] = round(distance, 2)
+        if formatted:
+            location['distance_formatted'] = format_distance(location['distance'])
+        result.append(location)
+    return result
+
+
 def filter_by_radius(
     locations: List[Dict[str, Any]],
     center_lat: float,
@@ -116,24 +260,14 @@ def filter_by_radius(
         >>> len(filtered)
         2
     """
-    filtered = []
-
-    for location in locations:
-        distance = calculate_distance_to_point(
-            location,
-            center_lat,
-            center_lon,
-            lat_key,
-            lon_key
-        )
-
-        # 좌표가 없거나 반경 밖이면 제외
-        if distance == float('inf') or distance > radius_m:
-            continue
-
-        # distance 필드 추가
-        location['distance'] = round(distance, 2)
-        filtered.append(location)
+    lats, lons = extract_coordinate_arrays(locations, lat_key, lon_key)
+    indices, distances = radius_search_arrays(
+        lats, lons, center_lat, center_lon,
+        radius_m=radius_m,
+        use_bbox=False,
+        sort=False
+    )
+    filtered = _attach_distances(locations, indices, distances)
 
     logger.debug(
         f"Filtered {len(filtered)}/{len(locations)} locations "
@@ -186,25 +320,12 @@ def get_nearest_locations(
     Returns:
         가까운 순서로 정렬된 위치 리스트 (최대 limit개)
     """
-    # 모든 위치에 distance 추가
-    locations_with_distance = []
-    for location in locations:
-        distance = calculate_distance_to_point(
-            location,
-            center_lat,
-            center_lon,
-            lat_key,
-            lon_key
-        )
-        if distance != float('inf'):
-            location['distance'] = round(distance, 2)
-            locations_with_distance.append(location)
-
-    # 거리순 정렬
-    sorted_locations = sort_by_distance(locations_with_distance, ascending=True)
-
-    # limit 적용
-    return sorted_locations[:limit]
+    lats, lons = extract_coordinate_arrays(locations, lat_key, lon_key)
+    indices, distances = radius_search_arrays(
+        lats, lons, center_lat, center_lon,
+        limit=limit
+    )
+    return _attach_distances(locations, indices, distances)
 
 
 def calculate_bounding_box(
@@ -346,30 +467,11 @@ def find_nearby_locations(
     Returns:
         반경 내 위치 리스트 (거리순 정렬, distance 필드 포함)
     """
-    # 1. 경계 상자로 빠른 사전 필터링
-    bbox = calculate_bounding_box(center_lat, center_lon, radius_m)
-    pre_filtered = filter_by_bounding_box(locations, bbox, lat_key, lon_key)
-
-    # 2. Haversine으로 정확한 거리 계산 및 필터링
-    filtered = filter_by_radius(
-        pre_filtered,
-        center_lat,
-        center_lon,
-        radius_m,
-        lat_key,
-        lon_key
+    # 경계 상자 사전 필터링 → Haversine 반경 필터링 → top-k 정렬 (일괄 처리)
+    lats, lons = extract_coordinate_arrays(locations, lat_key, lon_key)
+    indices, distances = radius_search_arrays(
+        lats, lons, center_lat, center_lon,
+        radius_m=radius_m,
+        limit=limit or None
     )
-
-    # 3. 거리순 정렬
-    sorted_locations = sort_by_distance(filtered, ascending=True)
-
-    # 4. limit 적용
-    if limit:
-        sorted_locations = sorted_locations[:limit]
-
-    # 5. distance 포맷 추가
-    for location in sorted_locations:
-        if 'distance' in location:
-            location['distance_formatted'] = format_distance(location['distance'])
-
-    return sorted_locations
+    return _attach_distances(locations, indices, distances, formatted=True)
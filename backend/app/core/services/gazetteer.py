@@ -0,0 +1,361 @@
+"""
+Gazetteer Service
+오프라인 서울 지명 사전 - 역/공공시설 이름과 주소를 Kakao 호출 없이 좌표로 변환
+"""
+
+import asyncio
+import csv
+import logging
+import threading
+import time
+from array import array
+from collections import Counter
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional, List, Dict, Any, Tuple
+
+from app.core.config import settings
+from app.core.services.distance_service import haversine_distance
+from app.core.services.geocode_cache import canonicalize_address
+from app.core.services.spatial_index import COORDINATE_COLUMNS, PAGE_SIZE
+
+logger = logging.getLogger(__name__)
+
+# 번들 지하철역 목록 (역 중심 근사 좌표)
+STATIONS_FILE = Path(__file__).resolve().parent.parent / "data" / "seoul_subway_stations.csv"
+
+# 지명 사전에 적재할 테이블별 (이름 컬럼, 주소 컬럼)
+GAZETTEER_COLUMNS: Dict[str, Tuple[str, str]] = {
+    'libraries': ('library_name', 'address'),
+    'cultural_spaces': ('fac_name', 'addr'),
+    'future_heritages': ('name', 'address')
+}
+
+# 같은 이름이 이 거리 이상 떨어져 있으면 모호한 이름으로 보고 사용하지 않음
+AMBIGUOUS_DISTANCE_M = 300
+
+# 퍼지 매칭 최소 길이 (정규화 후 글자 수)
+MIN_FUZZY_LENGTH = 3
+
+
+def _bigrams(text: str) -> List[str]:
+    """문자 bigram 목록 (중복 제거, 1글자는 그대로)"""
+    if len(text) < 2:
+        return [text] if text else []
+    return list(dict.fromkeys(text[i:i + 2] for i in range(len(text) - 1)))
+
+
+class _GazetteerData:
+    """지명 사전 스냅샷 (교체 단위)"""
+
+    def __init__(self):
+        self.names: List[str] = []
+        self.sources: List[str] = []
+        self.lats = array('d')
+        self.lons = array('d')
+        # 정규화 키 → 엔트리 번호 (-1 = 모호한 이름)
+        self.exact: Dict[str, int] = {}
+        # 정규화 이름 bigram → 엔트리 번호 목록 (이름만, 주소는 정확히 일치할 때만 사용)
+        self.postings: Dict[str, array] = {}
+        self.gram_counts = array('H')
+
+    def add(self, name: str, address: Optional[str], lat: float, lon: float, source: str) -> None:
+        entry_id = len(self.names)
+        self.names.append(name)
+        self.sources.append(source)
+        self.lats.append(lat)
+        self.lons.append(lon)
+
+        name_key = canonicalize_address(name)
+        self._add_exact(name_key, entry_id)
+        if address:
+            self._add_exact(canonicalize_address(address), entry_id)
+
+        grams = _bigrams(name_key) if len(name_key) >= MIN_FUZZY_LENGTH else []
+        self.gram_counts.append(min(len(grams), 0xFFFF))
+        for gram in grams:
+            self.postings.setdefault(gram, array('I')).append(entry_id)
+
+    def _add_exact(self, key: str, entry_id: int) -> None:
+        if not key:
+            return
+        existing = self.exact.get(key)
+        if existing is None:
+            self.exact[key] = entry_id
+        elif existing >= 0 and haversine_distance(
+            self.lats[existing], self.lons[existing],
+            self.lats[entry_id], self.lons[entry_id]
+        ) > AMBIGUOUS_DISTANCE_M:
+            self.exact[key] = -1
+
+    def match(self, entry_id: int, score: float) -> Dict[str, Any]:
+        return {
+            "name": self.names[entry_id],
+            "latitude": self.lats[entry_id],
+            "longitude": self.lons[entry_id],
+            "source": self.sources[entry_id],
+            "score": score
+        }
+
+
+class Gazetteer:
+    """
+    오프라인 지명 사전
+
+    Features:
+    - 번들 지하철역 목록 + 수집 테이블(도서관, 문화공간, 미래유산)의 이름/주소
+    - 정규화 키 정확 일치 (이름 또는 주소) → dict 조회
+    - 이름 bigram 역색인 기반 퍼지 매칭 (Dice 유사도)
+    - 같은 이름이 멀리 떨어진 여러 곳에 있으면 사용하지 않음 (Kakao로 위임)
+    """
+
+    def __init__(self, stations_file: Optional[Path] = None):
+        """
+        Gazetteer 초기화
+
+        Args:
+            stations_file: 지하철역 CSV 경로 (None이면 번들 파일 사용)
+        """
+        self.stations_file = stations_file or STATIONS_FILE
+        self._data = _GazetteerData()
+        self._lock = threading.Lock()
+        self._refresh_task: Optional[asyncio.Task] = None
+        self.built_at: Optional[float] = None
+
+        self.exact_hits = 0
+        self.fuzzy_hits = 0
+        self.misses = 0
+
+    @property
+    def is_ready(self) -> bool:
+        """사전 구축 완료 여부"""
+        return self.built_at is not None
+
+    @property
+    def size(self) -> int:
+        """등록된 지명 수"""
+        return len(self._data.names)
+
+    def load_stations(self) -> List[Dict[str, Any]]:
+        """
+        번들 지하철역 목록 로드
+
+        Returns:
+            [{"name", "latitude", "longitude"}] 리스트
+        """
+        try:
+            with open(self.stations_file, encoding='utf-8') as f:
+                return list(csv.DictReader(f))
+        except OSError as e:
+            logger.warning(f"Failed to load station list {self.stations_file}: {e}")
+            return []
+
+    def build(self, rows_by_table: Dict[str, List[Dict[str, Any]]]) -> int:
+        """
+        지하철역 목록과 테이블 행으로 사전 구축 (기존 사전과 원자적 교체)
+
+        Args:
+            rows_by_table: {table: [rows]} 딕셔너리 (GAZETTEER_COLUMNS 테이블)
+
+        Returns:
+            등록된 지명 수
+        """
+        data = _GazetteerData()
+
+        # 역 이름이 시설 이름보다 우선하도록 먼저 등록
+        for station in self.load_stations():
+            try:
+                data.add(
+                    station['name'], None,
+                    float(station['latitude']), float(station['longitude']),
+                    'stations'
+                )
+            except (KeyError, TypeError, ValueError):
+                continue
+
+        for table, rows in rows_by_table.items():
+            name_key, address_key = GAZETTEER_COLUMNS[table]
+            lat_key, lon_key = COORDINATE_COLUMNS[table]
+
+            for row in rows:
+                name = row.get(name_key)
+                lat = row.get(lat_key)
+                lon = row.get(lon_key)
+                if not name or lat is None or lon is None:
+                    continue
+
+                try:
+                    lat, lon = float(lat), float(lon)
+                except (TypeError, ValueError):
+                    continue
+
+                data.add(name, row.get(address_key), lat, lon, table)
+
+        with self._lock:
+            self._data = data
+            self.built_at = time.time()
+
+        logger.info(f"Gazetteer built: {len(data.names)} names, {len(data.exact)} keys")
+        return len(data.names)
+
+    def lookup(self, text: str) -> Optional[Dict[str, Any]]:
+        """
+        지명/주소 조회
+
+        Args:
+            text: 장소명 또는 주소 (예: "강남역", "서울특별시 중구 세종대로 110")
+
+        Returns:
+            {"name", "latitude", "longitude", "source", "score"} 딕셔너리
+            (score: 1.0 = 정확히 일치, 미만 = 퍼지 매칭 유사도) 또는 None (없거나 모호한 경우)
+        """
+        data = self._data
+        key = canonicalize_address(text)
+        if not key or not data.names:
+            return None
+
+        # 1. 정확히 일치
+        entry_id = data.exact.get(key)
+        if entry_id is not None:
+            if entry_id < 0:
+                self.misses += 1
+                return None
+            self.exact_hits += 1
+            return data.match(entry_id, 1.0)
+
+        # 2. 퍼지 매칭 (이름 bigram Dice 유사도)
+        match = self._fuzzy(data, key)
+        if match is None:
+            self.misses += 1
+        else:
+            self.fuzzy_hits += 1
+        return match
+
+    def _fuzzy(self, data: _GazetteerData, key: str) -> Optional[Dict[str, Any]]:
+        if len(key) < MIN_FUZZY_LENGTH:
+            return None
+
+        grams = _bigrams(key)
+        overlaps: Counter = Counter()
+        for gram in grams:
+            postings = data.postings.get(gram)
+            if postings:
+                overlaps.update(postings)
+
+        best_id = None
+        best_score = 0.0
+        tie = False
+        for entry_id, common in overlaps.items():
+            score = 2 * common / (len(grams) + data.gram_counts[entry_id])
+            if score > best_score:
+                best_id, best_score, tie = entry_id, score, False
+            elif score == best_score:
+                tie = True
+
+        # 동점 후보가 있으면 모호하므로 Kakao로 위임
+        if best_id is None or tie or best_score < settings.GAZETTEER_FUZZY_THRESHOLD:
+            return None
+        return data.match(best_id, round(best_score, 3))
+
+    def refresh(self, supabase=None) -> int:
+        """
+        Supabase에서 이름/주소/좌표 컬럼만 읽어 사전 재구축 (동기)
+
+        Args:
+            supabase: Supabase 클라이언트 (None이면 싱글톤 사용)
+
+        Returns:
+            등록된 지명 수
+        """
+        if supabase is None:
+            from app.db.supabase_client import get_supabase_client
+            supabase = get_supabase_client()
+
+        rows_by_table: Dict[str, List[Dict[str, Any]]] = {}
+
+        for table, (name_key, address_key) in GAZETTEER_COLUMNS.items():
+            lat_key, lon_key = COORDINATE_COLUMNS[table]
+            columns = f"{name_key},{address_key},{lat_key},{lon_key}"
+            rows: List[Dict[str, Any]] = []
+            offset = 0
+
+            while True:
+                response = supabase.table(table).select(columns) \
+                    .range(offset, offset + PAGE_SIZE - 1).execute()
+                page = response.data or []
+                rows.extend(page)
+
+                if len(page) < PAGE_SIZE:
+                    break
+                offset += PAGE_SIZE
+
+            rows_by_table[table] = rows
+
+        return self.build(rows_by_table)
+
+    async def refresh_async(self) -> int:
+        """이벤트 루프를 막지 않도록 스레드에서 재구축"""
+        return await asyncio.to_thread(self.refresh)
+
+    async def _refresh_loop(self, interval: int) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.refresh_async()
+            except Exception as e:
+                logger.error(f"Gazetteer refresh failed: {e}")
+
+    async def start(self, interval: Optional[int] = None) -> None:
+        """
+        최초 구축 후 주기적 재적재 태스크 시작
+
+        Args:
+            interval: 재적재 주기 (초, None이면 settings 사용)
+        """
+        interval = interval or settings.GAZETTEER_REFRESH_INTERVAL
+
+        try:
+            await self.refresh_async()
+        except Exception as e:
+            # 테이블 적재 실패 시 번들 역 목록만 사용
+            logger.warning(f"Gazetteer table load failed: {e}. Using bundled stations only.")
+            self.build({})
+
+        if self._refresh_task is None:
+            self._refresh_task = asyncio.create_task(self._refresh_loop(interval))
+
+    async def stop(self) -> None:
+        """재적재 태스크 중지"""
+        if self._refresh_task:
+            self._refresh_task.cancel()
+            try:
+                await self._refresh_task
+            except asyncio.CancelledError:
+                pass
+            self._refresh_task = None
+
+    def get_stats(self) -> dict:
+        """사전 통계 조회"""
+        total = self.exact_hits + self.fuzzy_hits + self.misses
+        hits = self.exact_hits + self.fuzzy_hits
+        return {
+            "ready": self.is_ready,
+            "size": self.size,
+            "keys": len(self._data.exact),
+            "exact_hits": self.exact_hits,
+            "fuzzy_hits": self.fuzzy_hits,
+            "misses": self.misses,
+            "hit_rate": f"{(hits / total * 100):.1f}%" if total else "0.0%",
+            "built_at": self.built_at
+        }
+
+
+@lru_cache()
+def get_gazetteer() -> Gazetteer:
+    """
+    Gazetteer 싱글톤 인스턴스
+
+    Returns:
+        Gazetteer 인스턴스
+    """
+    return Gazetteer()
@@ -0,0 +1,305 @@
+"""
+Geocode Cache Service
+지오코딩 결과 캐시 - 프로세스 메모리(LRU) + Redis
+"""
+
+import json
+import logging
+import unicodedata
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+from app.core.services.local_cache import LocalCache
+from app.core.services.redis_service import get_redis_service
+
+logger = logging.getLogger(__name__)
+
+# 광역 행정구역 접미사 (긴 것부터 매칭)
+REGION_SUFFIXES = ("특별자치시", "특별자치도", "특별시", "광역시", "시")
+
+# "시"를 제거하면 광역시와 겹치는 일반시 (경기 광주시 ≠ 광주광역시)
+AMBIGUOUS_CITIES = {"광주"}
+
+
+def canonicalize_address(address: str) -> str:
+    """
+    주소 문자열 정규화 (캐시 키용)
+
+    "서울특별시 중구", "서울시 중구", "서울 중구"처럼 표기만 다른 주소를
+    같은 키로 묶기 위해 첫 어절의 시 단위 접미사를 제거하고 공백을 없앰
+    ("서울시청"처럼 어절 중간의 "시"는 유지)
+
+    Args:
+        address: 입력 주소
+
+    Returns:
+        정규화된 주소 (예: "서울특별시 중구 세종대로 110" → "서울중구세종대로110")
+    """
+    tokens = unicodedata.normalize("NFC", address).lower().split()
+    if not tokens:
+        return ""
+
+    first = tokens[0]
+    for suffix in REGION_SUFFIXES:
+        if first.endswith(suffix) and len(first) > len(suffix):
+            base = first[:-len(suffix)]
+            if suffix != "시" or base not in AMBIGUOUS_CITIES:
+                tokens[0] = base
+            break
+
+    return "".join(tokens)
+
+
+class GeocodeCache:
+    """
+    지오코딩 결과 캐시
+
+    Features:
+    - 정지오코딩: 정규화한 주소 키로 좌표 캐싱 (결과 없음도 짧은 TTL로 캐싱)
+    - 역지오코딩: 좌표를 격자에 맞춰 반올림한 키로 주소 캐싱
+    - 메모리 LRU 조회 후 Redis 조회 (긴 TTL)
+      (결과 없음 엔트리의 짧은 TTL을 메모리에도 적용하기 위해 RedisService L1 대신 자체 LRU 사용,
+       Redis 조회는 L1을 거치지 않아 메모리에 한 번만 보관)
+    - 히트율 및 절약한 Kakao API 호출 수 집계
+    """
+
+    def __init__(self):
+        """GeocodeCache 초기화"""
+        self.redis = get_redis_service()
+        self.local = LocalCache(
+            settings.GEOCODE_CACHE_MAX_BYTES,
+            settings.REVERSE_GEOCODE_CACHE_TTL
+        )
+        self.forward_local = LocalCache(
+            settings.GEOCODE_CACHE_MAX_BYTES,
+            settings.GEOCODE_CACHE_TTL
+        )
+
+        # 정지오코딩 통계
+        self.forward_hits = 0
+        self.forward_misses = 0
+        self.negative_hits = 0
+        self.kakao_calls_saved = 0
+
+    def forward_key(self, address: str) -> str:
+        """
+        정지오코딩 캐시 키 생성
+
+        Args:
+            address: 주소
+
+        Returns:
+            캐시 키 (예: "geo:서울중구세종대로110")
+        """
+        return f"geo:{canonicalize_address(address)}"
+
+    async def get_forward(self, address: str) -> Optional[Dict[str, Any]]:
+        """
+        캐시된 정지오코딩 결과 조회
+
+        Args:
+            address: 주소
+
+        Returns:
+            {"coords": [lat, lon] 또는 None(결과 없음), "calls": Kakao 호출 수}
+            또는 None (캐시 미스)
+        """
+        return (await self.get_forward_many([address]))[0]
+
+    async def get_forward_many(self, addresses: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """
+        여러 주소의 캐시된 정지오코딩 결과 조회 (메모리 미스 주소는 Redis MGET 1회)
+
+        Args:
+            addresses: 주소 리스트
+
+        Returns:
+            주소 순서대로 get_forward() 결과 리스트
+        """
+        keys = [self.forward_key(address) for address in addresses]
+        entries: List[Optional[Dict[str, Any]]] = [self.forward_local.get(key) for key in keys]
+
+        missing = [i for i, entry in enumerate(entries) if entry is None]
+        if missing:
+            fetched = await self.redis.amget([keys[i] for i in missing], use_local=False)
+            for i, entry in zip(missing, fetched):
+                if entry is None:
+                    continue
+                ttl = None if entry.get("coords") else settings.GEOCODE_NEGATIVE_CACHE_TTL
+                self.forward_local.set(keys[i], entry, size=len(json.dumps(entry)), ttl=ttl)
+                entries[i] = entry
+
+        for entry in entries:
+            if entry is None:
+                self.forward_misses += 1
+                continue
+            self.forward_hits += 1
+            if not entry.get("coords"):
+                self.negative_hits += 1
+            self.kakao_calls_saved += entry.get("calls", 1)
+
+        return entries
+
+    async def set_forward(
+        self,
+        address: str,
+        coords: Optional[Tuple[float, float]],
+        calls: int = 1
+    ) -> None:
+        """
+        정지오코딩 결과 캐싱
+
+        Args:
+            address: 주소
+            coords: (latitude, longitude) 또는 None (결과 없음, 짧은 TTL)
+            calls: 결과를 얻는 데 사용한 Kakao API 호출 수
+        """
+        key = self.forward_key(address)
+        entry = {"coords": list(coords) if coords else None, "calls": calls}
+
+        if coords:
+            ttl = settings.GEOCODE_CACHE_TTL
+        else:
+            ttl = settings.GEOCODE_NEGATIVE_CACHE_TTL
+
+        self.forward_local.set(key, entry, size=len(json.dumps(entry)), ttl=ttl)
+        await self.redis.aset(key, entry, ttl=ttl, use_local=False)
+
+    def reverse_key(self, latitude: float, longitude: float) -> str:
+        """
+        역지오코딩 캐시 키 생성
+
+        Args:
+            latitude: 위도
+            longitude: 경도
+
+        Returns:
+            캐시 키 (예: "revgeo:37.5665:126.978")
+        """
+        precision = settings.REVERSE_GEOCODE_PRECISION
+        return f"revgeo:{round(latitude, precision)}:{round(longitude, precision)}"
+
+    async def get_reverse(
+        self,
+        latitude: float,
+        longitude: float
+    ) -> Optional[str]:
+        """
+        캐시된 주소 조회
+
+        Args:
+            latitude: 위도
+            longitude: 경도
+
+        Returns:
+            주소 또는 None
+        """
+        key = self.reverse_key(latitude, longitude)
+
+        address = self.local.get(key)
+        if address is not None:
+            return address
+
+        address = await self.redis.aget(key, use_local=False)
+        if address is not None:
+            self.local.set(key, address, size=len(address.encode('utf-8')))
+
+        return address
+
+    async def set_reverse(
+        self,
+        latitude: float,
+        longitude: float,
+        address: str
+    ) -> None:
+        """
+        주소 캐싱
+
+        Args:
+            latitude: 위도
+            longitude: 경도
+            address: 역지오코딩 결과 주소
+        """
+        key = self.reverse_key(latitude, longitude)
+
+        self.local.set(key, address, size=len(address.encode('utf-8')))
+        await self.redis.aset(
+            key, address, ttl=settings.REVERSE_GEOCODE_CACHE_TTL, use_local=False
+        )
+
+    async def geocode(
+        self,
+        address: str,
+        kakao_service: Any,
+        check_cache: bool = True
+    ) -> Optional[Tuple[float, float]]:
+        """
+        주소 → 좌표 변환 (캐시 우선, 미스 시 Kakao 주소/키워드 동시 검색)
+
+        Kakao API 오류는 캐싱하지 않고 예외로 전달
+
+        Args:
+            address: 주소
+            kakao_service: KakaoMapService 인스턴스
+            check_cache: False면 캐시 조회 생략 (get_forward로 이미 미스 확인한 경우)
+
+        Returns:
+            (latitude, longitude) 튜플 또는 None (결과 없음)
+        """
+        cacheable = bool(canonicalize_address(address))
+
+        if cacheable and check_cache:
+            entry = await self.get_forward(address)
+            if entry is not None:
+                coords = entry.get("coords")
+                return tuple(coords) if coords else None
+
+        coords = await kakao_service.geocode(address, raise_errors=True)
+
+        if cacheable:
+            # 동시 요청 시 항상 2회, 순차 요청 시 폴백 여부를 알 수 없어 최소 1회로 집계
+            calls = 2 if settings.KAKAO_GEOCODE_HEDGE or not coords else 1
+            await self.set_forward(address, coords, calls=calls)
+
+        return coords
+
+    def clear(self):
+        """메모리 캐시 전체 삭제 및 통계 초기화"""
+        self.local.clear()
+        self.forward_local.clear()
+        self.forward_hits = 0
+        self.forward_misses = 0
+        self.negative_hits = 0
+        self.kakao_calls_saved = 0
+
+    def get_stats(self) -> dict:
+        """
+        캐시 통계
+
+        Returns:
+            통계 딕셔너리
+        """
+        total = self.forward_hits + self.forward_misses
+        return {
+            "forward": {
+                "hits": self.forward_hits,
+                "misses": self.forward_misses,
+                "negative_hits": self.negative_hits,
+                "hit_rate": f"{(self.forward_hits / total * 100):.1f}%" if total else "0.0%",
+                "kakao_calls_saved": self.kakao_calls_saved,
+                "local": self.forward_local.get_stats()
+            },
+            "reverse": self.local.get_stats()
+        }
+
+
+@lru_cache()
+def get_geocode_cache() -> GeocodeCache:
+    """
+    GeocodeCache 싱글톤 인스턴스
+
+    Returns:
+        GeocodeCache 인스턴스
+    """
+    return GeocodeCache()
@@ -3,12 +3,15 @@ Kakao Map API Service
 Kakao Map Geocoding (주소 → 좌표 변환)
 """
 
+import asyncio
 import logging
 from typing import Optional, Dict, Any, Tuple
 import httpx
 from functools import lru_cache
 
 from app.core.config import settings
+from app.core.services.circuit_breaker import CircuitBreaker, CircuitOpenError
+from app.core.services.timing import span
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +24,9 @@ class KakaoMapService:
     - 주소 → 좌표 변환 (Geocoding)
     - 좌표 → 주소 변환 (Reverse Geocoding)
     - 키워드 검색 (장소 검색)
+    - 주소/키워드 동시 검색 (hedged geocoding)
+    - 공유 httpx.AsyncClient (keep-alive, HTTP/2, 커넥션 풀)
+    - 서킷 브레이커 (연속 네트워크/5xx 오류 시 타임아웃 대기 없이 즉시 실패)
     """
 
     BASE_URL = "https://dapi.kakao.com/v2"
@@ -41,15 +47,151 @@ class KakaoMapService:
             "Authorization": f"KakaoAK {self.api_key}"
         }
 
+        # 요청마다 TCP/TLS 연결을 새로 맺지 않도록 공유 클라이언트 사용
+        self.client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+        # 장애 시 요청마다 KAKAO_TIMEOUT 을 기다리지 않도록 차단
+        # (open 동안 백그라운드 probe 로 복구 확인)
+        self.breaker = CircuitBreaker("kakao", probe=self._probe)
+
+    def _create_client(self) -> httpx.AsyncClient:
+        """
+        커넥션 풀 기반 httpx.AsyncClient 생성
+
+        Returns:
+            httpx.AsyncClient 인스턴스
+        """
+        limits = httpx.Limits(
+            max_connections=settings.KAKAO_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.KAKAO_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=settings.KAKAO_KEEPALIVE_EXPIRY
+        )
+        timeout = httpx.Timeout(settings.KAKAO_TIMEOUT)
+
+        try:
+            return httpx.AsyncClient(
+                limits=limits,
+                timeout=timeout,
+                http2=settings.KAKAO_HTTP2
+            )
+        except ImportError:
+            # h2 패키지 미설치 시 HTTP/1.1 keep-alive만 사용
+            logger.warning("h2 package not installed, Kakao client falls back to HTTP/1.1")
+            return httpx.AsyncClient(limits=limits, timeout=timeout)
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """
+        공유 클라이언트 반환 (lifespan 밖에서 호출 시 지연 생성)
+
+        커넥션은 이벤트 루프에 묶여 있으므로 루프가 바뀌면 새로 생성
+
+        Returns:
+            httpx.AsyncClient 인스턴스
+        """
+        loop = asyncio.get_running_loop()
+        if self.client is None or self.client.is_closed or self._client_loop is not loop:
+            self.client = self._create_client()
+            self._client_loop = loop
+        return self.client
+
+    async def start(self):
+        """공유 HTTP 클라이언트 생성 (앱 시작 시 호출)"""
+        self._get_client()
+        logger.info(
+            f"Kakao HTTP client started (http2={settings.KAKAO_HTTP2}, "
+            f"max_connections={settings.KAKAO_MAX_CONNECTIONS})"
+        )
+
+    async def aclose(self):
+        """공유 HTTP 클라이언트 종료 (앱 종료 시 호출)"""
+        if self.client is not None:
+            try:
+                await self.client.aclose()
+                logger.info("Kakao HTTP client closed")
+            except Exception as e:
+                logger.error(f"Kakao HTTP client close error: {e}")
+            finally:
+                self.client = None
+                self._client_loop = None
+
+        await self.breaker.aclose()
+
+    async def _probe(self):
+        """
+        서킷 복구 확인 (open 동안 recovery_timeout 간격으로만 실행)
+
+        가장 가벼운 좌표 → 행정구역 변환 요청 하나로 확인하며,
+        5xx / 429 / 네트워크 오류가 아니면 복구로 판단
+
+        Raises:
+            httpx.HTTPError: 아직 장애 상태
+        """
+        client = self._get_client()
+        response = await client.get(
+            f"{self.BASE_URL}/local/geo/coord2regioncode.json",
+            headers=self.headers,
+            params={"x": "126.9780", "y": "37.5665"}
+        )
+        if response.status_code >= 500 or response.status_code == 429:
+            response.raise_for_status()
+
+    async def _request(self, endpoint: str, params: Dict[str, Any]) -> httpx.Response:
+        """
+        서킷 브레이커를 거친 GET 요청
+
+        Args:
+            endpoint: API URL
+            params: 쿼리 파라미터
+
+        Returns:
+            성공(2xx) 응답
+
+        Raises:
+            CircuitOpenError: 서킷이 열려 있는 경우
+            httpx.HTTPError: 요청 실패
+        """
+        if not self.breaker.allow():
+            raise CircuitOpenError(self.breaker.name)
+
+        try:
+            client = self._get_client()
+            with span("kakao", endpoint=endpoint):
+                response = await client.get(
+                    endpoint,
+                    headers=self.headers,
+                    params=params
+                )
+            response.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            # 4xx 는 요청 문제이므로 장애로 집계하지 않음 (429 제외)
+            if e.response.status_code >= 500 or e.response.status_code == 429:
+                self.breaker.record_failure(e)
+            else:
+                self.breaker.record_success()
+            raise
+        except httpx.TransportError as e:
+            self.breaker.record_failure(e)
+            raise
+        except BaseException:
+            self.breaker.release()
+            raise
+
+        self.breaker.record_success()
+        return response
+
     async def address_to_coordinates(
         self,
-        address: str
+        address: str,
+        raise_errors: bool = False
     ) -> Optional[Tuple[float, float]]:
         """
         주소 → 좌표 변환 (Geocoding)
 
         Args:
             address: 주소 (예: "서울시청", "강남역", "서울 중구 세종대로 110")
+            raise_errors: True면 API 오류를 None 대신 예외로 전달
+                (결과 없음과 오류를 구분해야 하는 캐시용)
 
         Returns:
             (latitude, longitude) 튜플 또는 None
@@ -67,43 +209,97 @@ class KakaoMapService:
         params = {"query": address}
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    endpoint,
-                    headers=self.headers,
-                    params=params,
-                    timeout=10.0
-                )
-                response.raise_for_status()
+            response = await self._request(endpoint, params)
 
-                data = response.json()
-                documents = data.get("documents", [])
+            data = response.json()
+            documents = data.get("documents", [])
 
-                if not documents:
-                    logger.warning(f"No results found for address: {address}")
-                    return None
+            if not documents:
+                logger.warning(f"No results found for address: {address}")
+                return None
 
-                # 첫 번째 결과 사용
-                doc = documents[0]
-                lon = float(doc.get("x"))
-                lat = float(doc.get("y"))
+            # 첫 번째 결과 사용
+            doc = documents[0]
+            lon = float(doc.get("x"))
+            lat = float(doc.get("y"))
 
-                logger.info(f"Geocoded '{address}' → ({lat}, {lon})")
-                return (lat, lon)
+            logger.info(f"Geocoded '{address}' → ({lat}, {lon})")
+            return (lat, lon)
 
         except httpx.HTTPStatusError as e:
             logger.error(f"Kakao API HTTP error: {e.response.status_code} - {e.response.text}")
+            if raise_errors:
+                raise
             return None
         except Exception as e:
             logger.error(f"Geocoding error for '{address}': {e}")
+            if raise_errors:
+                raise
             return None
 
+    async def geocode(
+        self,
+        address: str,
+        raise_errors: bool = False
+    ) -> Optional[Tuple[float, float]]:
+        """
+        주소 검색 + 키워드 검색 (hedged)
+
+        두 검색을 동시에 요청하고 KAKAO_GEOCODE_PRIORITY 순서로 결과를 채택.
+        우선순위가 높은 검색이 결과를 반환하면 나머지 요청은 취소.
+        랜드마크("강남역" 등)처럼 주소 검색이 실패하는 입력도 왕복 1회 시간에 처리.
+
+        Args:
+            address: 주소 또는 장소명
+            raise_errors: True면 결과 없이 API 오류만 발생한 경우 예외로 전달
+
+        Returns:
+            (latitude, longitude) 튜플 또는 None
+        """
+        lookups = {
+            "address": lambda: self.address_to_coordinates(address, raise_errors=True),
+            "keyword": lambda: self.keyword_search(address, raise_errors=True)
+        }
+        priority = [name for name in settings.KAKAO_GEOCODE_PRIORITY if name in lookups]
+        priority += [name for name in lookups if name not in priority]
+
+        # 동시 요청 (비활성화 시 우선순위 순서대로 순차 요청)
+        tasks = None
+        if settings.KAKAO_GEOCODE_HEDGE:
+            tasks = [asyncio.create_task(lookups[name]()) for name in priority]
+
+        error = None
+        try:
+            for i, name in enumerate(priority):
+                try:
+                    coords = await (tasks[i] if tasks else lookups[name]())
+                except Exception as e:
+                    error = error or e
+                    continue
+
+                if coords:
+                    logger.debug(f"Geocode '{address}' resolved by {name} search")
+                    return coords
+        finally:
+            if tasks:
+                for task in tasks:
+                    if not task.done():
+                        task.cancel()
+                    elif not task.cancelled():
+                        # 채택되지 않은 검색의 예외도 확인 처리 ("never retrieved" 경고 방지)
+                        task.exception()
+
+        if error is not None and raise_errors:
+            raise error
+        return None
+
     async def keyword_search(
         self,
         keyword: str,
         latitude: Optional[float] = None,
         longitude: Optional[float] = None,
-        radius: int = 2000
+        radius: int = 2000,
+        raise_errors: bool = False
     ) -> Optional[Tuple[float, float]]:
         """
         키워드 검색 (장소 검색)
@@ -113,6 +309,7 @@ class KakaoMapService:
             latitude: 중심 위도 (선택)
             longitude: 중심 경도 (선택)
             radius: 반경 (미터)
+            raise_errors: True면 API 오류를 None 대신 예외로 전달
 
         Returns:
             (latitude, longitude) 튜플 또는 None
@@ -131,36 +328,33 @@ class KakaoMapService:
             params["radius"] = radius
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    endpoint,
-                    headers=self.headers,
-                    params=params,
-                    timeout=10.0
-                )
-                response.raise_for_status()
+            response = await self._request(endpoint, params)
 
-                data = response.json()
-                documents = data.get("documents", [])
+            data = response.json()
+            documents = data.get("documents", [])
 
-                if not documents:
-                    logger.warning(f"No results found for keyword: {keyword}")
-                    return None
+            if not documents:
+                logger.warning(f"No results found for keyword: {keyword}")
+                return None
 
-                # 첫 번째 결과 사용
-                doc = documents[0]
-                lon = float(doc.get("x"))
-                lat = float(doc.get("y"))
-                place_name = doc.get("place_name")
+            # 첫 번째 결과 사용
+            doc = documents[0]
+            lon = float(doc.get("x"))
+            lat = float(doc.get("y"))
+            place_name = doc.get("place_name")
 
-                logger.info(f"Found '{place_name}' for keyword '{keyword}' → ({lat}, {lon})")
-                return (lat, lon)
+            logger.info(f"Found '{place_name}' for keyword '{keyword}' → ({lat}, {lon})")
+            return (lat, lon)
 
         except httpx.HTTPStatusError as e:
             logger.error(f"Kakao API HTTP error: {e.response.status_code} - {e.response.text}")
+            if raise_errors:
+                raise
             return None
         except Exception as e:
             logger.error(f"Keyword search error for '{keyword}': {e}")
+            if raise_errors:
+                raise
             return None
 
     async def reverse_geocode(
@@ -189,32 +383,25 @@ class KakaoMapService:
         }
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    endpoint,
-                    headers=self.headers,
-                    params=params,
-                    timeout=10.0
-                )
-                response.raise_for_status()
+            response = await self._request(endpoint, params)
 
-                data = response.json()
-                documents = data.get("documents", [])
+            data = response.json()
+            documents = data.get("documents", [])
 
-                if not documents:
-                    logger.warning(f"No address found for coordinates: ({latitude}, {longitude})")
-                    return None
+            if not documents:
+                logger.warning(f"No address found for coordinates: ({latitude}, {longitude})")
+                return None
 
-                # 도로명 주소 우선, 없으면 지번 주소
-                doc = documents[0]
-                road_address = doc.get("road_address")
-                if road_address:
-                    address = road_address.get("address_name")
-                else:
-                    address = doc.get("address", {}).get("address_name")
+            # 도로명 주소 우선, 없으면 지번 주소
+            doc = documents[0]
+            road_address = doc.get("road_address")
+            if road_address:
+                address = road_address.get("address_name")
+            else:
+                address = doc.get("address", {}).get("address_name")
 
-                logger.info(f"Reverse geocoded ({latitude}, {longitude}) → '{address}'")
-                return address
+            logger.info(f"Reverse geocoded ({latitude}, {longitude}) → '{address}'")
+            return address
 
         except httpx.HTTPStatusError as e:
             logger.error(f"Kakao API HTTP error: {e.response.status_code} - {e.response.text}")
@@ -244,33 +431,26 @@ class KakaoMapService:
         params = {"query": keyword}
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    endpoint,
-                    headers=self.headers,
-                    params=params,
-                    timeout=10.0
-                )
-                response.raise_for_status()
-
-                data = response.json()
-                documents = data.get("documents", [])
-
-                if not documents:
-                    return None
-
-                # 첫 번째 결과 반환
-                doc = documents[0]
-                return {
-                    "name": doc.get("place_name"),
-                    "address": doc.get("address_name"),
-                    "road_address": doc.get("road_address_name"),
-                    "latitude": float(doc.get("y")),
-                    "longitude": float(doc.get("x")),
-                    "category": doc.get("category_name"),
-                    "phone": doc.get("phone"),
-                    "place_url": doc.get("place_url")
-                }
+            response = await self._request(endpoint, params)
+
+            data = response.json()
+            documents = data.get("documents", [])
+
+            if not documents:
+                return None
+
+            # 첫 번째 결과 반환
+            doc = documents[0]
+            return {
+                "name": doc.get("place_name"),
+                "address": doc.get("address_name"),
+                "road_address": doc.get("road_address_name"),
+                "latitude": float(doc.get("y")),
+                "longitude": float(doc.get("x")),
+                "category": doc.get("category_name"),
+                "phone": doc.get("phone"),
+                "place_url": doc.get("place_url")
+            }
 
         except Exception as e:
             logger.error(f"Get place info error for '{keyword}': {e}")
@@ -0,0 +1,297 @@
+"""
+LLM Message Service
+검색 응답과 분리된 백그라운드 LLM(Ollama) 추천 메시지 생성
+
+- 검색 응답은 템플릿 메시지 + 토큰으로 즉시 반환
+- 토큰 = 프롬프트(검색 결과 요약) fingerprint → 같은 결과는 LLM을 다시 호출하지 않음
+- 동시 Ollama 호출 수 제한 (세마포어), 대기 작업 수 초과 시 생성 생략
+- 생성된 메시지는 메모리 LRU + Redis(워커 간 공유)에 캐싱
+"""
+
+import asyncio
+import hashlib
+import logging
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
+
+import httpx
+
+from app.core.config import settings
+from app.core.services.local_cache import LocalCache
+from app.core.services.redis_service import get_redis_service
+from app.core.services.timing import span
+
+logger = logging.getLogger(__name__)
+
+READY = "ready"
+PENDING = "pending"
+FAILED = "failed"
+
+
+class LLMMessageService:
+    """
+    백그라운드 LLM 메시지 생성 서비스
+
+    Features:
+    - submit: 캐시된 메시지가 있으면 즉시 반환, 없으면 생성 작업 예약 후 토큰 반환
+    - 같은 fingerprint 의 동시 요청은 작업 하나로 병합
+    - get_status: 토큰 상태 조회 (선택적으로 완료까지 대기, 다른 워커가 생성한 메시지는 Redis 조회)
+    - 생성 실패는 짧은 TTL 동안만 기록하고 이후 같은 결과는 재시도
+    """
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        model: Optional[str] = None,
+        concurrency: Optional[int] = None
+    ):
+        """
+        Args:
+            base_url: Ollama 서버 URL (None이면 settings.OLLAMA_BASE_URL)
+            model: 모델명 (None이면 settings.OLLAMA_LLM_MODEL)
+            concurrency: 동시 Ollama 호출 수 (None이면 settings.LLM_MESSAGE_CONCURRENCY)
+        """
+        self.base_url = (base_url or settings.OLLAMA_BASE_URL).rstrip("/")
+        self.model = model or settings.OLLAMA_LLM_MODEL
+        self.concurrency = max(1, concurrency or settings.LLM_MESSAGE_CONCURRENCY)
+
+        self.redis = get_redis_service()
+        self.local = LocalCache(
+            settings.LLM_MESSAGE_CACHE_MAX_BYTES,
+            settings.LLM_MESSAGE_CACHE_TTL
+        )
+
+        # 진행 중인 생성 작업 (fingerprint → Task)
+        self._tasks: Dict[str, asyncio.Task] = {}
+
+        # 클라이언트/세마포어는 이벤트 루프에 묶여 있으므로 루프가 바뀌면 새로 생성
+        self._client: Optional[httpx.AsyncClient] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+        # 통계
+        self.generated = 0
+        self.cache_hits = 0
+        self.failures = 0
+        self.dropped = 0
+
+    def fingerprint(self, prompt: str) -> str:
+        """
+        프롬프트 fingerprint (메시지 토큰 겸 캐시 키)
+
+        프롬프트는 검색 결과 요약(주소, 반경, 개수, 카테고리별 개수, 상위 장소)으로만
+        구성되므로 같은 결과 집합은 같은 fingerprint 가 된다.
+
+        Args:
+            prompt: LLM 프롬프트
+
+        Returns:
+            32자리 16진수 문자열
+        """
+        return hashlib.sha256(f"{self.model}\n{prompt}".encode("utf-8")).hexdigest()[:32]
+
+    def cache_key(self, token: str) -> str:
+        """
+        Redis 캐시 키
+
+        Args:
+            token: 메시지 토큰
+
+        Returns:
+            캐시 키 (예: "llm:3f2a...")
+        """
+        return f"llm:{token}"
+
+    def submit(self, prompt: str) -> Tuple[Optional[str], Optional[str]]:
+        """
+        메시지 생성 요청 (대기하지 않음)
+
+        Args:
+            prompt: LLM 프롬프트
+
+        Returns:
+            (토큰, 이미 생성된 메시지 또는 None)
+            대기 작업 수가 한도를 넘으면 (None, None) - 템플릿 메시지만 사용
+        """
+        token = self.fingerprint(prompt)
+
+        entry = self.local.get(token)
+        if entry is not None and entry["message"] is not None:
+            self.cache_hits += 1
+            return token, entry["message"]
+
+        if token in self._tasks:
+            return token, None
+
+        if len(self._tasks) >= settings.LLM_MESSAGE_MAX_PENDING:
+            self.dropped += 1
+            logger.warning(
+                f"LLM message queue full ({len(self._tasks)} pending), using template message"
+            )
+            return None, None
+
+        self._tasks[token] = asyncio.get_running_loop().create_task(self._generate(token, prompt))
+        return token, None
+
+    async def get_status(self, token: str, wait: float = 0.0) -> Optional[Dict[str, Any]]:
+        """
+        토큰 상태 조회
+
+        Args:
+            token: 메시지 토큰
+            wait: 생성 중이면 완료까지 대기할 최대 시간 (초)
+
+        Returns:
+            {"token", "status": ready | pending | failed, "message"} 또는 None (알 수 없는 토큰)
+        """
+        task = self._tasks.get(token)
+        if task is not None and wait > 0:
+            try:
+                await asyncio.wait_for(asyncio.shield(task), timeout=wait)
+            except asyncio.TimeoutError:
+                pass
+
+        if token in self._tasks:
+            return {"token": token, "status": PENDING, "message": None}
+
+        entry = self.local.get(token)
+        if entry is None:
+            # 다른 워커가 생성한 메시지
+            entry = await self.redis.aget(self.cache_key(token), use_local=False)
+            if entry is None:
+                return None
+            self._store(token, entry)
+
+        status = READY if entry["message"] is not None else FAILED
+        return {"token": token, "status": status, "message": entry["message"]}
+
+    def _store(self, token: str, entry: Dict[str, Any], ttl: Optional[int] = None):
+        """메모리 캐시 저장"""
+        size = len(entry["message"].encode("utf-8")) if entry["message"] else 0
+        self.local.set(token, entry, size=size + len(token), ttl=ttl)
+
+    async def _generate(self, token: str, prompt: str):
+        """
+        메시지 생성 작업 (Redis 캐시 확인 → 세마포어 → Ollama 호출 → 캐싱)
+
+        Args:
+            token: 메시지 토큰
+            prompt: LLM 프롬프트
+        """
+        key = self.cache_key(token)
+        try:
+            cached = await self.redis.aget(key, use_local=False)
+            if cached is not None:
+                self.cache_hits += 1
+                self._store(token, cached)
+                return
+
+            async with self._get_semaphore():
+                message = await self._complete(prompt)
+
+            entry = {"message": message}
+            self._store(token, entry)
+            await self.redis.aset(key, entry, ttl=settings.LLM_MESSAGE_CACHE_TTL, use_local=False)
+            self.generated += 1
+            logger.info(f"LLM message generated: {token}")
+
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.failures += 1
+            self._store(token, {"message": None}, ttl=settings.LLM_MESSAGE_FAILURE_TTL)
+            logger.error(f"LLM message generation failed for {token}: {e}")
+        finally:
+            self._tasks.pop(token, None)
+
+    async def _complete(self, prompt: str) -> str:
+        """
+        Ollama /api/generate 호출 (스트리밍 없이 전체 응답)
+
+        Args:
+            prompt: LLM 프롬프트
+
+        Returns:
+            생성된 메시지
+
+        Raises:
+            httpx.HTTPError: 요청 실패
+            ValueError: 빈 응답
+        """
+        client = self._get_client()
+        with span("ollama"):
+            response = await client.post(
+                f"{self.base_url}/api/generate",
+                json={
+                    "model": self.model,
+                    "prompt": prompt,
+                    "stream": False,
+                    "options": {"temperature": 0.7}
+                }
+            )
+        response.raise_for_status()
+
+        message = (response.json().get("response") or "").strip()
+        if not message:
+            raise ValueError("Empty LLM response")
+        return message
+
+    def _bind_loop(self):
+        """현재 이벤트 루프용 클라이언트/세마포어 준비"""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(timeout=httpx.Timeout(settings.LLM_MESSAGE_TIMEOUT))
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+            self._loop = loop
+
+    def _get_client(self) -> httpx.AsyncClient:
+        self._bind_loop()
+        return self._client
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        self._bind_loop()
+        return self._semaphore
+
+    async def aclose(self):
+        """진행 중인 생성 작업 취소 및 HTTP 클라이언트 종료 (앱 종료 시 호출)"""
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._tasks.clear()
+
+        if self._client is not None:
+            try:
+                await self._client.aclose()
+            except Exception as e:
+                logger.error(f"LLM HTTP client close error: {e}")
+            finally:
+                self._client = None
+                self._loop = None
+
+    def get_stats(self) -> dict:
+        """
+        생성 통계
+
+        Returns:
+            통계 딕셔너리
+        """
+        return {
+            "pending": len(self._tasks),
+            "generated": self.generated,
+            "cache_hits": self.cache_hits,
+            "failures": self.failures,
+            "dropped": self.dropped,
+            "concurrency": self.concurrency
+        }
+
+
+@lru_cache()
+def get_llm_message_service() -> LLMMessageService:
+    """
+    LLMMessageService 싱글톤 인스턴스
+
+    Returns:
+        LLMMessageService 인스턴스
+    """
+    return LLMMessageService()
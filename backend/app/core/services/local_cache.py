@@ -0,0 +1,176 @@
+"""
+Local (L1) Cache
+프로세스 내 LRU 캐시 - Redis(L2) 앞단에서 네트워크 왕복 없이 응답
+"""
+
+import fnmatch
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Any, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class LocalCache:
+    """
+    바이트 한도 기반 LRU 캐시
+
+    Features:
+    - 전체 크기(바이트) 한도 초과 시 가장 오래 사용되지 않은 항목부터 제거
+    - 항목별 TTL
+    - 히트/미스/제거 카운터
+
+    Note:
+        저장된 객체를 복사 없이 그대로 반환하므로 호출 측은 읽기 전용으로 다뤄야 한다.
+    """
+
+    def __init__(self, max_bytes: int, default_ttl: int):
+        """
+        Args:
+            max_bytes: 최대 저장 크기 (바이트)
+            default_ttl: 기본 TTL (초)
+        """
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+
+        # key -> (value, size, expires_at)
+        self._entries: "OrderedDict[str, Tuple[Any, int, float]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        캐시 조회 (히트 시 최근 사용으로 갱신)
+
+        Args:
+            key: 캐시 키
+
+        Returns:
+            저장된 값 또는 None (없거나 만료)
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            value, _, expires_at = entry
+            if expires_at <= time.monotonic():
+                self._remove(key)
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        size: int,
+        ttl: Optional[int] = None
+    ) -> bool:
+        """
+        캐시 저장
+
+        Args:
+            key: 캐시 키
+            value: 저장할 값
+            size: 값의 크기 (바이트, 직렬화 길이 기준)
+            ttl: TTL (초) - None이면 기본값 사용
+
+        Returns:
+            저장 여부 (단일 항목이 한도를 넘으면 False)
+        """
+        if size > self.max_bytes:
+            return False
+
+        expires_at = time.monotonic() + (ttl or self.default_ttl)
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            self._entries[key] = (value, size, expires_at)
+            self._bytes += size
+
+            # 한도 초과 시 LRU 제거
+            while self._bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+        return True
+
+    def delete(self, key: str) -> bool:
+        """
+        캐시 항목 삭제
+
+        Args:
+            key: 캐시 키
+
+        Returns:
+            삭제 여부
+        """
+        with self._lock:
+            if key not in self._entries:
+                return False
+            self._remove(key)
+            return True
+
+    def delete_pattern(self, pattern: str) -> int:
+        """
+        패턴에 매칭되는 항목 삭제 (Redis glob 패턴과 동일한 형식)
+
+        Args:
+            pattern: 키 패턴 (예: "location:*")
+
+        Returns:
+            삭제된 항목 개수
+        """
+        with self._lock:
+            if pattern == "*":
+                deleted = len(self._entries)
+                self._entries.clear()
+                self._bytes = 0
+                return deleted
+
+            keys = [key for key in self._entries if fnmatch.fnmatchcase(key, pattern)]
+            for key in keys:
+                self._remove(key)
+            return len(keys)
+
+    def clear(self):
+        """전체 삭제"""
+        self.delete_pattern("*")
+
+    def _remove(self, key: str):
+        """항목 제거 (lock 보유 상태에서 호출)"""
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
+
+    def get_stats(self) -> dict:
+        """
+        L1 캐시 통계
+
+        Returns:
+            통계 딕셔너리
+        """
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": f"{(self.hits / total * 100):.1f}%" if total else "0.0%"
+        }
@@ -0,0 +1,285 @@
+"""
+Prometheus Metrics
+/metrics 엔드포인트용 애플리케이션 메트릭 (Prometheus 텍스트 노출 형식)
+
+- HTTP 요청 지연 시간 (라우트별) / 진행 중인 요청 수
+- 워크플로우 노드 / 외부 호출(Kakao, Supabase, Redis) 지연 시간 및 진행 중인 호출 수
+- 캐시 hit/miss (키 prefix 별)
+- 검색 결과 크기
+
+기록은 딕셔너리 카운터 증가뿐이라 상시 활성화해도 부담이 없고,
+노출 형식 문자열은 스크레이프 시에만 생성한다. (prometheus_client 불필요)
+"""
+
+import math
+from typing import Dict, List, Tuple
+
+from app.core.services import timing
+from app.core.services.timing import DEFAULT_BUCKETS, Histogram
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# 검색 결과 위치 수 버킷
+RESULT_SIZE_BUCKETS = (0, 1, 5, 10, 20, 50, 100, 200, 500, 1000)
+
+
+def _format_value(value: float) -> str:
+    """샘플 값 문자열 (정수는 소수점 없이, 무한대는 +Inf)"""
+    if isinstance(value, float):
+        if math.isinf(value):
+            return "+Inf" if value > 0 else "-Inf"
+        if value.is_integer():
+            return str(int(value))
+    return repr(value)
+
+
+def _escape(value: str) -> str:
+    """레이블 값 이스케이프"""
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(names: Tuple[str, ...], values: Tuple[str, ...]) -> str:
+    """레이블 문자열 (예: '{route="/health",status="200"}')"""
+    if not names:
+        return ""
+    pairs = ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values))
+    return "{" + pairs + "}"
+
+
+def _header(name: str, documentation: str, metric_type: str) -> List[str]:
+    return [f"# HELP {name} {documentation}", f"# TYPE {name} {metric_type}"]
+
+
+def _histogram_samples(
+    name: str,
+    labelnames: Tuple[str, ...],
+    labels: Tuple[str, ...],
+    histogram: Histogram
+) -> List[str]:
+    """히스토그램 하나의 _bucket(누적) / _sum / _count 샘플"""
+    lines = []
+    bucket_names = labelnames + ("le",)
+    cumulative = 0
+    for bound, count in zip(histogram.buckets + (float("inf"),), histogram.counts):
+        cumulative += count
+        lines.append(
+            f"{name}_bucket{_labels(bucket_names, labels + (_format_value(float(bound)),))} {cumulative}"
+        )
+    lines.append(f"{name}_sum{_labels(labelnames, labels)} {_format_value(histogram.sum)}")
+    lines.append(f"{name}_count{_labels(labelnames, labels)} {histogram.count}")
+    return lines
+
+
+class Counter:
+    """레이블별 누적 카운터"""
+
+    metric_type = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()):
+        """
+        Args:
+            name: 메트릭 이름
+            documentation: HELP 설명
+            labelnames: 레이블 이름
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self.values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, *labels: str, amount: float = 1):
+        """
+        값 증가
+
+        Args:
+            *labels: labelnames 순서의 레이블 값
+            amount: 증가량
+        """
+        self.values[labels] = self.values.get(labels, 0) + amount
+
+    def collect(self) -> List[str]:
+        """노출 형식 라인"""
+        lines = _header(self.name, self.documentation, self.metric_type)
+        for labels, value in sorted(self.values.items()):
+            lines.append(f"{self.name}{_labels(self.labelnames, labels)} {_format_value(value)}")
+        return lines
+
+    def reset(self):
+        self.values.clear()
+
+
+class Gauge(Counter):
+    """레이블별 현재 값 (진행 중인 요청 수 등)"""
+
+    metric_type = "gauge"
+
+    def dec(self, *labels: str, amount: float = 1):
+        """
+        값 감소
+
+        Args:
+            *labels: labelnames 순서의 레이블 값
+            amount: 감소량
+        """
+        self.values[labels] = self.values.get(labels, 0) - amount
+
+
+class LabeledHistogram:
+    """레이블별 히스토그램"""
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Tuple[str, ...] = (),
+        buckets: Tuple[float, ...] = DEFAULT_BUCKETS
+    ):
+        """
+        Args:
+            name: 메트릭 이름
+            documentation: HELP 설명
+            labelnames: 레이블 이름
+            buckets: 버킷 상한
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self.buckets = buckets
+        self.children: Dict[Tuple[str, ...], Histogram] = {}
+
+    def observe(self, value: float, *labels: str):
+        """
+        값 기록
+
+        Args:
+            value: 관측값
+            *labels: labelnames 순서의 레이블 값
+        """
+        histogram = self.children.get(labels)
+        if histogram is None:
+            histogram = self.children[labels] = Histogram(self.buckets)
+        histogram.observe(value)
+
+    def collect(self) -> List[str]:
+        """노출 형식 라인"""
+        lines = _header(self.name, self.documentation, "histogram")
+        for labels, histogram in sorted(self.children.items()):
+            lines.extend(_histogram_samples(self.name, self.labelnames, labels, histogram))
+        return lines
+
+    def reset(self):
+        self.children.clear()
+
+
+# HTTP
+HTTP_REQUEST_DURATION = LabeledHistogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template.",
+    ("method", "route", "status")
+)
+HTTP_REQUESTS_IN_FLIGHT = Gauge(
+    "http_requests_in_flight",
+    "HTTP requests currently being served."
+)
+
+# Cache
+CACHE_HITS = Counter(
+    "cache_hits_total",
+    "Cache hits by key prefix and tier (l1: in-process, l2: Redis).",
+    ("prefix", "tier")
+)
+CACHE_MISSES = Counter(
+    "cache_misses_total",
+    "Cache misses (L1 and Redis) by key prefix.",
+    ("prefix",)
+)
+
+# Search
+SEARCH_RESULT_SIZE = LabeledHistogram(
+    "search_result_locations",
+    "Number of locations returned per search workflow run.",
+    buckets=RESULT_SIZE_BUCKETS
+)
+
+_REGISTRY = (
+    HTTP_REQUEST_DURATION,
+    HTTP_REQUESTS_IN_FLIGHT,
+    CACHE_HITS,
+    CACHE_MISSES,
+    SEARCH_RESULT_SIZE
+)
+
+
+def key_prefix(key: str) -> str:
+    """
+    캐시 키 prefix (레이블 카디널리티 제한용 첫 구간)
+
+    Args:
+        key: 캐시 키 (예: "location:v3:37.5665:126.978:2000")
+
+    Returns:
+        prefix (예: "location")
+    """
+    return key.partition(":")[0]
+
+
+def record_cache_hit(key: str, tier: str):
+    """
+    캐시 hit 기록
+
+    Args:
+        key: 캐시 키
+        tier: "l1" 또는 "l2"
+    """
+    CACHE_HITS.inc(key_prefix(key), tier)
+
+
+def record_cache_miss(key: str):
+    """
+    캐시 miss 기록
+
+    Args:
+        key: 캐시 키
+    """
+    CACHE_MISSES.inc(key_prefix(key))
+
+
+def _span_metrics(kind: str, metric: str, label: str, subject: str) -> List[str]:
+    """timing 스팬 히스토그램 / 진행 중인 호출 수를 메트릭으로 변환"""
+    duration = f"{metric}_duration_seconds"
+    lines = _header(duration, f"{subject} latency.", "histogram")
+    for name, histogram in sorted(timing.get_histograms(kind).items()):
+        lines.extend(_histogram_samples(duration, (label,), (name,), histogram))
+
+    in_flight = f"{metric}s_in_flight"
+    lines.extend(_header(in_flight, f"{subject}s currently in progress.", "gauge"))
+    for name, count in sorted(timing.get_in_flight(kind).items()):
+        lines.append(f"{in_flight}{_labels((label,), (name,))} {count}")
+    return lines
+
+
+def render_metrics() -> str:
+    """
+    전체 메트릭 노출 형식 문자열
+
+    Returns:
+        Prometheus 텍스트 노출 형식 (version 0.0.4)
+    """
+    lines: List[str] = []
+    for metric in _REGISTRY:
+        lines.extend(metric.collect())
+
+    lines.extend(_span_metrics(
+        timing.NODE, "workflow_node", "node", "Workflow node"
+    ))
+    lines.extend(_span_metrics(
+        timing.DEPENDENCY, "dependency_call", "dependency", "External dependency call"
+    ))
+
+    return "\n".join(lines) + "\n"
+
+
+def reset_metrics():
+    """메트릭 초기화 (테스트용)"""
+    for metric in _REGISTRY:
+        metric.reset()
@@ -3,17 +3,46 @@ Redis Caching Service
 Upstash Redis 기반 캐싱 레이어
 """
 
+import asyncio
 import json
 import logging
-from typing import Optional, Any
+import math
+import random
+import time
+import uuid
+from typing import Optional, Any, Awaitable, Callable, List, Dict, Tuple, Union
 from functools import lru_cache
 import redis
 from redis.asyncio import Redis as AsyncRedis
 
 from app.core.config import settings
+from app.core.services.cache_codec import get_cache_codec
+from app.core.services.circuit_breaker import CircuitBreaker, OPEN
+from app.core.services import metrics
+from app.core.services.timing import span
+from app.core.services.local_cache import LocalCache
+from app.core.services.distance_service import calculate_bounding_box
 
 logger = logging.getLogger(__name__)
 
+# stale-while-revalidate 엔트리 표식 (값과 soft 만료 시각, 재계산 소요 시간을 함께 저장)
+SWR_MARKER = "__swr__"
+
+# 카테고리별 세대 카운터 (HINCRBY 한 번으로 해당 카테고리 키 전체 무효화)
+GENERATIONS_KEY = "cache:generations"
+# 카테고리 없는(전체) 쿼리의 세대 - 어느 카테고리가 올라가도 함께 증가
+GENERATION_ALL = "all"
+# 모든 카테고리 공통 세대 - 각 카테고리 세대에 더해지므로 한 번 증가로 전체 무효화
+GENERATION_EPOCH = "*"
+
+# 서킷 브레이커 실패로 집계할 오류 (연결/타임아웃, 값 디코딩 오류 등은 제외)
+OUTAGE_ERRORS = (
+    redis.exceptions.ConnectionError,
+    redis.exceptions.TimeoutError,
+    asyncio.TimeoutError,
+    OSError
+)
+
 
 class RedisService:
     """
@@ -21,18 +50,50 @@ class RedisService:
 
     Features:
     - Upstash Redis 연결
-    - 캐시 키 생성 전략 (좌표 반올림)
+    - 캐시 키 생성 전략 (좌표 반올림, 그리드 셀)
+    - 바이너리 값 코덱 (msgpack/JSON + zstd/zlib, 헤더 바이트로 형식 구분)
     - TTL 5분 기본 설정
-    - Get/Set/Delete 메서드
+    - Get/Set/Delete 메서드, 파이프라인 MGet/MSet
+    - 비동기 aget/aset/adelete/amget 메서드 (redis.asyncio 커넥션 풀)
+    - 비동기 경로 앞단 L1 프로세스 캐시 (pub/sub 으로 워커 간 무효화)
+    - 워커 간 분산 락 (SET NX PX, 토큰 확인 후 해제)
+    - 세대 카운터 기반 카테고리 무효화 (키에 세대 포함, 이전 세대는 SCAN+UNLINK 로 정리)
+    - stale-while-revalidate: soft 만료 후에도 stale 값을 응답하고 백그라운드에서 1회 갱신
+      (XFetch 확률적 조기 갱신으로 hot key의 갱신 시점 분산)
+    - 서킷 브레이커: 연속 연결 오류 시 소켓 타임아웃을 기다리지 않고 즉시 캐시 미스 처리,
+      백그라운드 PING 으로 복구 확인 후 자동 재개
     """
 
     def __init__(self):
         """Redis 클라이언트 초기화"""
+        self.breaker = CircuitBreaker("redis", probe=self._probe)
         self.enabled = settings.CACHE_ENABLED
         self.ttl = settings.REDIS_CACHE_TTL
+        self.codec = get_cache_codec()
         self.client: Optional[redis.Redis] = None
         self.async_client: Optional[AsyncRedis] = None
 
+        # L1 캐시 (워커 프로세스별)
+        self.local: Optional[LocalCache] = None
+        if settings.L1_CACHE_ENABLED:
+            self.local = LocalCache(settings.L1_CACHE_MAX_BYTES, settings.L1_CACHE_TTL)
+        self.instance_id = uuid.uuid4().hex
+        self._invalidation_task: Optional[asyncio.Task] = None
+
+        # L2 (Redis) 히트/미스 카운터 (비동기 경로)
+        self.l2_hits = 0
+        self.l2_misses = 0
+
+        # stale-while-revalidate 백그라운드 갱신 (키별 1개)
+        self._refresh_tasks: Dict[str, asyncio.Task] = {}
+        self.stale_hits = 0
+        self.early_refreshes = 0
+        self.refreshes = 0
+        self.refresh_errors = 0
+
+        # 카테고리별 캐시 세대 (키 생성 시 사용, pub/sub 및 주기적 재조회로 워커 간 동기화)
+        self._generations: Dict[str, int] = {}
+
         if self.enabled:
             try:
                 # Check if REDIS_URL uses HTTP/HTTPS (Upstash REST API)
@@ -48,19 +109,64 @@ class RedisService:
                 # Sync client
                 self.client = redis.from_url(
                     settings.REDIS_URL,
-                    decode_responses=True,
+                    decode_responses=False,
                     socket_connect_timeout=5,
                     socket_timeout=5
                 )
 
                 # Test connection
                 self.client.ping()
+                self.load_generations()
+
+                # Async client (이벤트 루프를 막지 않는 요청 경로용, 연결은 첫 명령 시 생성)
+                self.async_client = AsyncRedis.from_url(
+                    settings.REDIS_URL,
+                    decode_responses=False,
+                    socket_connect_timeout=5,
+                    socket_timeout=5,
+                    max_connections=settings.REDIS_MAX_CONNECTIONS
+                )
                 logger.info("Redis client initialized successfully")
 
             except Exception as e:
                 logger.warning(f"Redis connection failed: {e}. Caching disabled.")
                 self.enabled = False
                 self.client = None
+                self.async_client = None
+
+    @property
+    def enabled(self) -> bool:
+        """캐시 사용 가능 여부 (설정/초기 연결 성공 + 서킷이 열려 있지 않음, 부수 효과 없음)"""
+        return self._enabled and self.breaker.state != OPEN
+
+    @enabled.setter
+    def enabled(self, value: bool):
+        self._enabled = value
+
+    async def _probe(self):
+        """서킷 복구 확인 (PING)"""
+        await self.async_client.ping()
+
+    def _allow(self, client: Any) -> bool:
+        """
+        Redis 호출 직전 허용 여부 (실제 호출마다 한 번만 확인)
+
+        True 를 받은 호출은 record_success 또는 _record_error 로 결과를 기록해야 한다.
+
+        Args:
+            client: 사용할 클라이언트 (self.client 또는 self.async_client)
+
+        Returns:
+            호출해도 되면 True
+        """
+        return self._enabled and client is not None and self.breaker.allow()
+
+    def _record_error(self, error: Exception):
+        """연결/타임아웃 오류만 서킷 브레이커 실패로 집계 (그 외 오류는 half_open 시도 슬롯만 반환)"""
+        if isinstance(error, OUTAGE_ERRORS):
+            self.breaker.record_failure(error)
+        else:
+            self.breaker.release()
 
     def _round_coordinate(self, value: float, precision: int = 4) -> float:
         """
@@ -94,13 +200,14 @@ class RedisService:
             precision: 좌표 반올림 자릿수
 
         Returns:
-            캐시 키 (예: "location:37.5665:126.9780:1000:cultural_events")
+            캐시 키 (예: "location:v0:37.5665:126.9780:1000:cultural_events")
         """
         lat_rounded = self._round_coordinate(latitude, precision)
         lon_rounded = self._round_coordinate(longitude, precision)
 
         key_parts = [
             "location",
+            f"v{self.generation(category or GENERATION_ALL)}",
             f"{lat_rounded}",
             f"{lon_rounded}",
             f"{radius}"
@@ -111,6 +218,210 @@ class RedisService:
 
         return ":".join(key_parts)
 
+    def cell_index(
+        self,
+        latitude: float,
+        longitude: float,
+        cell_size: float
+    ) -> Tuple[int, int]:
+        """
+        좌표가 속한 그리드 셀 인덱스
+
+        Args:
+            latitude: 위도
+            longitude: 경도
+            cell_size: 셀 크기 (도)
+
+        Returns:
+            (위도 인덱스, 경도 인덱스)
+        """
+        return (
+            math.floor(latitude / cell_size),
+            math.floor(longitude / cell_size)
+        )
+
+    def covering_cells(
+        self,
+        latitude: float,
+        longitude: float,
+        radius: int,
+        cell_size: float
+    ) -> List[Tuple[int, int]]:
+        """
+        검색 반경의 경계 상자를 덮는 그리드 셀 목록
+
+        Args:
+            latitude: 중심 위도
+            longitude: 중심 경도
+            radius: 반경 (미터)
+            cell_size: 셀 크기 (도)
+
+        Returns:
+            셀 인덱스 리스트
+        """
+        min_lat, max_lat, min_lon, max_lon = calculate_bounding_box(latitude, longitude, radius)
+        min_i, min_j = self.cell_index(min_lat, min_lon, cell_size)
+        max_i, max_j = self.cell_index(max_lat, max_lon, cell_size)
+
+        return [
+            (i, j)
+            for i in range(min_i, max_i + 1)
+            for j in range(min_j, max_j + 1)
+        ]
+
+    def generate_cell_key(
+        self,
+        table: str,
+        cell: Tuple[int, int],
+        cell_size: float
+    ) -> str:
+        """
+        그리드 셀 캐시 키 생성
+
+        Args:
+            table: 테이블명
+            cell: 셀 인덱스
+            cell_size: 셀 크기 (도) - 설정 변경 시 키가 섞이지 않도록 포함
+
+        Returns:
+            캐시 키 (예: "cell:v0:0.01:libraries:3756:12697")
+        """
+        return f"cell:v{self.generation(table)}:{cell_size}:{table}:{cell[0]}:{cell[1]}"
+
+    @staticmethod
+    def key_generation(key: str) -> Optional[Tuple[str, int]]:
+        """
+        세대가 포함된 캐시 키의 (카테고리, 세대)
+
+        Args:
+            key: generate_cache_key/generate_cell_key 또는
+                utils.cache 데코레이터("cache:{func}:v{gen}:{hash}")로 만든 키
+
+        Returns:
+            (카테고리, 세대), 세대 키 형식이 아니면 None
+        """
+        parts = key.split(":")
+
+        if parts[0] == "location" and len(parts) in (5, 6):
+            version = parts[1]
+            namespace = parts[5] if len(parts) == 6 else GENERATION_ALL
+        elif parts[0] == "cell" and len(parts) == 6:
+            version = parts[1]
+            namespace = parts[3]
+        elif parts[0] == "cache" and len(parts) == 4:
+            # 데코레이터 키의 카테고리는 함수명의 key_prefix ("location.func" → "location")
+            version = parts[2]
+            namespace = parts[1].split(".", 1)[0] if "." in parts[1] else GENERATION_ALL
+        else:
+            return None
+
+        if not version.startswith("v") or not version[1:].isdigit():
+            return None
+
+        return namespace, int(version[1:])
+
+    def generation(self, namespace: str) -> int:
+        """
+        카테고리의 현재 캐시 세대 (프로세스 메모리 값, Redis 왕복 없음)
+
+        Args:
+            namespace: 카테고리 (전체는 GENERATION_ALL)
+
+        Returns:
+            세대 번호 (카테고리 카운터 + 공통 세대, 기본 0)
+        """
+        return self._generations.get(namespace, 0) + self._generations.get(GENERATION_EPOCH, 0)
+
+    def _apply_generations(self, generations: Dict[Any, Any]):
+        """Redis/메시지에서 읽은 세대 반영 (더 큰 값만 적용)"""
+        for namespace, value in generations.items():
+            if isinstance(namespace, bytes):
+                namespace = namespace.decode()
+            value = int(value)
+            if value > self._generations.get(namespace, 0):
+                self._generations[namespace] = value
+
+    def load_generations(self) -> bool:
+        """
+        Redis의 세대 카운터 동기 조회 (초기화 시)
+
+        Returns:
+            성공 여부
+        """
+        if not self.client:
+            return False
+
+        try:
+            self._apply_generations(self.client.hgetall(GENERATIONS_KEY))
+            return True
+        except Exception as e:
+            logger.warning(f"Redis generation load error: {e}")
+            return False
+
+    async def arefresh_generations(self) -> bool:
+        """
+        Redis의 세대 카운터 비동기 재조회 (무효화 메시지 누락 대비)
+
+        Returns:
+            성공 여부
+        """
+        if not self.async_client:
+            return False
+
+        try:
+            self._apply_generations(await self.async_client.hgetall(GENERATIONS_KEY))
+            return True
+        except Exception as e:
+            logger.warning(f"Redis generation refresh error: {e}")
+            return False
+
+    def bump_generation(self, namespace: Optional[str] = None) -> Optional[int]:
+        """
+        카테고리 캐시 세대 증가 - 이전 세대 키는 더 이상 조회되지 않음 (O(1) 무효화)
+
+        카테고리 결과는 전체(카테고리 없음) 쿼리 결과에도 포함되므로 GENERATION_ALL 도 함께
+        증가시킨다. None 이면 공통 세대(GENERATION_EPOCH)를 증가시켜 모든 카테고리를
+        무효화한다. 이전 세대 키는 TTL 만료 또는 sweep_stale_generations 로 정리한다.
+
+        Args:
+            namespace: 카테고리 (GENERATION_ALL 이면 전체 쿼리만, None이면 모든 카테고리)
+
+        Returns:
+            새 세대 번호 (None이면 GENERATION_ALL 의 세대), 실패 시 None
+        """
+        if not self._allow(self.client):
+            return None
+
+        if namespace is None:
+            namespaces = [GENERATION_EPOCH]
+        elif namespace == GENERATION_ALL:
+            namespaces = [GENERATION_ALL]
+        else:
+            namespaces = [namespace, GENERATION_ALL]
+
+        try:
+            pipe = self.client.pipeline(transaction=True)
+            for name in namespaces:
+                pipe.hincrby(GENERATIONS_KEY, name, 1)
+            generations = dict(zip(namespaces, pipe.execute()))
+            self.breaker.record_success()
+        except Exception as e:
+            self._record_error(e)
+            logger.error(f"Redis generation bump error for {namespace}: {e}")
+            return None
+
+        self._apply_generations(generations)
+        try:
+            self.client.publish(
+                settings.CACHE_INVALIDATION_CHANNEL,
+                self._invalidation_message(generations=generations)
+            )
+        except Exception as e:
+            logger.warning(f"Redis PUBLISH generation error: {e}")
+
+        logger.info(f"Cache generation bumped: {generations}")
+        return self.generation(namespace or GENERATION_ALL)
+
     def get(self, key: str) -> Optional[Any]:
         """
         캐시에서 데이터 조회
@@ -121,18 +432,22 @@ class RedisService:
         Returns:
             캐시된 데이터 (JSON 디코딩) 또는 None
         """
-        if not self.enabled or not self.client:
+        if not self._allow(self.client):
             return None
 
         try:
             cached = self.client.get(key)
+            self.breaker.record_success()
             if cached:
+                metrics.record_cache_hit(key, "l2")
                 logger.debug(f"Cache HIT: {key}")
-                return json.loads(cached)
+                return self._unwrap(self.codec.decode(cached))
             else:
+                metrics.record_cache_miss(key)
                 logger.debug(f"Cache MISS: {key}")
                 return None
         except Exception as e:
+            self._record_error(e)
             logger.error(f"Redis GET error for key {key}: {e}")
             return None
 
@@ -147,22 +462,31 @@ class RedisService:
 
         Args:
             key: 캐시 키
-            value: 저장할 데이터 (JSON 직렬화 가능)
+            value: 저장할 데이터 (JSON 호환 타입)
             ttl: Time To Live (초) - None이면 기본값 사용
 
         Returns:
             성공 여부
         """
-        if not self.enabled or not self.client:
+        if not self._allow(self.client):
             return False
 
         try:
             ttl = ttl or self.ttl
-            serialized = json.dumps(value, ensure_ascii=False)
-            self.client.setex(key, ttl, serialized)
+            serialized = self.codec.encode(value)
+
+            # 저장과 다른 워커의 L1 무효화 알림을 한 번의 왕복으로 전송 (L1 사용 시에만 알림)
+            pipe = self.client.pipeline(transaction=False)
+            pipe.setex(key, ttl, serialized)
+            if self.local is not None:
+                self.local.delete(key)
+                pipe.publish(settings.CACHE_INVALIDATION_CHANNEL, self._invalidation_message(keys=[key]))
+            pipe.execute()
+            self.breaker.record_success()
             logger.debug(f"Cache SET: {key} (TTL: {ttl}s)")
             return True
         except Exception as e:
+            self._record_error(e)
             logger.error(f"Redis SET error for key {key}: {e}")
             return False
 
@@ -176,41 +500,899 @@ class RedisService:
         Returns:
             성공 여부
         """
-        if not self.enabled or not self.client:
+        if not self._allow(self.client):
             return False
 
         try:
             result = self.client.delete(key)
+            self.breaker.record_success()
+            self._invalidate_local(keys=[key])
             logger.debug(f"Cache DELETE: {key} (result: {result})")
             return result > 0
         except Exception as e:
+            self._record_error(e)
             logger.error(f"Redis DELETE error for key {key}: {e}")
             return False
 
-    def delete_pattern(self, pattern: str) -> int:
+    def mget(self, keys: List[str]) -> List[Optional[Any]]:
         """
-        패턴에 매칭되는 모든 키 삭제
+        여러 키를 한 번에 조회 (MGET 단일 왕복)
 
         Args:
-            pattern: 키 패턴 (예: "location:*:cultural_events")
+            keys: 캐시 키 리스트
+
+        Returns:
+            키 순서대로 캐시된 데이터 (stale 값 포함) 또는 None 리스트
+        """
+        if not keys:
+            return []
+
+        if not self._allow(self.client):
+            return [None] * len(keys)
+
+        try:
+            values = self.client.mget(keys)
+            self.breaker.record_success()
+        except Exception as e:
+            self._record_error(e)
+            logger.error(f"Redis MGET error for {len(keys)} keys: {e}")
+            return [None] * len(keys)
+
+        results = []
+        for key, cached in zip(keys, values):
+            if cached:
+                metrics.record_cache_hit(key, "l2")
+            else:
+                metrics.record_cache_miss(key)
+            try:
+                results.append(self._unwrap(self.codec.decode(cached)) if cached else None)
+            except Exception as e:
+                logger.error(f"Redis MGET decode error for key {key}: {e}")
+                results.append(None)
+
+        logger.debug(f"Cache MGET: {sum(r is not None for r in results)}/{len(keys)} hits")
+        return results
+
+    def mset(
+        self,
+        mapping: Dict[str, Any],
+        ttl: Optional[int] = None
+    ) -> bool:
+        """
+        여러 키를 한 번에 저장 (SETEX 파이프라인 단일 왕복)
+
+        Args:
+            mapping: {캐시 키: 데이터}
+            ttl: Time To Live (초) - None이면 기본값 사용
+
+        Returns:
+            성공 여부
+        """
+        if not mapping:
+            return True
+
+        if not self._allow(self.client):
+            return False
+
+        try:
+            ttl = ttl or self.ttl
+
+            pipe = self.client.pipeline(transaction=False)
+            for key, value in mapping.items():
+                pipe.setex(key, ttl, self.codec.encode(value))
+            if self.local is not None:
+                for key in mapping:
+                    self.local.delete(key)
+                pipe.publish(
+                    settings.CACHE_INVALIDATION_CHANNEL,
+                    self._invalidation_message(keys=list(mapping))
+                )
+            pipe.execute()
+            self.breaker.record_success()
+
+            logger.debug(f"Cache MSET: {len(mapping)} keys (TTL: {ttl}s)")
+            return True
+        except Exception as e:
+            self._record_error(e)
+            logger.error(f"Redis MSET error for {len(mapping)} keys: {e}")
+            return False
+
+    async def aget(self, key: str, use_local: bool = True) -> Optional[Any]:
+        """
+        캐시에서 데이터 조회 (비동기)
+
+        Args:
+            key: 캐시 키
+            use_local: False면 L1을 거치지 않음 (자체 메모리 캐시를 둔 호출 측용)
+
+        Returns:
+            캐시된 데이터 (JSON 디코딩, soft 만료된 stale 값 포함) 또는 None
+        """
+        return self._unwrap(await self._aget_entry(key, use_local))
+
+    async def _aget_entry(self, key: str, use_local: bool = True) -> Optional[Any]:
+        """L1 → Redis 순서로 저장된 엔트리 조회 (SWR 엔트리는 그대로 반환)"""
+        if not self.enabled or not self.async_client:
+            return None
+
+        # L1 조회 (I/O 없음)
+        if use_local and self.local is not None:
+            value = self.local.get(key)
+            if value is not None:
+                metrics.record_cache_hit(key, "l1")
+                logger.debug(f"Cache L1 HIT: {key}")
+                return value
+
+        if not self.breaker.allow():
+            return None
+
+        try:
+            with span("redis", op="GET"):
+                cached = await self.async_client.get(key)
+            self.breaker.record_success()
+            if cached:
+                self.l2_hits += 1
+                metrics.record_cache_hit(key, "l2")
+                logger.debug(f"Cache HIT: {key}")
+                value = self.codec.decode(cached)
+                if use_local:
+                    self._store_local(key, value, cached)
+                return value
+            else:
+                self.l2_misses += 1
+                metrics.record_cache_miss(key)
+                logger.debug(f"Cache MISS: {key}")
+                return None
+        except Exception as e:
+            self._record_error(e)
+            logger.error(f"Redis async GET error for key {key}: {e}")
+            return None
+
+    async def aset(
+        self,
+        key: str,
+        value: Any,
+        ttl: Optional[int] = None,
+        use_local: bool = True
+    ) -> bool:
+        """
+        캐시에 데이터 저장 (비동기)
+
+        Args:
+            key: 캐시 키
+            value: 저장할 데이터 (JSON 호환 타입)
+            ttl: Time To Live (초) - None이면 기본값 사용
+            use_local: False면 L1 저장 및 워커 간 무효화 알림 생략
+
+        Returns:
+            성공 여부
+        """
+        if not self._allow(self.async_client):
+            return False
+
+        try:
+            ttl = ttl or self.ttl
+            serialized = self.codec.encode(value)
+
+            # 저장과 다른 워커의 L1 무효화 알림을 한 번의 왕복으로 전송
+            pipe = self.async_client.pipeline(transaction=False)
+            pipe.setex(key, ttl, serialized)
+            if use_local and self.local is not None:
+                pipe.publish(settings.CACHE_INVALIDATION_CHANNEL, self._invalidation_message(keys=[key]))
+            with span("redis", op="SET"):
+                await pipe.execute()
+            self.breaker.record_success()
+
+            if use_local:
+                self._store_local(key, value, serialized, ttl)
+            logger.debug(f"Cache SET: {key} (TTL: {ttl}s)")
+            return True
+        except Exception as e:
+            if self.local is not None:
+                self.local.delete(key)
+            self._record_error(e)
+            logger.error(f"Redis async SET error for key {key}: {e}")
+            return False
+
+    async def adelete(self, key: str) -> bool:
+        """
+        캐시에서 데이터 삭제 (비동기)
+
+        Args:
+            key: 캐시 키
+
+        Returns:
+            성공 여부
+        """
+        if not self._allow(self.async_client):
+            return False
+
+        if self.local is not None:
+            self.local.delete(key)
+
+        try:
+            pipe = self.async_client.pipeline(transaction=False)
+            pipe.delete(key)
+            if self.local is not None:
+                pipe.publish(settings.CACHE_INVALIDATION_CHANNEL, self._invalidation_message(keys=[key]))
+            with span("redis", op="DEL"):
+                result, *_ = await pipe.execute()
+            self.breaker.record_success()
+            logger.debug(f"Cache DELETE: {key} (result: {result})")
+            return result > 0
+        except Exception as e:
+            self._record_error(e)
+            logger.error(f"Redis async DELETE error for key {key}: {e}")
+            return False
+
+    async def amget(self, keys: List[str], use_local: bool = True) -> List[Optional[Any]]:
+        """
+        여러 키를 한 번에 조회 (비동기, 단일 왕복)
+
+        Args:
+            keys: 캐시 키 리스트
+            use_local: False면 L1을 거치지 않음 (자체 메모리 캐시를 둔 호출 측용)
+
+        Returns:
+            키 순서대로 캐시된 데이터 (stale 값 포함) 또는 None 리스트
+        """
+        return [self._unwrap(entry) for entry in await self._amget_entries(keys, use_local)]
+
+    async def _amget_entries(self, keys: List[str], use_local: bool = True) -> List[Optional[Any]]:
+        """L1 → Redis(MGET) 순서로 저장된 엔트리 조회 (SWR 엔트리는 그대로 반환)"""
+        if not keys:
+            return []
+
+        if not self.enabled or not self.async_client:
+            return [None] * len(keys)
+
+        results: List[Optional[Any]] = [None] * len(keys)
+
+        # L1에 없는 키만 Redis 조회
+        missing = []
+        for i, key in enumerate(keys):
+            value = self.local.get(key) if use_local and self.local is not None else None
+            if value is not None:
+                metrics.record_cache_hit(key, "l1")
+                results[i] = value
+            else:
+                missing.append(i)
+
+        if not missing or not self.breaker.allow():
+            return results
+
+        try:
+            with span("redis", op="MGET"):
+                values = await self.async_client.mget([keys[i] for i in missing])
+            self.breaker.record_success()
+        except Exception as e:
+            self._record_error(e)
+            logger.error(f"Redis async MGET error for {len(missing)} keys: {e}")
+            return results
+
+        for i, cached in zip(missing, values):
+            if cached:
+                self.l2_hits += 1
+                metrics.record_cache_hit(keys[i], "l2")
+                results[i] = self.codec.decode(cached)
+                if use_local:
+                    self._store_local(keys[i], results[i], cached)
+            else:
+                self.l2_misses += 1
+                metrics.record_cache_miss(keys[i])
+
+        return results
+
+    async def amset(
+        self,
+        mapping: Dict[str, Any],
+        ttl: Optional[int] = None
+    ) -> bool:
+        """
+        여러 키를 한 번에 저장 (비동기, 파이프라인 단일 왕복)
+
+        Args:
+            mapping: {캐시 키: 데이터}
+            ttl: Time To Live (초) - None이면 기본값 사용
+
+        Returns:
+            성공 여부
+        """
+        if not mapping:
+            return True
+
+        if not self._allow(self.async_client):
+            return False
+
+        try:
+            ttl = ttl or self.ttl
+            serialized = {
+                key: self.codec.encode(value)
+                for key, value in mapping.items()
+            }
+
+            pipe = self.async_client.pipeline(transaction=False)
+            for key, data in serialized.items():
+                pipe.setex(key, ttl, data)
+            if self.local is not None:
+                pipe.publish(
+                    settings.CACHE_INVALIDATION_CHANNEL,
+                    self._invalidation_message(keys=list(mapping))
+                )
+            with span("redis", op="MSET"):
+                await pipe.execute()
+            self.breaker.record_success()
+
+            for key, value in mapping.items():
+                self._store_local(key, value, serialized[key], ttl)
+            logger.debug(f"Cache MSET: {len(mapping)} keys (TTL: {ttl}s)")
+            return True
+        except Exception as e:
+            self._record_error(e)
+            logger.error(f"Redis async MSET error for {len(mapping)} keys: {e}")
+            return False
+
+    async def aget_swr(
+        self,
+        key: str,
+        refresh: Callable[[], Awaitable[Any]],
+        ttl: Optional[int] = None
+    ) -> Optional[Any]:
+        """
+        stale-while-revalidate 조회 (비동기)
+
+        soft 만료 전에는 XFetch 방식으로 만료가 가까울수록, 재계산이 오래 걸릴수록
+        높은 확률로 조기 갱신하고, soft 만료 후 hard 만료 전에는 stale 값을 그대로 반환한다.
+        갱신은 백그라운드에서 키별로 한 번만 실행된다 (워커 간에는 Redis 락으로 중복 방지).
+
+        Args:
+            key: 캐시 키
+            refresh: 새 값을 계산하는 코루틴 함수 (None/빈 값이면 저장하지 않음)
+            ttl: 갱신 시 soft TTL (초) - None이면 기본값 사용
+
+        Returns:
+            캐시된 데이터 (fresh 또는 stale) 또는 None (캐시 미스, 호출 측이 직접 계산)
+        """
+        entry = await self._aget_entry(key)
+        if not self._is_swr_entry(entry):
+            return entry
+
+        now = time.time()
+        soft_expiry = entry["soft_expiry"]
+
+        if now >= soft_expiry:
+            self.stale_hits += 1
+            logger.debug(f"Cache STALE: {key}")
+            self._schedule_refresh(key, refresh, ttl)
+        elif self._should_refresh_early(now, soft_expiry, entry.get("delta", 0.0)):
+            self.early_refreshes += 1
+            logger.debug(f"Cache early refresh: {key}")
+            self._schedule_refresh(key, refresh, ttl)
+
+        return entry["value"]
+
+    async def aset_swr(
+        self,
+        key: str,
+        value: Any,
+        ttl: Optional[int] = None,
+        delta: float = 0.0
+    ) -> bool:
+        """
+        stale-while-revalidate 엔트리 저장 (비동기)
+
+        Args:
+            key: 캐시 키
+            value: 저장할 데이터 (JSON 호환 타입)
+            ttl: soft TTL (초) - None이면 기본값 사용, hard TTL은 SWR_STALE_TTL 만큼 더 김
+            delta: 값을 계산하는 데 걸린 시간 (초, 조기 갱신 확률에 사용)
+
+        Returns:
+            성공 여부
+        """
+        ttl = ttl or self.ttl
+        return await self.aset(
+            key, self._swr_entry(value, ttl, delta), ttl=ttl + settings.SWR_STALE_TTL
+        )
+
+    async def amget_swr(
+        self,
+        keys: List[str],
+        refresh: Callable[[List[str]], Awaitable[Dict[str, Any]]],
+        ttl: Optional[int] = None
+    ) -> List[Optional[Any]]:
+        """
+        여러 키 stale-while-revalidate 조회 (비동기, 단일 왕복)
+
+        stale 또는 조기 갱신 대상 키를 모아 백그라운드에서 한 번에 갱신한다.
+
+        Args:
+            keys: 캐시 키 리스트
+            refresh: 갱신 대상 키 리스트를 받아 {키: 새 값}을 반환하는 코루틴 함수
+                (반환하지 않은 키는 기존 값 유지)
+            ttl: 갱신 시 soft TTL (초) - None이면 기본값 사용
+
+        Returns:
+            키 순서대로 캐시된 데이터 (fresh 또는 stale) 또는 None 리스트
+        """
+        entries = await self._amget_entries(keys)
+        now = time.time()
+        due = []
+
+        for key, entry in zip(keys, entries):
+            if not self._is_swr_entry(entry):
+                continue
+            if now >= entry["soft_expiry"]:
+                self.stale_hits += 1
+                due.append(key)
+            elif self._should_refresh_early(now, entry["soft_expiry"], entry.get("delta", 0.0)):
+                self.early_refreshes += 1
+                due.append(key)
+
+        due = [key for key in due if key not in self._refresh_tasks]
+        if due:
+            logger.debug(f"Cache refresh scheduled: {len(due)} keys")
+            task = asyncio.create_task(self._refresh_many(due, refresh, ttl))
+            for key in due:
+                self._refresh_tasks[key] = task
+                task.add_done_callback(lambda done, key=key: self._forget_refresh(key, done))
+
+        return [self._unwrap(entry) for entry in entries]
+
+    async def amset_swr(
+        self,
+        mapping: Dict[str, Any],
+        ttl: Optional[int] = None,
+        delta: float = 0.0
+    ) -> bool:
+        """
+        여러 stale-while-revalidate 엔트리 저장 (비동기, 파이프라인 단일 왕복)
+
+        Args:
+            mapping: {캐시 키: 데이터}
+            ttl: soft TTL (초) - None이면 기본값 사용, hard TTL은 SWR_STALE_TTL 만큼 더 김
+            delta: 값을 계산하는 데 걸린 시간 (초, 조기 갱신 확률에 사용)
+
+        Returns:
+            성공 여부
+        """
+        ttl = ttl or self.ttl
+        return await self.amset(
+            {key: self._swr_entry(value, ttl, delta) for key, value in mapping.items()},
+            ttl=ttl + settings.SWR_STALE_TTL
+        )
+
+    def _swr_entry(self, value: Any, ttl: int, delta: float) -> Dict[str, Any]:
+        """soft 만료 시각과 재계산 소요 시간을 포함한 엔트리"""
+        return {
+            SWR_MARKER: 1,
+            "value": value,
+            "soft_expiry": time.time() + ttl,
+            "delta": round(delta, 4)
+        }
+
+    def _should_refresh_early(self, now: float, soft_expiry: float, delta: float) -> bool:
+        """
+        XFetch 조기 갱신 판정: now - delta * beta * ln(U) >= soft_expiry
+
+        Args:
+            now: 현재 시각 (epoch 초)
+            soft_expiry: soft 만료 시각 (epoch 초)
+            delta: 재계산 소요 시간 (초)
+
+        Returns:
+            조기 갱신 여부
+        """
+        if delta <= 0 or settings.SWR_XFETCH_BETA <= 0:
+            return False
+        # 1 - random() ∈ (0, 1] 이므로 log 정의역 보장
+        gap = -delta * settings.SWR_XFETCH_BETA * math.log(1.0 - random.random())
+        return now + gap >= soft_expiry
+
+    def _schedule_refresh(
+        self,
+        key: str,
+        refresh: Callable[[], Awaitable[Any]],
+        ttl: Optional[int]
+    ):
+        """키별 백그라운드 갱신 태스크 시작 (이미 진행 중이면 무시)"""
+        task = self._refresh_tasks.get(key)
+        if task is not None and not task.done():
+            return
+
+        task = asyncio.create_task(self._refresh(key, refresh, ttl))
+        self._refresh_tasks[key] = task
+        task.add_done_callback(lambda done: self._forget_refresh(key, done))
+
+    def _forget_refresh(self, key: str, task: asyncio.Task):
+        if self._refresh_tasks.get(key) is task:
+            del self._refresh_tasks[key]
+
+    async def _refresh(
+        self,
+        key: str,
+        refresh: Callable[[], Awaitable[Any]],
+        ttl: Optional[int]
+    ):
+        """백그라운드 갱신 (다른 워커가 갱신 중이면 생략)"""
+        token = await self.acquire_lock(f"refresh:{key}", settings.SWR_REFRESH_LOCK_TTL)
+        if token is None:
+            return
+
+        try:
+            started = time.monotonic()
+            value = await refresh()
+            if value:
+                await self.aset_swr(key, value, ttl=ttl, delta=time.monotonic() - started)
+                self.refreshes += 1
+                logger.debug(f"Cache refreshed: {key}")
+        except Exception as e:
+            self.refresh_errors += 1
+            logger.error(f"Cache background refresh error for key {key}: {e}")
+        finally:
+            await self.release_lock(f"refresh:{key}", token)
+
+    async def _refresh_many(
+        self,
+        keys: List[str],
+        refresh: Callable[[List[str]], Awaitable[Dict[str, Any]]],
+        ttl: Optional[int]
+    ):
+        """여러 키 백그라운드 갱신 (다른 워커가 갱신 중인 키는 제외)"""
+        tokens = await asyncio.gather(*[
+            self.acquire_lock(f"refresh:{key}", settings.SWR_REFRESH_LOCK_TTL) for key in keys
+        ])
+        locked = {key: token for key, token in zip(keys, tokens) if token is not None}
+        if not locked:
+            return
+
+        try:
+            started = time.monotonic()
+            values = await refresh(list(locked))
+            if values:
+                await self.amset_swr(values, ttl=ttl, delta=time.monotonic() - started)
+                self.refreshes += len(values)
+        except Exception as e:
+            self.refresh_errors += 1
+            logger.error(f"Cache background refresh error for {len(locked)} keys: {e}")
+        finally:
+            await asyncio.gather(*[
+                self.release_lock(f"refresh:{key}", token) for key, token in locked.items()
+            ])
+
+    @staticmethod
+    def _is_swr_entry(entry: Any) -> bool:
+        """stale-while-revalidate 엔트리 여부"""
+        return isinstance(entry, dict) and SWR_MARKER in entry
+
+    def _unwrap(self, entry: Any) -> Any:
+        """SWR 엔트리면 값만 반환 (일반 조회는 stale 값도 그대로 사용)"""
+        return entry["value"] if self._is_swr_entry(entry) else entry
+
+    async def acquire_lock(self, name: str, ttl_ms: int) -> Optional[str]:
+        """
+        분산 락 획득 (비동기, 대기 없음)
+
+        Args:
+            name: 락 이름
+            ttl_ms: 락 만료 시간 (밀리초, 보유 워커가 죽어도 자동 해제)
+
+        Returns:
+            해제용 토큰 (획득 실패 또는 Redis 비활성화 시 None)
+        """
+        if not self._allow(self.async_client):
+            return None
+
+        token = uuid.uuid4().hex
+        try:
+            acquired = await self.async_client.set(f"lock:{name}", token, nx=True, px=ttl_ms)
+            self.breaker.record_success()
+            return token if acquired else None
+        except Exception as e:
+            self._record_error(e)
+            logger.error(f"Redis lock acquire error for {name}: {e}")
+            return None
+
+    async def release_lock(self, name: str, token: str) -> bool:
+        """
+        분산 락 해제 (자신이 보유한 락만 삭제)
+
+        Args:
+            name: 락 이름
+            token: acquire_lock()이 반환한 토큰
+
+        Returns:
+            해제 여부 (만료 후 다른 워커가 획득한 경우 False)
+        """
+        if not self._allow(self.async_client):
+            return False
+
+        key = f"lock:{name}"
+        try:
+            # GET과 DEL 사이에 락이 바뀌면 트랜잭션이 취소되도록 WATCH
+            async with self.async_client.pipeline(transaction=True) as pipe:
+                await pipe.watch(key)
+                if await pipe.get(key) != token.encode():
+                    await pipe.unwatch()
+                    self.breaker.record_success()
+                    return False
+                pipe.multi()
+                pipe.delete(key)
+                await pipe.execute()
+            self.breaker.record_success()
+            return True
+        except Exception as e:
+            self._record_error(e)
+            logger.error(f"Redis lock release error for {name}: {e}")
+            return False
+
+    async def is_locked(self, name: str) -> bool:
+        """
+        분산 락 보유 여부 조회
+
+        Args:
+            name: 락 이름
+
+        Returns:
+            다른 워커가 보유 중이면 True
+        """
+        if not self._allow(self.async_client):
+            return False
+
+        try:
+            locked = await self.async_client.exists(f"lock:{name}")
+            self.breaker.record_success()
+            return bool(locked)
+        except Exception as e:
+            self._record_error(e)
+            logger.error(f"Redis lock check error for {name}: {e}")
+            return False
+
+    def _store_local(
+        self,
+        key: str,
+        value: Any,
+        serialized: bytes,
+        ttl: Optional[int] = None
+    ):
+        """
+        L1 캐시 저장 (크기는 직렬화된 바이트 길이 기준)
+
+        Args:
+            key: 캐시 키
+            value: 디코딩된 값
+            serialized: 코덱으로 인코딩된 바이트
+            ttl: Redis TTL (초) - L1 TTL보다 짧으면 이를 따름
+        """
+        if self.local is None:
+            return
+
+        local_ttl = min(ttl, self.local.default_ttl) if ttl else None
+        self.local.set(key, value, len(serialized), ttl=local_ttl)
+
+    def _invalidation_message(
+        self,
+        keys: Optional[List[str]] = None,
+        pattern: Optional[str] = None,
+        generations: Optional[Dict[str, int]] = None
+    ) -> str:
+        """L1 무효화/세대 변경 메시지 (발신 워커 ID 포함)"""
+        return json.dumps({
+            "origin": self.instance_id,
+            "keys": keys or [],
+            "pattern": pattern,
+            "generations": generations or {}
+        })
+
+    def _invalidate_local(
+        self,
+        keys: Optional[List[str]] = None,
+        pattern: Optional[str] = None
+    ):
+        """
+        현재 워커의 L1 삭제 후 다른 워커에 무효화 알림 (동기 경로)
+
+        Args:
+            keys: 삭제할 키 리스트
+            pattern: 삭제할 키 패턴
+        """
+        if self.local is None:
+            return
+
+        for key in keys or []:
+            self.local.delete(key)
+        if pattern:
+            self.local.delete_pattern(pattern)
+
+        try:
+            self.client.publish(
+                settings.CACHE_INVALIDATION_CHANNEL,
+                self._invalidation_message(keys=keys, pattern=pattern)
+            )
+        except Exception as e:
+            logger.warning(f"Redis PUBLISH invalidation error: {e}")
+
+    def _handle_invalidation(self, data: Union[str, bytes]):
+        """
+        무효화 메시지 처리 (자신이 보낸 메시지는 무시)
+
+        Args:
+            data: _invalidation_message 형식의 JSON (pub/sub 수신 시 bytes)
+        """
+        try:
+            message = json.loads(data)
+        except (TypeError, ValueError):
+            logger.warning(f"Invalid cache invalidation message: {data!r}")
+            return
+
+        if message.get("origin") == self.instance_id:
+            return
+
+        if message.get("generations"):
+            self._apply_generations(message["generations"])
+
+        if self.local is None:
+            return
+
+        for key in message.get("keys") or []:
+            self.local.delete(key)
+        if message.get("pattern"):
+            self.local.delete_pattern(message["pattern"])
+
+    async def start_invalidation_listener(self):
+        """L1 무효화/세대 변경 구독 시작 (애플리케이션 시작 시 호출)"""
+        if not self.enabled or not self.async_client:
+            return
+        if self._invalidation_task and not self._invalidation_task.done():
+            return
+
+        self._invalidation_task = asyncio.create_task(self._listen_invalidations())
+
+    async def stop_invalidation_listener(self):
+        """L1 무효화 구독 종료"""
+        if self._invalidation_task:
+            self._invalidation_task.cancel()
+            try:
+                await self._invalidation_task
+            except asyncio.CancelledError:
+                pass
+            self._invalidation_task = None
+
+    async def _listen_invalidations(self):
+        """무효화 채널 구독 루프 (연결 끊김 시 L1 비우고 재구독, 세대 카운터 주기적 재조회)"""
+        while True:
+            pubsub = self.async_client.pubsub(ignore_subscribe_messages=True)
+            try:
+                await pubsub.subscribe(settings.CACHE_INVALIDATION_CHANNEL)
+                logger.info(f"Subscribed to {settings.CACHE_INVALIDATION_CHANNEL}")
+                await self.arefresh_generations()
+                refreshed_at = time.monotonic()
+
+                while True:
+                    message = await pubsub.get_message(timeout=1.0)
+                    if message and message.get("type") == "message":
+                        self._handle_invalidation(message["data"])
+
+                    if time.monotonic() - refreshed_at >= settings.CACHE_GENERATION_REFRESH:
+                        await self.arefresh_generations()
+                        refreshed_at = time.monotonic()
+
+            except asyncio.CancelledError:
+                await pubsub.aclose()
+                raise
+
+            except Exception as e:
+                # 끊긴 동안의 무효화를 놓쳤을 수 있으므로 L1 전체 삭제
+                logger.warning(f"Cache invalidation listener error: {e}. Retrying in 5s")
+                if self.local is not None:
+                    self.local.clear()
+                await pubsub.aclose()
+                await asyncio.sleep(5)
+
+    def sweep(
+        self,
+        pattern: str,
+        predicate: Optional[Callable[[str], bool]] = None,
+        batch_size: Optional[int] = None
+    ) -> int:
+        """
+        SCAN + 파이프라인 UNLINK 로 키 정리 (KEYS 와 달리 Redis를 오래 막지 않음)
+
+        UNLINK 는 메모리 해제를 백그라운드 스레드에서 수행하므로 큰 값도 즉시 반환된다.
+
+        Args:
+            pattern: 키 패턴 (SCAN MATCH)
+            predicate: 삭제 여부 판단 함수 (None이면 매칭 키 전체)
+            batch_size: SCAN COUNT 및 파이프라인당 UNLINK 개수
 
         Returns:
             삭제된 키 개수
         """
-        if not self.enabled or not self.client:
+        if not self._allow(self.client):
             return 0
 
+        batch_size = batch_size or settings.CACHE_SWEEP_BATCH
+        deleted = 0
+        batch: List[str] = []
+
+        def flush() -> int:
+            pipe = self.client.pipeline(transaction=False)
+            for key in batch:
+                pipe.unlink(key)
+            removed = sum(pipe.execute())
+            batch.clear()
+            return removed
+
         try:
-            keys = self.client.keys(pattern)
-            if keys:
-                deleted = self.client.delete(*keys)
-                logger.info(f"Cache DELETE pattern '{pattern}': {deleted} keys")
-                return deleted
-            return 0
+            for key in self.client.scan_iter(match=pattern, count=batch_size):
+                if isinstance(key, bytes):
+                    key = key.decode()
+                if predicate is not None and not predicate(key):
+                    continue
+                batch.append(key)
+                if len(batch) >= batch_size:
+                    deleted += flush()
+            if batch:
+                deleted += flush()
+            self.breaker.record_success()
         except Exception as e:
-            logger.error(f"Redis DELETE_PATTERN error for '{pattern}': {e}")
+            self._record_error(e)
+            logger.error(f"Redis SWEEP error for '{pattern}': {e}")
+
+        return deleted
+
+    def sweep_stale_generations(self, namespace: Optional[str] = None) -> int:
+        """
+        현재 세대보다 이전 세대의 위치/셀/데코레이터 캐시 키 정리 (메모리 회수)
+
+        Args:
+            namespace: 카테고리 (None이면 전체 카테고리)
+
+        Returns:
+            삭제된 키 개수
+        """
+        if not self.enabled or not self.client:
             return 0
 
+        self.load_generations()
+
+        def is_stale(key: str) -> bool:
+            parsed = self.key_generation(key)
+            if parsed is None:
+                return False
+            key_namespace, generation = parsed
+            if namespace is not None and key_namespace != namespace:
+                return False
+            return generation < self.generation(key_namespace)
+
+        deleted = (
+            self.sweep("location:v*", is_stale)
+            + self.sweep("cell:v*", is_stale)
+            + self.sweep("cache:*:v*", is_stale)
+        )
+        logger.info(f"Cache SWEEP stale generations ({namespace or 'all namespaces'}): {deleted} keys")
+        return deleted
+
+    def delete_pattern(self, pattern: str) -> int:
+        """
+        패턴에 매칭되는 모든 키 삭제 (SCAN + UNLINK)
+
+        카테고리 단위 무효화는 bump_generation 이 O(1) 이므로 그쪽을 우선 사용한다.
+
+        Args:
+            pattern: 키 패턴 (예: "location:*:cultural_events")
+
+        Returns:
+            삭제된 키 개수
+        """
+        if not self.enabled or not self.client:
+            return 0
+
+        self._invalidate_local(pattern=pattern)
+        deleted = self.sweep(pattern)
+        logger.info(f"Cache DELETE pattern '{pattern}': {deleted} keys")
+        return deleted
+
     def flush_all(self) -> bool:
         """
         모든 캐시 삭제 (주의: 전체 Redis DB 삭제)
@@ -218,14 +1400,17 @@ class RedisService:
         Returns:
             성공 여부
         """
-        if not self.enabled or not self.client:
+        if not self._allow(self.client):
             return False
 
         try:
             self.client.flushdb()
+            self.breaker.record_success()
+            self._invalidate_local(pattern="*")
             logger.warning("Cache FLUSH: All keys deleted")
             return True
         except Exception as e:
+            self._record_error(e)
             logger.error(f"Redis FLUSHDB error: {e}")
             return False
 
@@ -236,13 +1421,20 @@ class RedisService:
         Returns:
             통계 딕셔너리
         """
-        if not self.enabled or not self.client:
+        if not self._enabled or not self.client:
             return {"enabled": False}
 
+        circuit = self.breaker.get_stats()
+        if self.breaker.state == OPEN:
+            # 장애 중에는 INFO 도 타임아웃되므로 서킷 상태만 반환
+            return {"enabled": True, "available": False, "circuit": circuit}
+
         try:
             info = self.client.info()
             return {
                 "enabled": True,
+                "available": True,
+                "circuit": circuit,
                 "connected_clients": info.get("connected_clients", 0),
                 "used_memory_human": info.get("used_memory_human", "0B"),
                 "total_commands_processed": info.get("total_commands_processed", 0),
@@ -251,11 +1443,27 @@ class RedisService:
                 "hit_rate": self._calculate_hit_rate(
                     info.get("keyspace_hits", 0),
                     info.get("keyspace_misses", 0)
-                )
+                ),
+                "codec": self.codec.name,
+                "generations": dict(self._generations),
+                "l1": self.local.get_stats() if self.local is not None else None,
+                "l2": {
+                    "hits": self.l2_hits,
+                    "misses": self.l2_misses,
+                    "hit_rate": self._calculate_hit_rate(self.l2_hits, self.l2_misses)
+                },
+                "swr": {
+                    "stale_hits": self.stale_hits,
+                    "early_refreshes": self.early_refreshes,
+                    "refreshes": self.refreshes,
+                    "refresh_errors": self.refresh_errors,
+                    "refreshing": len(self._refresh_tasks)
+                }
             }
         except Exception as e:
+            self._record_error(e)
             logger.error(f"Redis STATS error: {e}")
-            return {"enabled": True, "error": str(e)}
+            return {"enabled": True, "circuit": circuit, "error": str(e)}
 
     def _calculate_hit_rate(self, hits: int, misses: int) -> str:
         """캐시 히트율 계산"""
@@ -273,6 +1481,21 @@ class RedisService:
             except Exception as e:
                 logger.error(f"Redis close error: {e}")
 
+    async def aclose(self):
+        """비동기 Redis 연결 풀 종료"""
+        await self.stop_invalidation_listener()
+        await self.breaker.aclose()
+        for task in list(self._refresh_tasks.values()):
+            task.cancel()
+        await asyncio.gather(*self._refresh_tasks.values(), return_exceptions=True)
+        self._refresh_tasks.clear()
+        if self.async_client:
+            try:
+                await self.async_client.aclose()
+                logger.info("Redis async client closed")
+            except Exception as e:
+                logger.error(f"Redis async close error: {e}")
+
 
 @lru_cache()
 def get_redis_service() -> RedisService:
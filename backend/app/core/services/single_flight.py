@@ -0,0 +1,92 @@
+"""
+Single-flight Service
+동일 키의 동시 요청을 하나의 계산으로 합쳐 결과를 공유 (캐시 만료 시 thundering herd 방지)
+"""
+
+import asyncio
+import logging
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Dict
+
+logger = logging.getLogger(__name__)
+
+
+class SingleFlight:
+    """
+    프로세스 내 요청 병합
+
+    Features:
+    - 같은 키로 진행 중인 계산이 있으면 새로 실행하지 않고 그 결과를 대기
+    - 계산은 별도 태스크로 실행되어 먼저 도착한 요청이 취소돼도 나머지 요청에 결과 전달
+    - 예외도 대기 중인 모든 요청에 그대로 전달
+    """
+
+    def __init__(self):
+        """SingleFlight 초기화"""
+        self._calls: Dict[str, asyncio.Task] = {}
+        self.executions = 0
+        self.coalesced = 0
+
+    @property
+    def in_flight(self) -> int:
+        """진행 중인 계산 수"""
+        return len(self._calls)
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        키 단위로 병합된 계산 실행
+
+        Args:
+            key: 병합 키 (정규화된 쿼리)
+            fn: 결과를 계산하는 코루틴 함수
+
+        Returns:
+            계산 결과 (같은 키의 동시 요청은 같은 객체를 공유)
+        """
+        task = self._calls.get(key)
+
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.create_task(fn())
+            self._calls[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+            self.executions += 1
+        else:
+            self.coalesced += 1
+            logger.debug(f"Single-flight coalesced: {key}")
+
+        # 대기 중인 요청이 취소돼도 계산은 계속 (다른 요청과 캐시 저장을 위해)
+        return await asyncio.shield(task)
+
+    def _forget(self, key: str, task: asyncio.Task) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+
+        # 대기자가 모두 취소된 경우 미확인 예외 경고 방지
+        if not task.cancelled():
+            task.exception()
+
+    def get_stats(self) -> dict:
+        """
+        병합 통계
+
+        Returns:
+            통계 딕셔너리
+        """
+        total = self.executions + self.coalesced
+        return {
+            "in_flight": self.in_flight,
+            "executions": self.executions,
+            "coalesced": self.coalesced,
+            "coalesce_rate": f"{(self.coalesced / total * 100):.1f}%" if total else "0.0%"
+        }
+
+
+@lru_cache()
+def get_single_flight() -> SingleFlight:
+    """
+    SingleFlight 싱글톤 인스턴스
+
+    Returns:
+        SingleFlight 인스턴스
+    """
+    return SingleFlight()
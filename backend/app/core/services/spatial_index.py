@@ -0,0 +1,362 @@
+"""
+Spatial Index Service
+인메모리 그리드 공간 인덱스 - 반경 검색을 Supabase 왕복 없이 처리
+"""
+
+import asyncio
+import logging
+import math
+import threading
+import time
+from collections import defaultdict
+from functools import lru_cache
+from typing import Optional, List, Dict, Any, Tuple
+
+import numpy as np
+
+from app.core.config import settings
+from app.core.services.distance_service import (
+    radius_search_arrays,
+    calculate_bounding_box,
+    format_distance
+)
+
+logger = logging.getLogger(__name__)
+
+# 테이블별 좌표 필드명 (lat_key, lon_key)
+COORDINATE_COLUMNS: Dict[str, Tuple[str, str]] = {
+    'cultural_events': ('lat', 'lot'),
+    'libraries': ('latitude', 'longitude'),
+    'cultural_spaces': ('latitude', 'longitude'),
+    'future_heritages': ('latitude', 'longitude'),
+    'public_reservations': ('y_coord', 'x_coord')
+}
+
+# PostgREST 기본 응답 최대 행 수
+PAGE_SIZE = 1000
+
+# 그리드 셀 키 (위도 인덱스, 경도 인덱스)
+CellKey = Tuple[int, int]
+
+_EMPTY_POSITIONS = np.empty(0, dtype=np.intp)
+
+
+class _TableGrid:
+    """
+    단일 테이블의 좌표 배열 + 그리드 셀 버킷
+
+    add() 로 행을 모은 뒤 freeze() 로 좌표와 셀 버킷(행 위치)을 numpy 배열로 변환한다.
+    """
+
+    def __init__(self, cell_size: float):
+        self.cell_size = cell_size
+        self.rows: List[Dict[str, Any]] = []
+        self.lats = np.empty(0, dtype=np.float64)
+        self.lons = np.empty(0, dtype=np.float64)
+        self.cells: Dict[CellKey, Any] = defaultdict(list)
+        self._lats: List[float] = []
+        self._lons: List[float] = []
+
+    @property
+    def size(self) -> int:
+        return len(self.rows)
+
+    def cell_of(self, lat: float, lon: float) -> CellKey:
+        return (
+            math.floor(lat / self.cell_size),
+            math.floor(lon / self.cell_size)
+        )
+
+    def add(self, lat: float, lon: float, row: Dict[str, Any]) -> None:
+        self.cells[self.cell_of(lat, lon)].append(len(self.rows))
+        self.rows.append(row)
+        self._lats.append(lat)
+        self._lons.append(lon)
+
+    def freeze(self) -> None:
+        """구축 완료 - 좌표/셀 버킷을 배열로 변환 (이후 add 불가)"""
+        self.lats = np.array(self._lats, dtype=np.float64)
+        self.lons = np.array(self._lons, dtype=np.float64)
+        self.cells = {
+            cell: np.array(positions, dtype=np.intp)
+            for cell, positions in self.cells.items()
+        }
+        self._lats = []
+        self._lons = []
+
+    def candidates(
+        self,
+        bbox: Tuple[float, float, float, float]
+    ) -> np.ndarray:
+        """경계 상자와 겹치는 셀의 행 위치 반환"""
+        min_lat, max_lat, min_lon, max_lon = bbox
+        lat_lo, lon_lo = self.cell_of(min_lat, min_lon)
+        lat_hi, lon_hi = self.cell_of(max_lat, max_lon)
+
+        buckets = []
+        for lat_idx in range(lat_lo, lat_hi + 1):
+            for lon_idx in range(lon_lo, lon_hi + 1):
+                bucket = self.cells.get((lat_idx, lon_idx))
+                if bucket is not None:
+                    buckets.append(bucket)
+
+        if not buckets:
+            return _EMPTY_POSITIONS
+        return np.concatenate(buckets)
+
+
+class SpatialIndex:
+    """
+    인메모리 공간 인덱스
+
+    Features:
+    - 5개 테이블 전체를 고정 크기 그리드 셀로 버킷팅 (테이블별 좌표 배열)
+    - 경계 상자로 후보 셀 선택 후 벡터화 Haversine 정밀 필터링 및 top-k 선택
+    - 주기적 Supabase 재적재 (원자적 교체, 조회 중단 없음)
+    """
+
+    def __init__(self, cell_size: Optional[float] = None):
+        """
+        SpatialIndex 초기화
+
+        Args:
+            cell_size: 그리드 셀 크기 (도 단위, None이면 settings 사용)
+        """
+        self.cell_size = cell_size or settings.SPATIAL_INDEX_CELL_SIZE
+        self._grids: Dict[str, _TableGrid] = {}
+        self._lock = threading.Lock()
+        self._refresh_task: Optional[asyncio.Task] = None
+        self.built_at: Optional[float] = None
+
+    @property
+    def is_ready(self) -> bool:
+        """인덱스 구축 완료 여부"""
+        return self.built_at is not None
+
+    @property
+    def size(self) -> int:
+        """인덱싱된 전체 행 수"""
+        return sum(grid.size for grid in self._grids.values())
+
+    def build(self, rows_by_table: Dict[str, List[Dict[str, Any]]]) -> int:
+        """
+        테이블별 행으로 인덱스 구축 (기존 인덱스와 원자적 교체)
+
+        Args:
+            rows_by_table: {table: [rows]} 딕셔너리
+
+        Returns:
+            인덱싱된 행 수 (좌표 없는 행 제외)
+        """
+        grids: Dict[str, _TableGrid] = {}
+
+        for table, rows in rows_by_table.items():
+            lat_key, lon_key = COORDINATE_COLUMNS.get(table, ('latitude', 'longitude'))
+            grid = _TableGrid(self.cell_size)
+
+            for row in rows:
+                lat = row.get(lat_key)
+                lon = row.get(lon_key)
+                if lat is None or lon is None:
+                    continue
+
+                try:
+                    lat, lon = float(lat), float(lon)
+                except (TypeError, ValueError):
+                    continue
+
+                row['_table'] = table
+                grid.add(lat, lon, row)
+
+            grid.freeze()
+            grids[table] = grid
+
+        with self._lock:
+            self._grids = grids
+            self.built_at = time.time()
+
+        indexed = sum(grid.size for grid in grids.values())
+        logger.info(f"Spatial index built: {indexed} rows in {len(grids)} tables")
+        return indexed
+
+    def query(
+        self,
+        center_lat: float,
+        center_lon: float,
+        radius_m: int,
+        category: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        반경 검색
+
+        Args:
+            center_lat: 중심점 위도
+            center_lon: 중심점 경도
+            radius_m: 반경 (미터)
+            category: 카테고리 (None이면 전체 테이블)
+            limit: 최대 반환 개수 (None이면 전체)
+
+        Returns:
+            거리순 정렬된 위치 리스트 (distance, distance_formatted 포함, 원본 행의 복사본)
+        """
+        grids = self._grids
+
+        if category:
+            tables = [category] if category in grids else []
+        else:
+            tables = list(grids.keys())
+
+        bbox = calculate_bounding_box(center_lat, center_lon, radius_m)
+
+        # 테이블별 후보 셀의 좌표를 이어 붙여 한 번에 거리 계산 / top-k 선택
+        sources: List[Tuple[_TableGrid, np.ndarray]] = []
+        for table in tables:
+            grid = grids[table]
+            positions = grid.candidates(bbox)
+            if positions.size:
+                sources.append((grid, positions))
+
+        if not sources:
+            return []
+
+        indices, distances = radius_search_arrays(
+            np.concatenate([grid.lats[positions] for grid, positions in sources]),
+            np.concatenate([grid.lons[positions] for grid, positions in sources]),
+            center_lat,
+            center_lon,
+            radius_m=radius_m,
+            limit=limit or None
+        )
+
+        # 이어 붙인 배열의 인덱스 → (테이블, 행 위치)
+        offsets = np.cumsum([positions.size for _, positions in sources])
+        source_ids = np.searchsorted(offsets, indices, side='right')
+
+        results = []
+        for index, source_id, distance in zip(
+            indices.tolist(), source_ids.tolist(), distances.tolist()
+        ):
+            grid, positions = sources[source_id]
+            start = int(offsets[source_id - 1]) if source_id else 0
+            location = dict(grid.rows[positions[index - start]])
+            location['distance'] = round(distance, 2)
+            location['distance_formatted'] = format_distance(distance)
+            results.append(location)
+
+        return results
+
+    def refresh(self, supabase=None) -> int:
+        """
+        Supabase에서 전체 테이블을 다시 읽어 인덱스 재구축 (동기)
+
+        ServiceFetcher.SELECT_COLUMNS 프로젝션으로 응답에 쓰이는 컬럼만 읽으며,
+        실제 스키마에 없는 컬럼이 있으면 해당 테이블만 전체 컬럼으로 재시도한다.
+
+        Args:
+            supabase: Supabase 클라이언트 (None이면 싱글톤 사용)
+
+        Returns:
+            인덱싱된 행 수
+        """
+        if supabase is None:
+            from app.db.supabase_client import get_supabase_client
+            supabase = get_supabase_client()
+
+        # service_fetcher 가 이 모듈을 import 하므로 지연 import
+        from app.core.agents.service_fetcher import ServiceFetcher, UNKNOWN_COLUMN_ERROR_CODES
+
+        start_time = time.time()
+        rows_by_table: Dict[str, List[Dict[str, Any]]] = {}
+
+        for table in COORDINATE_COLUMNS:
+            rows: List[Dict[str, Any]] = []
+            offset = 0
+            columns = ServiceFetcher.SELECT_COLUMNS.get(table, '*')
+
+            # PostgREST는 응답 행 수를 제한하므로 페이지 단위로 조회
+            while True:
+                try:
+                    response = supabase.table(table).select(columns) \
+                        .range(offset, offset + PAGE_SIZE - 1).execute()
+                except Exception as e:
+                    if columns == '*' or getattr(e, 'code', None) not in UNKNOWN_COLUMN_ERROR_CODES:
+                        raise
+                    logger.warning(f"Column projection failed for table {table}, using '*': {e}")
+                    columns = '*'
+                    continue
+
+                page = response.data or []
+                rows.extend(page)
+
+                if len(page) < PAGE_SIZE:
+                    break
+                offset += PAGE_SIZE
+
+            rows_by_table[table] = rows
+
+        indexed = self.build(rows_by_table)
+        logger.info(f"Spatial index refreshed in {time.time() - start_time:.3f}s")
+        return indexed
+
+    async def refresh_async(self) -> int:
+        """이벤트 루프를 막지 않도록 스레드에서 재구축"""
+        return await asyncio.to_thread(self.refresh)
+
+    async def _refresh_loop(self, interval: int) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.refresh_async()
+            except Exception as e:
+                # 재적재 실패 시 기존 인덱스로 계속 응답
+                logger.error(f"Spatial index refresh failed: {e}")
+
+    async def start(self, interval: Optional[int] = None) -> None:
+        """
+        최초 구축 후 주기적 재적재 태스크 시작
+
+        Args:
+            interval: 재적재 주기 (초, None이면 settings 사용)
+        """
+        interval = interval or settings.SPATIAL_INDEX_REFRESH_INTERVAL
+
+        try:
+            await self.refresh_async()
+        except Exception as e:
+            logger.warning(f"Initial spatial index build failed: {e}. Falling back to Supabase queries.")
+
+        if self._refresh_task is None:
+            self._refresh_task = asyncio.create_task(self._refresh_loop(interval))
+
+    async def stop(self) -> None:
+        """재적재 태스크 중지"""
+        if self._refresh_task:
+            self._refresh_task.cancel()
+            try:
+                await self._refresh_task
+            except asyncio.CancelledError:
+                pass
+            self._refresh_task = None
+
+    def get_stats(self) -> dict:
+        """인덱스 통계 조회"""
+        return {
+            "ready": self.is_ready,
+            "size": self.size,
+            "tables": {table: grid.size for table, grid in self._grids.items()},
+            "cells": sum(len(grid.cells) for grid in self._grids.values()),
+            "cell_size": self.cell_size,
+            "built_at": self.built_at
+        }
+
+
+@lru_cache()
+def get_spatial_index() -> SpatialIndex:
+    """
+    공간 인덱스 싱글톤 인스턴스
+
+    Returns:
+        SpatialIndex 인스턴스
+    """
+    return SpatialIndex()
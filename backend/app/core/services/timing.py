@@ -0,0 +1,320 @@
+"""
+Timing Spans
+워크플로우 노드 / 외부 호출(Kakao, Supabase, Redis) 소요 시간 측정
+
+- 요청별 스팬 목록 (Server-Timing 헤더)
+- 이름별 누적 히스토그램
+- OpenTelemetry 스팬 (OTEL_ENABLED, SDK/OTLP exporter 설치 시)
+"""
+
+import bisect
+import functools
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 히스토그램 버킷 상한 (초)
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# 스팬 종류 (워크플로우 노드 / 외부 호출)
+NODE = "node"
+DEPENDENCY = "dependency"
+
+# 현재 요청의 (스팬 이름, 소요 시간) 목록 - 요청 밖에서는 None
+_request_spans: ContextVar[Optional[List[Tuple[str, float]]]] = ContextVar(
+    "request_spans", default=None
+)
+
+# setup_tracing 성공 시 설정되는 OpenTelemetry tracer / provider
+_tracer = None
+_provider = None
+
+
+class Histogram:
+    """
+    고정 버킷 누적 히스토그램 (Prometheus histogram 과 같은 구조)
+
+    Features:
+    - observe: 버킷 이분 탐색 + 카운터 증가 (할당 없음)
+    - 버킷 상한으로 근사한 분위수
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        """
+        Args:
+            buckets: 오름차순 버킷 상한 (초), +Inf 버킷은 자동 추가
+        """
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float):
+        """
+        값 기록
+
+        Args:
+            value: 관측값 (초)
+        """
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        분위수 근사 (해당 관측이 속한 버킷의 상한)
+
+        Args:
+            q: 분위 (0.0 ~ 1.0)
+
+        Returns:
+            버킷 상한 (초), 관측이 없으면 None, +Inf 버킷이면 inf
+        """
+        if self.count == 0:
+            return None
+
+        rank = q * self.count
+        seen = 0
+        for i, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= rank:
+                return self.buckets[i] if i < len(self.buckets) else float("inf")
+        return float("inf")
+
+    def get_stats(self) -> dict:
+        """
+        요약 통계 (밀리초)
+
+        Returns:
+            통계 딕셔너리
+        """
+        p50 = self.quantile(0.5)
+        p95 = self.quantile(0.95)
+        return {
+            "count": self.count,
+            "mean_ms": round(self.sum / self.count * 1000, 2) if self.count else None,
+            "p50_ms": p50 * 1000 if p50 is not None else None,
+            "p95_ms": p95 * 1000 if p95 is not None else None
+        }
+
+
+# 스팬 이름별 히스토그램 / 종류 / 진행 중인 호출 수
+_histograms: Dict[str, Histogram] = {}
+_kinds: Dict[str, str] = {}
+_in_flight: Dict[str, int] = {}
+
+
+def record(name: str, duration: float, kind: str = DEPENDENCY):
+    """
+    소요 시간 기록 (요청 스팬 목록 + 히스토그램)
+
+    Args:
+        name: 스팬 이름
+        duration: 소요 시간 (초)
+        kind: 스팬 종류 (NODE / DEPENDENCY)
+    """
+    spans = _request_spans.get()
+    if spans is not None:
+        spans.append((name, duration))
+
+    histogram = _histograms.get(name)
+    if histogram is None:
+        histogram = _histograms[name] = Histogram()
+        _kinds[name] = kind
+    histogram.observe(duration)
+
+
+@contextmanager
+def span(name: str, kind: str = DEPENDENCY, **attributes: Any) -> Iterator[None]:
+    """
+    소요 시간 측정 블록 (동기/비동기 코드 모두 with 로 사용)
+
+    Args:
+        name: 스팬 이름 (예: "redis", "fetch_services")
+        kind: 스팬 종류 (NODE / DEPENDENCY)
+        **attributes: OpenTelemetry 스팬 속성
+
+    Example:
+        with span("supabase", table="libraries"):
+            rows = await ...
+    """
+    _kinds.setdefault(name, kind)
+    _in_flight[name] = _in_flight.get(name, 0) + 1
+
+    if _tracer is None:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            record(name, time.perf_counter() - start, kind)
+            _in_flight[name] -= 1
+        return
+
+    with _tracer.start_as_current_span(name, attributes=attributes):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            record(name, time.perf_counter() - start, kind)
+            _in_flight[name] -= 1
+
+
+def timed(name: str, kind: str = NODE) -> Callable:
+    """
+    코루틴 함수 소요 시간 측정 데코레이터
+
+    Args:
+        name: 스팬 이름
+        kind: 스팬 종류 (기본: 워크플로우 노드)
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            with span(name, kind):
+                return await func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def start_request() -> List[Tuple[str, float]]:
+    """
+    현재 컨텍스트(요청)의 스팬 수집 시작
+
+    Returns:
+        이후 기록되는 스팬이 추가되는 리스트
+    """
+    spans: List[Tuple[str, float]] = []
+    _request_spans.set(spans)
+    return spans
+
+
+def server_timing_header(spans: List[Tuple[str, float]], total: Optional[float] = None) -> str:
+    """
+    Server-Timing 헤더 값 (같은 이름은 합산, 호출 수를 desc 로 표시)
+
+    Args:
+        spans: (스팬 이름, 소요 시간) 리스트
+        total: 전체 처리 시간 (초)
+
+    Returns:
+        헤더 값 (예: 'analyze_location;dur=1.2, redis;dur=3.4;desc="2 calls", total;dur=9.8')
+    """
+    totals: Dict[str, List[float]] = {}
+    for name, duration in spans:
+        entry = totals.setdefault(name, [0.0, 0])
+        entry[0] += duration
+        entry[1] += 1
+
+    metrics = []
+    for name, (duration, calls) in totals.items():
+        metric = f"{name};dur={duration * 1000:.1f}"
+        if calls > 1:
+            metric += f';desc="{calls} calls"'
+        metrics.append(metric)
+
+    if total is not None:
+        metrics.append(f"total;dur={total * 1000:.1f}")
+
+    return ", ".join(metrics)
+
+
+def get_timing_stats() -> Dict[str, dict]:
+    """
+    스팬 이름별 히스토그램 요약
+
+    Returns:
+        {스팬 이름: 통계}
+    """
+    return {name: histogram.get_stats() for name, histogram in sorted(_histograms.items())}
+
+
+def get_histograms(kind: Optional[str] = None) -> Dict[str, Histogram]:
+    """
+    스팬 이름별 히스토그램 (내보내기용)
+
+    Args:
+        kind: 지정 시 해당 종류(NODE / DEPENDENCY)만
+
+    Returns:
+        {스팬 이름: 히스토그램}
+    """
+    if kind is None:
+        return _histograms
+    return {name: histogram for name, histogram in _histograms.items() if _kinds.get(name) == kind}
+
+
+def get_in_flight(kind: Optional[str] = None) -> Dict[str, int]:
+    """
+    스팬 이름별 진행 중인 호출 수
+
+    Args:
+        kind: 지정 시 해당 종류(NODE / DEPENDENCY)만
+
+    Returns:
+        {스팬 이름: 진행 중인 호출 수}
+    """
+    return {
+        name: count for name, count in _in_flight.items()
+        if kind is None or _kinds.get(name) == kind
+    }
+
+
+def reset_timings():
+    """히스토그램 초기화"""
+    _histograms.clear()
+    _kinds.clear()
+
+
+def setup_tracing() -> bool:
+    """
+    OpenTelemetry OTLP 내보내기 설정 (로컬 collector)
+
+    requirements-otel.txt (opentelemetry-sdk, opentelemetry-exporter-otlp) 가 설치되어 있어야 하며,
+    없으면 경고 후 히스토그램/Server-Timing 만 사용한다.
+
+    Returns:
+        설정 성공 여부
+    """
+    global _tracer, _provider
+
+    if not settings.OTEL_ENABLED:
+        return False
+
+    try:
+        from opentelemetry import trace
+        from opentelemetry.sdk.resources import Resource
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import BatchSpanProcessor
+        from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
+    except ImportError as e:
+        logger.warning(f"OpenTelemetry SDK/exporter not installed ({e}). Span export disabled.")
+        return False
+
+    provider = TracerProvider(
+        resource=Resource.create({"service.name": settings.OTEL_SERVICE_NAME})
+    )
+    provider.add_span_processor(
+        BatchSpanProcessor(OTLPSpanExporter(endpoint=settings.OTEL_EXPORTER_OTLP_ENDPOINT, insecure=True))
+    )
+    trace.set_tracer_provider(provider)
+    _provider = provider
+    _tracer = trace.get_tracer(__name__)
+
+    logger.info(f"OpenTelemetry span export enabled ({settings.OTEL_EXPORTER_OTLP_ENDPOINT})")
+    return True
+
+
+def shutdown_tracing():
+    """남은 스팬 내보내기 후 종료"""
+    global _tracer, _provider
+
+    if _provider is not None:
+        _provider.shutdown()
+    _tracer = None
+    _provider = None
@@ -3,11 +3,18 @@ Service Search Workflow Graph
 LangGraph 기반 3-에이전트 워크플로우
 """
 
+import asyncio
 import logging
-from typing import Optional
+import time
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, Optional
 from langgraph.graph import StateGraph, END
 import uuid
 
+from app.core.config import settings
+from app.core.services import metrics
+from app.core.services.distance_service import sort_by_distance
+from app.core.services.timing import NODE, span, timed
 from app.core.workflow.state import (
     WorkflowState,
     LocationQuery,
@@ -21,6 +28,8 @@ from app.core.agents.response_generator import ResponseGenerator
 
 logger = logging.getLogger(__name__)
 
+WORKFLOW_ENGINES = ("direct", "langgraph")
+
 
 class ServiceSearchGraph:
     """
@@ -30,16 +39,29 @@ class ServiceSearchGraph:
     1. LocationAnalyzer: 위치 분석 (주소 → 좌표, 정규화)
     2. ServiceFetcher: 서비스 조회 (Supabase + Redis 캐싱)
     3. ResponseGenerator: 응답 생성 (Kakao Map 마커 + 메시지)
+
+    Engines:
+    - direct: 세 노드를 그래프와 같은 순서로 직접 호출 (상태 객체를 그대로 전달,
+      그래프 실행과 결과 dict 재검증 비용 없음)
+    - langgraph: 컴파일된 StateGraph 로 실행
+    두 방식 모두 노드가 오류를 state.errors 에 기록하고 다음 노드로 진행한다.
     """
 
-    def __init__(self, use_llm: bool = False):
+    def __init__(self, use_llm: bool = False, engine: Optional[str] = None):
         """
         ServiceSearchGraph 초기화
 
         Args:
             use_llm: ResponseGenerator에서 LLM 사용 여부
+            engine: "direct" 또는 "langgraph" (None이면 settings.WORKFLOW_ENGINE)
+
+        Raises:
+            ValueError: 알 수 없는 engine
         """
         self.use_llm = use_llm
+        self.engine = engine or settings.WORKFLOW_ENGINE
+        if self.engine not in WORKFLOW_ENGINES:
+            raise ValueError(f"Unknown workflow engine: {self.engine}")
 
         # 에이전트 초기화
         self.location_analyzer = LocationAnalyzer()
@@ -49,7 +71,7 @@ class ServiceSearchGraph:
         # 그래프 빌드
         self.graph = self._build_graph()
 
-        logger.info(f"ServiceSearchGraph initialized (use_llm={use_llm})")
+        logger.info(f"ServiceSearchGraph initialized (use_llm={use_llm}, engine={self.engine})")
 
     def _build_graph(self) -> StateGraph:
         """
@@ -75,6 +97,25 @@ class ServiceSearchGraph:
         # 컴파일
         return workflow.compile()
 
+    async def _run_direct(self, state: WorkflowState) -> WorkflowState:
+        """
+        그래프 없이 노드 순차 실행 (그래프와 같은 순서, 상태 객체 참조 전달)
+
+        Args:
+            state: 초기 워크플로우 상태
+
+        Returns:
+            최종 상태
+        """
+        for node in (
+            self._analyze_location_node,
+            self._fetch_services_node,
+            self._generate_response_node
+        ):
+            state = await node(state)
+        return state
+
+    @timed("analyze_location")
     async def _analyze_location_node(self, state: WorkflowState) -> WorkflowState:
         """
         LocationAnalyzer 노드
@@ -88,8 +129,11 @@ class ServiceSearchGraph:
         try:
             logger.info(f"[analyze_location] Starting for workflow {state.workflow_id}")
 
-            # LocationAnalyzer 실행
-            analyzed = await self.location_analyzer.analyze(state.query)
+            # LocationAnalyzer 실행 (역지오코딩은 fetch_services 단계에서 조회와 동시 실행)
+            analyzed = await self.location_analyzer.analyze(
+                state.query,
+                resolve_address=False
+            )
 
             if analyzed is None:
                 error_msg = "Failed to analyze location"
@@ -114,6 +158,7 @@ class ServiceSearchGraph:
             state.errors.append(error_msg)
             return state
 
+    @timed("fetch_services")
     async def _fetch_services_node(self, state: WorkflowState) -> WorkflowState:
         """
         ServiceFetcher 노드
@@ -134,11 +179,26 @@ class ServiceSearchGraph:
 
             logger.info(f"[fetch_services] Starting for workflow {state.workflow_id}")
 
-            # ServiceFetcher 실행
-            results = await self.service_fetcher.fetch(
-                state.analyzed_location,
+            analyzed = state.analyzed_location
+            needs_address = (
+                state.query.include_address
+                and analyzed.source == "coordinates"
+                and not analyzed.address
+            )
+
+            # ServiceFetcher 실행 (주소가 필요하면 역지오코딩과 동시 실행)
+            fetch = self.service_fetcher.fetch(
+                analyzed,
                 limit=50  # Default limit
             )
+            if needs_address:
+                results, address = await asyncio.gather(
+                    fetch,
+                    self.location_analyzer.resolve_address(analyzed.latitude, analyzed.longitude)
+                )
+                analyzed.address = address
+            else:
+                results = await fetch
 
             if results is None:
                 error_msg = "Failed to fetch services"
@@ -163,6 +223,7 @@ class ServiceSearchGraph:
             state.errors.append(error_msg)
             return state
 
+    @timed("generate_response")
     async def _generate_response_node(self, state: WorkflowState) -> WorkflowState:
         """
         ResponseGenerator 노드
@@ -199,7 +260,6 @@ class ServiceSearchGraph:
             state.response = response
 
             # 워크플로우 완료 시간 기록
-            from datetime import datetime
             state.completed_at = datetime.now()
 
             logger.info(
@@ -243,8 +303,11 @@ class ServiceSearchGraph:
         logger.info(f"Starting workflow {workflow_id}")
 
         try:
-            # 그래프 실행
-            result = await self.graph.ainvoke(initial_state)
+            if self.engine == "direct":
+                result = await self._run_direct(initial_state)
+            else:
+                # 그래프 실행
+                result = await self.graph.ainvoke(initial_state)
 
             # LangGraph ainvoke는 dict를 반환하므로 WorkflowState로 변환
             if isinstance(result, dict):
@@ -269,6 +332,9 @@ class ServiceSearchGraph:
             else:
                 logger.info(f"Workflow {workflow_id} completed successfully")
 
+            if final_state.search_results is not None:
+                metrics.SEARCH_RESULT_SIZE.observe(len(final_state.search_results.locations))
+
             return final_state
 
         except Exception as e:
@@ -276,6 +342,120 @@ class ServiceSearchGraph:
             initial_state.errors.append(f"Workflow execution error: {e}")
             return initial_state
 
+    async def stream(
+        self,
+        query: LocationQuery,
+        limit: int = 50,
+        workflow_id: Optional[str] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        워크플로우 스트리밍 실행
+
+        위치 분석 직후 헤더를 보내고, 카테고리(테이블)별 조회가 끝나는 대로 위치/마커
+        배치를 보낸 뒤, 전체 결과를 거리순으로 합친 상위 limit개 기준 요약과 메시지를
+        마지막에 보낸다.
+
+        Events:
+        - header: workflow_id, 검색 중심/반경, 조회할 카테고리 목록
+        - locations: 카테고리별 위치 + Kakao Map 마커 (카테고리당 최대 limit개, 조회 실패 시 빈 배치)
+        - final: 메시지, 요약, 오류 (역지오코딩 주소는 이 단계에서 포함)
+        - error: 위치 분석 실패로 조회를 진행할 수 없는 경우 (마지막 이벤트)
+
+        Args:
+            query: 사용자 위치 쿼리
+            limit: 최종 결과 및 카테고리별 배치 최대 개수
+            workflow_id: 워크플로우 ID (선택, 없으면 자동 생성)
+
+        Yields:
+            이벤트 딕셔너리 ('type' 포함)
+        """
+        if workflow_id is None:
+            workflow_id = str(uuid.uuid4())
+
+        state = WorkflowState(query=query, workflow_id=workflow_id)
+        logger.info(f"Starting streaming workflow {workflow_id}")
+
+        state = await self._analyze_location_node(state)
+        analyzed = state.analyzed_location
+        if analyzed is None:
+            yield {'type': 'error', 'workflow_id': workflow_id, 'errors': state.errors}
+            return
+
+        categories = (
+            [analyzed.category] if analyzed.category
+            else list(self.service_fetcher.TABLE_MAP)
+        )
+
+        yield {
+            'type': 'header',
+            'workflow_id': workflow_id,
+            'search_center': {'latitude': analyzed.latitude, 'longitude': analyzed.longitude},
+            'search_radius': analyzed.radius,
+            'search_address': analyzed.address,
+            'categories': categories
+        }
+
+        # 역지오코딩은 조회와 동시에 진행하고 최종 요약에 포함
+        address_task = None
+        if query.include_address and analyzed.source == "coordinates" and not analyzed.address:
+            address_task = asyncio.ensure_future(
+                self.location_analyzer.resolve_address(analyzed.latitude, analyzed.longitude)
+            )
+
+        try:
+            started = time.time()
+            locations = []
+            async for category, results in self.service_fetcher.stream_by_category(
+                analyzed, categories, limit_per_category=limit
+            ):
+                if results is None:
+                    state.errors.append(f"Failed to fetch {category}")
+                    batch = []
+                else:
+                    batch = results.locations
+                    locations.extend(batch)
+
+                yield {'type': 'locations', **self.response_generator.format_batch(category, batch)}
+
+            final_locations = sort_by_distance(locations, ascending=True)[:limit]
+            state.search_results = SearchResults(
+                locations=final_locations,
+                total=len(final_locations),
+                category=analyzed.category,
+                search_center={'latitude': analyzed.latitude, 'longitude': analyzed.longitude},
+                search_radius=analyzed.radius,
+                execution_time=time.time() - started
+            )
+            metrics.SEARCH_RESULT_SIZE.observe(len(final_locations))
+
+            if address_task is not None:
+                analyzed.address = await address_task
+
+            with span("generate_response", NODE):
+                response = await self.response_generator.generate(state.search_results, analyzed)
+            if not response.success:
+                state.errors.append("Failed to generate response")
+
+            summary = {
+                key: value for key, value in response.summary.items()
+                if key not in ('grouped_by_category', 'kakao_markers')
+            }
+            state.completed_at = datetime.now()
+
+            yield {
+                'type': 'final',
+                'workflow_id': workflow_id,
+                'success': response.success and not state.errors,
+                'message': response.message,
+                'message_token': response.message_token,
+                'summary': summary,
+                'errors': state.errors
+            }
+
+        finally:
+            if address_task is not None and not address_task.done():
+                address_task.cancel()
+
 
 # Singleton instance
 _graph_instance: Optional[ServiceSearchGraph] = None
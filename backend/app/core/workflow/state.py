@@ -46,6 +46,7 @@ class LocationQuery(BaseModel):
     # 검색 조건
     radius: int = Field(2000, description="검색 반경 (미터)")
     category: Optional[str] = Field(None, description="카테고리 필터")
+    include_address: bool = Field(True, description="좌표 입력 시 역지오코딩 주소 포함 여부")
 
     # 우선순위 설정
     category_priority: Optional[List[str]] = Field(
@@ -79,6 +80,7 @@ class FormattedResponse(BaseModel):
     message: str = Field(..., description="사용자에게 보여질 메시지")
     locations: List[Dict[str, Any]] = Field(default_factory=list, description="위치 리스트")
     summary: Optional[Dict[str, Any]] = Field(None, description="요약 정보")
+    message_token: Optional[str] = Field(None, description="백그라운드 LLM 메시지 조회 토큰 (use_llm)")
 
     # 응답 메타데이터
     success: bool = Field(True, description="성공 여부")
@@ -5,9 +5,11 @@ Provides singleton Supabase client instance
 
 from supabase import create_client, Client
 from functools import lru_cache
+import asyncio
 import logging
 
 from app.core.config import settings
+from app.core.services.circuit_breaker import CircuitBreaker
 
 logger = logging.getLogger(__name__)
 
@@ -51,6 +53,24 @@ def get_supabase_admin_client() -> Client:
         raise
 
 
+async def _probe_supabase():
+    """Supabase 복구 확인 (1행 조회)"""
+    await asyncio.to_thread(
+        lambda: get_supabase_client().table('libraries').select('id').limit(1).execute()
+    )
+
+
+@lru_cache()
+def get_supabase_breaker() -> CircuitBreaker:
+    """
+    Supabase 서킷 브레이커 싱글톤 (요청 경로의 테이블/RPC 조회가 공유)
+
+    Returns:
+        CircuitBreaker 인스턴스
+    """
+    return CircuitBreaker("supabase", probe=_probe_supabase)
+
+
 # FastAPI dependency for Supabase client
 async def get_db() -> Client:
     """
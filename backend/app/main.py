@@ -4,12 +4,22 @@ FastAPI Main Application Entry Point
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 import logging
 from contextlib import asynccontextmanager
 
 from app.core.config import settings
 from app.api.v1.router import api_router
+from app.api.middleware import MetricsMiddleware, ServerTimingMiddleware
+from app.core.services import metrics, timing
+from app.core.services.spatial_index import get_spatial_index
+from app.core.services.redis_service import get_redis_service
+from app.core.services.kakao_map_service import get_kakao_map_service
+from app.core.services.geocode_cache import get_geocode_cache
+from app.core.services.gazetteer import get_gazetteer
+from app.core.services.single_flight import get_single_flight
+from app.core.services.llm_message_service import get_llm_message_service
+from app.db.supabase_client import get_supabase_breaker
 
 # Configure logging
 logging.basicConfig(
@@ -30,10 +40,36 @@ async def lifespan(app: FastAPI):
     logger.info(f"Supabase URL: {settings.SUPABASE_URL}")
     logger.info(f"Redis Cache Enabled: {settings.CACHE_ENABLED}")
 
+    # 타이밍 스팬 OpenTelemetry 내보내기 (OTEL_ENABLED)
+    timing.setup_tracing()
+
+    # 공간 인덱스 구축 (이후 주기적 재적재)
+    spatial_index = get_spatial_index()
+    if settings.SPATIAL_INDEX_ENABLED:
+        await spatial_index.start()
+
+    # 오프라인 지명 사전 (역/공공시설 이름 → 좌표)
+    gazetteer = get_gazetteer()
+    if settings.GAZETTEER_ENABLED:
+        await gazetteer.start()
+
+    # 다른 워커의 캐시 갱신 시 L1 무효화
+    await get_redis_service().start_invalidation_listener()
+
+    # Kakao API 공유 HTTP 클라이언트 (keep-alive 커넥션 재사용)
+    await get_kakao_map_service().start()
+
     yield
 
     # Shutdown
     logger.info("Shutting down Seoul Location Services API")
+    await spatial_index.stop()
+    await gazetteer.stop()
+    await get_redis_service().aclose()
+    await get_kakao_map_service().aclose()
+    await get_supabase_breaker().aclose()
+    await get_llm_message_service().aclose()
+    timing.shutdown_tracing()
 
 
 # Create FastAPI application
@@ -56,6 +92,14 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 노드/외부 호출 소요 시간 Server-Timing 헤더
+if settings.SERVER_TIMING_ENABLED:
+    app.add_middleware(ServerTimingMiddleware)
+
+# 라우트별 요청 지연 시간 / 진행 중인 요청 수 메트릭
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+
 # Include API router
 app.include_router(api_router, prefix=f"/api/{settings.API_VERSION}")
 
@@ -72,11 +116,32 @@ async def health_check():
             "status": "healthy",
             "version": settings.API_VERSION,
             "environment": settings.ENVIRONMENT,
-            "cache_enabled": settings.CACHE_ENABLED
+            "cache_enabled": settings.CACHE_ENABLED,
+            "spatial_index": get_spatial_index().get_stats(),
+            "geocode_cache": get_geocode_cache().get_stats(),
+            "gazetteer": get_gazetteer().get_stats(),
+            "single_flight": get_single_flight().get_stats(),
+            "timings": timing.get_timing_stats(),
+            "llm_messages": get_llm_message_service().get_stats(),
+            "circuit_breakers": {
+                "redis": get_redis_service().breaker.get_stats(),
+                "kakao": get_kakao_map_service().breaker.get_stats(),
+                "supabase": get_supabase_breaker().get_stats()
+            }
         }
     )
 
 
+# Prometheus metrics endpoint
+if settings.METRICS_ENABLED:
+    @app.get("/metrics", include_in_schema=False)
+    async def prometheus_metrics():
+        """
+        Prometheus scrape endpoint
+        """
+        return Response(content=metrics.render_metrics(), media_type=metrics.CONTENT_TYPE)
+
+
 @app.get("/", tags=["Root"])
 async def root():
     """
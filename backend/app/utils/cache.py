@@ -9,22 +9,28 @@ import functools
 from typing import Callable, Optional, Any
 import hashlib
 
-from app.core.services.redis_service import get_redis_service
+from app.core.services.redis_service import GENERATION_ALL, get_redis_service
 
 logger = logging.getLogger(__name__)
 
 
-def generate_cache_key(func_name: str, *args, **kwargs) -> str:
+def generate_cache_key(
+    func_name: str,
+    *args,
+    namespace: str = GENERATION_ALL,
+    **kwargs
+) -> str:
     """
     함수 호출 인자 기반 캐시 키 생성
 
     Args:
         func_name: 함수명
         *args: 위치 인자
+        namespace: 세대 카운터 카테고리 (invalidate_category 로 무효화되는 단위)
         **kwargs: 키워드 인자
 
     Returns:
-        캐시 키
+        캐시 키 (예: "cache:location.func:v3:<md5>")
     """
     # 인자를 문자열로 변환
     args_str = json.dumps(args, sort_keys=True, default=str)
@@ -34,7 +40,9 @@ def generate_cache_key(func_name: str, *args, **kwargs) -> str:
     key_content = f"{func_name}:{args_str}:{kwargs_str}"
     key_hash = hashlib.md5(key_content.encode()).hexdigest()
 
-    return f"cache:{func_name}:{key_hash}"
+    generation = get_redis_service().generation(namespace)
+
+    return f"cache:{func_name}:v{generation}:{key_hash}"
 
 
 def cache_response(
@@ -46,7 +54,7 @@ def cache_response(
 
     Args:
         ttl: Time To Live (초), None이면 Redis 서비스 기본값 사용
-        key_prefix: 캐시 키 접두사
+        key_prefix: 캐시 키 접두사 (세대 카운터 카테고리로도 사용, 없으면 전체)
 
     Example:
         @cache_response(ttl=300, key_prefix="location")
@@ -66,7 +74,9 @@ def cache_response(
 
             # 캐시 키 생성
             func_name = f"{key_prefix}.{func.__name__}" if key_prefix else func.__name__
-            cache_key = generate_cache_key(func_name, *args, **kwargs)
+            cache_key = generate_cache_key(
+                func_name, *args, namespace=key_prefix or GENERATION_ALL, **kwargs
+            )
 
             # 캐시 조회
             cached_result = redis.get(cache_key)
@@ -93,9 +103,11 @@ def cache_response(
                 return await func(*args, **kwargs)
 
             func_name = f"{key_prefix}.{func.__name__}" if key_prefix else func.__name__
-            cache_key = generate_cache_key(func_name, *args, **kwargs)
+            cache_key = generate_cache_key(
+                func_name, *args, namespace=key_prefix or GENERATION_ALL, **kwargs
+            )
 
-            cached_result = redis.get(cache_key)
+            cached_result = await redis.aget(cache_key)
             if cached_result is not None:
                 logger.info(f"Cache HIT: {func.__name__}")
                 return cached_result
@@ -103,7 +115,7 @@ def cache_response(
             logger.info(f"Cache MISS: {func.__name__}, executing...")
             result = await func(*args, **kwargs)
 
-            redis.set(cache_key, result, ttl=ttl)
+            await redis.aset(cache_key, result, ttl=ttl)
 
             return result
 
@@ -119,10 +131,11 @@ def cache_response(
 
 def invalidate_cache(pattern: str = "*") -> int:
     """
-    캐시 무효화
+    캐시 무효화 (SCAN + UNLINK, 카테고리 단위는 invalidate_category 사용)
 
     Args:
-        pattern: 삭제할 캐시 키 패턴 (예: "location:*")
+        pattern: 삭제할 캐시 키의 "cache:" 뒤 부분 glob 패턴 (정규식 아님)
+            (예: "location.find_*" → "cache:location.find_*")
 
     Returns:
         삭제된 키 개수
@@ -139,6 +152,50 @@ def invalidate_cache(pattern: str = "*") -> int:
     return deleted
 
 
+def invalidate_category(category: Optional[str] = None) -> Optional[int]:
+    """
+    카테고리 캐시 무효화 (세대 카운터 증가, 키 개수와 무관하게 O(1))
+
+    위치/셀 캐시와 같은 key_prefix 의 데코레이터 캐시가 함께 무효화된다.
+    이전 세대 키는 TTL 만료 또는 sweep_stale_cache 로 정리된다.
+
+    Args:
+        category: 카테고리 (None이면 모든 카테고리 + 전체 쿼리,
+            GENERATION_ALL 이면 카테고리 없는 전체 쿼리만)
+
+    Returns:
+        새 세대 번호, 캐시 비활성화/실패 시 None
+    """
+    redis = get_redis_service()
+
+    if not redis.enabled:
+        logger.warning("Cache disabled, invalidation skipped")
+        return None
+
+    generation = redis.bump_generation(category)
+    logger.info(f"Invalidated category '{category or 'every category'}' (generation {generation})")
+
+    return generation
+
+
+def sweep_stale_cache(category: Optional[str] = None) -> int:
+    """
+    이전 세대 위치/셀/데코레이터 캐시 키 삭제 (메모리 회수, SCAN + UNLINK)
+
+    Args:
+        category: 카테고리 (None이면 전체)
+
+    Returns:
+        삭제된 키 개수
+    """
+    redis = get_redis_service()
+
+    if not redis.enabled:
+        return 0
+
+    return redis.sweep_stale_generations(category)
+
+
 def cache_location_query(ttl: int = 300):
     """
     위치 쿼리 전용 캐싱 데코레이터
@@ -175,7 +232,9 @@ class CacheManager:
 
     Features:
     - 캐시 통계 조회
-    - 패턴별 캐시 무효화
+    - 카테고리별 캐시 무효화 (세대 카운터)
+    - 패턴별 캐시 무효화 (SCAN + UNLINK)
+    - 이전 세대 키 정리
     - 캐시 전체 삭제
     """
 
@@ -190,6 +249,14 @@ class CacheManager:
         """특정 패턴의 캐시 무효화"""
         return invalidate_cache(pattern)
 
+    def invalidate_category(self, category: Optional[str] = None) -> Optional[int]:
+        """카테고리 캐시 무효화 (세대 카운터 증가)"""
+        return invalidate_category(category)
+
+    def sweep_stale(self, category: Optional[str] = None) -> int:
+        """이전 세대 캐시 키 정리"""
+        return sweep_stale_cache(category)
+
     def invalidate_all(self) -> bool:
         """모든 캐시 삭제 (주의!)"""
         if not self.redis.enabled:
@@ -204,7 +271,8 @@ class CacheManager:
 
     def get_cache_info(self, func_name: str, *args, **kwargs) -> Optional[dict]:
         """특정 함수 호출의 캐시 정보 조회"""
-        cache_key = generate_cache_key(func_name, *args, **kwargs)
+        namespace = func_name.split(".", 1)[0] if "." in func_name else GENERATION_ALL
+        cache_key = generate_cache_key(func_name, *args, namespace=namespace, **kwargs)
         cached = self.redis.get(cache_key)
 
         if cached:
@@ -0,0 +1,123 @@
+"""
+캐시 값 코덱 벤치마크 스크립트
+기존 JSON 텍스트(json.dumps, ensure_ascii=False) vs msgpack/JSON + zstd/zlib 비교
+
+ServiceFetcher.SELECT_COLUMNS 전체 컬럼을 채운 합성 위치 리스트로
+엔트리당 크기와 인코딩/디코딩 지연 시간을 측정
+"""
+
+import sys
+import json
+import random
+import statistics
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+# 프로젝트 루트 경로 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.agents.service_fetcher import ServiceFetcher
+from app.core.services.cache_codec import CacheCodec, is_available
+
+
+# 벤치마크 설정
+ENTRY_SIZES = (1, 20, 100)  # 엔트리당 위치 수 (단일 셀 ~ limit 20 ~ 큰 셀)
+ITERATIONS = 300
+FORMATS = [
+    ("json", "none"),
+    ("json", "zlib"),
+    ("json", "zstd"),
+    ("msgpack", "none"),
+    ("msgpack", "zlib"),
+    ("msgpack", "zstd"),
+]
+
+SAMPLE_TEXT = [
+    "서울특별시 중구 세종대로 110", "종로구", "도서관", "문화공간", "전시/미술",
+    "무료", "https://example.seoul.go.kr/detail?id=12345", "02-120",
+    "어린이와 가족이 함께 즐길 수 있는 공연 프로그램입니다.",
+]
+
+
+def make_location(table: str, rng: random.Random) -> Dict[str, Any]:
+    """테이블 컬럼 전체를 채운 위치 1건 (Supabase 응답 형태)"""
+    location: Dict[str, Any] = {}
+    for column in ServiceFetcher.SELECT_COLUMNS[table].split(","):
+        if column in ("latitude", "lat", "y_coord"):
+            location[column] = round(37.4 + rng.random() * 0.3, 6)
+        elif column in ("longitude", "lot", "x_coord"):
+            location[column] = round(126.8 + rng.random() * 0.4, 6)
+        elif column.endswith("_count") or column in ("id", "no", "v_max", "v_min"):
+            location[column] = rng.randint(1, 100000)
+        else:
+            location[column] = " ".join(rng.sample(SAMPLE_TEXT, 3))
+    location["_table"] = table
+    location["distance"] = round(rng.random() * 2000, 2)
+    location["distance_formatted"] = f"{location['distance']:.0f}m"
+    return location
+
+
+def make_entry(size: int, seed: int) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    tables = list(ServiceFetcher.SELECT_COLUMNS)
+    return [make_location(tables[i % len(tables)], rng) for i in range(size)]
+
+
+def time_us(fn: Callable[[], Any]) -> float:
+    """반복 실행 평균 (마이크로초)"""
+    samples = []
+    for _ in range(ITERATIONS):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1_000_000)
+    return statistics.median(samples)
+
+
+def main():
+    print("=" * 92)
+    print("Cache Codec Benchmark")
+    print(f"iterations={ITERATIONS} (median)")
+    print("=" * 92)
+
+    for size in ENTRY_SIZES:
+        entry = make_entry(size, seed=size)
+
+        legacy = json.dumps(entry, ensure_ascii=False).encode("utf-8")
+        legacy_encode = time_us(lambda: json.dumps(entry, ensure_ascii=False).encode("utf-8"))
+        legacy_decode = time_us(lambda: json.loads(legacy))
+
+        print(f"\n[{size} locations/entry]")
+        print(
+            f"{'format':>14} | {'bytes':>8} | {'saved':>7} | {'encode (us)':>11} | "
+            f"{'decode (us)':>11} | {'Δencode':>8} | {'Δdecode':>8}"
+        )
+        print("-" * 92)
+        print(
+            f"{'legacy json':>14} | {len(legacy):>8} | {'-':>7} | {legacy_encode:>11.1f} | "
+            f"{legacy_decode:>11.1f} | {'-':>8} | {'-':>8}"
+        )
+
+        for serializer, compression in FORMATS:
+            if not is_available(serializer, compression):
+                print(f"{serializer + '+' + compression:>14} | (not installed)")
+                continue
+
+            codec = CacheCodec(serializer, compression, min_compress_bytes=0)
+            encoded = codec.encode(entry)
+            assert codec.decode(encoded) == entry
+
+            encode = time_us(lambda: codec.encode(entry))
+            decode = time_us(lambda: codec.decode(encoded))
+            saved = 1 - len(encoded) / len(legacy)
+
+            print(
+                f"{codec.name:>14} | {len(encoded):>8} | {saved:>6.1%} | {encode:>11.1f} | "
+                f"{decode:>11.1f} | {encode - legacy_encode:>+8.1f} | {decode - legacy_decode:>+8.1f}"
+            )
+
+    print("=" * 92)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+거리 계산 벤치마크 스크립트
+Python 루프 vs NumPy 벡터화 반경/top-k 검색 비교
+"""
+
+import sys
+import time
+import statistics
+from pathlib import Path
+from typing import List, Dict, Any, Callable
+
+import numpy as np
+
+# 프로젝트 루트 경로 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.services.distance_service import (
+    haversine_distance,
+    radius_search_arrays,
+    find_nearby_locations
+)
+
+
+# 벤치마크 설정
+CENTER_LAT = 37.5665  # 서울시청
+CENTER_LON = 126.9780
+RADIUS_M = 2000
+LIMIT = 50
+POINT_COUNTS = [10_000, 50_000, 100_000]
+ITERATIONS = 10
+
+
+def generate_locations(count: int, seed: int = 42) -> List[Dict[str, Any]]:
+    """서울 범위 내 임의 위치 생성"""
+    rng = np.random.default_rng(seed)
+    lats = rng.uniform(37.42, 37.70, count)
+    lons = rng.uniform(126.76, 127.18, count)
+    return [
+        {'id': str(i), 'latitude': float(lat), 'longitude': float(lon)}
+        for i, (lat, lon) in enumerate(zip(lats, lons))
+    ]
+
+
+def loop_find_nearby(locations: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """기존 방식: 위치마다 haversine_distance 호출"""
+    results = []
+    for location in locations:
+        distance = haversine_distance(
+            CENTER_LAT, CENTER_LON,
+            location['latitude'], location['longitude']
+        )
+        if distance <= RADIUS_M:
+            results.append({**location, 'distance': round(distance, 2)})
+    results.sort(key=lambda x: x['distance'])
+    return results[:LIMIT]
+
+
+def measure(func: Callable[[], Any], iterations: int = ITERATIONS) -> float:
+    """평균 실행 시간 측정 (밀리초)"""
+    func()  # 워밍업
+    times = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func()
+        times.append((time.perf_counter() - start) * 1000)
+    return statistics.mean(times)
+
+
+def main():
+    print("=" * 80)
+    print("Distance Service Benchmark")
+    print(f"center=({CENTER_LAT}, {CENTER_LON}), radius={RADIUS_M}m, limit={LIMIT}")
+    print("=" * 80)
+    print(f"{'points':>10} | {'loop (ms)':>10} | {'wrapper (ms)':>12} | {'columnar (ms)':>13} | {'speedup':>8}")
+    print("-" * 80)
+
+    for count in POINT_COUNTS:
+        locations = generate_locations(count)
+        lats = np.array([loc['latitude'] for loc in locations])
+        lons = np.array([loc['longitude'] for loc in locations])
+
+        loop_ms = measure(lambda: loop_find_nearby(locations))
+        wrapper_ms = measure(lambda: find_nearby_locations(
+            locations, CENTER_LAT, CENTER_LON, radius_m=RADIUS_M, limit=LIMIT
+        ))
+        columnar_ms = measure(lambda: radius_search_arrays(
+            lats, lons, CENTER_LAT, CENTER_LON, radius_m=RADIUS_M, limit=LIMIT
+        ))
+
+        print(
+            f"{count:>10,} | {loop_ms:>10.2f} | {wrapper_ms:>12.2f} | "
+            f"{columnar_ms:>13.3f} | {loop_ms / columnar_ms:>7.1f}x"
+        )
+
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""
+Kakao HTTP 클라이언트 벤치마크 스크립트
+요청마다 httpx.AsyncClient 생성 vs 공유 클라이언트(keep-alive) 비교
+
+로컬 모의 Kakao 서버(uvicorn)를 띄워 측정하므로 TLS 핸드셰이크 비용은
+포함되지 않음 (실제 dapi.kakao.com 대상에서는 차이가 더 커짐)
+"""
+
+import sys
+import time
+import asyncio
+import socket
+import statistics
+import threading
+from pathlib import Path
+from typing import Awaitable, Callable, List
+
+import httpx
+import uvicorn
+
+# 프로젝트 루트 경로 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.services.kakao_map_service import KakaoMapService
+
+
+# 벤치마크 설정
+REQUESTS = 200
+CONCURRENCY = 10
+ADDRESS = "서울 중구 세종대로 110"
+
+
+async def mock_kakao_app(scope, receive, send):
+    """주소 검색 응답만 반환하는 최소 ASGI 앱"""
+    if scope["type"] != "http":
+        return
+    body = '{"documents": [{"x": "126.978", "y": "37.5665"}]}'.encode("utf-8")
+    await send({
+        "type": "http.response.start",
+        "status": 200,
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode())
+        ]
+    })
+    await send({"type": "http.response.body", "body": body})
+
+
+def start_mock_server() -> str:
+    """백그라운드 스레드에서 모의 서버 실행 후 base URL 반환"""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+
+    config = uvicorn.Config(mock_kakao_app, host="127.0.0.1", port=port, log_level="error")
+    server = uvicorn.Server(config)
+    threading.Thread(target=server.run, daemon=True).start()
+
+    while not server.started:
+        time.sleep(0.05)
+    return f"http://127.0.0.1:{port}/v2"
+
+
+class PerRequestClientService(KakaoMapService):
+    """기존 방식: 호출마다 새 AsyncClient 생성 (매번 TCP 연결)"""
+
+    async def address_to_coordinates(self, address):
+        endpoint = f"{self.BASE_URL}/local/search/address.json"
+        async with httpx.AsyncClient() as client:
+            response = await client.get(
+                endpoint,
+                headers=self.headers,
+                params={"query": address},
+                timeout=10.0
+            )
+            response.raise_for_status()
+            doc = response.json()["documents"][0]
+            return (float(doc["y"]), float(doc["x"]))
+
+
+async def measure(call: Callable[[], Awaitable], concurrency: int) -> List[float]:
+    """요청별 지연 시간 측정 (밀리초)"""
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async def timed():
+        async with semaphore:
+            start = time.perf_counter()
+            await call()
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    await call()  # 워밍업
+    latencies.clear()
+    await asyncio.gather(*(timed() for _ in range(REQUESTS)))
+    return latencies
+
+
+def percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+async def run():
+    base_url = start_mock_server()
+
+    per_request = PerRequestClientService(api_key="benchmark")
+    shared = KakaoMapService(api_key="benchmark")
+    per_request.BASE_URL = shared.BASE_URL = base_url
+    await shared.start()
+
+    print("=" * 80)
+    print("Kakao HTTP Client Benchmark")
+    print(f"server={base_url}, requests={REQUESTS}")
+    print("=" * 80)
+    print(f"{'mode':>12} | {'conc':>5} | {'mean (ms)':>10} | {'p50 (ms)':>9} | {'p95 (ms)':>9} | {'total (s)':>9}")
+    print("-" * 80)
+
+    for concurrency in (1, CONCURRENCY):
+        for name, service in (("per-request", per_request), ("shared", shared)):
+            start = time.perf_counter()
+            latencies = await measure(
+                lambda: service.address_to_coordinates(ADDRESS),
+                concurrency
+            )
+            total = time.perf_counter() - start
+            print(
+                f"{name:>12} | {concurrency:>5} | {statistics.mean(latencies):>10.2f} | "
+                f"{percentile(latencies, 0.5):>9.2f} | {percentile(latencies, 0.95):>9.2f} | "
+                f"{total:>9.2f}"
+            )
+
+    await shared.aclose()
+    print("=" * 80)
+
+
+def main():
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
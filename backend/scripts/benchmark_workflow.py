@@ -0,0 +1,122 @@
+"""
+워크플로우 실행 엔진 벤치마크 스크립트
+LangGraph StateGraph(ainvoke + WorkflowState.model_validate) vs 노드 직접 호출 비교
+
+위치 분석/서비스 조회는 고정 결과를 즉시 반환하도록 대체하고, 응답 생성은 실제
+ResponseGenerator(템플릿)를 사용해 요청당 엔진 오버헤드만 측정
+"""
+
+import sys
+import asyncio
+import logging
+import random
+import statistics
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+# 프로젝트 루트 경로 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.workflow.service_graph import ServiceSearchGraph
+from app.core.workflow.state import AnalyzedLocation, LocationQuery, SearchResults
+
+
+# 벤치마크 설정
+RESULT_COUNTS = (50, 200)
+ITERATIONS = 300
+CENTER_LAT = 37.5665  # 서울시청
+CENTER_LON = 126.9780
+
+
+def make_locations(count: int, seed: int = 42) -> List[Dict[str, Any]]:
+    """libraries 테이블 형태의 위치 리스트 (거리순)"""
+    rng = random.Random(seed)
+    locations = []
+    for i in range(count):
+        distance = round(rng.random() * 2000, 2)
+        locations.append({
+            'id': str(i),
+            '_table': 'libraries',
+            'library_name': f'도서관 {i}',
+            'address': '서울특별시 중구 세종대로 110',
+            'latitude': CENTER_LAT + rng.uniform(-0.01, 0.01),
+            'longitude': CENTER_LON + rng.uniform(-0.01, 0.01),
+            'homepage': 'https://lib.seoul.go.kr',
+            'opertime': '09:00~18:00',
+            'distance': distance,
+            'distance_formatted': f'{distance:.0f}m'
+        })
+    locations.sort(key=lambda location: location['distance'])
+    return locations
+
+
+def make_graph(engine: str, locations: List[Dict[str, Any]]) -> ServiceSearchGraph:
+    """외부 호출 없이 고정 결과를 반환하는 그래프"""
+    graph = ServiceSearchGraph(use_llm=False, engine=engine)
+
+    async def analyze(query, resolve_address=True):
+        return AnalyzedLocation(
+            latitude=CENTER_LAT,
+            longitude=CENTER_LON,
+            address='서울특별시 중구 세종대로 110',
+            radius=2000,
+            source='coordinates'
+        )
+
+    async def fetch(analyzed_location, limit=20):
+        return SearchResults(
+            locations=list(locations),
+            total=len(locations),
+            search_center={'latitude': CENTER_LAT, 'longitude': CENTER_LON},
+            search_radius=2000,
+            execution_time=0.0
+        )
+
+    graph.location_analyzer.analyze = analyze
+    graph.service_fetcher.fetch = fetch
+    return graph
+
+
+async def time_us(graph: ServiceSearchGraph) -> float:
+    """요청 1건 실행 시간 중앙값 (마이크로초)"""
+    query = LocationQuery(latitude=CENTER_LAT, longitude=CENTER_LON, radius=2000)
+
+    for _ in range(20):  # 워밍업
+        await graph.run(query, workflow_id='warmup')
+
+    samples = []
+    for _ in range(ITERATIONS):
+        start = time.perf_counter()
+        state = await graph.run(query, workflow_id='bench')
+        samples.append((time.perf_counter() - start) * 1_000_000)
+        assert not state.errors, state.errors
+
+    return statistics.median(samples)
+
+
+async def main():
+    logging.disable(logging.CRITICAL)
+
+    print("=" * 72)
+    print("Workflow Engine Benchmark")
+    print(f"iterations={ITERATIONS} (median)")
+    print("=" * 72)
+    print(f"{'results':>8} | {'langgraph (us)':>14} | {'direct (us)':>11} | {'overhead (us)':>13} | {'speedup':>7}")
+    print("-" * 72)
+
+    for count in RESULT_COUNTS:
+        locations = make_locations(count)
+        langgraph_us = await time_us(make_graph("langgraph", locations))
+        direct_us = await time_us(make_graph("direct", locations))
+
+        print(
+            f"{count:>8} | {langgraph_us:>14.1f} | {direct_us:>11.1f} | "
+            f"{langgraph_us - direct_us:>13.1f} | {langgraph_us / direct_us:>6.2f}x"
+        )
+
+    print("=" * 72)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
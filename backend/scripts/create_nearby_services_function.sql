@@ -0,0 +1,114 @@
+-- Seoul Location Services - nearby_services RPC
+-- 용도: 반경 검색을 PostGIS로 위임 (ST_DWithin + KNN 정렬)
+-- 호출: supabase.rpc('nearby_services', {center_lat, center_lon, radius_m, category, result_limit})
+-- 전제: init_supabase_schema.sql 의 location GEOGRAPHY 컬럼 및 GIST 인덱스
+
+-- ============================================================================
+-- 1. location 컬럼 백필 (트리거 생성 이전에 적재된 행)
+-- ============================================================================
+UPDATE cultural_events
+SET location = ST_SetSRID(ST_MakePoint(lot, lat), 4326)::geography
+WHERE location IS NULL AND lat IS NOT NULL AND lot IS NOT NULL;
+
+UPDATE libraries
+SET location = ST_SetSRID(ST_MakePoint(longitude, latitude), 4326)::geography
+WHERE location IS NULL AND latitude IS NOT NULL AND longitude IS NOT NULL;
+
+UPDATE cultural_spaces
+SET location = ST_SetSRID(ST_MakePoint(longitude, latitude), 4326)::geography
+WHERE location IS NULL AND latitude IS NOT NULL AND longitude IS NOT NULL;
+
+UPDATE future_heritages
+SET location = ST_SetSRID(ST_MakePoint(longitude, latitude), 4326)::geography
+WHERE location IS NULL AND latitude IS NOT NULL AND longitude IS NOT NULL;
+
+UPDATE public_reservations
+SET location = ST_SetSRID(ST_MakePoint(x_coord, y_coord), 4326)::geography
+WHERE location IS NULL AND y_coord IS NOT NULL AND x_coord IS NOT NULL;
+
+-- ============================================================================
+-- 2. nearby_services 함수
+-- ============================================================================
+-- 테이블별로 ST_DWithin(GIST 인덱스) 필터 후 <-> KNN 정렬로 상위 N개만 뽑고,
+-- 합친 결과를 다시 거리순으로 잘라 반환한다.
+-- data: location 컬럼을 제외한 원본 행 (jsonb)
+CREATE OR REPLACE FUNCTION nearby_services(
+    center_lat DOUBLE PRECISION,
+    center_lon DOUBLE PRECISION,
+    radius_m INTEGER DEFAULT 2000,
+    category TEXT DEFAULT NULL,
+    result_limit INTEGER DEFAULT 50
+)
+RETURNS TABLE (
+    table_name TEXT,
+    distance DOUBLE PRECISION,
+    data JSONB
+) AS $$
+    WITH origin AS (
+        SELECT ST_SetSRID(ST_MakePoint(center_lon, center_lat), 4326)::geography AS geog
+    ),
+    matches AS (
+        (SELECT 'cultural_events'::TEXT, ST_Distance(t.location, o.geog), to_jsonb(t) - 'location'
+         FROM cultural_events t, origin o
+         WHERE (nearby_services.category IS NULL OR nearby_services.category = 'cultural_events')
+           AND ST_DWithin(t.location, o.geog, radius_m)
+         ORDER BY t.location <-> o.geog
+         LIMIT result_limit)
+
+        UNION ALL
+
+        (SELECT 'libraries'::TEXT, ST_Distance(t.location, o.geog), to_jsonb(t) - 'location'
+         FROM libraries t, origin o
+         WHERE (nearby_services.category IS NULL OR nearby_services.category = 'libraries')
+           AND ST_DWithin(t.location, o.geog, radius_m)
+         ORDER BY t.location <-> o.geog
+         LIMIT result_limit)
+
+        UNION ALL
+
+        (SELECT 'cultural_spaces'::TEXT, ST_Distance(t.location, o.geog), to_jsonb(t) - 'location'
+         FROM cultural_spaces t, origin o
+         WHERE (nearby_services.category IS NULL OR nearby_services.category = 'cultural_spaces')
+           AND ST_DWithin(t.location, o.geog, radius_m)
+         ORDER BY t.location <-> o.geog
+         LIMIT result_limit)
+
+        UNION ALL
+
+        (SELECT 'future_heritages'::TEXT, ST_Distance(t.location, o.geog), to_jsonb(t) - 'location'
+         FROM future_heritages t, origin o
+         WHERE (nearby_services.category IS NULL OR nearby_services.category = 'future_heritages')
+           AND ST_DWithin(t.location, o.geog, radius_m)
+         ORDER BY t.location <-> o.geog
+         LIMIT result_limit)
+
+        UNION ALL
+
+        (SELECT 'public_reservations'::TEXT, ST_Distance(t.location, o.geog), to_jsonb(t) - 'location'
+         FROM public_reservations t, origin o
+         WHERE (nearby_services.category IS NULL OR nearby_services.category = 'public_reservations')
+           AND ST_DWithin(t.location, o.geog, radius_m)
+         ORDER BY t.location <-> o.geog
+         LIMIT result_limit)
+    )
+    SELECT * FROM matches
+    ORDER BY 2
+    LIMIT result_limit;
+$$ LANGUAGE sql STABLE;
+
+-- ============================================================================
+-- 3. 권한 (Supabase anon/authenticated 역할이 있는 경우에만)
+-- ============================================================================
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM pg_roles WHERE rolname = 'anon') THEN
+        GRANT EXECUTE ON FUNCTION nearby_services(DOUBLE PRECISION, DOUBLE PRECISION, INTEGER, TEXT, INTEGER) TO anon;
+    END IF;
+    IF EXISTS (SELECT 1 FROM pg_roles WHERE rolname = 'authenticated') THEN
+        GRANT EXECUTE ON FUNCTION nearby_services(DOUBLE PRECISION, DOUBLE PRECISION, INTEGER, TEXT, INTEGER) TO authenticated;
+    END IF;
+END;
+$$;
+
+-- 예시: 서울시청 반경 1km 도서관 10곳
+-- SELECT * FROM nearby_services(37.5665, 126.9780, 1000, 'libraries', 10);
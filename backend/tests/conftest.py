@@ -0,0 +1,54 @@
+"""
+Shared test fixtures
+"""
+
+from unittest.mock import patch
+
+import pytest
+import fakeredis
+
+from app.core.services.redis_service import RedisService
+from app.core.services.geocode_cache import get_geocode_cache
+from app.db.supabase_client import get_supabase_breaker
+
+
+def build_fake_redis_service(server: fakeredis.FakeServer) -> RedisService:
+    """주어진 fakeredis 서버에 연결된 Redis 서비스 (워커 1개에 해당)"""
+    with patch('app.core.services.redis_service.settings.CACHE_ENABLED', True), \
+            patch('app.core.services.redis_service.settings.REDIS_URL', 'redis://localhost:6379'), \
+            patch('app.core.services.redis_service.redis.from_url',
+                  return_value=fakeredis.FakeRedis(server=server, decode_responses=False)), \
+            patch('app.core.services.redis_service.AsyncRedis.from_url',
+                  return_value=fakeredis.FakeAsyncRedis(server=server, decode_responses=False)):
+        service = RedisService()
+
+    assert service.enabled
+    return service
+
+
+@pytest.fixture
+def fake_redis_server() -> fakeredis.FakeServer:
+    """fakeredis 서버 (같은 서버에 연결된 서비스끼리 데이터/pub-sub 공유)"""
+    return fakeredis.FakeServer()
+
+
+@pytest.fixture
+def fake_redis_service(fake_redis_server) -> RedisService:
+    """fakeredis 기반 Redis 서비스 (동기/비동기 클라이언트가 같은 데이터 공유)"""
+    return build_fake_redis_service(fake_redis_server)
+
+
+@pytest.fixture(autouse=True)
+def clear_geocode_cache():
+    """테스트 간 지오코딩 메모리 캐시 격리"""
+    get_geocode_cache().clear()
+    yield
+    get_geocode_cache().clear()
+
+
+@pytest.fixture(autouse=True)
+def reset_supabase_breaker():
+    """테스트 간 Supabase 서킷 상태 격리 (요청 경로가 공유하는 싱글톤)"""
+    get_supabase_breaker().reset()
+    yield
+    get_supabase_breaker().reset()
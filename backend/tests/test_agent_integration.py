@@ -3,13 +3,20 @@ Integration Tests for LangGraph Agents
 LocationAnalyzer → ServiceFetcher → ResponseGenerator 통합 테스트
 """
 
+import asyncio
+import time
 import pytest
 from unittest.mock import Mock, AsyncMock, patch
+from postgrest.exceptions import APIError
 from typing import List, Dict, Any
 
+from app.core.config import settings
+from app.core.services.single_flight import SingleFlight
 from app.core.workflow.state import LocationQuery, AnalyzedLocation, SearchResults
 from app.core.agents.location_analyzer import LocationAnalyzer
 from app.core.agents.service_fetcher import ServiceFetcher
+from app.core.services.spatial_index import COORDINATE_COLUMNS
+from app.core.services.kakao_map_service import KakaoMapService
 from app.core.agents.response_generator import ResponseGenerator
 
 
@@ -56,7 +63,7 @@ def sample_locations() -> List[Dict[str, Any]]:
 def mock_kakao_service():
     """Mock Kakao Map Service"""
     with patch('app.core.agents.location_analyzer.get_kakao_map_service') as mock:
-        service = Mock()
+        service = KakaoMapService(api_key='test-key')
         service.address_to_coordinates = AsyncMock(return_value=(37.5665, 126.9780))
         service.keyword_search = AsyncMock(return_value=(37.5665, 126.9780))
         service.reverse_geocode = AsyncMock(return_value="서울시 중구 세종대로 110")
@@ -69,21 +76,20 @@ def mock_supabase_client():
     """Mock Supabase Client"""
     with patch('app.core.agents.service_fetcher.get_supabase_client') as mock:
         client = Mock()
+        # 범위 필터(gte/lte) 체인이 같은 쿼리 객체를 반환하도록 설정
+        query = client.table.return_value.select.return_value
+        query.gte.return_value = query
+        query.lte.return_value = query
         mock.return_value = client
         yield client
 
 
 @pytest.fixture
-def mock_redis_service():
-    """Mock Redis Service"""
+def mock_redis_service(fake_redis_service):
+    """Redis Service (fakeredis, 빈 캐시로 시작)"""
     with patch('app.core.agents.service_fetcher.get_redis_service') as mock:
-        service = Mock()
-        service.enabled = True
-        service.get = Mock(return_value=None)  # Cache miss
-        service.set = Mock(return_value=True)
-        service.generate_cache_key = Mock(return_value="test:cache:key")
-        mock.return_value = service
-        yield service
+        mock.return_value = fake_redis_service
+        yield fake_redis_service
 
 
 # Integration Tests
@@ -243,55 +249,50 @@ class TestCacheScenarios:
         self,
         mock_kakao_service,
         mock_supabase_client,
+        mock_redis_service,
         sample_locations
     ):
         """캐시 미스 → 캐시 히트 시나리오"""
-        with patch('app.core.agents.service_fetcher.get_redis_service') as mock_redis:
-            # Setup Redis mock
-            redis_service = Mock()
-            redis_service.enabled = True
-
-            # First call: cache miss
-            call_count = {'get': 0}
-
-            def mock_get(key):
-                call_count['get'] += 1
-                if call_count['get'] == 1:
-                    return None  # First call: cache miss
-                else:
-                    return sample_locations  # Second call: cache hit
-
-            redis_service.get = mock_get
-            redis_service.set = Mock(return_value=True)
-            redis_service.generate_cache_key = Mock(return_value="test:cache:key")
-            mock_redis.return_value = redis_service
+        # Mock Supabase response
+        mock_response = Mock()
+        mock_response.data = sample_locations
+        query = mock_supabase_client.table.return_value.select.return_value
+        query.execute.return_value = mock_response
 
-            # Mock Supabase response
-            mock_response = Mock()
-            mock_response.data = sample_locations
-            mock_supabase_client.table.return_value.select.return_value.execute.return_value = mock_response
+        # Setup
+        analyzed = AnalyzedLocation(
+            latitude=37.5665,
+            longitude=126.9780,
+            radius=2000,
+            category='libraries',
+            source='coordinates'
+        )
 
-            # Setup
-            analyzed = AnalyzedLocation(
-                latitude=37.5665,
-                longitude=126.9780,
-                radius=2000,
-                category='libraries',
-                source='coordinates'
-            )
+        fetcher = ServiceFetcher()
 
-            fetcher = ServiceFetcher()
+        # First call: cache miss → Supabase query
+        results1 = await fetcher.fetch(analyzed, limit=20)
+        assert results1 is not None
+        assert results1.total > 0
 
-            # First call: cache miss → Supabase query
-            results1 = await fetcher.fetch(analyzed, limit=20)
-            assert results1 is not None
+        # Second call: cache hit → no Supabase query
+        results2 = await fetcher.fetch(analyzed, limit=20)
+        assert results2 is not None
+        assert results2.locations == results1.locations
 
-            # Second call: cache hit → no Supabase query
-            results2 = await fetcher.fetch(analyzed, limit=20)
-            assert results2 is not None
+        # 20m 떨어진 지점, 더 작은 반경 → 같은 셀 캐시 재사용
+        nearby = AnalyzedLocation(
+            latitude=37.5667,
+            longitude=126.9781,
+            radius=1000,
+            category='libraries',
+            source='coordinates'
+        )
+        results3 = await fetcher.fetch(nearby, limit=20)
+        assert results3.total == results1.total
 
-            # Verify cache was used
-            assert call_count['get'] == 2
+        # Verify cache was used
+        assert query.execute.call_count == 1
 
     @pytest.mark.asyncio
     async def test_cache_disabled(
@@ -435,6 +436,572 @@ class TestDistanceCalculation:
         assert results is not None
         assert all(loc['distance'] <= 1000 for loc in results.locations)
 
+    @pytest.mark.asyncio
+    async def test_bbox_prefilter_pushed_to_query(
+        self,
+        mock_kakao_service,
+        mock_supabase_client,
+        mock_redis_service
+    ):
+        """경계 상자 필터 및 컬럼 프로젝션이 Supabase 쿼리에 전달되는지 검증"""
+        mock_response = Mock()
+        mock_response.data = []
+        query = mock_supabase_client.table.return_value.select.return_value
+        query.execute.return_value = mock_response
+
+        analyzed = AnalyzedLocation(
+            latitude=37.5665,
+            longitude=126.9780,
+            radius=1000,
+            category='public_reservations',
+            source='coordinates'
+        )
+
+        fetcher = ServiceFetcher()
+        with patch('app.core.agents.service_fetcher.settings.CELL_CACHE_ENABLED', False):
+            await fetcher.fetch(analyzed, limit=20)
+
+        columns = mock_supabase_client.table.return_value.select.call_args[0][0]
+        assert columns == ServiceFetcher.SELECT_COLUMNS['public_reservations']
+        assert 'location' not in columns.split(',')
+
+        # public_reservations: 위도 y_coord, 경도 x_coord
+        gte_args = [c[0] for c in query.gte.call_args_list]
+        lte_args = [c[0] for c in query.lte.call_args_list]
+        assert [col for col, _ in gte_args] == ['y_coord', 'x_coord']
+        assert [col for col, _ in lte_args] == ['y_coord', 'x_coord']
+        (_, min_lat), (_, min_lon) = gte_args
+        (_, max_lat), (_, max_lon) = lte_args
+        assert min_lat < 37.5665 < max_lat
+        assert min_lon < 126.9780 < max_lon
+        assert max_lat - min_lat == pytest.approx(2 / 111.0)
+
+    @pytest.mark.asyncio
+    async def test_projection_failure_falls_back_to_all_columns(
+        self,
+        mock_kakao_service,
+        mock_supabase_client,
+        mock_redis_service
+    ):
+        """컬럼 프로젝션 실패 시 '*'로 재시도"""
+        mock_response = Mock()
+        mock_response.data = [
+            {'id': '1', 'library_name': 'Fallback', 'latitude': 37.5665, 'longitude': 126.9780}
+        ]
+        query = mock_supabase_client.table.return_value.select.return_value
+        query.execute.side_effect = [
+            APIError({'code': '42703', 'message': 'column libraries.facilities does not exist'}),
+            mock_response
+        ]
+
+        analyzed = AnalyzedLocation(
+            latitude=37.5665,
+            longitude=126.9780,
+            radius=1000,
+            category='libraries',
+            source='coordinates'
+        )
+
+        fetcher = ServiceFetcher()
+        results = await fetcher.fetch(analyzed, limit=20)
+
+        assert results.total == 1
+        assert mock_supabase_client.table.return_value.select.call_args[0][0] == '*'
+        assert 'libraries' in fetcher._projection_disabled
+
+    def test_transient_error_keeps_projection(
+        self,
+        mock_supabase_client,
+        mock_redis_service
+    ):
+        """타임아웃 등 일시 오류는 '*'로 재시도하지 않고 프로젝션 유지"""
+        query = mock_supabase_client.table.return_value.select.return_value
+        query.execute.side_effect = APIError({'code': '57014', 'message': 'statement timeout'})
+
+        fetcher = ServiceFetcher()
+        with pytest.raises(APIError):
+            fetcher._query_table('libraries', (37.5, 37.6, 126.9, 127.0))
+
+        assert query.execute.call_count == 1
+        assert 'libraries' not in fetcher._projection_disabled
+
+        query.execute.side_effect = ConnectionError("connection reset")
+        with pytest.raises(ConnectionError):
+            fetcher._query_table('libraries', (37.5, 37.6, 126.9, 127.0))
+        assert 'libraries' not in fetcher._projection_disabled
+
+
+class TestParallelFetch:
+    """테이블 병렬 조회 테스트"""
+
+    @staticmethod
+    def make_query_table(delays: Dict[str, float]):
+        """테이블별 지연 후 시청 좌표 1건을 반환하는 _query_table 대체 함수"""
+        def query_table(table, bbox):
+            time.sleep(delays.get(table, 0))
+            lat_key, lon_key = COORDINATE_COLUMNS[table]
+            return [{'id': table, lat_key: 37.5665, lon_key: 126.9780}]
+        return query_table
+
+    @pytest.mark.asyncio
+    async def test_tables_queried_concurrently(
+        self,
+        mock_supabase_client,
+        mock_redis_service
+    ):
+        """전체 카테고리 조회 시 테이블 쿼리가 동시에 실행되는지 검증"""
+        analyzed = AnalyzedLocation(
+            latitude=37.5665,
+            longitude=126.9780,
+            radius=1000,
+            source='coordinates'
+        )
+
+        fetcher = ServiceFetcher()
+        fetcher._query_table = self.make_query_table(
+            {table: 0.2 for table in ServiceFetcher.TABLE_MAP}
+        )
+
+        start = time.perf_counter()
+        locations = await fetcher._fetch_from_supabase(analyzed, limit=20)
+        elapsed = time.perf_counter() - start
+
+        assert {loc['_table'] for loc in locations} == set(ServiceFetcher.TABLE_MAP)
+        # 순차 실행이면 1초 (0.2s x 5)
+        assert elapsed < 0.6
+
+    @pytest.mark.asyncio
+    async def test_slow_table_returns_partial_results(
+        self,
+        mock_supabase_client,
+        mock_redis_service
+    ):
+        """타임아웃된 테이블은 제외하고 나머지 결과 반환"""
+        analyzed = AnalyzedLocation(
+            latitude=37.5665,
+            longitude=126.9780,
+            radius=1000,
+            source='coordinates'
+        )
+
+        fetcher = ServiceFetcher()
+        fetcher._query_table = self.make_query_table({'libraries': 1.0})
+
+        with patch('app.core.agents.service_fetcher.settings.SUPABASE_TABLE_TIMEOUT', 0.1):
+            results = await fetcher.fetch(analyzed, limit=20)
+
+        tables = {loc['_table'] for loc in results.locations}
+        assert 'libraries' not in tables
+        assert tables == set(ServiceFetcher.TABLE_MAP) - {'libraries'}
+
+    @pytest.mark.asyncio
+    async def test_failed_table_does_not_fail_request(
+        self,
+        mock_supabase_client,
+        mock_redis_service
+    ):
+        """한 테이블 오류 시에도 나머지 테이블 결과 반환"""
+        analyzed = AnalyzedLocation(
+            latitude=37.5665,
+            longitude=126.9780,
+            radius=1000,
+            source='coordinates'
+        )
+
+        fetcher = ServiceFetcher()
+        query_table = self.make_query_table({})
+
+        def failing_query_table(table, bbox):
+            if table == 'cultural_events':
+                raise Exception("connection reset")
+            return query_table(table, bbox)
+
+        fetcher._query_table = failing_query_table
+        results = await fetcher.fetch(analyzed, limit=20)
+
+        assert results.total == len(ServiceFetcher.TABLE_MAP) - 1
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_skips_queries(
+        self,
+        mock_supabase_client,
+        mock_redis_service
+    ):
+        """연속 연결 오류로 서킷이 열리면 테이블 쿼리 없이 즉시 빈 결과"""
+        analyzed = AnalyzedLocation(
+            latitude=37.5665,
+            longitude=126.9780,
+            radius=1000,
+            source='coordinates'
+        )
+
+        fetcher = ServiceFetcher()
+        calls = []
+
+        def failing_query_table(table, bbox):
+            calls.append(table)
+            raise ConnectionError("connection refused")
+
+        fetcher._query_table = failing_query_table
+        with patch.object(fetcher.supabase_breaker, 'probe', None), \
+                patch.object(fetcher.supabase_breaker, 'failure_threshold', len(ServiceFetcher.TABLE_MAP)):
+            await fetcher._fetch_from_supabase(analyzed, limit=20)
+            assert fetcher.supabase_breaker.state == "open"
+
+            assert await fetcher._fetch_from_supabase(analyzed, limit=20) == []
+
+        assert len(calls) == len(ServiceFetcher.TABLE_MAP)
+
+
+class TestCellCache:
+    """그리드 셀 캐시 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_overlapping_queries_fetch_only_missing_cells(
+        self,
+        mock_supabase_client,
+        mock_redis_service
+    ):
+        """넓은 반경 재검색 시 누락 셀만 조회하고 결과 중복 없음"""
+        fetcher = ServiceFetcher()
+        calls = []
+        query_table = TestParallelFetch.make_query_table({})
+
+        def recording_query_table(table, bbox):
+            calls.append((table, bbox))
+            return query_table(table, bbox)
+
+        fetcher._query_table = recording_query_table
+
+        small = AnalyzedLocation(
+            latitude=37.5665, longitude=126.9780, radius=300,
+            category='libraries', source='coordinates'
+        )
+        large = AnalyzedLocation(
+            latitude=37.5665, longitude=126.9780, radius=2000,
+            category='libraries', source='coordinates'
+        )
+
+        results_small = await fetcher.fetch(small, limit=20)
+        results_large = await fetcher.fetch(large, limit=20)
+        results_again = await fetcher.fetch(large, limit=20)
+
+        assert results_small.total == 1
+        assert results_large.total == 1
+        assert results_again.total == 1
+        assert len(calls) == 2  # 두 번째 large 검색은 모두 캐시 히트
+
+    @pytest.mark.asyncio
+    async def test_failed_table_cells_not_cached(
+        self,
+        mock_supabase_client,
+        mock_redis_service
+    ):
+        """조회 실패한 테이블의 셀은 빈 셀로 저장하지 않음"""
+        fetcher = ServiceFetcher()
+        query_table = TestParallelFetch.make_query_table({})
+
+        def failing_query_table(table, bbox):
+            if table == 'libraries':
+                raise Exception("connection reset")
+            return query_table(table, bbox)
+
+        fetcher._query_table = failing_query_table
+        analyzed = AnalyzedLocation(
+            latitude=37.5665, longitude=126.9780, radius=500, source='coordinates'
+        )
+
+        await fetcher.fetch(analyzed, limit=20)
+
+        cell = mock_redis_service.cell_index(37.5665, 126.9780, 0.01)
+        library_key = mock_redis_service.generate_cell_key('libraries', cell, 0.01)
+        event_key = mock_redis_service.generate_cell_key('cultural_events', cell, 0.01)
+        assert await mock_redis_service.aget(library_key) is None
+        assert len(await mock_redis_service.aget(event_key)) == 1
+
+    @pytest.mark.asyncio
+    async def test_large_radius_skips_cell_cache(
+        self,
+        mock_supabase_client,
+        mock_redis_service
+    ):
+        """셀 수가 한도를 넘으면 셀 캐시 미사용"""
+        fetcher = ServiceFetcher()
+        analyzed = AnalyzedLocation(
+            latitude=37.5665, longitude=126.9780, radius=10000, source='coordinates'
+        )
+
+        assert await fetcher._search_cells(analyzed, limit=20) is None
+
+    @pytest.mark.asyncio
+    async def test_stale_cells_served_and_refreshed(
+        self,
+        mock_supabase_client,
+        mock_redis_service
+    ):
+        """기본 설정(셀 캐시 사용)에서 soft 만료된 셀은 즉시 응답 후 백그라운드 갱신"""
+        fetcher = ServiceFetcher()
+        calls = []
+        query_table = TestParallelFetch.make_query_table({})
+
+        def recording_query_table(table, bbox):
+            calls.append(table)
+            return query_table(table, bbox)
+
+        fetcher._query_table = recording_query_table
+        analyzed = AnalyzedLocation(
+            latitude=37.5665, longitude=126.9780, radius=2000,
+            category='libraries', source='coordinates'
+        )
+
+        await fetcher.fetch(analyzed, limit=20)
+        assert calls == ['libraries']
+
+        # soft TTL 경과 후 (hard TTL 이전)
+        later = time.time() + settings.CELL_CACHE_TTL + 1
+        with patch('app.core.services.redis_service.time.time', return_value=later):
+            mock_redis_service.local.clear()
+            fetcher.single_flight = SingleFlight()
+            result = await fetcher.fetch(analyzed, limit=20)
+
+            assert result.total == 1
+            assert mock_redis_service.stale_hits > 0
+            await asyncio.gather(*set(mock_redis_service._refresh_tasks.values()))
+
+        assert calls == ['libraries', 'libraries']  # 백그라운드 갱신 1회
+        assert mock_redis_service.refreshes > 0
+
+    @pytest.mark.asyncio
+    async def test_rpc_enabled_skips_cell_cache(
+        self,
+        mock_supabase_client,
+        mock_redis_service
+    ):
+        """PostGIS RPC 사용 시 셀 캐시를 건너뛰고 RPC + 좌표 키 캐시 사용"""
+        fetcher = ServiceFetcher()
+        fetcher._search_cells = AsyncMock()
+        fetcher._fetch_from_rpc = AsyncMock(
+            return_value=[{'id': '1', 'distance': 10.0, '_table': 'libraries'}]
+        )
+        analyzed = AnalyzedLocation(
+            latitude=37.5665, longitude=126.9780, radius=2000, source='coordinates'
+        )
+
+        with patch('app.core.agents.service_fetcher.settings.NEARBY_RPC_ENABLED', True):
+            first = await fetcher.fetch(analyzed, limit=20)
+            second = await fetcher.fetch(analyzed, limit=20)
+
+        assert first.total == second.total == 1
+        fetcher._search_cells.assert_not_called()
+        fetcher._fetch_from_rpc.assert_called_once()  # 두 번째는 좌표 키 캐시 히트
+
+
+class TestMultiCategoryFetch:
+    """여러 카테고리 일괄 조회 테스트 (MGET 1회 + 파이프라인 저장 1회)"""
+
+    @staticmethod
+    def search_by_category(calls: List[str]):
+        """카테고리별 1건을 반환하는 _search_supabase 대체 함수"""
+        async def search(analyzed_location, limit):
+            calls.append(analyzed_location.category)
+            if analyzed_location.category == 'future_heritages':
+                return []
+            return [{'id': analyzed_location.category, 'distance': 10.0,
+                     '_table': analyzed_location.category}]
+        return search
+
+    @pytest.mark.asyncio
+    async def test_single_round_trip_per_phase(
+        self,
+        mock_supabase_client,
+        mock_redis_service
+    ):
+        """카테고리 수와 관계없이 조회 MGET 1회, 미스 저장 파이프라인 1회"""
+        calls = []
+        fetcher = ServiceFetcher()
+        fetcher._search_supabase = self.search_by_category(calls)
+        categories = ['libraries', 'cultural_events', 'future_heritages']
+        analyzed = AnalyzedLocation(
+            latitude=37.5665, longitude=126.9780, radius=2000, source='coordinates'
+        )
+        client = mock_redis_service.async_client
+
+        with patch.object(client, 'mget', wraps=client.mget) as mget, \
+                patch.object(client, 'get', wraps=client.get) as get, \
+                patch.object(client, 'pipeline', wraps=client.pipeline) as pipeline:
+            first = await fetcher.fetch_by_category(analyzed, categories, limit_per_category=5)
+
+            assert mget.call_count == 1
+            assert pipeline.call_count == 1
+            assert sorted(calls) == sorted(categories)
+            assert first['libraries'].total == 1
+            assert first['future_heritages'].total == 0
+
+            mock_redis_service.local.clear()
+            second = await fetcher.fetch_by_category(analyzed, categories, limit_per_category=5)
+
+            assert mget.call_count == 2
+            assert pipeline.call_count == 1
+            get.assert_not_called()
+
+        # 결과 없는 카테고리는 저장하지 않아 다시 조회
+        assert sorted(calls) == sorted(categories + ['future_heritages'])
+        assert second['cultural_events'].locations == first['cultural_events'].locations
+
+    @pytest.mark.asyncio
+    async def test_shares_cache_with_single_fetch(
+        self,
+        mock_supabase_client,
+        mock_redis_service
+    ):
+        """단일 카테고리 fetch 와 같은 캐시 키 사용"""
+        calls = []
+        fetcher = ServiceFetcher()
+        fetcher._search_supabase = self.search_by_category(calls)
+        analyzed = AnalyzedLocation(
+            latitude=37.5665, longitude=126.9780, radius=2000, source='coordinates'
+        )
+
+        with patch('app.core.agents.service_fetcher.settings.CELL_CACHE_ENABLED', False):
+            await fetcher.fetch_by_category(analyzed, ['libraries'])
+            result = await fetcher.fetch(fetcher._with_category(analyzed, 'libraries'), limit=10)
+
+        assert result.total == 1
+        assert calls == ['libraries']
+
+    @pytest.mark.asyncio
+    async def test_redis_disabled_fetches_each_category(
+        self,
+        mock_supabase_client,
+        mock_redis_service
+    ):
+        """Redis 비활성화 시 카테고리별 fetch"""
+        calls = []
+        fetcher = ServiceFetcher()
+        fetcher._search_supabase = self.search_by_category(calls)
+        mock_redis_service.enabled = False
+        analyzed = AnalyzedLocation(
+            latitude=37.5665, longitude=126.9780, radius=2000, source='coordinates'
+        )
+
+        results = await fetcher.fetch_by_category(analyzed, ['libraries', 'cultural_events'])
+
+        assert set(results) == {'libraries', 'cultural_events'}
+        assert sorted(calls) == ['cultural_events', 'libraries']
+
+
+class TestSingleFlightFetch:
+    """동일 쿼리 동시 캐시 미스 병합 테스트"""
+
+    @staticmethod
+    def slow_search(delay: float = 0.05):
+        """지연 후 결과를 반환하는 Supabase 검색 mock"""
+        async def search(analyzed_location, limit):
+            await asyncio.sleep(delay)
+            return [{'id': '1', 'distance': 10.0, '_table': 'libraries'}]
+
+        return AsyncMock(side_effect=search)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_scan_once(
+        self,
+        mock_supabase_client,
+        mock_redis_service
+    ):
+        """같은 쿼리의 동시 미스는 Supabase 조회 1회"""
+        fetcher = ServiceFetcher()
+        fetcher._search_supabase = self.slow_search()
+        analyzed = AnalyzedLocation(
+            latitude=37.5665, longitude=126.9780, radius=2000, source='coordinates'
+        )
+
+        with patch('app.core.agents.service_fetcher.settings.CELL_CACHE_ENABLED', False):
+            results = await asyncio.gather(*[fetcher.fetch(analyzed) for _ in range(10)])
+
+        assert all(result.total == 1 for result in results)
+        fetcher._search_supabase.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_different_limits_not_coalesced(
+        self,
+        mock_supabase_client,
+        mock_redis_service
+    ):
+        """limit이 다르면 별도 계산"""
+        fetcher = ServiceFetcher()
+        fetcher._search_supabase = self.slow_search()
+        analyzed = AnalyzedLocation(
+            latitude=37.5665, longitude=126.9780, radius=2000, source='coordinates'
+        )
+
+        with patch('app.core.agents.service_fetcher.settings.CELL_CACHE_ENABLED', False), \
+                patch('app.core.agents.service_fetcher.settings.CACHE_ENABLED', False):
+            await asyncio.gather(fetcher.fetch(analyzed, limit=10), fetcher.fetch(analyzed, limit=20))
+
+        assert fetcher._search_supabase.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_stale_cache_served_and_refreshed(
+        self,
+        mock_supabase_client,
+        mock_redis_service
+    ):
+        """soft 만료된 캐시는 즉시 응답하고 백그라운드에서 갱신"""
+        fetcher = ServiceFetcher()
+        fetcher._search_supabase = AsyncMock(
+            return_value=[{'id': '2', 'distance': 5.0, '_table': 'libraries'}]
+        )
+        analyzed = AnalyzedLocation(
+            latitude=37.5665, longitude=126.9780, radius=2000, source='coordinates'
+        )
+        cache_key = mock_redis_service.generate_cache_key(37.5665, 126.9780, 2000, None)
+        await mock_redis_service.aset_swr(
+            cache_key, [{'id': '1', 'distance': 10.0, '_table': 'libraries'}], ttl=300
+        )
+        with patch('app.core.services.redis_service.time.time', return_value=time.time() + 301):
+            with patch('app.core.agents.service_fetcher.settings.CELL_CACHE_ENABLED', False):
+                result = await fetcher.fetch(analyzed)
+
+            assert result.locations[0]['id'] == '1'
+            await asyncio.gather(*mock_redis_service._refresh_tasks.values())
+
+        fetcher._search_supabase.assert_called_once_with(analyzed, 20)
+        assert (await mock_redis_service.aget(cache_key))[0]['id'] == '2'
+
+    @pytest.mark.asyncio
+    async def test_redis_lock_coalesces_across_workers(
+        self,
+        mock_supabase_client,
+        mock_redis_service,
+        fake_redis_server
+    ):
+        """Redis 락 사용 시 다른 워커는 캐시 저장을 기다려 재사용"""
+        from tests.conftest import build_fake_redis_service
+        from app.core.services.single_flight import SingleFlight
+
+        workers = []
+        for redis_service in (mock_redis_service, build_fake_redis_service(fake_redis_server)):
+            fetcher = ServiceFetcher()
+            fetcher.redis = redis_service
+            fetcher.single_flight = SingleFlight()  # 워커마다 별도 프로세스
+            fetcher._search_supabase = self.slow_search(0.1)
+            workers.append(fetcher)
+
+        analyzed = AnalyzedLocation(
+            latitude=37.5665, longitude=126.9780, radius=2000, source='coordinates'
+        )
+
+        with patch('app.core.agents.service_fetcher.settings.CELL_CACHE_ENABLED', False), \
+                patch('app.core.agents.service_fetcher.settings.SINGLE_FLIGHT_REDIS_LOCK', True), \
+                patch('app.core.agents.service_fetcher.settings.SINGLE_FLIGHT_POLL_INTERVAL', 0.01):
+            results = await asyncio.gather(*[worker.fetch(analyzed) for worker in workers])
+
+        assert all(result.total == 1 for result in results)
+        calls = sum(worker._search_supabase.call_count for worker in workers)
+        assert calls == 1
+        # 계산 후 락 해제
+        assert not await mock_redis_service.is_locked(workers[0]._flight_key(analyzed, 20))
+
 
 class TestResponseGeneration:
     """응답 생성 테스트"""
@@ -3,11 +3,15 @@ API Endpoint Tests for Geocoding
 지오코딩 API 엔드포인트 테스트
 """
 
+import asyncio
+import json
 import pytest
 from fastapi.testclient import TestClient
-from unittest.mock import Mock, AsyncMock, patch
+from unittest.mock import AsyncMock, patch
 
 from app.main import app
+from app.core.config import settings
+from app.core.services.kakao_map_service import KakaoMapService
 
 
 # Test Fixtures
@@ -22,7 +26,7 @@ def client():
 def mock_kakao_service():
     """Mock Kakao Map Service"""
     with patch('app.api.v1.endpoints.geocode.get_kakao_map_service') as mock:
-        service = Mock()
+        service = KakaoMapService(api_key='test-key')
 
         # Default mock behaviors
         service.address_to_coordinates = AsyncMock(return_value=(37.5665, 126.9780))
@@ -64,7 +68,7 @@ class TestGeocodeEndpoint:
         assert data['source'] == 'kakao'
 
         # Verify Kakao service was called
-        mock_kakao_service.address_to_coordinates.assert_called_once_with('서울시청')
+        mock_kakao_service.address_to_coordinates.assert_called_once_with('서울시청', raise_errors=True)
 
     def test_geocode_with_full_address(self, client, mock_kakao_service):
         """전체 주소로 지오코딩"""
@@ -143,6 +147,9 @@ class TestGeocodeEndpoint:
         mock_kakao_service.address_to_coordinates = AsyncMock(
             side_effect=Exception("Kakao API error")
         )
+        mock_kakao_service.keyword_search = AsyncMock(
+            side_effect=Exception("Kakao API error")
+        )
 
         response = client.post(
             "/api/v1/geocode",
@@ -152,6 +159,124 @@ class TestGeocodeEndpoint:
         # 검증
         assert response.status_code == 500
 
+    def test_geocode_address_error_keyword_success(self, client, mock_kakao_service):
+        """주소 검색 오류 시에도 동시 요청한 키워드 검색 결과 사용"""
+        mock_kakao_service.address_to_coordinates = AsyncMock(
+            side_effect=Exception("Kakao API error")
+        )
+
+        response = client.post(
+            "/api/v1/geocode",
+            json={'address': '강남역'}
+        )
+
+        assert response.status_code == 200
+        mock_kakao_service.keyword_search.assert_called_once_with('강남역', raise_errors=True)
+
+    def test_geocode_cached_across_address_variants(self, client, mock_kakao_service):
+        """표기만 다른 같은 주소는 캐시 사용 (Kakao 1회 호출)"""
+        for address in ['서울특별시 중구 세종대로 110', '서울시 중구 세종대로 110', '서울 중구 세종대로110']:
+            response = client.post(
+                "/api/v1/geocode",
+                json={'address': address}
+            )
+            assert response.status_code == 200
+            assert response.json()['address'] == address
+
+        mock_kakao_service.address_to_coordinates.assert_called_once()
+
+
+def parse_ndjson(response):
+    """NDJSON 응답을 index 순으로 정렬한 리스트로 변환"""
+    items = [json.loads(line) for line in response.text.splitlines() if line]
+    return sorted(items, key=lambda item: item['index'])
+
+
+class TestBatchGeocodeEndpoint:
+    """POST /api/v1/geocode/batch 테스트 (NDJSON 스트리밍)"""
+
+    def test_batch_dedupes_addresses(self, client, mock_kakao_service):
+        """표기만 다른 중복 주소는 한 번만 조회하고 입력마다 결과 반환"""
+        addresses = ['서울특별시 중구 세종대로 110', '강남역', '서울시 중구 세종대로 110']
+
+        response = client.post("/api/v1/geocode/batch", json={'addresses': addresses})
+
+        assert response.status_code == 200
+        assert response.headers['content-type'].startswith('application/x-ndjson')
+
+        items = parse_ndjson(response)
+        assert [item['index'] for item in items] == [0, 1, 2]
+        assert [item['address'] for item in items] == addresses
+        assert all(item['status'] == 'ok' for item in items)
+        assert mock_kakao_service.address_to_coordinates.call_count == 2
+
+    def test_batch_serves_cached_first(self, client, mock_kakao_service):
+        """캐시된 주소는 Kakao 호출 없이 응답"""
+        client.post("/api/v1/geocode", json={'address': '서울시청'})
+        mock_kakao_service.address_to_coordinates.reset_mock()
+
+        response = client.post("/api/v1/geocode/batch", json={'addresses': ['서울시청', '광화문']})
+
+        items = [json.loads(line) for line in response.text.splitlines()]
+        # 캐시 적중 결과가 먼저 스트리밍됨
+        assert items[0]['address'] == '서울시청'
+        assert items[0]['source'] == 'cache'
+        assert items[1]['source'] == 'kakao'
+        mock_kakao_service.address_to_coordinates.assert_called_once_with('광화문', raise_errors=True)
+
+    def test_batch_per_item_status(self, client, mock_kakao_service):
+        """주소별 성공/실패/오류 상태"""
+        async def address_search(address, raise_errors=False):
+            if address == '오류주소':
+                raise Exception("Kakao API error")
+            if address == '서울시청':
+                return (37.5665, 126.9780)
+            return None
+
+        mock_kakao_service.address_to_coordinates = AsyncMock(side_effect=address_search)
+        mock_kakao_service.keyword_search = AsyncMock(return_value=None)
+
+        response = client.post(
+            "/api/v1/geocode/batch",
+            json={'addresses': ['서울시청', '존재하지않는주소', '오류주소', '  ']}
+        )
+
+        items = parse_ndjson(response)
+        assert [item['status'] for item in items] == ['ok', 'not_found', 'error', 'invalid']
+        assert items[0]['latitude'] == 37.5665
+        assert 'Kakao API error' in items[2]['error']
+
+    def test_batch_concurrency_bounded(self, client, mock_kakao_service):
+        """동시 Kakao 요청 수 제한"""
+        in_flight = 0
+        max_in_flight = 0
+
+        async def address_search(address, raise_errors=False):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return (37.5665, 126.9780)
+
+        mock_kakao_service.address_to_coordinates = AsyncMock(side_effect=address_search)
+
+        with patch('app.api.v1.endpoints.geocode.settings.GEOCODE_BATCH_CONCURRENCY', 3):
+            response = client.post(
+                "/api/v1/geocode/batch",
+                json={'addresses': [f'주소{i}' for i in range(12)]}
+            )
+
+        assert len(parse_ndjson(response)) == 12
+        assert 1 < max_in_flight <= 3
+
+    def test_batch_size_validation(self, client):
+        """빈 목록 및 최대 개수 초과는 422"""
+        assert client.post("/api/v1/geocode/batch", json={'addresses': []}).status_code == 422
+
+        too_many = ['주소'] * (settings.GEOCODE_BATCH_MAX_SIZE + 1)
+        assert client.post("/api/v1/geocode/batch", json={'addresses': too_many}).status_code == 422
+
 
 class TestReverseGeocodeEndpoint:
     """POST /api/v1/geocode/reverse 테스트 (좌표 → 주소)"""
@@ -3,6 +3,7 @@ API Endpoint Tests for Services
 서비스 검색 API 엔드포인트 테스트
 """
 
+import json
 import pytest
 from fastapi.testclient import TestClient
 from unittest.mock import Mock, AsyncMock, patch
@@ -575,3 +576,77 @@ class TestWorkflowErrors:
             data = response.json()
             assert 'errors' in data
             assert len(data['errors']) == 2
+
+
+class TestNearbyStreamingEndpoint:
+    """GET /api/v1/services/nearby?stream= 테스트"""
+
+    @staticmethod
+    async def events():
+        yield {'type': 'header', 'workflow_id': 'stream-1', 'categories': ['libraries']}
+        yield {'type': 'locations', 'category': 'libraries', 'count': 1, 'locations': [{'id': '1'}]}
+        yield {'type': 'final', 'success': True, 'message': '서울시청 주변 도서관 1개', 'errors': []}
+
+    def test_stream_ndjson(self, client):
+        """NDJSON - 한 줄에 이벤트 하나"""
+        with patch('app.api.v1.endpoints.services.get_service_graph') as mock_graph:
+            mock_instance = Mock()
+            mock_instance.stream = Mock(return_value=self.events())
+            mock_graph.return_value = mock_instance
+
+            response = client.get(
+                "/api/v1/services/nearby",
+                params={'lat': 37.5665, 'lon': 126.9780, 'limit': 10, 'stream': 'ndjson'}
+            )
+
+            assert response.status_code == 200
+            assert response.headers['content-type'].startswith('application/x-ndjson')
+            lines = [json.loads(line) for line in response.text.splitlines()]
+            assert [line['type'] for line in lines] == ['header', 'locations', 'final']
+            assert lines[2]['message'] == '서울시청 주변 도서관 1개'
+            assert mock_instance.stream.call_args.kwargs['limit'] == 10
+
+    def test_stream_sse(self, client):
+        """SSE - event/data 필드"""
+        with patch('app.api.v1.endpoints.services.get_service_graph') as mock_graph:
+            mock_instance = Mock()
+            mock_instance.stream = Mock(return_value=self.events())
+            mock_graph.return_value = mock_instance
+
+            response = client.get(
+                "/api/v1/services/nearby",
+                params={'lat': 37.5665, 'lon': 126.9780, 'stream': 'sse'}
+            )
+
+            assert response.headers['content-type'].startswith('text/event-stream')
+            blocks = response.text.strip().split('\n\n')
+            assert blocks[0].startswith('event: header\ndata: {')
+            assert blocks[-1].startswith('event: final\n')
+
+    def test_stream_error_event(self, client):
+        """스트림 도중 예외는 error 이벤트로 전달"""
+        async def failing():
+            yield {'type': 'header', 'workflow_id': 'stream-2'}
+            raise RuntimeError("boom")
+
+        with patch('app.api.v1.endpoints.services.get_service_graph') as mock_graph:
+            mock_instance = Mock()
+            mock_instance.stream = Mock(return_value=failing())
+            mock_graph.return_value = mock_instance
+
+            response = client.get(
+                "/api/v1/services/nearby",
+                params={'lat': 37.5665, 'lon': 126.9780, 'stream': 'ndjson'}
+            )
+
+            lines = [json.loads(line) for line in response.text.splitlines()]
+            assert lines[-1] == {'type': 'error', 'errors': ['boom']}
+
+    def test_stream_invalid_format(self, client):
+        """알 수 없는 스트리밍 형식은 422"""
+        response = client.get(
+            "/api/v1/services/nearby",
+            params={'lat': 37.5665, 'lon': 126.9780, 'stream': 'xml'}
+        )
+
+        assert response.status_code == 422
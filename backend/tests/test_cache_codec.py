@@ -0,0 +1,102 @@
+"""
+Unit tests for Cache Codec
+"""
+
+import json
+import pytest
+
+from app.core.services.cache_codec import (
+    CacheCodec,
+    HEADER_FLAG,
+    SERIALIZER_IDS,
+    COMPRESSOR_IDS,
+    is_available
+)
+
+
+SAMPLE = [
+    {"id": 1, "library_name": "서울도서관", "latitude": 37.5662, "longitude": 126.9779,
+     "distance": 120.5, "tags": ["열람실", "주차"], "homepage": None, "is_free": True},
+] * 30
+
+FORMATS = [
+    (serializer, compression)
+    for serializer in SERIALIZER_IDS
+    for compression in COMPRESSOR_IDS
+]
+
+
+class TestCacheCodec:
+    """캐시 값 코덱 테스트"""
+
+    @pytest.mark.parametrize("serializer,compression", FORMATS)
+    def test_roundtrip(self, serializer, compression):
+        """직렬화/압축 조합별 왕복"""
+        if not is_available(serializer, compression):
+            pytest.skip(f"{serializer}+{compression} not installed")
+
+        codec = CacheCodec(serializer, compression, min_compress_bytes=0)
+        encoded = codec.encode(SAMPLE)
+
+        assert isinstance(encoded, bytes)
+        assert encoded[0] == HEADER_FLAG | (SERIALIZER_IDS[serializer] << 2) | COMPRESSOR_IDS[compression]
+        assert codec.decode(encoded) == SAMPLE
+
+    @pytest.mark.parametrize("serializer,compression", FORMATS)
+    def test_decode_other_format(self, serializer, compression):
+        """설정이 달라도 헤더로 형식을 판별해 디코딩"""
+        if not is_available(serializer, compression):
+            pytest.skip(f"{serializer}+{compression} not installed")
+
+        encoded = CacheCodec(serializer, compression, min_compress_bytes=0).encode(SAMPLE)
+
+        assert CacheCodec("json", "none").decode(encoded) == SAMPLE
+
+    def test_compression_reduces_size(self):
+        """압축 시 크기 감소"""
+        plain = CacheCodec("json", "none").encode(SAMPLE)
+        compressed = CacheCodec("json", "zlib", min_compress_bytes=0).encode(SAMPLE)
+
+        assert len(compressed) < len(plain)
+
+    def test_small_value_not_compressed(self):
+        """min_compress_bytes 미만 값은 압축 없이 저장"""
+        codec = CacheCodec("json", "zlib", min_compress_bytes=512)
+        encoded = codec.encode({"id": 1})
+
+        assert encoded[0] & 0x03 == COMPRESSOR_IDS["none"]
+        assert encoded[1:] == b'{"id":1}'
+        assert codec.decode(encoded) == {"id": 1}
+
+    def test_legacy_json_entry(self):
+        """헤더 없는 기존 JSON 텍스트 엔트리 (bytes/str)"""
+        codec = CacheCodec("json", "zlib")
+        legacy = json.dumps(SAMPLE, ensure_ascii=False)
+
+        assert codec.decode(legacy.encode("utf-8")) == SAMPLE
+        assert codec.decode(legacy) == SAMPLE
+        assert codec.decode(b'"text"') == "text"
+
+    def test_unknown_header_raises(self):
+        """알 수 없는 헤더는 ValueError"""
+        codec = CacheCodec("json", "none")
+
+        with pytest.raises(ValueError):
+            codec.decode(bytes((HEADER_FLAG | (5 << 2),)) + b"{}")
+        with pytest.raises(ValueError):
+            codec.decode(bytes((HEADER_FLAG | 0x03,)) + b"{}")
+
+    def test_invalid_settings(self):
+        """알 수 없는 형식 이름"""
+        with pytest.raises(ValueError):
+            CacheCodec("pickle", "none")
+        with pytest.raises(ValueError):
+            CacheCodec("json", "lz4")
+
+    def test_name(self):
+        """형식 이름"""
+        assert CacheCodec("json", "zlib").name == "json+zlib"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,142 @@
+"""
+Unit tests for Circuit Breaker
+"""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from app.core.services.circuit_breaker import (
+    CircuitBreaker,
+    CircuitOpenError,
+    CLOSED,
+    OPEN,
+    HALF_OPEN
+)
+
+
+class TestCircuitBreaker:
+    """서킷 브레이커 상태 전이 테스트"""
+
+    def test_opens_after_consecutive_failures(self):
+        """연속 실패가 한도에 도달하면 open"""
+        breaker = CircuitBreaker("test", failure_threshold=3, recovery_timeout=60)
+
+        breaker.record_failure()
+        breaker.record_failure()
+        assert breaker.state == CLOSED
+        assert breaker.allow() is True
+
+        breaker.record_failure(ConnectionError("down"))
+        assert breaker.state == OPEN
+        assert breaker.allow() is False
+        assert breaker.get_stats()["rejected"] == 1
+        assert breaker.get_stats()["opened"] == 1
+
+    def test_success_resets_consecutive_failures(self):
+        """중간 성공 시 연속 실패 횟수 초기화"""
+        breaker = CircuitBreaker("test", failure_threshold=2, recovery_timeout=60)
+
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+
+        assert breaker.state == CLOSED
+        assert breaker.get_stats()["failures"] == 2
+
+    def test_half_open_after_recovery_timeout(self):
+        """probe 없이 recovery_timeout 경과 후 half_open, 성공 시 close"""
+        breaker = CircuitBreaker("test", failure_threshold=1, recovery_timeout=5)
+
+        with patch('app.core.services.circuit_breaker.time.monotonic', return_value=100.0):
+            breaker.record_failure()
+        with patch('app.core.services.circuit_breaker.time.monotonic', return_value=104.0):
+            assert breaker.allow() is False
+        with patch('app.core.services.circuit_breaker.time.monotonic', return_value=105.0):
+            assert breaker.allow() is True
+        assert breaker.state == HALF_OPEN
+
+        breaker.record_success()
+        assert breaker.state == CLOSED
+
+    def test_half_open_allows_single_trial(self):
+        """half_open 에서는 시도 요청 하나만 허용, 결과 기록 전까지 나머지는 거부"""
+        breaker = CircuitBreaker("test", failure_threshold=1, recovery_timeout=5)
+
+        with patch('app.core.services.circuit_breaker.time.monotonic', return_value=100.0):
+            breaker.record_failure()
+        with patch('app.core.services.circuit_breaker.time.monotonic', return_value=105.0):
+            assert breaker.allow() is True
+            assert breaker.allow() is False
+            assert breaker.allow() is False
+        assert breaker.state == HALF_OPEN
+        assert breaker.get_stats()["rejected"] == 2
+
+        # 장애와 무관하게 끝난 시도는 슬롯만 반환
+        breaker.release()
+        with patch('app.core.services.circuit_breaker.time.monotonic', return_value=106.0):
+            assert breaker.allow() is True
+        assert breaker.state == HALF_OPEN
+
+        # 결과 없이 recovery_timeout 이 지나면 다음 시도 허용
+        with patch('app.core.services.circuit_breaker.time.monotonic', return_value=110.0):
+            assert breaker.allow() is False
+        with patch('app.core.services.circuit_breaker.time.monotonic', return_value=111.0):
+            assert breaker.allow() is True
+
+        breaker.record_success()
+        assert breaker.state == CLOSED
+        assert breaker.allow() is True
+        assert breaker.allow() is True
+
+    def test_half_open_failure_reopens(self):
+        """half_open 상태의 실패는 바로 다시 open"""
+        breaker = CircuitBreaker("test", failure_threshold=3, recovery_timeout=5)
+        breaker.state = HALF_OPEN
+
+        breaker.record_failure()
+
+        assert breaker.state == OPEN
+
+    @pytest.mark.asyncio
+    async def test_background_probe_closes(self):
+        """open 동안 백그라운드 probe 가 성공하면 자동 close"""
+        probe = AsyncMock(side_effect=[ConnectionError("still down"), None])
+        breaker = CircuitBreaker("test", failure_threshold=1, recovery_timeout=0.01, probe=probe)
+
+        breaker.record_failure()
+        assert breaker.state == OPEN
+
+        # probe 실행 중에는 recovery_timeout 이 지나도 요청 경로는 차단
+        await asyncio.sleep(0.015)
+        assert breaker.allow() is False
+
+        for _ in range(100):
+            if breaker.state == CLOSED:
+                break
+            await asyncio.sleep(0.01)
+
+        assert breaker.state == CLOSED
+        assert probe.await_count == 2
+        assert breaker.allow() is True
+        await breaker.aclose()
+
+    def test_reset(self):
+        """reset 후 closed"""
+        breaker = CircuitBreaker("test", failure_threshold=1, recovery_timeout=60)
+        breaker.record_failure()
+
+        breaker.reset()
+
+        assert breaker.state == CLOSED
+        assert breaker.allow() is True
+
+    def test_open_error(self):
+        """CircuitOpenError 메시지"""
+        error = CircuitOpenError("kakao")
+        assert error.name == "kakao"
+        assert "kakao" in str(error)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -329,3 +329,72 @@ class TestFindNearbyLocations:
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
+
+
+class TestVectorizedDistance:
+    """벡터화 거리 계산 테스트"""
+
+    def test_array_matches_scalar(self):
+        """벡터화 결과가 스칼라 Haversine과 일치"""
+        lats = [37.5665, 37.5511, 37.4979]
+        lons = [126.9780, 126.9882, 127.0276]
+
+        distances = distance_service.haversine_distance_array(37.5665, 126.9780, lats, lons)
+
+        for lat, lon, distance in zip(lats, lons, distances):
+            expected = distance_service.haversine_distance(37.5665, 126.9780, lat, lon)
+            assert distance == pytest.approx(expected, abs=1e-6)
+
+    def test_extract_missing_coordinates_as_nan(self):
+        """좌표 없는 위치는 NaN"""
+        lats, lons = distance_service.extract_coordinate_arrays([
+            {'latitude': 37.5, 'longitude': 127.0},
+            {'latitude': None, 'longitude': 127.0},
+            {}
+        ])
+        assert lats[0] == 37.5
+        assert math.isnan(lats[1]) and math.isnan(lats[2]) and math.isnan(lons[2])
+
+    def test_radius_search_top_k(self):
+        """argpartition top-k 결과가 전체 정렬 결과와 일치"""
+        import numpy as np
+
+        rng = np.random.default_rng(42)
+        lats = rng.uniform(37.45, 37.65, 10000)
+        lons = rng.uniform(126.85, 127.10, 10000)
+        lats[::100] = np.nan
+
+        indices, distances = distance_service.radius_search_arrays(
+            lats, lons, 37.5665, 126.9780, radius_m=3000, limit=25
+        )
+
+        full = distance_service.haversine_distance_array(37.5665, 126.9780, lats, lons)
+        valid = np.flatnonzero(full <= 3000)
+        expected = valid[np.argsort(full[valid], kind='stable')][:25]
+
+        assert len(indices) == 25
+        assert list(indices) == list(expected)
+        assert list(distances) == sorted(distances)
+
+    def test_radius_search_zero_limit(self):
+        """limit=0이면 빈 결과"""
+        indices, distances = distance_service.radius_search_arrays(
+            [37.5665], [126.9780], 37.5665, 126.9780, limit=0
+        )
+        assert len(indices) == 0 and len(distances) == 0
+
+    def test_find_nearby_schema_unchanged(self):
+        """래퍼 함수의 결과 스키마 유지"""
+        locations = [
+            {'name': 'far', 'latitude': 37.5511, 'longitude': 126.9882},
+            {'name': 'near', 'latitude': 37.5665, 'longitude': 126.9780},
+            {'name': 'none', 'latitude': None, 'longitude': None}
+        ]
+
+        result = distance_service.find_nearby_locations(locations, 37.5665, 126.9780, radius_m=3000)
+
+        assert [loc['name'] for loc in result] == ['near', 'far']
+        assert result[0]['distance'] == 0.0
+        assert result[0]['distance_formatted'] == '0m'
+        assert isinstance(result[1]['distance'], float)
+        assert result[1]['distance_formatted'].endswith('km')
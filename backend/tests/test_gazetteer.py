@@ -0,0 +1,167 @@
+"""
+Unit tests for Gazetteer
+"""
+
+import pytest
+from unittest.mock import Mock, AsyncMock, patch
+
+from app.core.services.gazetteer import Gazetteer
+from app.core.agents.location_analyzer import LocationAnalyzer
+from app.core.workflow.state import LocationQuery
+
+
+@pytest.fixture
+def stations_file(tmp_path):
+    """테스트용 지하철역 목록"""
+    path = tmp_path / "stations.csv"
+    path.write_text(
+        "name,latitude,longitude\n"
+        "강남역,37.4979,127.0276\n"
+        "건대입구역,37.5404,127.0692\n"
+        "서울대입구역,37.4812,126.9527\n",
+        encoding="utf-8"
+    )
+    return path
+
+
+@pytest.fixture
+def rows_by_table():
+    """테이블별 샘플 데이터"""
+    return {
+        'libraries': [
+            {'library_name': '남산도서관', 'address': '서울특별시 용산구 소월로 109',
+             'latitude': 37.5534, 'longitude': 126.9817},
+            {'library_name': '작은도서관', 'address': None, 'latitude': 37.60, 'longitude': 127.00},
+            {'library_name': '좌표 없음', 'address': None, 'latitude': None, 'longitude': None}
+        ],
+        'cultural_spaces': [
+            {'fac_name': '작은도서관', 'addr': None, 'latitude': 37.50, 'longitude': 126.90}
+        ],
+        'future_heritages': [
+            {'name': '서울광장', 'address': '서울특별시 중구 세종대로 110', 'latitude': 37.5658, 'longitude': 126.9772}
+        ]
+    }
+
+
+@pytest.fixture
+def gazetteer(stations_file, rows_by_table):
+    """구축된 지명 사전"""
+    gazetteer = Gazetteer(stations_file=stations_file)
+    gazetteer.build(rows_by_table)
+    return gazetteer
+
+
+class TestGazetteer:
+    """지명 사전 테스트"""
+
+    def test_empty_before_build(self, stations_file):
+        """구축 전에는 조회 결과 없음"""
+        gazetteer = Gazetteer(stations_file=stations_file)
+
+        assert gazetteer.is_ready is False
+        assert gazetteer.lookup("강남역") is None
+
+    def test_build_skips_missing_coordinates(self, gazetteer):
+        """좌표 없는 행 제외 (역 3 + 행 4)"""
+        assert gazetteer.size == 7
+
+    def test_exact_name(self, gazetteer):
+        """이름 정확히 일치 (공백/시 접미사 차이 무시)"""
+        for text in ["강남역", "강남 역", " 강남역 "]:
+            match = gazetteer.lookup(text)
+            assert match['latitude'] == 37.4979
+            assert match['source'] == 'stations'
+            assert match['score'] == 1.0
+
+    def test_exact_address(self, gazetteer):
+        """주소 정확히 일치"""
+        match = gazetteer.lookup("서울시 중구 세종대로 110")
+
+        assert match['name'] == '서울광장'
+        assert match['score'] == 1.0
+
+    def test_fuzzy_name(self, gazetteer):
+        """역 접미사 누락 등 근접한 이름은 퍼지 매칭"""
+        match = gazetteer.lookup("건대입구")
+
+        assert match['name'] == '건대입구역'
+        assert 0.8 <= match['score'] < 1.0
+
+    def test_fuzzy_rejects_weak_match(self, gazetteer):
+        """유사도가 낮거나 너무 짧은 입력은 매칭하지 않음"""
+        assert gazetteer.lookup("서울대") is None
+        assert gazetteer.lookup("강남") is None
+        assert gazetteer.lookup("서울특별시 용산구 소월로 10") is None
+
+    def test_ambiguous_name(self, gazetteer):
+        """멀리 떨어진 동명 시설은 사용하지 않음"""
+        assert gazetteer.lookup("작은도서관") is None
+
+    def test_stats(self, gazetteer):
+        """조회 통계"""
+        gazetteer.lookup("강남역")
+        gazetteer.lookup("건대입구")
+        gazetteer.lookup("존재하지않는곳")
+
+        stats = gazetteer.get_stats()
+        assert stats['exact_hits'] == 1
+        assert stats['fuzzy_hits'] == 1
+        assert stats['misses'] == 1
+
+    def test_refresh_selects_name_columns(self, stations_file):
+        """이름/주소/좌표 컬럼만 조회"""
+        supabase = Mock()
+        query = supabase.table.return_value.select.return_value
+        query.range.return_value.execute.return_value = Mock(data=[])
+
+        gazetteer = Gazetteer(stations_file=stations_file)
+        assert gazetteer.refresh(supabase) == 3
+
+        selected = [c.args[0] for c in supabase.table.return_value.select.call_args_list]
+        assert 'library_name,address,latitude,longitude' in selected
+        assert 'fac_name,addr,latitude,longitude' in selected
+
+    @pytest.mark.asyncio
+    async def test_start_falls_back_to_stations(self, stations_file):
+        """테이블 적재 실패 시 번들 역 목록만 사용"""
+        gazetteer = Gazetteer(stations_file=stations_file)
+
+        with patch.object(gazetteer, 'refresh', side_effect=Exception("supabase down")):
+            await gazetteer.start(interval=3600)
+
+        assert gazetteer.is_ready is True
+        assert gazetteer.lookup("강남역") is not None
+        await gazetteer.stop()
+
+
+class TestLocationAnalyzerGazetteer:
+    """LocationAnalyzer 지명 사전 연동 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_gazetteer_hit_skips_kakao(self, gazetteer):
+        """지명 사전 일치 시 Kakao 호출 없음"""
+        analyzer = LocationAnalyzer()
+        analyzer.gazetteer = gazetteer
+
+        with patch.object(analyzer.kakao_service, 'geocode', new_callable=AsyncMock) as mock_geocode:
+            result = await analyzer.analyze(LocationQuery(address="강남역"))
+
+            assert result.latitude == 37.4979
+            assert result.longitude == 127.0276
+            assert result.address == "강남역"
+            assert result.confidence == 0.9
+            mock_geocode.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_gazetteer_miss_uses_kakao(self, gazetteer):
+        """지명 사전에 없으면 Kakao 지오코딩"""
+        analyzer = LocationAnalyzer()
+        analyzer.gazetteer = gazetteer
+
+        with patch.object(analyzer.kakao_service, 'geocode', new_callable=AsyncMock) as mock_geocode:
+            mock_geocode.return_value = (37.5796, 126.9770)
+
+            result = await analyzer.analyze(LocationQuery(address="경복궁"))
+
+            assert result.latitude == 37.5796
+            mock_geocode.assert_called_once()
@@ -0,0 +1,162 @@
+"""
+Unit tests for Geocode Cache (forward geocoding)
+"""
+
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from app.core.config import settings
+from app.core.services.geocode_cache import GeocodeCache, canonicalize_address
+from app.core.services.kakao_map_service import KakaoMapService
+
+
+@pytest.fixture
+def kakao_service():
+    """Mock Kakao Map Service"""
+    service = KakaoMapService(api_key="test-key")
+    service.address_to_coordinates = AsyncMock(return_value=(37.5665, 126.9780))
+    service.keyword_search = AsyncMock(return_value=(37.4979, 127.0276))
+    return service
+
+
+@pytest.fixture
+def cache(fake_redis_service):
+    """fakeredis 기반 GeocodeCache"""
+    with patch('app.core.services.geocode_cache.get_redis_service', return_value=fake_redis_service):
+        return GeocodeCache()
+
+
+class TestCanonicalizeAddress:
+    """주소 정규화 테스트"""
+
+    @pytest.mark.parametrize("address", [
+        "서울특별시 중구 세종대로 110",
+        "서울시 중구 세종대로 110",
+        "서울 중구 세종대로110",
+        "  서울특별시  중구 세종대로 110 ",
+    ])
+    def test_region_suffix_variants(self, address):
+        """시 단위 접미사/공백 차이는 같은 키"""
+        assert canonicalize_address(address) == "서울중구세종대로110"
+
+    def test_keeps_si_inside_word(self):
+        """어절 중간/장소명의 "시"는 유지"""
+        assert canonicalize_address("서울시청") == "서울시청"
+        assert canonicalize_address("강남역") == "강남역"
+
+    def test_ambiguous_city(self):
+        """경기 광주시와 광주광역시는 다른 키"""
+        assert canonicalize_address("광주시 오포읍") != canonicalize_address("광주광역시 오포읍")
+
+
+class TestForwardGeocodeCache:
+    """정지오코딩 캐시 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_variants_share_cache(self, cache, kakao_service):
+        """표기만 다른 주소는 Kakao 1회 호출"""
+        first = await cache.geocode("서울특별시 중구 세종대로 110", kakao_service)
+        second = await cache.geocode("서울 중구 세종대로 110", kakao_service)
+
+        assert first == second == (37.5665, 126.9780)
+        kakao_service.address_to_coordinates.assert_called_once_with(
+            "서울특별시 중구 세종대로 110", raise_errors=True
+        )
+
+    @pytest.mark.asyncio
+    async def test_single_in_process_copy(self, cache, kakao_service, fake_redis_service):
+        """지오코딩 결과는 자체 LRU에만 보관 (RedisService L1 중복 저장 없음)"""
+        await cache.geocode("서울시청", kakao_service)
+        await cache.set_reverse(37.5665, 126.9780, "서울특별시 중구 세종대로 110")
+
+        cache.clear()
+        assert await cache.geocode("서울시청", kakao_service) == (37.5665, 126.9780)
+        assert await cache.get_reverse(37.5665, 126.9780) == "서울특별시 중구 세종대로 110"
+
+        assert fake_redis_service.local.get_stats()["entries"] == 0
+        kakao_service.address_to_coordinates.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_get_forward_many_single_round_trip(self, cache, kakao_service, fake_redis_service):
+        """여러 주소 캐시 조회는 메모리 미스 주소만 Redis MGET 1회"""
+        await cache.geocode("서울시청", kakao_service)
+        await cache.geocode("광화문", kakao_service)
+        cache.clear()
+        await cache.geocode("서울시청", kakao_service)  # 메모리에 적재
+
+        with patch.object(fake_redis_service.async_client, 'get', wraps=fake_redis_service.async_client.get) as get, \
+                patch.object(fake_redis_service.async_client, 'mget', wraps=fake_redis_service.async_client.mget) as mget:
+            entries = await cache.get_forward_many(["서울시청", "광화문", "없는주소"])
+
+        assert entries[0]["coords"] == [37.5665, 126.9780]
+        assert entries[1]["coords"] == [37.5665, 126.9780]
+        assert entries[2] is None
+        mget.assert_called_once()
+        assert len(mget.call_args[0][0]) == 2
+        get.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_shared_across_workers(self, fake_redis_server, kakao_service):
+        """메모리 캐시가 비어 있어도 Redis에서 조회"""
+        from tests.conftest import build_fake_redis_service
+
+        caches = []
+        for _ in range(2):
+            with patch('app.core.services.geocode_cache.get_redis_service',
+                       return_value=build_fake_redis_service(fake_redis_server)):
+                caches.append(GeocodeCache())
+
+        await caches[0].geocode("강남역", kakao_service)
+        assert await caches[1].geocode("강남역", kakao_service) == (37.5665, 126.9780)
+
+        kakao_service.address_to_coordinates.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_negative_cache_short_ttl(self, cache, kakao_service, fake_redis_service):
+        """결과 없음도 캐싱하되 짧은 TTL 사용"""
+        kakao_service.address_to_coordinates.return_value = None
+        kakao_service.keyword_search.return_value = None
+
+        assert await cache.geocode("존재하지않는주소", kakao_service) is None
+        assert await cache.geocode("존재하지않는주소", kakao_service) is None
+
+        kakao_service.address_to_coordinates.assert_called_once()
+        kakao_service.keyword_search.assert_called_once()
+
+        negative_ttl = await fake_redis_service.async_client.ttl(cache.forward_key("존재하지않는주소"))
+        assert 0 < negative_ttl <= settings.GEOCODE_NEGATIVE_CACHE_TTL
+
+        kakao_service.keyword_search.return_value = (37.4979, 127.0276)
+        await cache.geocode("강남역", kakao_service)
+        positive_ttl = await fake_redis_service.async_client.ttl(cache.forward_key("강남역"))
+        assert positive_ttl > settings.GEOCODE_NEGATIVE_CACHE_TTL
+
+    @pytest.mark.asyncio
+    async def test_errors_not_cached(self, cache, kakao_service):
+        """Kakao API 오류는 캐싱하지 않고 예외 전달"""
+        kakao_service.address_to_coordinates.side_effect = [Exception("timeout"), (37.5665, 126.9780)]
+        kakao_service.keyword_search.return_value = None
+
+        with pytest.raises(Exception):
+            await cache.geocode("서울시청", kakao_service)
+
+        assert await cache.geocode("서울시청", kakao_service) == (37.5665, 126.9780)
+        assert kakao_service.address_to_coordinates.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_stats(self, cache, kakao_service):
+        """히트율 및 절약한 Kakao 호출 수 집계"""
+        kakao_service.address_to_coordinates.return_value = None
+
+        # 미스: 주소 검색 + 키워드 검색 = 2회 호출
+        await cache.geocode("강남역", kakao_service)
+        # 히트 3회: 각각 2회 호출 절약
+        for _ in range(3):
+            await cache.geocode("강남역", kakao_service)
+
+        stats = cache.get_stats()["forward"]
+        assert stats["hits"] == 3
+        assert stats["misses"] == 1
+        assert stats["negative_hits"] == 0
+        assert stats["hit_rate"] == "75.0%"
+        assert stats["kakao_calls_saved"] == 6
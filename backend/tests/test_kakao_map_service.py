@@ -0,0 +1,290 @@
+"""
+Unit tests for KakaoMapService (shared HTTP client, hedged geocoding)
+"""
+
+import asyncio
+import gc
+import time
+import pytest
+import httpx
+from unittest.mock import AsyncMock, patch
+
+from app.core.services.circuit_breaker import CircuitOpenError
+from app.core.services.kakao_map_service import KakaoMapService
+
+
+def kakao_handler(request: httpx.Request) -> httpx.Response:
+    """Kakao Local API 응답 모의"""
+    if request.url.path.endswith("/coord2address.json"):
+        return httpx.Response(200, json={
+            "documents": [{"road_address": {"address_name": "서울특별시 중구 세종대로 110"}}]
+        })
+    return httpx.Response(200, json={
+        "documents": [{"x": "126.978", "y": "37.5665", "place_name": "서울시청"}]
+    })
+
+
+@pytest.fixture
+def service():
+    """모의 transport를 사용하는 KakaoMapService"""
+    service = KakaoMapService(api_key="test-key")
+    created = []
+
+    def create_client():
+        client = httpx.AsyncClient(transport=httpx.MockTransport(kakao_handler))
+        created.append(client)
+        return client
+
+    with patch.object(service, '_create_client', side_effect=create_client):
+        service.created_clients = created
+        yield service
+
+
+class TestKakaoMapServiceClient:
+    """공유 httpx.AsyncClient 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_client_reused_across_calls(self, service):
+        """여러 API 호출이 하나의 클라이언트를 공유"""
+        await service.start()
+
+        assert await service.address_to_coordinates("서울시청") == (37.5665, 126.978)
+        assert await service.keyword_search("서울시청") == (37.5665, 126.978)
+        assert await service.reverse_geocode(37.5665, 126.978) == "서울특별시 중구 세종대로 110"
+        assert (await service.get_place_info("서울시청"))["name"] == "서울시청"
+
+        assert len(service.created_clients) == 1
+
+        await service.aclose()
+        assert service.client is None
+        assert service.created_clients[0].is_closed
+
+    @pytest.mark.asyncio
+    async def test_client_created_lazily(self, service):
+        """start() 없이 호출해도 클라이언트 지연 생성"""
+        assert service.client is None
+
+        await service.address_to_coordinates("서울시청")
+
+        assert service.client is not None
+        assert len(service.created_clients) == 1
+        await service.aclose()
+
+    @pytest.mark.asyncio
+    async def test_client_recreated_after_close(self, service):
+        """종료 후 재호출 시 새 클라이언트 생성"""
+        await service.start()
+        await service.aclose()
+
+        await service.reverse_geocode(37.5665, 126.978)
+
+        assert len(service.created_clients) == 2
+        await service.aclose()
+
+    @pytest.mark.asyncio
+    async def test_auth_header_sent(self, service):
+        """공유 클라이언트 사용 시에도 인증 헤더 전송"""
+        seen = []
+
+        def handler(request):
+            seen.append(request.headers.get("Authorization"))
+            return kakao_handler(request)
+
+        service._create_client.side_effect = lambda: httpx.AsyncClient(
+            transport=httpx.MockTransport(handler)
+        )
+
+        await service.keyword_search("강남역")
+
+        assert seen == ["KakaoAK test-key"]
+        await service.aclose()
+
+    def test_create_client_pool_settings(self):
+        """커넥션 풀 설정 반영 (h2 미설치 시 HTTP/1.1 폴백)"""
+        service = KakaoMapService(api_key="test-key")
+
+        with patch('app.core.services.kakao_map_service.settings') as mock_settings:
+            mock_settings.KAKAO_MAX_CONNECTIONS = 7
+            mock_settings.KAKAO_MAX_KEEPALIVE_CONNECTIONS = 3
+            mock_settings.KAKAO_KEEPALIVE_EXPIRY = 15.0
+            mock_settings.KAKAO_TIMEOUT = 2.5
+            mock_settings.KAKAO_HTTP2 = True
+
+            client = service._create_client()
+
+        assert client.timeout.connect == 2.5
+        pool = client._transport._pool
+        assert pool._max_connections == 7
+        assert pool._max_keepalive_connections == 3
+
+
+class TestKakaoCircuitBreaker:
+    """Kakao API 서킷 브레이커 테스트"""
+
+    @staticmethod
+    def make_service(handler):
+        service = KakaoMapService(api_key="test-key")
+        service._create_client = lambda: httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        service.breaker.failure_threshold = 2
+        return service
+
+    @pytest.mark.asyncio
+    async def test_server_errors_open_circuit(self):
+        """연속 5xx 후 요청하지 않고 즉시 실패"""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(503)
+
+        service = self.make_service(handler)
+
+        assert await service.address_to_coordinates("서울시청") is None
+        assert await service.reverse_geocode(37.5665, 126.978) is None
+        assert service.breaker.state == "open"
+
+        assert await service.keyword_search("서울시청") is None
+        with pytest.raises(CircuitOpenError):
+            await service.address_to_coordinates("서울시청", raise_errors=True)
+        assert len(calls) == 2
+        await service.aclose()
+
+    @pytest.mark.asyncio
+    async def test_probe_closes_circuit(self):
+        """open 동안 백그라운드 probe 가 복구를 확인하면 close"""
+        status = {"code": 503}
+        paths = []
+
+        def handler(request):
+            paths.append(request.url.path)
+            return httpx.Response(status["code"], json={"documents": []})
+
+        service = self.make_service(handler)
+        service.breaker.recovery_timeout = 0.01
+
+        assert await service.address_to_coordinates("서울시청") is None
+        assert await service.address_to_coordinates("서울시청") is None
+        assert service.breaker.state == "open"
+
+        status["code"] = 200
+        for _ in range(100):
+            if service.breaker.state == "closed":
+                break
+            await asyncio.sleep(0.01)
+
+        assert service.breaker.state == "closed"
+        assert "/v2/local/geo/coord2regioncode.json" in paths
+        await service.aclose()
+
+    @pytest.mark.asyncio
+    async def test_client_errors_do_not_open_circuit(self):
+        """4xx 는 장애로 집계하지 않음"""
+        service = self.make_service(lambda request: httpx.Response(400))
+
+        for _ in range(3):
+            assert await service.address_to_coordinates("???") is None
+
+        assert service.breaker.state == "closed"
+        await service.aclose()
+
+
+class TestHedgedGeocode:
+    """주소/키워드 동시 검색 테스트"""
+
+    @pytest.fixture
+    def service(self):
+        return KakaoMapService(api_key="test-key")
+
+    @staticmethod
+    def delayed(result, delay):
+        """지연 후 결과를 반환하는 AsyncMock (취소 여부 기록)"""
+        state = {"cancelled": False}
+
+        async def call(*args, **kwargs):
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                state["cancelled"] = True
+                raise
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+        mock = AsyncMock(side_effect=call)
+        mock.state = state
+        return mock
+
+    @pytest.mark.asyncio
+    async def test_lookups_run_concurrently(self, service):
+        """주소 검색 실패 시 키워드 결과를 기다리는 시간이 직렬 합보다 짧음"""
+        service.address_to_coordinates = self.delayed(None, 0.1)
+        service.keyword_search = self.delayed((37.4979, 127.0276), 0.1)
+
+        start = time.perf_counter()
+        coords = await service.geocode("강남역")
+        elapsed = time.perf_counter() - start
+
+        assert coords == (37.4979, 127.0276)
+        assert elapsed < 0.18
+
+    @pytest.mark.asyncio
+    async def test_preferred_result_wins_and_loser_cancelled(self, service):
+        """우선순위 결과 채택 후 나머지 요청 취소"""
+        service.address_to_coordinates = self.delayed((37.5665, 126.9780), 0.01)
+        service.keyword_search = self.delayed((37.0, 127.0), 0.5)
+
+        assert await service.geocode("서울 중구 세종대로 110") == (37.5665, 126.9780)
+        await asyncio.sleep(0)
+        assert service.keyword_search.state["cancelled"] is True
+
+    @pytest.mark.asyncio
+    async def test_priority_waits_for_preferred(self, service):
+        """우선순위가 낮은 검색이 먼저 끝나도 우선 검색 결과 사용"""
+        service.address_to_coordinates = self.delayed((37.5665, 126.9780), 0.05)
+        service.keyword_search = self.delayed((37.0, 127.0), 0.0)
+
+        assert await service.geocode("서울시청") == (37.5665, 126.9780)
+
+        with patch('app.core.services.kakao_map_service.settings.KAKAO_GEOCODE_PRIORITY', ["keyword", "address"]):
+            assert await service.geocode("서울시청") == (37.0, 127.0)
+
+    @pytest.mark.asyncio
+    async def test_errors(self, service):
+        """한쪽 오류는 다른 결과로 대체, 둘 다 실패 시 raise_errors에 따라 예외"""
+        service.address_to_coordinates = self.delayed(Exception("timeout"), 0.0)
+        service.keyword_search = self.delayed((37.4979, 127.0276), 0.0)
+        assert await service.geocode("강남역", raise_errors=True) == (37.4979, 127.0276)
+
+        service.keyword_search = self.delayed(None, 0.0)
+        assert await service.geocode("강남역") is None
+        with pytest.raises(Exception, match="timeout"):
+            await service.geocode("강남역", raise_errors=True)
+
+    @pytest.mark.asyncio
+    async def test_failed_loser_exception_retrieved(self, service):
+        """채택되지 않은 검색이 실패해도 "Task exception was never retrieved" 없음"""
+        service.address_to_coordinates = self.delayed((37.5665, 126.9780), 0.02)
+        service.keyword_search = self.delayed(Exception("keyword timeout"), 0.0)
+
+        loop = asyncio.get_running_loop()
+        unretrieved = []
+        loop.set_exception_handler(lambda _, context: unretrieved.append(context))
+        try:
+            assert await service.geocode("서울시청") == (37.5665, 126.9780)
+            await asyncio.sleep(0)
+            gc.collect()
+        finally:
+            loop.set_exception_handler(None)
+
+        assert unretrieved == []
+
+    @pytest.mark.asyncio
+    async def test_sequential_when_hedging_disabled(self, service):
+        """동시 요청 비활성화 시 주소 검색 성공하면 키워드 검색 생략"""
+        service.address_to_coordinates = AsyncMock(return_value=(37.5665, 126.9780))
+        service.keyword_search = AsyncMock(return_value=(37.0, 127.0))
+
+        with patch('app.core.services.kakao_map_service.settings.KAKAO_GEOCODE_HEDGE', False):
+            assert await service.geocode("서울시청") == (37.5665, 126.9780)
+
+        service.keyword_search.assert_not_called()
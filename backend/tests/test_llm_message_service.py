@@ -0,0 +1,253 @@
+"""
+Unit tests for LLM Message Service
+로컬 스텁 모델 서버(Ollama /api/generate 호환)를 사용한 백그라운드 메시지 생성 테스트
+"""
+
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.agents.response_generator import ResponseGenerator
+from app.core.services.llm_message_service import LLMMessageService
+from app.core.workflow.state import AnalyzedLocation, SearchResults
+from app.main import app
+from tests.conftest import build_fake_redis_service
+
+
+class StubModelServer:
+    """Ollama /api/generate 스텁 (호출 수, 최대 동시 요청 수 기록)"""
+
+    def __init__(self, delay: float = 0.05, status: int = 200):
+        self.delay = delay
+        self.status = status
+        self.calls = 0
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                with stub.lock:
+                    stub.calls += 1
+                    stub.active += 1
+                    stub.max_active = max(stub.max_active, stub.active)
+                time.sleep(stub.delay)
+                with stub.lock:
+                    stub.active -= 1
+
+                payload = json.dumps({
+                    "model": body["model"],
+                    "response": f" 추천 메시지 #{len(body['prompt'])} ",
+                    "done": True
+                }).encode("utf-8")
+                self.send_response(stub.status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.thread = threading.Thread(
+            target=self.server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True
+        )
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def stub_server():
+    """로컬 스텁 모델 서버"""
+    with StubModelServer() as server:
+        yield server
+
+
+@pytest.fixture
+def service(stub_server):
+    """스텁 서버에 연결된 서비스 (동시 호출 2)"""
+    return LLMMessageService(base_url=stub_server.url, model="stub", concurrency=2)
+
+
+def make_results(count: int = 3) -> SearchResults:
+    return SearchResults(
+        locations=[
+            {'id': str(i), '_table': 'libraries', 'library_name': f'도서관 {i}',
+             'latitude': 37.5665, 'longitude': 126.978, 'distance': 100.0 * (i + 1),
+             'distance_formatted': f'{100 * (i + 1)}m'}
+            for i in range(count)
+        ],
+        total=count,
+        search_center={'latitude': 37.5665, 'longitude': 126.978},
+        search_radius=2000,
+        execution_time=0.1
+    )
+
+
+class TestLLMMessageService:
+    """백그라운드 생성 / 캐싱 / 동시성 제한 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_background_generation(self, service, stub_server):
+        """submit 은 대기하지 않고 토큰 반환, 생성 후 ready"""
+        token, message = service.submit("prompt")
+
+        assert message is None
+        assert (await service.get_status(token))["status"] == "pending"
+
+        status = await service.get_status(token, wait=5)
+
+        assert status == {"token": token, "status": "ready", "message": "추천 메시지 #6"}
+        assert stub_server.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_identical_prompt_hits_llm_once(self, service, stub_server):
+        """생성 중/생성 후 같은 fingerprint 는 LLM 재호출 없음"""
+        first, _ = service.submit("same")
+        second, _ = service.submit("same")
+        await service.get_status(first, wait=5)
+        third, message = service.submit("same")
+
+        assert first == second == third
+        assert message == "추천 메시지 #4"
+        assert stub_server.calls == 1
+        assert service.get_stats()["cache_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrency_limit(self, stub_server):
+        """세마포어로 동시 모델 호출 수 제한"""
+        service = LLMMessageService(base_url=stub_server.url, model="stub", concurrency=1)
+        tokens = [service.submit(f"prompt {i}")[0] for i in range(3)]
+
+        statuses = await asyncio.gather(*[service.get_status(token, wait=5) for token in tokens])
+
+        assert [status["status"] for status in statuses] == ["ready"] * 3
+        assert stub_server.calls == 3
+        assert stub_server.max_active == 1
+        await service.aclose()
+
+    @pytest.mark.asyncio
+    async def test_failure_then_retry(self, service, stub_server):
+        """모델 오류는 failed, 같은 결과의 다음 요청은 재시도"""
+        stub_server.status = 500
+        token, _ = service.submit("prompt")
+
+        assert (await service.get_status(token, wait=5))["status"] == "failed"
+
+        stub_server.status = 200
+        service.submit("prompt")
+
+        assert (await service.get_status(token, wait=5))["status"] == "ready"
+        assert stub_server.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_queue_full(self, service):
+        """대기 작업 수 한도 초과 시 토큰 없음 (템플릿 메시지만)"""
+        with patch('app.core.services.llm_message_service.settings.LLM_MESSAGE_MAX_PENDING', 1):
+            assert service.submit("a")[0] is not None
+            assert service.submit("b") == (None, None)
+
+        assert service.get_stats()["dropped"] == 1
+
+    @pytest.mark.asyncio
+    async def test_shared_across_workers(self, stub_server, fake_redis_server):
+        """다른 워커가 생성한 메시지는 Redis 에서 조회 (LLM 재호출 없음)"""
+        workers = [
+            LLMMessageService(base_url=stub_server.url, model="stub") for _ in range(2)
+        ]
+        for worker in workers:
+            worker.redis = build_fake_redis_service(fake_redis_server)
+
+        token, _ = workers[0].submit("prompt")
+        await workers[0].get_status(token, wait=5)
+
+        assert (await workers[1].get_status(token))["status"] == "ready"
+        workers[1].local.clear()
+        workers[1].submit("prompt")
+        assert (await workers[1].get_status(token, wait=5))["message"] == "추천 메시지 #6"
+        assert stub_server.calls == 1
+
+        for worker in workers:
+            await worker.aclose()
+
+    @pytest.mark.asyncio
+    async def test_unknown_token(self, service):
+        """알 수 없는 토큰은 None"""
+        assert await service.get_status("0" * 32) is None
+
+
+class TestResponseGeneratorLLM:
+    """ResponseGenerator(use_llm=True) 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_template_first_then_llm(self, service, stub_server):
+        """첫 응답은 템플릿 + 토큰, 같은 결과의 이후 응답은 생성된 메시지"""
+        with patch('app.core.agents.response_generator.get_llm_message_service', return_value=service):
+            generator = ResponseGenerator(use_llm=True)
+        location = AnalyzedLocation(
+            latitude=37.5665, longitude=126.978, address='서울시청', radius=2000, source='coordinates'
+        )
+
+        first = await generator.generate(make_results(), location)
+
+        assert first.message.startswith("📍 서울시청")
+        assert first.message_token is not None
+
+        await service.get_status(first.message_token, wait=5)
+        second_results = make_results()
+        second_results.execution_time = 0.5  # 실행 시간은 fingerprint 에 포함되지 않음
+        second = await generator.generate(second_results, location)
+
+        assert second.message_token == first.message_token
+        assert second.message.startswith("추천 메시지")
+        assert stub_server.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_template_without_llm(self):
+        """use_llm=False 면 토큰 없음"""
+        response = await ResponseGenerator().generate(make_results())
+
+        assert response.message_token is None
+
+
+class TestMessageEndpoint:
+    """GET /api/v1/messages/{token} 테스트"""
+
+    def test_ready_and_unknown(self):
+        """ready 는 200, 알 수 없는 토큰은 404"""
+        service = Mock()
+        service.get_status = AsyncMock(side_effect=[
+            {"token": "abc", "status": "ready", "message": "추천"},
+            None
+        ])
+        client = TestClient(app)
+
+        with patch('app.api.v1.endpoints.messages.get_llm_message_service', return_value=service):
+            ready = client.get("/api/v1/messages/abc", params={"wait": 2})
+            unknown = client.get("/api/v1/messages/zzz")
+
+        assert ready.status_code == 200
+        assert ready.json() == {"token": "abc", "status": "ready", "message": "추천"}
+        assert service.get_status.call_args_list[0].kwargs == {"wait": 2.0}
+        assert unknown.status_code == 404
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,79 @@
+"""
+Unit tests for Local (L1) Cache
+"""
+
+import pytest
+from unittest.mock import patch
+
+from app.core.services.local_cache import LocalCache
+
+
+class TestLocalCache:
+    """L1 캐시 테스트"""
+
+    @pytest.fixture
+    def cache(self):
+        return LocalCache(max_bytes=100, default_ttl=60)
+
+    def test_get_set(self, cache):
+        """저장 후 같은 객체 반환"""
+        value = [{"id": 1}]
+        assert cache.set("key", value, size=10) is True
+
+        assert cache.get("key") is value
+        assert cache.get("missing") is None
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+    def test_lru_eviction_by_bytes(self, cache):
+        """바이트 한도 초과 시 가장 오래 사용되지 않은 항목 제거"""
+        cache.set("a", "A", size=40)
+        cache.set("b", "B", size=40)
+        cache.get("a")  # a를 최근 사용으로 갱신
+        cache.set("c", "C", size=40)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == "A"
+        assert cache.get("c") == "C"
+        assert cache.evictions == 1
+        assert cache.get_stats()["bytes"] == 80
+
+    def test_oversized_value_rejected(self, cache):
+        """한도보다 큰 단일 항목은 저장하지 않음"""
+        cache.set("a", "A", size=40)
+
+        assert cache.set("huge", "X", size=101) is False
+        assert cache.get("a") == "A"
+
+    def test_overwrite_updates_size(self, cache):
+        """같은 키 재저장 시 크기 갱신"""
+        cache.set("a", "A", size=40)
+        cache.set("a", "AA", size=20)
+
+        assert cache.get("a") == "AA"
+        assert cache.get_stats()["bytes"] == 20
+
+    def test_ttl_expiry(self, cache):
+        """TTL 만료 항목은 미스 처리 후 제거"""
+        with patch('app.core.services.local_cache.time.monotonic', return_value=1000.0):
+            cache.set("a", "A", size=10, ttl=5)
+
+        with patch('app.core.services.local_cache.time.monotonic', return_value=1004.0):
+            assert cache.get("a") == "A"
+
+        with patch('app.core.services.local_cache.time.monotonic', return_value=1005.0):
+            assert cache.get("a") is None
+
+        assert cache.get_stats()["entries"] == 0
+
+    def test_delete_pattern(self, cache):
+        """Redis glob 패턴으로 삭제"""
+        cache.set("location:1:libraries", 1, size=1)
+        cache.set("location:2:libraries", 2, size=1)
+        cache.set("location:3:cultural_events", 3, size=1)
+
+        assert cache.delete_pattern("location:*:libraries") == 2
+        assert cache.get("location:3:cultural_events") == 3
+
+        assert cache.delete_pattern("*") == 1
+        assert cache.get_stats()["bytes"] == 0
@@ -149,6 +149,45 @@ class TestLocationAnalyzer:
             assert result is not None
             assert result.category == "libraries"
 
+    @pytest.mark.asyncio
+    async def test_reverse_geocode_cached(self, analyzer):
+        """가까운 좌표의 역지오코딩은 캐시 재사용"""
+        with patch.object(analyzer.kakao_service, 'reverse_geocode', new_callable=AsyncMock) as mock_reverse:
+            mock_reverse.return_value = "서울특별시 중구 세종대로 110"
+
+            first = await analyzer.resolve_address(37.566501, 126.978001)
+            second = await analyzer.resolve_address(37.566512, 126.978013)  # 약 1.5m 차이
+
+            assert first == second == "서울특별시 중구 세종대로 110"
+            mock_reverse.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_reverse_geocode_failure_not_cached(self, analyzer):
+        """역지오코딩 실패 결과는 캐싱하지 않음"""
+        with patch.object(analyzer.kakao_service, 'reverse_geocode', new_callable=AsyncMock) as mock_reverse:
+            mock_reverse.side_effect = [Exception("timeout"), None, "서울특별시 중구"]
+
+            assert await analyzer.resolve_address(37.5665, 126.9780) is None
+            assert await analyzer.resolve_address(37.5665, 126.9780) is None
+            assert await analyzer.resolve_address(37.5665, 126.9780) == "서울특별시 중구"
+            assert mock_reverse.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_skip_reverse_geocode(self, analyzer):
+        """resolve_address=False 또는 include_address=False 시 역지오코딩 생략"""
+        with patch.object(analyzer.kakao_service, 'reverse_geocode', new_callable=AsyncMock) as mock_reverse:
+            deferred = await analyzer.analyze(
+                LocationQuery(latitude=37.5665, longitude=126.9780),
+                resolve_address=False
+            )
+            skipped = await analyzer.analyze(
+                LocationQuery(latitude=37.5665, longitude=126.9780, include_address=False)
+            )
+
+            assert deferred.address is None
+            assert skipped.address is None
+            mock_reverse.assert_not_called()
+
     def test_validate_location_valid(self, analyzer):
         """유효한 위치 검증"""
         location = AnalyzedLocation(
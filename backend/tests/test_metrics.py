@@ -0,0 +1,129 @@
+"""
+Unit tests for Prometheus Metrics
+"""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.middleware import MetricsMiddleware
+from app.core.services import metrics, timing
+from app.core.services.metrics import Counter, Gauge, LabeledHistogram, render_metrics
+from app.core.services.timing import span, timed
+from app.main import app as main_app
+
+
+@pytest.fixture(autouse=True)
+def clean_metrics():
+    """테스트 간 메트릭 격리"""
+    metrics.reset_metrics()
+    timing.reset_timings()
+    yield
+    metrics.reset_metrics()
+    timing.reset_timings()
+
+
+class TestExposition:
+    """노출 형식 테스트"""
+
+    def test_counter_and_gauge(self):
+        """레이블 샘플 및 HELP/TYPE"""
+        counter = Counter("hits_total", "Hits.", ("prefix",))
+        counter.inc("location")
+        counter.inc("location", amount=2)
+        gauge = Gauge("in_flight", "In flight.")
+        gauge.inc()
+        gauge.inc()
+        gauge.dec()
+
+        assert counter.collect() == [
+            "# HELP hits_total Hits.",
+            "# TYPE hits_total counter",
+            'hits_total{prefix="location"} 3'
+        ]
+        assert gauge.collect()[-1] == "in_flight 1"
+
+    def test_histogram_cumulative_buckets(self):
+        """버킷은 누적, +Inf 버킷 = count"""
+        histogram = LabeledHistogram("size", "Size.", ("route",), buckets=(1, 10))
+        for value in (0, 5, 5, 50):
+            histogram.observe(value, '/a"b')
+
+        assert histogram.collect()[2:] == [
+            'size_bucket{route="/a\\"b",le="1"} 1',
+            'size_bucket{route="/a\\"b",le="10"} 3',
+            'size_bucket{route="/a\\"b",le="+Inf"} 4',
+            'size_sum{route="/a\\"b"} 60',
+            'size_count{route="/a\\"b"} 4'
+        ]
+
+    @pytest.mark.asyncio
+    async def test_span_metrics(self):
+        """노드 / 외부 호출 스팬은 별도 메트릭으로 노출"""
+        @timed("fetch_services")
+        async def node():
+            with span("supabase"):
+                assert timing.get_in_flight(timing.DEPENDENCY) == {"supabase": 1}
+
+        await node()
+        text = render_metrics()
+
+        assert 'workflow_node_duration_seconds_count{node="fetch_services"} 1' in text
+        assert 'dependency_call_duration_seconds_count{dependency="supabase"} 1' in text
+        assert 'dependency_calls_in_flight{dependency="supabase"} 0' in text
+        assert "fetch_services" not in text.split("# HELP dependency_call_duration_seconds")[1]
+
+
+class TestCacheMetrics:
+    """캐시 hit/miss 카운터 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_hit_miss_by_prefix_and_tier(self, fake_redis_service):
+        """miss → L2 hit → L1 hit"""
+        key = "location:v0:37.5665:126.978:2000"
+        await fake_redis_service.aget(key)
+        await fake_redis_service.aset(key, [{"id": 1}], ttl=60)
+        fake_redis_service.local.clear()
+        await fake_redis_service.aget(key)
+        await fake_redis_service.aget(key)
+        await fake_redis_service.amget([key, "cell:v0:500:libraries:1:2"])
+
+        assert metrics.CACHE_MISSES.values == {("location",): 1, ("cell",): 1}
+        assert metrics.CACHE_HITS.values == {("location", "l2"): 1, ("location", "l1"): 2}
+
+
+class TestHttpMetrics:
+    """HTTP 요청 메트릭 테스트"""
+
+    def test_route_template_label(self):
+        """경로 파라미터는 라우트 템플릿으로, 미매칭 경로는 unmatched 로 집계"""
+        app = FastAPI()
+        app.add_middleware(MetricsMiddleware)
+
+        @app.get("/items/{item_id}")
+        async def item(item_id: str):
+            assert metrics.HTTP_REQUESTS_IN_FLIGHT.values[()] == 1
+            return {"id": item_id}
+
+        client = TestClient(app)
+        client.get("/items/1")
+        client.get("/items/2")
+        client.get("/nope")
+
+        children = metrics.HTTP_REQUEST_DURATION.children
+        assert children[("GET", "/items/{item_id}", "200")].count == 2
+        assert children[("GET", "unmatched", "404")].count == 1
+        assert metrics.HTTP_REQUESTS_IN_FLIGHT.values[()] == 0
+
+    def test_metrics_endpoint(self):
+        """/metrics 는 Prometheus 텍스트 형식"""
+        response = TestClient(main_app).get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        assert "# TYPE http_request_duration_seconds histogram" in response.text
+        assert "# TYPE cache_hits_total counter" in response.text
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -2,9 +2,10 @@
 Unit tests for Redis Service
 """
 
+import asyncio
 import pytest
 import json
-from unittest.mock import Mock, patch
+from unittest.mock import Mock, AsyncMock, patch
 from app.core.services.redis_service import RedisService, get_redis_service
 
 
@@ -42,7 +43,7 @@ class TestRedisService:
             radius=1000
         )
         # Default precision is 4 decimal places
-        assert key == "location:37.5665:126.978:1000"
+        assert key == "location:v0:37.5665:126.978:1000"
 
     def test_generate_cache_key_with_category(self, redis_service):
         """카테고리 포함 캐시 키"""
@@ -53,7 +54,7 @@ class TestRedisService:
             category="libraries"
         )
         # Default precision is 4 decimal places
-        assert key == "location:37.5665:126.978:1000:libraries"
+        assert key == "location:v0:37.5665:126.978:1000:libraries"
 
     def test_generate_cache_key_rounding(self, redis_service):
         """좌표 반올림 적용"""
@@ -92,26 +93,41 @@ class TestRedisService:
     def test_set_success(self, redis_service):
         """캐시 SET 성공 테스트"""
         test_data = {"name": "Test", "value": 123}
-        redis_service.client.setex.return_value = True
+        pipe = redis_service.client.pipeline.return_value
 
         success = redis_service.set("test:key", test_data, ttl=300)
 
         assert success is True
-        redis_service.client.setex.assert_called_once()
+        pipe.setex.assert_called_once()
         # 호출 인자 확인
-        call_args = redis_service.client.setex.call_args[0]
+        call_args = pipe.setex.call_args[0]
         assert call_args[0] == "test:key"
         assert call_args[1] == 300
-        assert json.loads(call_args[2]) == test_data
+        assert redis_service.codec.decode(call_args[2]) == test_data
+
+        # SETEX 와 L1 무효화 알림을 한 번의 왕복으로 전송
+        pipe.publish.assert_called_once()
+        pipe.execute.assert_called_once()
+        redis_service.client.setex.assert_not_called()
+        redis_service.client.publish.assert_not_called()
+
+    def test_set_without_local_skips_publish(self, redis_service):
+        """L1 미사용 시 무효화 알림 없음"""
+        redis_service.local = None
+        pipe = redis_service.client.pipeline.return_value
+
+        assert redis_service.set("test:key", {"data": "test"}, ttl=300) is True
+
+        pipe.setex.assert_called_once()
+        pipe.publish.assert_not_called()
 
     def test_set_default_ttl(self, redis_service):
         """기본 TTL 사용"""
         redis_service.ttl = 300
-        redis_service.client.setex.return_value = True
 
         redis_service.set("test:key", {"data": "test"})
 
-        call_args = redis_service.client.setex.call_args[0]
+        call_args = redis_service.client.pipeline.return_value.setex.call_args[0]
         assert call_args[1] == 300  # 기본 TTL
 
     def test_delete_success(self, redis_service):
@@ -132,19 +148,22 @@ class TestRedisService:
         assert success is False
 
     def test_delete_pattern(self, redis_service):
-        """패턴 매칭 삭제"""
-        redis_service.client.keys.return_value = ["loc:1", "loc:2", "loc:3"]
-        redis_service.client.delete.return_value = 3
+        """패턴 매칭 삭제 (SCAN + 파이프라인 UNLINK)"""
+        redis_service.client.scan_iter.return_value = iter([b"loc:1", b"loc:2", b"loc:3"])
+        pipe = redis_service.client.pipeline.return_value
+        pipe.execute.return_value = [1, 1, 1]
 
         deleted = redis_service.delete_pattern("loc:*")
 
         assert deleted == 3
-        redis_service.client.keys.assert_called_once_with("loc:*")
-        redis_service.client.delete.assert_called_once_with("loc:1", "loc:2", "loc:3")
+        redis_service.client.scan_iter.assert_called_once_with(match="loc:*", count=500)
+        assert [c.args for c in pipe.unlink.call_args_list] == [("loc:1",), ("loc:2",), ("loc:3",)]
+        redis_service.client.keys.assert_not_called()
+        redis_service.client.delete.assert_not_called()
 
     def test_delete_pattern_no_match(self, redis_service):
         """매칭되는 키 없음"""
-        redis_service.client.keys.return_value = []
+        redis_service.client.scan_iter.return_value = iter([])
 
         deleted = redis_service.delete_pattern("nonexistent:*")
 
@@ -227,6 +246,676 @@ class TestRedisServiceDisabled:
         stats = disabled_redis_service.get_stats()
         assert stats == {"enabled": False}
 
+    @pytest.mark.asyncio
+    async def test_lock_unavailable(self, disabled_redis_service):
+        """비활성화 시 락 획득 불가"""
+        assert await disabled_redis_service.acquire_lock("query", ttl_ms=1000) is None
+        assert await disabled_redis_service.release_lock("query", "token") is False
+        assert await disabled_redis_service.is_locked("query") is False
+
+
+class TestRedisServiceAsync:
+    """비동기 메서드 테스트 (fakeredis)"""
+
+    @pytest.mark.asyncio
+    async def test_aset_aget_roundtrip(self, fake_redis_service):
+        """aset → aget"""
+        test_data = {"name": "서울도서관", "value": 123}
+
+        success = await fake_redis_service.aset("test:key", test_data, ttl=60)
+        result = await fake_redis_service.aget("test:key")
+
+        assert success is True
+        assert result == test_data
+        assert 59 <= await fake_redis_service.async_client.ttl("test:key") <= 60
+
+    @pytest.mark.asyncio
+    async def test_aset_default_ttl(self, fake_redis_service):
+        """기본 TTL 사용"""
+        await fake_redis_service.aset("test:key", {"data": "test"})
+
+        ttl = await fake_redis_service.async_client.ttl("test:key")
+        assert fake_redis_service.ttl - 1 <= ttl <= fake_redis_service.ttl
+
+    @pytest.mark.asyncio
+    async def test_aget_miss(self, fake_redis_service):
+        """캐시 MISS"""
+        assert await fake_redis_service.aget("nonexistent:key") is None
+
+    @pytest.mark.asyncio
+    async def test_adelete(self, fake_redis_service):
+        """adelete 후 조회되지 않음"""
+        await fake_redis_service.aset("test:key", {"data": "test"})
+
+        assert await fake_redis_service.adelete("test:key") is True
+        assert await fake_redis_service.adelete("test:key") is False
+        assert await fake_redis_service.aget("test:key") is None
+
+    @pytest.mark.asyncio
+    async def test_amget(self, fake_redis_service):
+        """여러 키 조회 (순서 유지, 없는 키는 None)"""
+        await fake_redis_service.aset("key:1", {"id": 1})
+        await fake_redis_service.aset("key:3", [1, 2, 3])
+
+        results = await fake_redis_service.amget(["key:1", "key:2", "key:3"])
+
+        assert results == [{"id": 1}, None, [1, 2, 3]]
+        assert await fake_redis_service.amget([]) == []
+
+    @pytest.mark.asyncio
+    async def test_sync_and_async_share_data(self, fake_redis_service):
+        """동기 set → 비동기 aget"""
+        fake_redis_service.set("test:key", {"data": "sync"})
+
+        assert await fake_redis_service.aget("test:key") == {"data": "sync"}
+
+    @pytest.mark.asyncio
+    async def test_async_error_returns_default(self, fake_redis_service):
+        """연결 오류 시 None/False 반환"""
+        fake_redis_service.async_client = Mock()
+        fake_redis_service.async_client.get = AsyncMock(side_effect=Exception("Connection reset"))
+        fake_redis_service.async_client.setex = AsyncMock(side_effect=Exception("Connection reset"))
+        fake_redis_service.async_client.mget = AsyncMock(side_effect=Exception("Connection reset"))
+
+        assert await fake_redis_service.aget("test:key") is None
+        assert await fake_redis_service.aset("test:key", {"data": "test"}) is False
+        assert await fake_redis_service.amget(["a", "b"]) == [None, None]
+
+    @pytest.mark.asyncio
+    async def test_async_disabled(self):
+        """비활성화 시 aget → None, aset → False"""
+        with patch('app.core.services.redis_service.redis.from_url') as mock_redis:
+            mock_redis.side_effect = Exception("Connection failed")
+            service = RedisService()
+
+        assert await service.aget("test:key") is None
+        assert await service.aset("test:key", {"data": "test"}) is False
+        assert await service.adelete("test:key") is False
+        assert await service.amget(["a", "b"]) == [None, None]
+
+    @pytest.mark.asyncio
+    async def test_cache_response_async_uses_async_client(self, fake_redis_service):
+        """cache_response 데코레이터의 비동기 경로"""
+        from app.utils.cache import cache_response
+
+        calls = {'count': 0}
+
+        @cache_response(ttl=60, key_prefix="test")
+        async def compute(x):
+            calls['count'] += 1
+            return {"result": x * 2}
+
+        with patch('app.utils.cache.get_redis_service', return_value=fake_redis_service):
+            first = await compute(21)
+            second = await compute(21)
+
+        assert first == second == {"result": 42}
+        assert calls['count'] == 1
+
+
+class TestRedisServiceL1:
+    """L1 (프로세스 내) 캐시 계층 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_l1_hit_skips_redis(self, fake_redis_service):
+        """aset 이후 aget은 Redis 왕복 없이 L1에서 응답"""
+        await fake_redis_service.aset("test:key", {"data": "hot"})
+        fake_redis_service.async_client = Mock()
+
+        assert await fake_redis_service.aget("test:key") == {"data": "hot"}
+        fake_redis_service.async_client.get.assert_not_called()
+        assert fake_redis_service.local.hits == 1
+
+    @pytest.mark.asyncio
+    async def test_l2_hit_populates_l1(self, fake_redis_service):
+        """Redis 히트 값은 L1에 적재"""
+        fake_redis_service.client.setex("test:key", 300, json.dumps({"data": "warm"}))
+
+        assert await fake_redis_service.aget("test:key") == {"data": "warm"}
+        assert await fake_redis_service.aget("test:key") == {"data": "warm"}
+
+        assert fake_redis_service.l2_hits == 1
+        assert fake_redis_service.local.hits == 1
+
+    @pytest.mark.asyncio
+    async def test_amget_mixes_tiers(self, fake_redis_service):
+        """L1에 있는 키는 Redis 조회에서 제외"""
+        await fake_redis_service.aset("key:1", {"id": 1})
+        fake_redis_service.client.setex("key:2", 300, json.dumps({"id": 2}))
+
+        results = await fake_redis_service.amget(["key:1", "key:2", "key:3"])
+
+        assert results == [{"id": 1}, {"id": 2}, None]
+        assert fake_redis_service.l2_hits == 1
+        assert fake_redis_service.l2_misses == 1
+
+    @pytest.mark.asyncio
+    async def test_pubsub_invalidates_other_worker(self, fake_redis_server):
+        """다른 워커의 aset 시 L1 무효화"""
+        from tests.conftest import build_fake_redis_service
+
+        worker_a = build_fake_redis_service(fake_redis_server)
+        worker_b = build_fake_redis_service(fake_redis_server)
+
+        await worker_a.aset("test:key", {"version": 1})
+        assert await worker_b.aget("test:key") == {"version": 1}  # B의 L1에 적재
+
+        await worker_b.start_invalidation_listener()
+        try:
+            await asyncio.sleep(0.05)  # 구독 완료 대기
+            await worker_a.aset("test:key", {"version": 2})
+
+            for _ in range(50):
+                if worker_b.local.get_stats()["entries"] == 0:
+                    break
+                await asyncio.sleep(0.02)
+
+            assert await worker_b.aget("test:key") == {"version": 2}
+            # 자신이 보낸 메시지로는 L1을 비우지 않음
+            assert await worker_a.aget("test:key") == {"version": 2}
+            assert worker_a.local.hits >= 1
+        finally:
+            await worker_b.stop_invalidation_listener()
+
+    def test_handle_invalidation(self, fake_redis_service):
+        """무효화 메시지 처리 (키, 패턴, 자기 메시지 무시)"""
+        local = fake_redis_service.local
+        local.set("location:1:libraries", 1, size=1)
+        local.set("location:2:libraries", 2, size=1)
+        local.set("other", 3, size=1)
+
+        own = fake_redis_service._invalidation_message(keys=["other"])
+        fake_redis_service._handle_invalidation(own)
+        assert local.get("other") == 3
+
+        remote = json.dumps({"origin": "worker-x", "keys": ["other"], "pattern": "location:*"})
+        fake_redis_service._handle_invalidation(remote)
+        assert local.get_stats()["entries"] == 0
+
+        fake_redis_service._handle_invalidation("not json")  # 무시
+
+    def test_sync_delete_pattern_clears_l1(self, fake_redis_service):
+        """동기 delete_pattern 도 L1에서 제거"""
+        fake_redis_service.local.set("location:1", 1, size=1)
+        fake_redis_service.client.set("location:1", "1")
+
+        fake_redis_service.delete_pattern("location:*")
+
+        assert fake_redis_service.local.get("location:1") is None
+
+    def test_stats_include_tiers(self, fake_redis_service):
+        """통계에 L1/L2 카운터 포함"""
+        fake_redis_service.client = Mock()
+        fake_redis_service.client.info.return_value = {}
+
+        stats = fake_redis_service.get_stats()
+
+        assert stats["l1"]["max_bytes"] == fake_redis_service.local.max_bytes
+        assert stats["l2"] == {"hits": 0, "misses": 0, "hit_rate": "0.0%"}
+
+
+class TestRedisServiceMulti:
+    """동기 MGET / 파이프라인 MSET 테스트"""
+
+    def test_mset_mget_roundtrip(self, fake_redis_service):
+        """여러 키 저장 후 한 번에 조회 (누락 키는 None)"""
+        assert fake_redis_service.mset({"a": [1], "b": {"x": 2}}, ttl=60) is True
+
+        assert fake_redis_service.mget(["a", "missing", "b"]) == [[1], None, {"x": 2}]
+        assert 0 < fake_redis_service.client.ttl("a") <= 60
+
+    def test_mset_single_pipeline(self, fake_redis_service):
+        """키 개수와 관계없이 파이프라인 1회 실행"""
+        client = fake_redis_service.client
+        with patch.object(client, 'pipeline', wraps=client.pipeline) as pipeline, \
+                patch.object(client, 'setex', wraps=client.setex) as setex:
+            fake_redis_service.mset({f"k:{i}": i for i in range(10)})
+
+        assert pipeline.call_count == 1
+        setex.assert_not_called()
+
+    def test_mset_invalidates_l1(self, fake_redis_service):
+        """다른 워커 L1 무효화 메시지 포함, 자신의 L1 에서도 제거"""
+        fake_redis_service.local.set("a", "old", size=3)
+
+        fake_redis_service.mset({"a": "new"})
+
+        assert fake_redis_service.local.get("a") is None
+        assert fake_redis_service.mget(["a"]) == ["new"]
+
+    def test_mget_unwraps_swr_entries(self, fake_redis_service):
+        """SWR 엔트리는 값만 반환"""
+        fake_redis_service.mset({"s": fake_redis_service._swr_entry([1], 60, 0.1)})
+
+        assert fake_redis_service.mget(["s"]) == [[1]]
+
+    def test_multi_disabled(self, fake_redis_service):
+        """비활성화 시 None 리스트 / False"""
+        fake_redis_service.enabled = False
+
+        assert fake_redis_service.mget(["a", "b"]) == [None, None]
+        assert fake_redis_service.mset({"a": 1}) is False
+        assert fake_redis_service.mget([]) == []
+
+
+class TestRedisServiceGenerations:
+    """세대 카운터 무효화 / SCAN+UNLINK 정리 테스트"""
+
+    def test_bump_generation_changes_keys(self, fake_redis_service):
+        """세대 증가 시 해당 카테고리와 전체 쿼리 키만 변경"""
+        library_key = fake_redis_service.generate_cache_key(37.5665, 126.9780, 1000, "libraries")
+        event_key = fake_redis_service.generate_cache_key(37.5665, 126.9780, 1000, "cultural_events")
+        all_key = fake_redis_service.generate_cache_key(37.5665, 126.9780, 1000)
+        cell_key = fake_redis_service.generate_cell_key("libraries", (3756, 12697), 0.01)
+
+        assert fake_redis_service.bump_generation("libraries") == 1
+
+        assert fake_redis_service.generate_cache_key(37.5665, 126.9780, 1000, "libraries") != library_key
+        assert fake_redis_service.generate_cache_key(37.5665, 126.9780, 1000, "cultural_events") == event_key
+        assert fake_redis_service.generate_cache_key(37.5665, 126.9780, 1000) != all_key
+        assert fake_redis_service.generate_cell_key("libraries", (3756, 12697), 0.01) == \
+            "cell:v1:0.01:libraries:3756:12697"
+        assert cell_key == "cell:v0:0.01:libraries:3756:12697"
+
+    @pytest.mark.asyncio
+    async def test_bump_invalidates_cached_value(self, fake_redis_service):
+        """세대 증가 후 이전 값은 조회되지 않음 (L1 포함)"""
+        key = fake_redis_service.generate_cache_key(37.5665, 126.9780, 1000, "libraries")
+        await fake_redis_service.aset(key, [{"id": 1}])
+        assert await fake_redis_service.aget(key) == [{"id": 1}]
+
+        fake_redis_service.bump_generation("libraries")
+        new_key = fake_redis_service.generate_cache_key(37.5665, 126.9780, 1000, "libraries")
+
+        assert await fake_redis_service.aget(new_key) is None
+
+    def test_generation_shared_between_workers(self, fake_redis_server, fake_redis_service):
+        """다른 워커는 초기화/무효화 메시지로 세대 반영"""
+        from tests.conftest import build_fake_redis_service
+
+        other = build_fake_redis_service(fake_redis_server)
+        fake_redis_service.bump_generation("libraries")
+
+        # 새로 시작한 워커는 Redis에서 로드
+        assert build_fake_redis_service(fake_redis_server).generation("libraries") == 1
+
+        # 실행 중인 워커는 pub/sub 메시지로 반영
+        assert other.generation("libraries") == 0
+        other._handle_invalidation(json.dumps({
+            "origin": fake_redis_service.instance_id,
+            "generations": {"libraries": 1, "all": 1}
+        }))
+        assert other.generation("libraries") == 1
+        assert other.generation("all") == 1
+
+    @pytest.mark.asyncio
+    async def test_refresh_generations(self, fake_redis_server, fake_redis_service):
+        """메시지를 놓쳐도 주기적 재조회로 반영"""
+        from tests.conftest import build_fake_redis_service
+
+        other = build_fake_redis_service(fake_redis_server)
+        fake_redis_service.bump_generation("libraries")
+
+        assert await other.arefresh_generations() is True
+        assert other.generation("libraries") == 1
+
+    def test_key_generation(self, fake_redis_service):
+        """키에서 (카테고리, 세대) 추출"""
+        assert fake_redis_service.key_generation("location:v2:37.5665:126.978:1000:libraries") == ("libraries", 2)
+        assert fake_redis_service.key_generation("location:v0:37.5665:126.978:1000") == ("all", 0)
+        assert fake_redis_service.key_generation("cell:v3:0.01:libraries:3756:12697") == ("libraries", 3)
+        assert fake_redis_service.key_generation("cache:location.find:v4:abc") == ("location", 4)
+        assert fake_redis_service.key_generation("cache:find:v1:abc") == ("all", 1)
+        assert fake_redis_service.key_generation("cache:generations") is None
+        assert fake_redis_service.key_generation("location:37.5665:126.978:1000") is None
+        assert fake_redis_service.key_generation("geocode:forward:abc") is None
+
+    def test_sweep_stale_generations(self, fake_redis_service):
+        """이전 세대 키만 UNLINK"""
+        client = fake_redis_service.client
+        old_library = fake_redis_service.generate_cache_key(37.5665, 126.9780, 1000, "libraries")
+        old_cell = fake_redis_service.generate_cell_key("libraries", (3756, 12697), 0.01)
+        event_key = fake_redis_service.generate_cache_key(37.5665, 126.9780, 1000, "cultural_events")
+        for key in (old_library, old_cell, event_key, "geocode:forward:abc"):
+            client.set(key, b"1")
+
+        fake_redis_service.bump_generation("libraries")
+        new_library = fake_redis_service.generate_cache_key(37.5665, 126.9780, 1000, "libraries")
+        client.set(new_library, b"1")
+
+        assert fake_redis_service.sweep_stale_generations("libraries") == 2
+        assert client.exists(old_library, old_cell) == 0
+        assert client.exists(new_library, event_key, "geocode:forward:abc") == 3
+
+    def test_sweep_stale_decorator_keys(self, fake_redis_service):
+        """데코레이터 캐시 키(cache:{func}:v{gen}:{hash})도 이전 세대만 정리"""
+        from app.utils import cache as cache_utils
+
+        client = fake_redis_service.client
+        with patch.object(cache_utils, 'get_redis_service', return_value=fake_redis_service):
+            old_key = cache_utils.generate_cache_key("location.find", 1, namespace="location")
+            other_key = cache_utils.generate_cache_key("supabase.get", 1, namespace="supabase")
+            client.set(old_key, b"1")
+            client.set(other_key, b"1")
+
+            fake_redis_service.bump_generation("location")
+            new_key = cache_utils.generate_cache_key("location.find", 1, namespace="location")
+            client.set(new_key, b"1")
+
+        assert fake_redis_service.sweep_stale_generations() == 1
+        assert client.exists(old_key) == 0
+        assert client.exists(new_key, other_key, "cache:generations") == 3
+
+    def test_bump_every_generation(self, fake_redis_service):
+        """bump_generation(None) 은 모든 카테고리 세대를 올림"""
+        fake_redis_service.bump_generation("libraries")
+        before = {
+            name: fake_redis_service.generation(name)
+            for name in ("libraries", "cultural_events", "all")
+        }
+
+        assert fake_redis_service.bump_generation(None) == before["all"] + 1
+        for name, generation in before.items():
+            assert fake_redis_service.generation(name) == generation + 1
+
+        # 이후 카테고리 단위 증가도 계속 새 세대
+        assert fake_redis_service.bump_generation("libraries") == before["libraries"] + 2
+
+    def test_sweep_batches(self, fake_redis_service):
+        """배치 크기보다 많은 키도 모두 삭제"""
+        client = fake_redis_service.client
+        for i in range(25):
+            client.set(f"tmp:{i}", b"1")
+        client.set("keep:1", b"1")
+
+        assert fake_redis_service.sweep("tmp:*", batch_size=10) == 25
+        assert client.exists("keep:1") == 1
+
+    def test_invalidate_category_helpers(self, fake_redis_service):
+        """utils.cache 카테고리 무효화 / 데코레이터 키 세대"""
+        from app.utils import cache as cache_utils
+
+        with patch.object(cache_utils, 'get_redis_service', return_value=fake_redis_service):
+            before = cache_utils.generate_cache_key("location.find", 1, namespace="location")
+            assert ":v0:" in before
+
+            assert cache_utils.invalidate_category("location") == 1
+            assert cache_utils.generate_cache_key("location.find", 1, namespace="location") != before
+
+            fake_redis_service.client.set("cache:location.find:v0:abc", b"1")
+            assert cache_utils.invalidate_cache("location.*") == 1
+
+
+class TestRedisServiceCircuit:
+    """Redis 서킷 브레이커 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_fail_fast_after_connection_errors(self, fake_redis_service):
+        """연속 연결 오류 후 Redis를 호출하지 않고 즉시 미스"""
+        import redis as redis_lib
+
+        fake_redis_service.local.clear()
+        get = AsyncMock(side_effect=redis_lib.exceptions.ConnectionError("down"))
+        fake_redis_service.async_client.get = get
+        fake_redis_service.breaker.failure_threshold = 2
+        fake_redis_service.breaker.probe = None
+
+        assert await fake_redis_service.aget("k1") is None
+        assert await fake_redis_service.aget("k2") is None
+        assert fake_redis_service.enabled is False
+
+        assert await fake_redis_service.aget("k3") is None
+        assert get.await_count == 2
+
+        stats = fake_redis_service.get_stats()
+        assert stats["available"] is False
+        assert stats["circuit"]["state"] == "open"
+
+    @pytest.mark.asyncio
+    async def test_enabled_has_no_side_effects(self, fake_redis_service):
+        """enabled 조회는 거부 카운트/half_open 전환 없음, 실제 호출만 시도 슬롯 사용"""
+        import redis as redis_lib
+
+        breaker = fake_redis_service.breaker
+        breaker.failure_threshold = 1
+        breaker.recovery_timeout = 0.01
+        breaker.probe = None
+        breaker.record_failure(redis_lib.exceptions.ConnectionError("down"))
+        await asyncio.sleep(0.02)
+
+        for _ in range(3):
+            assert fake_redis_service.enabled is False
+        assert breaker.state == "open"
+        assert breaker.rejected == 0
+
+        # 첫 호출만 half_open 시도로 허용, 결과 기록 후 close
+        fake_redis_service.local.clear()
+        assert await fake_redis_service.aset("k", 1, use_local=False) is True
+        assert breaker.state == "closed"
+        assert await fake_redis_service.aget("k", use_local=False) == 1
+
+    @pytest.mark.asyncio
+    async def test_decode_error_not_counted(self, fake_redis_service):
+        """값 디코딩 오류는 장애로 집계하지 않음"""
+        fake_redis_service.breaker.failure_threshold = 1
+        await fake_redis_service.async_client.set("bad", bytes((0x80 | (5 << 2),)) + b"{}")
+
+        assert await fake_redis_service.aget("bad", use_local=False) is None
+        assert fake_redis_service.breaker.state == "closed"
+
+    @pytest.mark.asyncio
+    async def test_probe_closes_circuit(self, fake_redis_service):
+        """백그라운드 PING 성공 시 자동 복구"""
+        import redis as redis_lib
+
+        fake_redis_service.breaker.failure_threshold = 1
+        fake_redis_service.breaker.recovery_timeout = 0.01
+        fake_redis_service.breaker.record_failure(redis_lib.exceptions.ConnectionError("down"))
+        assert fake_redis_service.enabled is False
+
+        for _ in range(100):
+            if fake_redis_service.breaker.state == "closed":
+                break
+            await asyncio.sleep(0.01)
+
+        assert fake_redis_service.enabled is True
+        assert await fake_redis_service.aset("k", 1) is True
+
+
+class TestRedisServiceCells:
+    """그리드 셀 캐시 키 테스트"""
+
+    def test_cell_index(self, fake_redis_service):
+        """좌표 → 셀 인덱스"""
+        assert fake_redis_service.cell_index(37.5665, 126.9780, 0.01) == (3756, 12697)
+        # 20m 떨어진 지점은 같은 셀
+        assert fake_redis_service.cell_index(37.5667, 126.9781, 0.01) == (3756, 12697)
+
+    def test_covering_cells(self, fake_redis_service):
+        """반경 경계 상자를 덮는 셀"""
+        cells = fake_redis_service.covering_cells(37.5665, 126.9780, 300, 0.01)
+
+        assert (3756, 12697) in cells
+        assert len(cells) <= 4
+
+        large = fake_redis_service.covering_cells(37.5665, 126.9780, 2000, 0.01)
+        assert set(cells) <= set(large)
+
+    def test_generate_cell_key(self, fake_redis_service):
+        """셀 캐시 키 형식"""
+        key = fake_redis_service.generate_cell_key('libraries', (3756, 12697), 0.01)
+        assert key == "cell:v0:0.01:libraries:3756:12697"
+
+    @pytest.mark.asyncio
+    async def test_amset(self, fake_redis_service):
+        """여러 키 저장 (빈 리스트 포함)"""
+        success = await fake_redis_service.amset({"key:1": [{"id": 1}], "key:2": []}, ttl=60)
+
+        assert success is True
+        fake_redis_service.local.clear()
+        assert await fake_redis_service.amget(["key:1", "key:2"]) == [[{"id": 1}], []]
+        assert 59 <= await fake_redis_service.async_client.ttl("key:2") <= 60
+
+
+class TestRedisServiceLock:
+    """분산 락 테스트 (single-flight)"""
+
+    @pytest.mark.asyncio
+    async def test_acquire_exclusive(self, fake_redis_service):
+        """이미 잡힌 락은 획득 불가"""
+        token = await fake_redis_service.acquire_lock("query", ttl_ms=1000)
+
+        assert token is not None
+        assert await fake_redis_service.acquire_lock("query", ttl_ms=1000) is None
+        assert await fake_redis_service.is_locked("query") is True
+        assert 0 < await fake_redis_service.async_client.pttl("lock:query") <= 1000
+
+    @pytest.mark.asyncio
+    async def test_release_requires_token(self, fake_redis_service):
+        """다른 토큰으로는 해제 불가"""
+        token = await fake_redis_service.acquire_lock("query", ttl_ms=1000)
+
+        assert await fake_redis_service.release_lock("query", "other-token") is False
+        assert await fake_redis_service.is_locked("query") is True
+
+        assert await fake_redis_service.release_lock("query", token) is True
+        assert await fake_redis_service.is_locked("query") is False
+        assert await fake_redis_service.acquire_lock("query", ttl_ms=1000) is not None
+
+
+class TestRedisServiceSWR:
+    """stale-while-revalidate 및 XFetch 조기 갱신 테스트"""
+
+    @staticmethod
+    async def expire_soft(service, key):
+        """저장된 엔트리의 soft 만료 시각을 과거로 변경 (hard TTL 유지)"""
+        entry = service.codec.decode(await service.async_client.get(key))
+        entry["soft_expiry"] = 0
+        await service.async_client.set(key, service.codec.encode(entry), keepttl=True)
+        service.local.clear()
+
+    @pytest.mark.asyncio
+    async def test_aset_swr_ttl_and_unwrap(self, fake_redis_service):
+        """hard TTL = soft TTL + stale 구간, 일반 조회는 값만 반환"""
+        with patch('app.core.services.redis_service.settings.SWR_STALE_TTL', 600):
+            await fake_redis_service.aset_swr("swr:key", [{"id": 1}], ttl=60, delta=0.2)
+
+        assert 659 <= await fake_redis_service.async_client.ttl("swr:key") <= 660
+        assert await fake_redis_service.aget("swr:key") == [{"id": 1}]
+        assert await fake_redis_service.amget(["swr:key", "swr:none"]) == [[{"id": 1}], None]
+        assert fake_redis_service.get("swr:key") == [{"id": 1}]
+
+    @pytest.mark.asyncio
+    async def test_fresh_entry_not_refreshed(self, fake_redis_service):
+        """soft 만료 전이고 재계산 시간이 0이면 갱신 없음"""
+        refresh = AsyncMock(return_value=[{"id": 2}])
+        await fake_redis_service.aset_swr("swr:key", [{"id": 1}], ttl=60)
+
+        assert await fake_redis_service.aget_swr("swr:key", refresh) == [{"id": 1}]
+        await asyncio.sleep(0)
+        refresh.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_plain_entry_returned_as_is(self, fake_redis_service):
+        """SWR 이전 형식의 값은 그대로 반환"""
+        refresh = AsyncMock()
+        await fake_redis_service.aset("swr:key", [{"id": 1}], ttl=60)
+
+        assert await fake_redis_service.aget_swr("swr:key", refresh) == [{"id": 1}]
+        assert await fake_redis_service.aget_swr("swr:none", refresh) is None
+        refresh.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_stale_served_with_single_refresh(self, fake_redis_service):
+        """stale 값을 즉시 반환하고 동시 요청에도 갱신은 1회"""
+        async def slow_refresh():
+            await asyncio.sleep(0.02)
+            return [{"id": 2}]
+
+        refresh = AsyncMock(side_effect=slow_refresh)
+        await fake_redis_service.aset_swr("swr:key", [{"id": 1}], ttl=60)
+        await self.expire_soft(fake_redis_service, "swr:key")
+
+        results = await asyncio.gather(*[
+            fake_redis_service.aget_swr("swr:key", refresh, ttl=60) for _ in range(5)
+        ])
+        assert results == [[{"id": 1}]] * 5
+
+        await asyncio.gather(*fake_redis_service._refresh_tasks.values())
+        refresh.assert_called_once()
+        assert await fake_redis_service.aget("swr:key") == [{"id": 2}]
+        assert fake_redis_service.stale_hits == 5
+        assert fake_redis_service.refreshes == 1
+        assert not await fake_redis_service.is_locked("refresh:swr:key")
+
+    @pytest.mark.asyncio
+    async def test_refresh_skipped_when_other_worker_refreshing(self, fake_redis_service):
+        """다른 워커가 갱신 락을 보유하면 갱신 생략"""
+        refresh = AsyncMock(return_value=[{"id": 2}])
+        await fake_redis_service.aset_swr("swr:key", [{"id": 1}], ttl=60)
+        await self.expire_soft(fake_redis_service, "swr:key")
+        await fake_redis_service.acquire_lock("refresh:swr:key", ttl_ms=1000)
+
+        assert await fake_redis_service.aget_swr("swr:key", refresh) == [{"id": 1}]
+        await asyncio.gather(*fake_redis_service._refresh_tasks.values())
+
+        refresh.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_refresh_error_keeps_stale(self, fake_redis_service):
+        """갱신 실패 시 stale 값 유지"""
+        refresh = AsyncMock(side_effect=Exception("supabase down"))
+        await fake_redis_service.aset_swr("swr:key", [{"id": 1}], ttl=60)
+        await self.expire_soft(fake_redis_service, "swr:key")
+
+        await fake_redis_service.aget_swr("swr:key", refresh)
+        await asyncio.gather(*fake_redis_service._refresh_tasks.values())
+
+        assert fake_redis_service.refresh_errors == 1
+        assert await fake_redis_service.aget("swr:key") == [{"id": 1}]
+
+    @pytest.mark.asyncio
+    async def test_amget_swr_batch_refresh(self, fake_redis_service):
+        """여러 키 조회 시 stale 키만 모아 한 번에 갱신"""
+        refresh = AsyncMock(return_value={"swr:a": [{"id": 2}]})
+        await fake_redis_service.amset_swr({"swr:a": [{"id": 1}], "swr:b": []}, ttl=60)
+        await self.expire_soft(fake_redis_service, "swr:a")
+
+        results = await fake_redis_service.amget_swr(["swr:a", "swr:b", "swr:none"], refresh, ttl=60)
+        assert results == [[{"id": 1}], [], None]
+
+        await asyncio.gather(*set(fake_redis_service._refresh_tasks.values()))
+        refresh.assert_called_once_with(["swr:a"])
+        assert await fake_redis_service.amget(["swr:a", "swr:b"]) == [[{"id": 2}], []]
+        assert not fake_redis_service._refresh_tasks
+
+    def test_xfetch_probability(self, fake_redis_service):
+        """만료가 가깝고 재계산이 오래 걸릴수록 조기 갱신"""
+        now = 1000.0
+
+        with patch('app.core.services.redis_service.random.random', return_value=0.5):
+            # -ln(0.5) ≈ 0.69 → gap ≈ delta * 0.69
+            assert fake_redis_service._should_refresh_early(now, now + 1.0, delta=2.0) is True
+            assert fake_redis_service._should_refresh_early(now, now + 60.0, delta=2.0) is False
+            assert fake_redis_service._should_refresh_early(now, now + 1.0, delta=0.0) is False
+
+            with patch('app.core.services.redis_service.settings.SWR_XFETCH_BETA', 0):
+                assert fake_redis_service._should_refresh_early(now, now + 1.0, delta=2.0) is False
+
+    @pytest.mark.asyncio
+    async def test_early_refresh_before_soft_expiry(self, fake_redis_service):
+        """XFetch 판정 시 soft 만료 전에도 갱신"""
+        refresh = AsyncMock(return_value=[{"id": 2}])
+        await fake_redis_service.aset_swr("swr:key", [{"id": 1}], ttl=60, delta=0.5)
+
+        with patch.object(fake_redis_service, '_should_refresh_early', return_value=True):
+            assert await fake_redis_service.aget_swr("swr:key", refresh) == [{"id": 1}]
+        await asyncio.gather(*fake_redis_service._refresh_tasks.values())
+
+        refresh.assert_called_once()
+        assert fake_redis_service.early_refreshes == 1
+        assert fake_redis_service.stale_hits == 0
+
 
 class TestGetRedisServiceSingleton:
     """싱글톤 패턴 테스트"""
@@ -263,7 +952,6 @@ class TestRedisServiceIntegration:
         }
 
         # 1. SET
-        redis_service.client.setex.return_value = True
         success = redis_service.set("location:37.5665:126.9780:1000", test_data)
         assert success is True
 
@@ -280,11 +968,11 @@ class TestRedisServiceIntegration:
     def test_invalidate_category_cache(self, redis_service):
         """카테고리별 캐시 무효화"""
         # libraries 카테고리 캐시 무효화
-        redis_service.client.keys.return_value = [
-            "location:37.5665:126.9780:1000:libraries",
-            "location:37.5700:126.9800:2000:libraries"
-        ]
-        redis_service.client.delete.return_value = 2
+        redis_service.client.scan_iter.return_value = iter([
+            "location:v0:37.5665:126.9780:1000:libraries",
+            "location:v0:37.5700:126.9800:2000:libraries"
+        ])
+        redis_service.client.pipeline.return_value.execute.return_value = [1, 1]
 
         deleted = redis_service.delete_pattern("location:*:libraries")
 
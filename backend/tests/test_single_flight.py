@@ -0,0 +1,100 @@
+"""
+Unit tests for Single-flight request coalescing
+"""
+
+import asyncio
+import pytest
+
+from app.core.services.single_flight import SingleFlight
+
+
+class TestSingleFlight:
+    """SingleFlight 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_execution(self):
+        """같은 키의 동시 호출은 한 번만 실행하고 같은 결과 공유"""
+        flight = SingleFlight()
+        calls = 0
+
+        async def compute():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return [{"id": 1}]
+
+        results = await asyncio.gather(*[flight.do("key", compute) for _ in range(10)])
+
+        assert calls == 1
+        assert all(result is results[0] for result in results)
+        assert flight.get_stats()["executions"] == 1
+        assert flight.get_stats()["coalesced"] == 9
+        assert flight.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_different_keys_run_separately(self):
+        """다른 키는 병합하지 않음"""
+        flight = SingleFlight()
+
+        async def compute(value):
+            await asyncio.sleep(0.01)
+            return value
+
+        results = await asyncio.gather(
+            flight.do("a", lambda: compute("A")),
+            flight.do("b", lambda: compute("B"))
+        )
+
+        assert results == ["A", "B"]
+        assert flight.get_stats()["executions"] == 2
+
+    @pytest.mark.asyncio
+    async def test_sequential_calls_not_coalesced(self):
+        """완료 후 호출은 새로 실행 (결과를 캐싱하지 않음)"""
+        flight = SingleFlight()
+        calls = 0
+
+        async def compute():
+            nonlocal calls
+            calls += 1
+            return calls
+
+        assert await flight.do("key", compute) == 1
+        assert await flight.do("key", compute) == 2
+
+    @pytest.mark.asyncio
+    async def test_exception_propagates_to_all_waiters(self):
+        """계산 실패 시 대기 중인 모든 호출에 예외 전달"""
+        flight = SingleFlight()
+
+        async def compute():
+            await asyncio.sleep(0.01)
+            raise ValueError("supabase down")
+
+        results = await asyncio.gather(
+            *[flight.do("key", compute) for _ in range(3)],
+            return_exceptions=True
+        )
+
+        assert all(isinstance(result, ValueError) for result in results)
+        assert flight.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_cancel_computation(self):
+        """먼저 호출한 요청이 취소돼도 다른 대기자는 결과 수신"""
+        flight = SingleFlight()
+
+        async def compute():
+            await asyncio.sleep(0.05)
+            return "done"
+
+        leader = asyncio.create_task(flight.do("key", compute))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(flight.do("key", compute))
+        await asyncio.sleep(0)
+
+        leader.cancel()
+
+        assert await follower == "done"
+        with pytest.raises(asyncio.CancelledError):
+            await leader
@@ -0,0 +1,186 @@
+"""
+Unit tests for Spatial Index
+"""
+
+import pytest
+from unittest.mock import Mock, patch
+
+from app.core.services.spatial_index import SpatialIndex, PAGE_SIZE
+from app.core.services.distance_service import haversine_distance
+from app.core.workflow.state import AnalyzedLocation
+
+
+@pytest.fixture
+def rows_by_table():
+    """테이블별 샘플 데이터"""
+    return {
+        'libraries': [
+            {'id': 'lib-1', 'library_name': '시청 도서관', 'latitude': 37.5665, 'longitude': 126.9780},
+            {'id': 'lib-2', 'library_name': '남산 도서관', 'latitude': 37.5511, 'longitude': 126.9882},
+            {'id': 'lib-3', 'library_name': '좌표 없음', 'latitude': None, 'longitude': None}
+        ],
+        'cultural_events': [
+            {'id': 'evt-1', 'title': '광장 축제', 'lat': 37.5660, 'lot': 126.9785}
+        ],
+        'public_reservations': [
+            {'id': 'res-1', 'service_name': '강남 체육관', 'y_coord': 37.4979, 'x_coord': 127.0276}
+        ]
+    }
+
+
+@pytest.fixture
+def index(rows_by_table):
+    """구축된 공간 인덱스"""
+    spatial_index = SpatialIndex(cell_size=0.01)
+    spatial_index.build(rows_by_table)
+    return spatial_index
+
+
+class TestSpatialIndex:
+    """공간 인덱스 테스트"""
+
+    def test_not_ready_before_build(self):
+        """구축 전에는 사용 불가"""
+        assert SpatialIndex(cell_size=0.01).is_ready is False
+
+    def test_build_skips_missing_coordinates(self, index):
+        """좌표 없는 행은 인덱싱 제외"""
+        assert index.is_ready is True
+        assert index.size == 4
+        assert index.get_stats()['tables']['libraries'] == 2
+
+    def test_query_matches_brute_force(self, index, rows_by_table):
+        """인덱스 결과가 전체 스캔 결과와 동일"""
+        center = (37.5665, 126.9780)
+        radius = 2000
+
+        results = index.query(center[0], center[1], radius)
+
+        expected = []
+        for table, rows in rows_by_table.items():
+            for row in rows:
+                lat = row.get('y_coord') or row.get('lat') or row.get('latitude')
+                lon = row.get('x_coord') or row.get('lot') or row.get('longitude')
+                if lat is None:
+                    continue
+                if haversine_distance(center[0], center[1], lat, lon) <= radius:
+                    expected.append(row['id'])
+
+        assert sorted(loc['id'] for loc in results) == sorted(expected)
+        distances = [loc['distance'] for loc in results]
+        assert distances == sorted(distances)
+
+    def test_query_schema(self, index):
+        """distance, distance_formatted, _table 필드 포함"""
+        results = index.query(37.5665, 126.9780, 500)
+
+        assert results[0]['id'] == 'lib-1'
+        assert results[0]['distance'] == 0.0
+        assert results[0]['distance_formatted'] == '0m'
+        assert results[0]['_table'] == 'libraries'
+
+    def test_query_category_and_limit(self, index):
+        """카테고리 필터 및 limit 적용"""
+        libraries = index.query(37.5665, 126.9780, 5000, category='libraries')
+        assert {loc['_table'] for loc in libraries} == {'libraries'}
+
+        limited = index.query(37.5665, 126.9780, 5000, limit=1)
+        assert len(limited) == 1
+
+        assert index.query(37.5665, 126.9780, 5000, category='unknown') == []
+
+    def test_query_does_not_mutate_index(self, index):
+        """결과 수정이 인덱스에 영향 없음"""
+        first = index.query(37.5665, 126.9780, 500)
+        first[0]['distance'] = -1
+
+        second = index.query(37.5665, 126.9780, 500)
+        assert second[0]['distance'] == 0.0
+
+    def test_refresh_paginates(self):
+        """PostgREST 페이지 단위 적재"""
+        full_page = [
+            {'id': str(i), 'latitude': 37.5, 'longitude': 127.0}
+            for i in range(PAGE_SIZE)
+        ]
+        last_page = [{'id': 'last', 'latitude': 37.5, 'longitude': 127.0}]
+
+        tables = {}
+
+        def make_table(name):
+            if name not in tables:
+                table = Mock()
+                pages = [full_page, last_page] if name == 'libraries' else [[]]
+                responses = [Mock(data=page) for page in pages]
+                table.select.return_value.range.return_value.execute.side_effect = responses
+                tables[name] = table
+            return tables[name]
+
+        supabase = Mock()
+        supabase.table.side_effect = make_table
+
+        spatial_index = SpatialIndex(cell_size=0.01)
+        indexed = spatial_index.refresh(supabase)
+
+        assert indexed == PAGE_SIZE + 1
+
+    def test_refresh_uses_column_projection(self):
+        """ServiceFetcher.SELECT_COLUMNS 프로젝션 사용, 없는 컬럼이면 해당 테이블만 '*' 재시도"""
+        from app.core.agents.service_fetcher import ServiceFetcher
+
+        class UnknownColumnError(Exception):
+            code = '42703'
+
+        tables = {}
+
+        def make_table(name):
+            if name not in tables:
+                table = Mock()
+                selected = table.select.return_value.range.return_value.execute
+                if name == 'libraries':
+                    selected.side_effect = [
+                        UnknownColumnError("column does not exist"),
+                        Mock(data=[{'id': 'lib', 'latitude': 37.5, 'longitude': 127.0}])
+                    ]
+                else:
+                    selected.return_value = Mock(data=[])
+                tables[name] = table
+            return tables[name]
+
+        supabase = Mock()
+        supabase.table.side_effect = make_table
+
+        assert SpatialIndex(cell_size=0.01).refresh(supabase) == 1
+
+        events = tables['cultural_events'].select.call_args_list
+        assert [c.args[0] for c in events] == [ServiceFetcher.SELECT_COLUMNS['cultural_events']]
+        libraries = tables['libraries'].select.call_args_list
+        assert [c.args[0] for c in libraries] == [ServiceFetcher.SELECT_COLUMNS['libraries'], '*']
+
+
+class TestServiceFetcherWithIndex:
+    """ServiceFetcher 공간 인덱스 경로"""
+
+    @pytest.mark.asyncio
+    async def test_fetch_uses_index_without_supabase(self, index):
+        """인덱스 구축 시 Supabase/Redis 호출 없이 응답"""
+        from app.core.agents.service_fetcher import ServiceFetcher
+
+        with patch('app.core.agents.service_fetcher.get_supabase_client') as mock_supabase, \
+                patch('app.core.agents.service_fetcher.get_redis_service') as mock_redis, \
+                patch('app.core.agents.service_fetcher.get_spatial_index', return_value=index):
+            fetcher = ServiceFetcher()
+
+            analyzed = AnalyzedLocation(
+                latitude=37.5665,
+                longitude=126.9780,
+                radius=2000,
+                category='libraries',
+                source='coordinates'
+            )
+            results = await fetcher.fetch(analyzed, limit=20)
+
+            assert results.total == 2
+            assert results.locations[0]['id'] == 'lib-1'
+            mock_supabase.return_value.table.assert_not_called()
+            mock_redis.return_value.aget.assert_not_called()
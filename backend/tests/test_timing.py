@@ -0,0 +1,127 @@
+"""
+Unit tests for Timing Spans / Server-Timing Middleware
+"""
+
+import asyncio
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.middleware import ServerTimingMiddleware
+from app.core.services import timing
+from app.core.services.timing import Histogram, server_timing_header, span, timed
+
+
+@pytest.fixture(autouse=True)
+def clean_timings():
+    """테스트 간 히스토그램 격리"""
+    timing.reset_timings()
+    yield
+    timing.reset_timings()
+
+
+class TestHistogram:
+    """히스토그램 테스트"""
+
+    def test_observe_and_quantile(self):
+        """버킷 카운트 및 분위수"""
+        histogram = Histogram(buckets=(0.01, 0.1, 1.0))
+        for value in (0.005, 0.005, 0.05, 0.5, 5.0):
+            histogram.observe(value)
+
+        assert histogram.counts == [2, 1, 1, 1]
+        assert histogram.count == 5
+        assert histogram.quantile(0.4) == 0.01
+        assert histogram.quantile(0.6) == 0.1
+        assert histogram.quantile(1.0) == float("inf")
+
+    def test_empty_stats(self):
+        """관측이 없으면 None"""
+        stats = Histogram().get_stats()
+
+        assert stats["count"] == 0
+        assert stats["p50_ms"] is None
+
+
+class TestSpans:
+    """스팬 수집 테스트"""
+
+    def test_span_records_histogram(self):
+        """요청 밖의 스팬도 히스토그램에 기록"""
+        with span("redis"):
+            pass
+
+        assert timing.get_timing_stats()["redis"]["count"] == 1
+
+    def test_span_records_on_error(self):
+        """예외가 나도 소요 시간 기록"""
+        with pytest.raises(ValueError):
+            with span("kakao"):
+                raise ValueError("boom")
+
+        assert timing.get_histograms()["kakao"].count == 1
+
+    @pytest.mark.asyncio
+    async def test_request_spans_isolated(self):
+        """동시 요청의 스팬은 서로 섞이지 않음"""
+        @timed("node")
+        async def node(delay):
+            await asyncio.sleep(delay)
+
+        async def request(delay):
+            spans = timing.start_request()
+            await node(delay)
+            with span("redis"):
+                pass
+            return spans
+
+        first, second = await asyncio.gather(request(0.01), request(0.0))
+
+        assert [name for name, _ in first] == ["node", "redis"]
+        assert [name for name, _ in second] == ["node", "redis"]
+        assert first[0][1] >= 0.01
+        assert timing.get_histograms()["node"].count == 2
+
+    def test_server_timing_header(self):
+        """같은 이름 합산 + 호출 수 표시"""
+        header = server_timing_header(
+            [("analyze_location", 0.0012), ("redis", 0.001), ("redis", 0.002)],
+            total=0.01
+        )
+
+        assert header == 'analyze_location;dur=1.2, redis;dur=3.0;desc="2 calls", total;dur=10.0'
+
+    def test_setup_tracing_disabled(self):
+        """OTEL_ENABLED=False 면 내보내기 비활성"""
+        assert timing.setup_tracing() is False
+
+
+class TestServerTimingMiddleware:
+    """Server-Timing 미들웨어 테스트"""
+
+    def test_header_added(self):
+        """응답에 노드/외부 호출 스팬과 total 포함"""
+        app = FastAPI()
+        app.add_middleware(ServerTimingMiddleware)
+
+        @app.get("/search")
+        async def search():
+            with span("supabase"):
+                pass
+            with span("redis"):
+                pass
+            with span("redis"):
+                pass
+            return {"ok": True}
+
+        response = TestClient(app).get("/search")
+
+        assert response.status_code == 200
+        header = response.headers["server-timing"]
+        assert header.startswith("supabase;dur=")
+        assert 'redis;dur=' in header and 'desc="2 calls"' in header
+        assert "total;dur=" in header
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -3,12 +3,16 @@ LangGraph Workflow Integration Tests
 전체 워크플로우 통합 테스트 (service_graph.py)
 """
 
+import asyncio
+import time
 import pytest
 from unittest.mock import Mock, AsyncMock, patch
 import uuid
 
 from app.core.workflow.state import WorkflowState, LocationQuery, AnalyzedLocation, SearchResults, FormattedResponse
 from app.core.workflow.service_graph import ServiceSearchGraph, get_service_graph, search_services
+from app.core.services.kakao_map_service import KakaoMapService
+from app.core.services import timing
 
 
 # Test Fixtures
@@ -17,7 +21,7 @@ from app.core.workflow.service_graph import ServiceSearchGraph, get_service_grap
 def mock_kakao_service():
     """Mock Kakao Map Service"""
     with patch('app.core.agents.location_analyzer.get_kakao_map_service') as mock:
-        service = Mock()
+        service = KakaoMapService(api_key='test-key')
         service.address_to_coordinates = AsyncMock(return_value=(37.5665, 126.9780))
         service.keyword_search = AsyncMock(return_value=(37.5665, 126.9780))
         service.reverse_geocode = AsyncMock(return_value="서울특별시 중구 세종대로 110")
@@ -30,6 +34,10 @@ def mock_supabase_client():
     """Mock Supabase Client"""
     with patch('app.core.agents.service_fetcher.get_supabase_client') as mock:
         client = Mock()
+        # 범위 필터(gte/lte) 체인이 같은 쿼리 객체를 반환하도록 설정
+        query = client.table.return_value.select.return_value
+        query.gte.return_value = query
+        query.lte.return_value = query
 
         # Default mock response
         mock_response = Mock()
@@ -58,16 +66,11 @@ def mock_supabase_client():
 
 
 @pytest.fixture
-def mock_redis_service():
-    """Mock Redis Service"""
+def mock_redis_service(fake_redis_service):
+    """Redis Service (fakeredis, 빈 캐시로 시작)"""
     with patch('app.core.agents.service_fetcher.get_redis_service') as mock:
-        service = Mock()
-        service.enabled = True
-        service.get = Mock(return_value=None)  # Cache miss
-        service.set = Mock(return_value=True)
-        service.generate_cache_key = Mock(return_value="test:cache:key")
-        mock.return_value = service
-        yield service
+        mock.return_value = fake_redis_service
+        yield fake_redis_service
 
 
 # Workflow Graph Tests
@@ -175,6 +178,65 @@ class TestServiceSearchGraph:
         assert final_state.analyzed_location.source == 'address'
         assert final_state.response.success is True
 
+    @pytest.mark.asyncio
+    async def test_reverse_geocode_runs_concurrently_with_fetch(
+        self,
+        mock_kakao_service,
+        mock_supabase_client,
+        mock_redis_service
+    ):
+        """역지오코딩이 서비스 조회와 동시에 실행되고 주소가 응답에 반영"""
+        # 각 호출이 상대 호출의 시작을 기다림 - 순차 실행이면 대기 시간 초과
+        reverse_started = asyncio.Event()
+        fetch_started = asyncio.Event()
+
+        async def waiting_reverse_geocode(lat, lon):
+            reverse_started.set()
+            await asyncio.wait_for(fetch_started.wait(), timeout=1.0)
+            return "서울특별시 중구 세종대로 110"
+
+        mock_kakao_service.reverse_geocode = AsyncMock(side_effect=waiting_reverse_geocode)
+
+        graph = ServiceSearchGraph(use_llm=False)
+        original_fetch = graph.service_fetcher.fetch
+
+        async def waiting_fetch(*args, **kwargs):
+            fetch_started.set()
+            await asyncio.wait_for(reverse_started.wait(), timeout=1.0)
+            return await original_fetch(*args, **kwargs)
+
+        graph.service_fetcher.fetch = waiting_fetch
+
+        query = LocationQuery(latitude=37.5665, longitude=126.9780, radius=2000)
+        final_state = await graph.run(query)
+
+        assert len(final_state.errors) == 0
+        assert reverse_started.is_set() and fetch_started.is_set()
+        assert final_state.analyzed_location.address == "서울특별시 중구 세종대로 110"
+        assert final_state.response.summary['search_address'] == "서울특별시 중구 세종대로 110"
+
+    @pytest.mark.asyncio
+    async def test_workflow_without_address(
+        self,
+        mock_kakao_service,
+        mock_supabase_client,
+        mock_redis_service
+    ):
+        """include_address=False 시 Kakao 역지오코딩 호출 없음"""
+        query = LocationQuery(
+            latitude=37.5665,
+            longitude=126.9780,
+            radius=2000,
+            include_address=False
+        )
+
+        graph = ServiceSearchGraph(use_llm=False)
+        final_state = await graph.run(query)
+
+        assert len(final_state.errors) == 0
+        assert final_state.analyzed_location.address is None
+        mock_kakao_service.reverse_geocode.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_workflow_with_custom_workflow_id(
         self,
@@ -383,6 +445,163 @@ class TestWorkflowErrorHandling:
             assert len(final_state.errors) > 0
 
 
+class TestWorkflowStreaming:
+    """스트리밍 실행 테스트"""
+
+    @staticmethod
+    def make_graph(delays):
+        """카테고리별 지연 후 결과를 반환하는 그래프"""
+        graph = ServiceSearchGraph(engine="direct")
+        graph.location_analyzer.analyze = AsyncMock(return_value=AnalyzedLocation(
+            latitude=37.5665, longitude=126.9780, radius=2000, source='coordinates'
+        ))
+
+        async def fetch(analyzed_location, limit=20):
+            category = analyzed_location.category
+            await asyncio.sleep(delays[category])
+            locations = [
+                {'id': f'{category}-{i}', '_table': category, 'latitude': 37.5665,
+                 'longitude': 126.978, 'distance': delays[category] * 1000 + i}
+                for i in range(limit)
+            ]
+            return SearchResults(locations=locations, total=len(locations), category=category)
+
+        graph.service_fetcher.fetch = fetch
+        return graph
+
+    @pytest.mark.asyncio
+    async def test_batches_in_completion_order(self):
+        """헤더 → 완료 순서대로 카테고리 배치 → 최종 메시지"""
+        delays = {
+            'cultural_events': 0.05, 'libraries': 0.0, 'cultural_spaces': 0.02,
+            'future_heritages': 0.03, 'public_reservations': 0.04
+        }
+        graph = self.make_graph(delays)
+        query = LocationQuery(latitude=37.5665, longitude=126.9780, include_address=False)
+
+        events = [event async for event in graph.stream(query, limit=3)]
+
+        assert [event['type'] for event in events] == ['header'] + ['locations'] * 5 + ['final']
+        assert events[0]['categories'] == list(delays)
+        assert [event['category'] for event in events[1:6]] == sorted(delays, key=delays.get)
+        assert all(event['count'] == 3 for event in events[1:6])
+        assert len(events[1]['kakao_markers']) == 3
+
+        final = events[-1]
+        assert final['success'] is True
+        assert final['summary']['total_count'] == 3
+        assert final['summary']['category_counts'] == {'도서관': 3}
+        assert 'kakao_markers' not in final['summary']
+
+    @pytest.mark.asyncio
+    async def test_failed_category_reported(self):
+        """조회 실패 카테고리는 빈 배치 + 최종 오류"""
+        graph = self.make_graph({'libraries': 0.0})
+        graph.location_analyzer.analyze.return_value.category = 'libraries'
+        graph.service_fetcher.fetch = AsyncMock(return_value=None)
+        query = LocationQuery(latitude=37.5665, longitude=126.9780, category='libraries', include_address=False)
+
+        events = [event async for event in graph.stream(query)]
+
+        assert events[1]['count'] == 0
+        assert events[-1]['success'] is False
+        assert events[-1]['errors'] == ['Failed to fetch libraries']
+
+    @pytest.mark.asyncio
+    async def test_analyze_failure(self):
+        """위치 분석 실패 시 error 이벤트만"""
+        graph = ServiceSearchGraph(engine="direct")
+        graph.location_analyzer.analyze = AsyncMock(return_value=None)
+
+        events = [event async for event in graph.stream(LocationQuery(address="없는주소"))]
+
+        assert [event['type'] for event in events] == ['error']
+        assert events[0]['errors'] == ['Failed to analyze location']
+
+
+class TestWorkflowEngines:
+    """direct / langgraph 실행 엔진 비교 테스트"""
+
+    @staticmethod
+    def summarize(state: WorkflowState) -> dict:
+        """실행마다 달라지는 시각/ID를 제외한 결과"""
+        return {
+            "errors": state.errors,
+            "analyzed": state.analyzed_location.model_dump(exclude={"timestamp"})
+            if state.analyzed_location else None,
+            "locations": state.search_results.locations if state.search_results else None,
+            "message": state.response.message if state.response else None,
+            "completed": state.completed_at is not None
+        }
+
+    @pytest.mark.asyncio
+    async def test_engines_produce_same_state(
+        self,
+        mock_kakao_service,
+        mock_supabase_client,
+        mock_redis_service
+    ):
+        """두 엔진의 최종 상태가 동일"""
+        query = LocationQuery(latitude=37.5665, longitude=126.9780, radius=2000)
+
+        direct = await ServiceSearchGraph(engine="direct").run(query)
+        mock_redis_service.local.clear()
+        graph = await ServiceSearchGraph(engine="langgraph").run(query)
+
+        assert self.summarize(direct) == self.summarize(graph)
+        assert not direct.errors
+
+    @pytest.mark.asyncio
+    async def test_engines_same_error_handling(self, mock_kakao_service):
+        """노드 오류 시 두 엔진 모두 오류를 누적하고 계속 진행"""
+        mock_kakao_service.address_to_coordinates.return_value = None
+        mock_kakao_service.keyword_search.return_value = None
+        query = LocationQuery(address="존재하지않는주소12345")
+
+        states = [
+            await ServiceSearchGraph(engine=engine).run(query)
+            for engine in ("direct", "langgraph")
+        ]
+
+        assert states[0].errors == states[1].errors
+        assert len(states[0].errors) == 3
+
+    @pytest.mark.asyncio
+    async def test_direct_passes_state_by_reference(self, mock_kakao_service):
+        """direct 엔진은 노드 결과(위치 dict 포함)를 복사하지 않음"""
+        results = SearchResults(
+            locations=[{'id': '1', '_table': 'libraries', 'latitude': 37.5665, 'longitude': 126.978}],
+            total=1
+        )
+        graph = ServiceSearchGraph(engine="direct")
+        graph.service_fetcher.fetch = AsyncMock(return_value=results)
+
+        state = await graph.run(LocationQuery(latitude=37.5665, longitude=126.9780, include_address=False))
+
+        assert state.search_results is results
+        assert state.search_results.locations[0] is results.locations[0]
+
+    @pytest.mark.parametrize("engine", ["direct", "langgraph"])
+    @pytest.mark.asyncio
+    async def test_node_spans_recorded(self, engine, mock_kakao_service):
+        """두 엔진 모두 노드별 타이밍 스팬 기록"""
+        graph = ServiceSearchGraph(engine=engine)
+        graph.service_fetcher.fetch = AsyncMock(return_value=SearchResults(locations=[], total=0))
+
+        spans = timing.start_request()
+        await graph.run(LocationQuery(latitude=37.5665, longitude=126.9780, include_address=False))
+
+        assert [name for name, _ in spans] == ["analyze_location", "fetch_services", "generate_response"]
+
+    def test_engine_from_settings(self):
+        """engine 미지정 시 설정값, 알 수 없는 값은 ValueError"""
+        with patch('app.core.workflow.service_graph.settings.WORKFLOW_ENGINE', 'langgraph'):
+            assert ServiceSearchGraph().engine == "langgraph"
+
+        with pytest.raises(ValueError):
+            ServiceSearchGraph(engine="celery")
+
+
 class TestSingletonAndConvenienceFunctions:
     """싱글톤 및 편의 함수 테스트"""
 